@@ -2,10 +2,14 @@
 # SPDX-License-Identifier: Apache-2.0
 
 import argparse
+import json
 import logging
+import multiprocessing
+import os
 import re
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional, Union
+from typing import Callable, Mapping, Optional, Sequence, Union
 
 from .base import BaseMode
 from riescue.compliance.src.instr_generator import InstrGenerator
@@ -13,6 +17,8 @@ from riescue.compliance.src.test_generator import TestGenerator
 from riescue.compliance.config import ResourceBuilder, Resource
 from riescue.compliance.src.comparator import Comparator
 from riescue.compliance.src.instr_builder import InstrBuilder
+from riescue.compliance.src.shard_planner import Shard, ShardResult, merge_shard_results, plan_shards
+from riescue.compliance.lib.riscv_instrs.base import InstrBase
 from riescue.compliance.lib.testcase import TestCase
 from riescue.riescued import RiescueD
 from riescue.lib.toolchain import Spike, Whisper, Toolchain
@@ -20,6 +26,17 @@ from riescue.lib.rand import RandNum
 
 log = logging.getLogger(__name__)
 
+# Shared with forked shard workers, see :py:meth:`BringupMode._generate_shards`
+_shard_context: Optional[tuple["BringupMode", Resource, Toolchain, Sequence[type[InstrBase]]]] = None
+
+
+def _run_shard(shard: Shard) -> ShardResult:
+    "Process pool worker. Runs ``shard`` with the context inherited from the parent"
+    if _shard_context is None:
+        raise RuntimeError("Shard worker started without a shard context")
+    mode, resource, toolchain, sim_classes = _shard_context
+    return mode._run_shard(shard, resource, toolchain, sim_classes)
+
 
 class BringupMode(BaseMode[Resource]):
     """
@@ -40,8 +57,23 @@ class BringupMode(BaseMode[Resource]):
         bringup_args.add_argument("--first_pass_iss", type=str, help="Provide Target ISS for the first pass")
         bringup_args.add_argument("--second_pass_iss", type=str, help="Provide Target ISS for the second pass")
         bringup_args.add_argument("--rpt_cnt", type=int, help="Each instruction will have rpt_cnt instances in the test")
+        bringup_args.add_argument(
+            "--setup_jobs",
+            type=int,
+            help="Set up instructions on this many processes. Each instruction is randomized from its own sub-stream of the seed, so output is the same for any number of processes",
+        )
+        bringup_args.add_argument(
+            "--shards",
+            type=int,
+            help="Split the instructions into this many sub-tests, each with its own seed and run directory, run on a process pool. "
+            "0 picks the number from the estimated setup lines and --max_instrs_per_file",
+        )
+        bringup_args.add_argument("--shard_jobs", type=int, help="Max number of shards run at once. Defaults to the number of CPUs")
         bringup_args.add_argument("--max_instrs_per_file", type=int, help="Max instrs in the test file during the first pass. Doesn't include second pass or runtime instructions")
         bringup_args.add_argument("--compare_iss", action="store_true", help="Run second pass testcase on both ISS targets (i.e whisper and spike) and compares the logs")
+        bringup_args.add_argument(
+            "--iss_jobs", type=int, help="Max number of ISS runs on the same test at once, e.g. whisper and spike with --compare_iss. Defaults to 2, use 1 to run them one after the other"
+        )
         bringup_args.add_argument("--repeat_runtime", "-repeat_runtime", type=int, help="--repeat_times passthrough. Run each discrete test these many times. Only use this with --disable_pass")
         bringup_args.add_argument("--output_format", "-op_fmt", type=str, help="Format in which output is generated")
         bringup_args.add_argument("--load_fp_regs", "-lfpr", action="store_false", help="Switch to load fp regs with load instructions rather than fmv instructions.")
@@ -85,6 +117,8 @@ class BringupMode(BaseMode[Resource]):
     ) -> Path:
         """
         Top level wrapper to generate and simulate a test
+
+        :return: Path returned by :py:meth:`generate`
         """
         cfg = self.configure(seed=seed, bringup_test_json=bringup_test_json, cl_args=cl_args)
         return self.generate(cfg, toolchain)
@@ -114,7 +148,7 @@ class BringupMode(BaseMode[Resource]):
         Generate, compile, and return ELF test file. Returned test will have been simulated on ISS, otherwise an exception will be raised.
 
         :param cfg: :class:`Resource` object for use in :py:meth:`generate`
-        :return: Path to the generated ELF test file
+        :return: Path to the generated ELF test file. With ``shards``, path to the ``bringup_shards.json`` shard report instead, which lists every shard's ELF
         """
         resource = cfg
         rng = RandNum(resource.seed)
@@ -127,7 +161,6 @@ class BringupMode(BaseMode[Resource]):
 
         # Parse opcodes and generate the tree for all the extensions.
         instr_generator = InstrGenerator(resource)
-        test_generator = TestGenerator(resource)
 
         # Get the instruction records, dictionaries of things like name, opcode, variable fields, etc.
         sim_instrs = resource.get_sim_set()
@@ -135,7 +168,27 @@ class BringupMode(BaseMode[Resource]):
         # Turn the instruction records into classes that can be crossed with the configurations, instantiated and generated, just missing configuration and label at this point.
         sim_classes = InstrBuilder.build_dynamic_classes(sim_instrs)
 
-        instrs = instr_generator.generate_instructions(sim_classes)
+        if resource.shards is not None:
+            return self._generate_shards(resource, toolchain, sim_classes)
+        _, elf = self._generate_test(resource, toolchain, instr_generator, sim_classes)
+        return elf
+
+    def _generate_test(
+        self,
+        resource: Resource,
+        toolchain: Toolchain,
+        instr_generator: InstrGenerator,
+        sim_classes: Sequence[type[InstrBase]],
+        repeats: Optional[Mapping[str, Sequence[int]]] = None,
+    ) -> tuple[TestCase, Path]:
+        """
+        Generate and run the first and second pass of a test.
+
+        :param repeats: Repeat indices of each instruction to generate, defaults to all repeats
+        :return: The final testcase, the second pass unless it's disabled, and the path to its ELF test file
+        """
+        test_generator = TestGenerator(resource)
+        instrs = instr_generator.generate_instructions(sim_classes, repeats)
         log.info(f"Generated {len(instrs)} instructions")
         testcase = test_generator.process_instrs(instrs, iteration=1)
 
@@ -148,12 +201,12 @@ class BringupMode(BaseMode[Resource]):
 
         if resource.disable_pass:
             log.warning("Second pass is disabled, skipping second pass")
-            return first_pass.generated_files.elf
+            return testcase, first_pass.generated_files.elf
 
         second_pass_testcase = test_generator.process_instrs(instrs, iteration=2)  # Parse the first pass log and generate the second pass testcase.
 
         if resource.compare_iss:
-            return self._compare_iss(testcase, second_pass_testcase, resource, toolchain)
+            return second_pass_testcase, self._compare_iss(testcase, second_pass_testcase, resource, toolchain)
 
         # Run the Second pass
         last_rd = None
@@ -162,7 +215,58 @@ class BringupMode(BaseMode[Resource]):
         self._clean_up(str(testfile), output_format=resource.output_format)
         if last_rd is None:
             raise ValueError("Didn't run a final RiescueD instance")
-        return last_rd.generated_files.elf
+        return second_pass_testcase, last_rd.generated_files.elf
+
+    def _generate_shards(self, resource: Resource, toolchain: Toolchain, sim_classes: Sequence[type[InstrBase]]) -> Path:
+        """
+        Split the instructions into shards, see :py:func:`plan_shards`, and run each as its own test in ``<run_dir>/shard_<n>`` on a process pool.
+        Shards run to completion even if others fail. Their results and signatures are merged into ``<run_dir>/bringup_shards.json``, see :py:func:`merge_shard_results`.
+
+        :return: Path to the shard report
+        :raises RuntimeError: if any shard failed
+        """
+        global _shard_context
+        shards = plan_shards(sim_classes, resource, resource.shards or 0, resource.rng)
+        jobs = max(1, min(len(shards), resource.shard_jobs or os.cpu_count() or 1))
+        log.info(f"Running {len(shards)} shards on {jobs} processes")
+
+        if "fork" in multiprocessing.get_all_start_methods():
+            # Workers inherit the instruction classes, which are built at runtime and can't be pickled
+            _shard_context = (self, resource, toolchain, sim_classes)
+            try:
+                with ProcessPoolExecutor(max_workers=jobs, mp_context=multiprocessing.get_context("fork")) as executor:
+                    results = list(executor.map(_run_shard, shards))
+            finally:
+                _shard_context = None
+        else:
+            results = [self._run_shard(shard, resource, toolchain, sim_classes) for shard in shards]
+
+        report = self.run_dir / "bringup_shards.json"
+        with open(report, "w") as f:
+            json.dump(merge_shard_results(resource.seed, shards, results), f, indent=2)
+        failed = [result for result in results if not result.passed]
+        if failed:
+            raise RuntimeError(f"{len(failed)} of {len(results)} bringup shards failed, see {report}: " + ", ".join(f"shard {result.index}: {result.error}" for result in failed))
+        log.info(f"All {len(results)} shards passed, see {report}")
+        return report
+
+    def _run_shard(self, shard: Shard, resource: Resource, toolchain: Toolchain, sim_classes: Sequence[type[InstrBase]]) -> ShardResult:
+        "Run one shard as a test with its own seed and run directory. Errors are recorded in the result rather than raised"
+        shard_dir = self.run_dir / f"shard_{shard.index}"
+        result = ShardResult(shard.index, shard.seed, str(shard_dir), sorted(shard.repeats), shard.cost)
+        try:
+            shard_mode = BringupMode(run_dir=shard_dir, conf=self.conf)
+            shard_resource = resource.duplicate(seed=shard.seed, run_dir=shard_dir, shards=None)
+            shard_resource.with_rng(RandNum(shard.seed))
+            testcase, elf = shard_mode._generate_test(shard_resource, toolchain, InstrGenerator(shard_resource), sim_classes, shard.repeats)
+        except Exception as e:
+            log.error(f"Shard {shard.index} with seed {shard.seed} failed: {e}")
+            result.error = f"{type(e).__name__}: {e}"
+            return result
+        result.passed = True
+        result.elf = str(elf)
+        result.signature = str(testcase.signature)
+        return result
 
     # helper methods
     def _get_iss(self, iss_name: str, toolchain: Toolchain) -> Union[Spike, Whisper]:
@@ -176,33 +280,60 @@ class BringupMode(BaseMode[Resource]):
             raise ValueError(f"No ISS {iss_name} configured in toolchain")
         return iss
 
-    def _rd_run_iss(self, file: Path, iss: Union[str, list[str]], resource: Resource, toolchain: Toolchain) -> RiescueD:
-        "Shortcut for running RiescueD and ISS on the test"
+    def _rd_run_iss(
+        self,
+        file: Path,
+        iss: Union[str, list[str]],
+        resource: Resource,
+        toolchain: Toolchain,
+        on_log: Optional[Callable[[str], None]] = None,
+    ) -> RiescueD:
+        """
+        Shortcut for running RiescueD and ISS on the test. The test is built once and each ISS runs on the same ELF.
+        Up to ``resource.iss_jobs`` ISS run at once.
+
+        :param on_log: Called with the ISS name as soon as its run finishes, while other ISS may still be running
+        """
         if isinstance(iss, str):
             iss = [iss]
         rd = RiescueD(file, run_dir=self.run_dir, seed=resource.seed, toolchain=toolchain)
         rd.generate(resource.featmgr)
         rd.build(resource.featmgr)
-        for simulator in iss:
-            if toolchain.whisper is not None:
-                whisper_config_json_override = toolchain.whisper.check_filepath(toolchain.whisper.whisper_config_json)
-            else:
-                whisper_config_json_override = None
-
-            rd.simulate(resource.featmgr, iss=self._get_iss(simulator, toolchain), whisper_config_json_override=whisper_config_json_override)
+        if toolchain.whisper is not None:
+            whisper_config_json_override = toolchain.whisper.check_filepath(toolchain.whisper.whisper_config_json)
+        else:
+            whisper_config_json_override = None
+
+        def simulate(simulator: str) -> None:
+            # logs are compared and used to generate the next pass, so they always need the trace
+            rd.simulate(resource.featmgr, iss=self._get_iss(simulator, toolchain), whisper_config_json_override=whisper_config_json_override, trace=True)
+            if on_log is not None:
+                on_log(simulator)
+
+        jobs = min(resource.iss_jobs, len(iss))
+        if jobs <= 1:
+            for simulator in iss:
+                simulate(simulator)
+            return rd
+
+        # ISS runs are subprocesses, so threads are enough to overlap them. First failure is raised once all runs finish
+        with ThreadPoolExecutor(max_workers=jobs) as executor:
+            runs = [executor.submit(simulate, simulator) for simulator in iss]
+        for run in runs:
+            run.result()
         return rd
 
     def _compare_iss(self, first_pass: TestCase, second_pass: TestCase, resource: Resource, toolchain: Toolchain) -> Path:
         """
         Compare ISS.
         Assumes first pass was already run, just runs a second pass
-        Runs both ISS on the testcase and compares the logs
+        Runs both ISS on the testcase and compares the logs. Each log is converted as soon as its ISS finishes
 
         """
         comparator = Comparator(resource)
         comparator.compare_logs(first_pass)
-        rd = self._rd_run_iss(second_pass.testname, ["whisper", "spike"], resource, toolchain)
-        comparator.compare_logs(second_pass)
+        rd = self._rd_run_iss(second_pass.testname, ["whisper", "spike"], resource, toolchain, on_log=lambda iss: comparator.process_log(second_pass, iss))
+        comparator.compare_logs(second_pass, processed=["whisper", "spike"])
         return rd.generated_files.elf
 
     def _clean_up(self, output_file: str, output_format: str):
@@ -67,6 +67,8 @@ class BringupArgsAdapter(BaseAdapter):
             resource.second_pass_iss = args.second_pass_iss
         if args.compare_iss is not None:
             resource.compare_iss = args.compare_iss
+        if args.iss_jobs is not None:
+            resource.iss_jobs = args.iss_jobs
         if args.dump_instrs is not None:
             resource.dump_instrs = bool(args.dump_instrs)
         if args.combine_compliance_tests is not None:
@@ -85,6 +87,12 @@ class BringupArgsAdapter(BaseAdapter):
         # rd args
         if args.rpt_cnt is not None:
             resource.rpt_cnt = args.rpt_cnt
+        if args.setup_jobs is not None:
+            resource.setup_jobs = args.setup_jobs
+        if args.shards is not None:
+            resource.shards = args.shards
+        if args.shard_jobs is not None:
+            resource.shard_jobs = args.shard_jobs
         if args.max_instrs_per_file is not None:
             resource.max_instr_per_file = args.max_instrs_per_file
         if args.vector_bringup is not None:
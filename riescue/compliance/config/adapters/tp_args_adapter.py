@@ -31,6 +31,7 @@ class TpArgsAdapter(BaseAdapter):
 
         cfg.isa = args.isa
         cfg.test_plan_name = args.test_plan_name
+        cfg.write_test_source = not getattr(args, "no_test_source", False)
 
         # configure feat manager builder
         # handle pass-through args
@@ -170,6 +170,9 @@ class Resource:
     # Runs the second-pass test case on both whisper and spike and compare logs.
     compare_iss: bool = False
 
+    # Max number of ISS runs on the same test at once, e.g. whisper and spike with compare_iss. 1 runs them one after the other.
+    iss_jobs: int = 2
+
     # Format in which output is generated.
     output_format: str = "all"
 
@@ -178,6 +181,15 @@ class Resource:
     # Replicates the instructions "_rpt_cnt" times.
     rpt_cnt: int = 1
 
+    # If set, randomize each instruction from its own RandNum sub-stream and set up instructions on this many processes.
+    setup_jobs: Optional[int] = None
+
+    # If set, split the instructions into this many sub-tests run on a process pool. 0 picks the number from the estimated setup lines and max_instr_per_file.
+    shards: Optional[int] = None
+
+    # Max number of shards run at once. Defaults to the number of CPUs.
+    shard_jobs: Optional[int] = None
+
     # Pad size for inserting random instruction inside setups.
     pad_size: int = 256
 
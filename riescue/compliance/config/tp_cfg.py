@@ -22,6 +22,7 @@ class TpCfg:
     isa: str = ""
     test_plan_name: str = ""
     seed: int = 0
+    write_test_source: bool = True  #: Write the generated test plan assembly to ``run_dir`` as an artifact
 
     # copy method
     def duplicate(self, featmgr: FeatMgr) -> "TpCfg":
@@ -345,8 +345,9 @@ class ConstraintDBAccessComponent:
 
     def get_constrained_imm_value(self, instr_name: str, imm_name: str):
         self.constraints = imm_constraints(self.resource_db)
-        if instr_name in self.constraints.data:
-            return self.constraints.data[instr_name][imm_name]["value_generator"]()
+        value_generator = self.constraints.get_constraint(instr_name, imm_name)
+        if value_generator is not None:
+            return value_generator()
 
         return None
 
@@ -0,0 +1,42 @@
+# SPDX-FileCopyrightText: © 2025 Tenstorrent AI ULC
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Vector register file model for post-setup checks.
+
+Holds register contents reported by the first-pass ISS as byte arrays, so elements of any width are a view of the register rather than parsed one at a time from hex strings.
+"""
+
+import numpy as np
+
+
+class VectorRegisterFile:
+    """
+    ``num_regs`` registers of ``vlen`` bits, stored as little-endian bytes. Element 0 of a register is its lowest ``eew`` bits.
+
+    :param vlen: Register width in bits
+    :param num_regs: Number of registers
+    """
+
+    def __init__(self, vlen: int, num_regs: int = 32):
+        self.vlen = vlen
+        self.data = np.zeros((num_regs, vlen // 8), dtype=np.uint8)
+
+    def load_hex(self, reg: int, value: str) -> None:
+        """
+        Set a register from a hex string, most significant digit first, as the ISS reports it.
+        Only the lowest ``vlen`` bits of ``value`` are used; a shorter value is zero-extended.
+        """
+        digits = value[-(self.vlen // 4) :].rjust(self.vlen // 4, "0")
+        self.data[reg] = np.frombuffer(bytes.fromhex(digits), dtype=np.uint8)[::-1]
+
+    def elements(self, reg: int, eew: int) -> np.ndarray:
+        "Signed ``eew``-bit elements of a register, element 0 first"
+        return self.data[reg].view(f"<i{eew // 8}")
+
+    def sign_extended_hex(self, reg: int, eew: int) -> list[str]:
+        """
+        Elements of a register sign-extended to 64 bits, as ``hex()`` strings.
+        Matches ``VectorInstrSetup.sign_extend(element, eew, 64)``.
+        """
+        return [hex(element) for element in self.elements(reg, eew).astype(np.int64).view(np.uint64).tolist()]
@@ -5,6 +5,7 @@ import copy
 
 from .components import VecStoreComponent, VecLoadComponent, VecUnitStrideComponent, VecStridedComponent, VecIndexedComponent, SegmentedComponent
 from .load_store import VecStoreUnitStrideSetup, VecLoadUnitStrideSetup, VecLoadStoreBase
+from .register_file import VectorRegisterFile
 from .utilities import VecInstrVregInitializer, choose_randomly_but_not, no_overlap
 
 from riescue.compliance.config import Resource
@@ -236,11 +237,8 @@ class VecLoadUnitStrideSegmentedSetup(SegmentedComponent, VecLoadUnitStrideSetup
             #   The V0 mask register may have prevented updates to elements or entire registers from the set we expected.
             #   Here we determine for what we have actually received updates.
             """
+            vreg_file = VectorRegisterFile(self.vlen)
             for reg, value in vrs.items():
-                rem = (int(self.vlen * lmul_to_use_eowsh) // 4) - len(value)
-                if rem != 0:
-                    value = "".join("0" for digit in range((self.vlen // 4) - rem)) + value
-
                 distance_from_first = reg % int(max(1, lmul_to_use_eowsh))
                 first_reg = reg - distance_from_first
                 first_offset = distance_from_first * self.vlen
@@ -249,15 +247,9 @@ class VecLoadUnitStrideSegmentedSetup(SegmentedComponent, VecLoadUnitStrideSetup
                 if first_reg not in element_offsets_we_do_have:
                     element_offsets_we_do_have[first_reg] = dict()
 
-                for offset in range(first_offset, last_offset, vsew_to_use_eowsh):
-                    relative_offset = offset - first_offset
-                    first_slice_index = (len(value) * 4 - relative_offset - vsew_to_use_eowsh) // 4
-                    last_slice_index = (len(value) * 4 - relative_offset) // 4
-                    assert (last_slice_index - first_slice_index) == (
-                        vsew_to_use_eowsh // 4
-                    ), f"Slice index calculation error. Last: {last_slice_index}, First: {first_slice_index}, VSEW: {vsew_to_use_eowsh}"
-
-                    element_offsets_we_do_have[first_reg][offset] = self.sign_extend(int(value[first_slice_index:last_slice_index], 16), vsew_to_use_eowsh, 64)
+                vreg_file.load_hex(reg, value)
+                offsets = range(first_offset, last_offset, vsew_to_use_eowsh)
+                element_offsets_we_do_have[first_reg].update(zip(offsets, vreg_file.sign_extended_hex(reg, vsew_to_use_eowsh)))
 
             comparison_reg = self.get_random_reg(instr.reg_manager, "Int")
             vtype_reg = self.get_random_reg(instr.reg_manager, "Int")
@@ -626,11 +618,8 @@ class VecLoadStridedSegmentedSetup(SegmentedComponent, VecLoadComponent, VecUnit
             #   The V0 mask register may have prevented updates to elements or entire registers from the set we expected.
             #   Here we determine for what we have actually received updates.
             """
+            vreg_file = VectorRegisterFile(self.vlen)
             for reg, value in vrs.items():
-                rem = (int(self.vlen * lmul_to_use_eowsh) // 4) - len(value)
-                if rem != 0:
-                    value = "".join("0" for digit in range((self.vlen // 4) - rem)) + value
-
                 distance_from_first = reg % int(max(1, lmul_to_use_eowsh))
                 first_reg = reg - distance_from_first
                 first_offset = distance_from_first * self.vlen
@@ -639,15 +628,9 @@ class VecLoadStridedSegmentedSetup(SegmentedComponent, VecLoadComponent, VecUnit
                 if first_reg not in element_offsets_we_do_have:
                     element_offsets_we_do_have[first_reg] = dict()
 
-                for offset in range(first_offset, last_offset, vsew_to_use_eowsh):
-                    relative_offset = offset - first_offset
-                    first_slice_index = (len(value) * 4 - relative_offset - vsew_to_use_eowsh) // 4
-                    last_slice_index = (len(value) * 4 - relative_offset) // 4
-                    assert (last_slice_index - first_slice_index) == (
-                        vsew_to_use_eowsh // 4
-                    ), f"Slice index calculation error. Last: {last_slice_index}, First: {first_slice_index}, VSEW: {vsew_to_use_eowsh}"
-
-                    element_offsets_we_do_have[first_reg][offset] = self.sign_extend(int(value[first_slice_index:last_slice_index], 16), vsew_to_use_eowsh, 64)
+                vreg_file.load_hex(reg, value)
+                offsets = range(first_offset, last_offset, vsew_to_use_eowsh)
+                element_offsets_we_do_have[first_reg].update(zip(offsets, vreg_file.sign_extended_hex(reg, vsew_to_use_eowsh)))
 
             comparison_reg = self.get_random_reg(instr.reg_manager, "Int")
             vtype_reg = self.get_random_reg(instr.reg_manager, "Int")
@@ -965,11 +948,8 @@ class VecLoadIndexedUnorderedSegmentedSetup(SegmentedComponent, VecLoadStoreBase
             #   The V0 mask register may have prevented updates to elements or entire registers from the set we expected.
             #   Here we determine for what we have actually received updates.
             """
+            vreg_file = VectorRegisterFile(self.vlen)
             for reg, value in vrs.items():
-                rem = (int(self.vlen * lmul_to_use_eowsh) // 4) - len(value)
-                if rem != 0:
-                    value = "".join("0" for digit in range((self.vlen // 4) - rem)) + value
-
                 distance_from_first = reg % int(max(1, lmul_to_use_eowsh))
                 first_reg = reg - distance_from_first
                 first_offset = distance_from_first * self.vlen
@@ -978,15 +958,9 @@ class VecLoadIndexedUnorderedSegmentedSetup(SegmentedComponent, VecLoadStoreBase
                 if first_reg not in element_offsets_we_do_have:
                     element_offsets_we_do_have[first_reg] = dict()
 
-                for offset in range(first_offset, last_offset, vsew_to_use_eowsh):
-                    relative_offset = offset - first_offset
-                    first_slice_index = (len(value) * 4 - relative_offset - vsew_to_use_eowsh) // 4
-                    last_slice_index = (len(value) * 4 - relative_offset) // 4
-                    assert (last_slice_index - first_slice_index) == (
-                        vsew_to_use_eowsh // 4
-                    ), f"Slice index calculation error. Last: {last_slice_index}, First: {first_slice_index}, VSEW: {vsew_to_use_eowsh}"
-
-                    element_offsets_we_do_have[first_reg][offset] = self.sign_extend(int(value[first_slice_index:last_slice_index], 16), vsew_to_use_eowsh, 64)
+                vreg_file.load_hex(reg, value)
+                offsets = range(first_offset, last_offset, vsew_to_use_eowsh)
+                element_offsets_we_do_have[first_reg].update(zip(offsets, vreg_file.sign_extended_hex(reg, vsew_to_use_eowsh)))
 
             comparison_reg = self.get_random_reg(instr.reg_manager, "Int")
             working_vec_reg = work_vreg_name
@@ -1366,11 +1340,8 @@ class VecLoadWholeRegSetup(SegmentedComponent, VecLoadUnitStrideSetup):
             #   The V0 mask register may have prevented updates to elements or entire registers from the set we expected.
             #   Here we determine for what we have actually received updates.
             """
+            vreg_file = VectorRegisterFile(self.vlen)
             for reg, value in vrs.items():
-                rem = (int(self.vlen * lmul_to_use_eowsh) // 4) - len(value)
-                if rem != 0:
-                    value = "".join("0" for digit in range((self.vlen // 4) - rem)) + value
-
                 distance_from_first = reg % int(max(1, lmul_to_use_eowsh))
                 first_reg = reg - distance_from_first
                 first_offset = distance_from_first * self.vlen
@@ -1379,15 +1350,9 @@ class VecLoadWholeRegSetup(SegmentedComponent, VecLoadUnitStrideSetup):
                 if first_reg not in element_offsets_we_do_have:
                     element_offsets_we_do_have[first_reg] = dict()
 
-                for offset in range(first_offset, last_offset, vsew_to_use_eowsh):
-                    relative_offset = offset - first_offset
-                    first_slice_index = (len(value) * 4 - relative_offset - vsew_to_use_eowsh) // 4
-                    last_slice_index = (len(value) * 4 - relative_offset) // 4
-                    assert (last_slice_index - first_slice_index) == (
-                        vsew_to_use_eowsh // 4
-                    ), f"Slice index calculation error. Last: {last_slice_index}, First: {first_slice_index}, VSEW: {vsew_to_use_eowsh}"
-
-                    element_offsets_we_do_have[first_reg][offset] = self.sign_extend(int(value[first_slice_index:last_slice_index], 16), vsew_to_use_eowsh, 64)
+                vreg_file.load_hex(reg, value)
+                offsets = range(first_offset, last_offset, vsew_to_use_eowsh)
+                element_offsets_we_do_have[first_reg].update(zip(offsets, vreg_file.sign_extended_hex(reg, vsew_to_use_eowsh)))
 
             comparison_reg = self.get_random_reg(instr.reg_manager, "Int")
             working_vec_reg = work_vreg_name
@@ -1,260 +1,178 @@
 # SPDX-FileCopyrightText: © 2025 Tenstorrent AI ULC
 # SPDX-License-Identifier: Apache-2.0
 
-from collections import OrderedDict
+from bisect import bisect_right
+from typing import Callable, Optional
+
 from riescue.compliance.config import Resource
+from riescue.lib.rand import RandNum
+
+
+def twos_complement(value: int, num_bits: int) -> int:
+    "Sign-extend a ``num_bits`` wide value"
+    if value & (1 << (num_bits - 1)) > 0:
+        value = value - (1 << num_bits)
+
+    return value
+
+
+class ImmConstraint:
+    """
+    Legal values of an immediate operand, sampled directly from the legal set.
+
+    Raw field values are the multiples of ``1 << align`` in ``[0, 1 << width)``, less any excluded values.
+    Every legal value is equally likely.
+
+    :param width: Field width in bits
+    :param align: Number of low bits that are always zero
+    :param signed: Field is two's complement; sampled values are sign-extended
+    :param nonzero: Zero is not a legal value
+    :param max_value: Largest legal raw value, when less than the field allows
+    :param ranges: Inclusive ``(lo, hi)`` ranges of raw values, used instead of ``width``/``align``/``max_value``
+    """
+
+    def __init__(
+        self,
+        width: int = 0,
+        align: int = 0,
+        signed: bool = False,
+        nonzero: bool = False,
+        max_value: Optional[int] = None,
+        ranges: Optional[list[tuple[int, int]]] = None,
+    ):
+        self.width = width
+        self.signed = signed
+        if ranges is None:
+            self.step = 1 << align
+            hi = (1 << width) - self.step if max_value is None else max_value - max_value % self.step
+            ranges = [(self.step if nonzero else 0, hi)]
+        else:
+            self.step = 1
+            if nonzero:
+                ranges = [(max(lo, 1), hi) for lo, hi in ranges if hi >= 1]
+
+        # Start of each range and cumulative count of legal values, so a sample is one draw and a bisect
+        self.starts = [lo for lo, _ in ranges]
+        self.cumulative: list[int] = []
+        total = 0
+        for lo, hi in ranges:
+            total += (hi - lo) // self.step + 1
+            self.cumulative.append(total)
+
+    @property
+    def count(self) -> int:
+        "Number of legal values"
+        return self.cumulative[-1]
+
+    def sample(self, rng: RandNum) -> int:
+        "Return a legal value, sign-extended for signed fields"
+        n = rng.randrange(0, self.count)
+        i = bisect_right(self.cumulative, n)
+        value = self.starts[i] + (n - (self.cumulative[i - 1] if i else 0)) * self.step
+        return twos_complement(value, self.width) if self.signed else value
+
+
+# Data is organized by instruction name at the top level,
+# The next level is immediate operand name as it appears in the spec, according to its role in the instruction,
+# rather than as it might appear in third party interpretations of the spec.
+#
+# For example, for the instruction 'c.ldsp', rather than list a c_uimm9sp{hi, lo} and maybe the size of these fields,
+# instead a constraint for 'offset' for 'c.ldsp' is provided that produces a legal value for this operand at an assembly code
+# level.
+#
+# This provides an alternative to the ambiguous, ad-hoc and manual process of explicitly synthesizing constraints in the
+# instruction setup code.
+IMM_CONSTRAINTS: dict[str, dict[str, ImmConstraint]] = {
+    "c.lwsp": {"offset": ImmConstraint(width=8, align=2)},
+    "c.ldsp": {"offset": ImmConstraint(width=9, align=3)},
+    "c.fldsp": {"offset": ImmConstraint(width=9, align=3)},
+    "c.swsp": {"offset": ImmConstraint(width=8, align=2)},
+    "c.sdsp": {"offset": ImmConstraint(width=9, align=3)},
+    "c.fsdsp": {"offset": ImmConstraint(width=9, align=3)},
+    "c.lw": {"offset": ImmConstraint(width=7, align=2)},
+    "c.ld": {"offset": ImmConstraint(width=8, align=3)},
+    "c.fld": {"offset": ImmConstraint(width=8, align=3)},
+    "c.sw": {"offset": ImmConstraint(width=7, align=2)},
+    "c.sd": {"offset": ImmConstraint(width=8, align=3)},
+    "c.fsd": {"offset": ImmConstraint(width=8, align=3)},
+    # FIXME Not actually used yet, needs to be re-evaluated
+    "c.j": {"offset": ImmConstraint(width=12, align=1, signed=True, nonzero=True)},
+    "c.beqz": {"offset": ImmConstraint(width=9, align=1, signed=True, nonzero=True)},
+    "c.bnez": {"offset": ImmConstraint(width=9, align=1, signed=True, nonzero=True)},
+    "c.li": {"imm": ImmConstraint(width=6, signed=True)},
+    "c.lui": {"nzimm": ImmConstraint(ranges=[(0xFFFE0, 0xFFFFF), (0x1, 0x1F)])},
+    "c.addi": {"nzimm": ImmConstraint(width=6, signed=True, nonzero=True)},
+    "c.addiw": {"imm": ImmConstraint(width=6, signed=True)},
+    "c.addi16sp": {"nzimm": ImmConstraint(width=10, align=4, signed=True, nonzero=True)},
+    "c.addi4spn": {"nzuimm": ImmConstraint(width=10, align=2, nonzero=True)},
+    "c.slli": {"shamt": ImmConstraint(width=6, nonzero=True)},
+    "c.srli": {"shamt": ImmConstraint(width=6, nonzero=True)},
+    "c.srai": {"shamt": ImmConstraint(width=6, nonzero=True)},
+    "c.andi": {"imm": ImmConstraint(width=6, signed=True)},
+    # FIXME Preventing negative offsets
+    "fsw": {"imm": ImmConstraint(width=11, max_value=0x800 - 9)},
+    "flw": {"imm": ImmConstraint(width=11, max_value=0x800 - 9)},
+    "fsd": {"imm": ImmConstraint(width=11, max_value=0x800 - 9)},
+    "fld": {"imm": ImmConstraint(width=11, max_value=0x800 - 9)},
+    "flh": {"imm": ImmConstraint(width=11, max_value=0x800 - 9)},
+    "fsh": {"imm": ImmConstraint(width=11, max_value=0x800 - 9)},
+}
+
+# Compressed instruction formats
+IMM_FORMATS: dict[str, str] = {
+    "c.lwsp": "CI",
+    "c.ldsp": "CI",
+    "c.fldsp": "CI",
+    "c.swsp": "CSS",
+    "c.sdsp": "CSS",
+    "c.fsdsp": "CSS",
+    "c.lw": "CL",
+    "c.ld": "CL",
+    "c.fld": "CL",
+    "c.sw": "CS",
+    "c.sd": "CS",
+    "c.fsd": "CS",
+    "c.j": "CJ",
+    "c.beqz": "CB",
+    "c.bnez": "CB",
+    "c.li": "CI",
+    "c.lui": "CI",
+    "c.addi": "CI",
+    "c.addiw": "CI",
+    "c.addi16sp": "CI",
+    "c.addi4spn": "CIW",
+    "c.slli": "CI",
+    "c.srli": "CB",
+    "c.srai": "CB",
+    "c.andi": "CB",
+}
 
 
 class imm_constraints:
-
-    def choose_from_ranges(self, acceptable_ranges=[]):
-        if len(acceptable_ranges) == 1:
-            return self.resource_db.rng.randrange(acceptable_ranges[0][0], acceptable_ranges[0][1] + 1)
-
-        weights = dict()
-
-        for a_range in acceptable_ranges:
-            weights[a_range] = a_range[1] - a_range[0]
-
-        kv_list = [[key, value] for key, value in weights.items()]
-
-        for index in range(1, len(kv_list)):
-            kv_list[index][1] += kv_list[index - 1][1]
-
-        randnum = self.resource_db.rng.randrange(0, kv_list[-1][1])
-
-        for item in kv_list:
-            if randnum < item[1]:
-                return self.resource_db.rng.randrange(item[0][0], item[0][1] + 1)
-
-    def twos_complement(self, value, num_bits):
-        if value & (1 << (num_bits - 1)) > 0:
-            value = value - (1 << num_bits)
-
-        return value
-
-    def get_constraints(self, instruction_name):
-        return self.data.get(instruction_name, None)
-
-    def get_constraint(self, instruction_name, field_name):
-        instr_dict = self.data.get(instruction_name, None)
-        if instr_dict:
-            field_dict = instr_dict.get(field_name, None)
-
-            if field_dict:
-                return field_dict["value_generator"]
-
-        return None
-
-    def get_sole_value_generator(self, instruction_name):
-        instr_dict = self.data.get(instruction_name, None)
-        if instr_dict:
-            for key, value in instr_dict.items():
-                if isinstance(value, OrderedDict):
-                    for key, v2 in value.items():
-                        if key == "value_generator":
-                            return v2
-
-        return None
-
-    def call_until_nonzero(self, function):
-        result = function()
-
-        while result == 0:
-            result = function()
-
-        if result == -0 or result == 0:
-            assert False
-
-        return result
-
-    # Calls value function until constraint function is satisfied
-    def call_until_satisfied(self, value_function, constraint_function):
-        result = value_function()
-
-        while constraint_function(result) == 0:
-            result = value_function()
-
-        return result
-
-    def call_until_nonnegative(self, function, bits):
-        value = function()
-        result = self.twos_complement(value, bits)
-
-        while result < 0:
-            value = function()
-            result = self.twos_complement(value, bits)
-
-        if result == -0 or result == 0:
-            assert False
-
-        return value
+    """
+    Immediate value generators for the instructions in :data:`IMM_CONSTRAINTS`, drawing from the ``resource_db`` random generator.
+    """
 
     def __init__(self, resource_db: Resource):
         self.resource_db = resource_db
-        self.data = OrderedDict()
-        self.bits = self.resource_db.rng.get_rand_bits
-
-        """
-        #
-        #   Data is organized by instruction name at the top level,
-        #   The next level is immediate operand name as it appears in the spec, according to its role in the instruction,
-        #   rather than as it might appear in third party interpretations of the spec.
-        #
-        #   For example, for the instruction 'c.ldsp', rather than list a c_uimm9sp{hi, lo} and maybe the size of these fields,
-        #   instead a generator for 'offset' for 'c.ldsp' is provided that produces a legal value for this operand at an assembly code
-        #   level.
-        #
-        #   This provides an alternative to the ambiguous, ad-hoc and manual process of explicitly synthesizing constraints in the
-        #   instruction setup code.
-        #
-        """
-        self.data["c.lwsp"] = OrderedDict()
-        self.data["c.lwsp"]["offset"] = OrderedDict()
-        self.data["c.lwsp"]["format"] = "CI"
-        self.data["c.lwsp"]["offset"]["value_generator"] = lambda: self.bits(8) & 0b11111100
-
-        self.data["c.ldsp"] = OrderedDict()
-        self.data["c.ldsp"]["offset"] = OrderedDict()
-        self.data["c.ldsp"]["format"] = "CI"
-        self.data["c.ldsp"]["offset"]["value_generator"] = lambda: self.bits(9) & 0b111111000
-
-        self.data["c.fldsp"] = OrderedDict()
-        self.data["c.fldsp"]["offset"] = OrderedDict()
-        self.data["c.fldsp"]["format"] = "CI"
-        self.data["c.fldsp"]["offset"]["value_generator"] = lambda: self.bits(9) & 0b111111000
-
-        self.data["c.swsp"] = OrderedDict()
-        self.data["c.swsp"]["offset"] = OrderedDict()
-        self.data["c.swsp"]["format"] = "CSS"
-        self.data["c.swsp"]["offset"]["value_generator"] = lambda: self.bits(8) & 0b11111100
-
-        self.data["c.sdsp"] = OrderedDict()
-        self.data["c.sdsp"]["offset"] = OrderedDict()
-        self.data["c.sdsp"]["format"] = "CSS"
-        self.data["c.sdsp"]["offset"]["value_generator"] = lambda: self.bits(9) & 0b111111000
-
-        self.data["c.fsdsp"] = OrderedDict()
-        self.data["c.fsdsp"]["offset"] = OrderedDict()
-        self.data["c.fsdsp"]["format"] = "CSS"
-        self.data["c.fsdsp"]["offset"]["value_generator"] = lambda: self.bits(9) & 0b111111000
-
-        self.data["c.lw"] = OrderedDict()
-        self.data["c.lw"]["offset"] = OrderedDict()
-        self.data["c.lw"]["format"] = "CL"
-        self.data["c.lw"]["offset"]["value_generator"] = lambda: self.bits(7) & 0b1111100
-
-        self.data["c.ld"] = OrderedDict()
-        self.data["c.ld"]["offset"] = OrderedDict()
-        self.data["c.ld"]["format"] = "CL"
-        self.data["c.ld"]["offset"]["value_generator"] = lambda: self.bits(8) & 0b11111000
-
-        self.data["c.fld"] = OrderedDict()
-        self.data["c.fld"]["offset"] = OrderedDict()
-        self.data["c.fld"]["format"] = "CL"
-        self.data["c.fld"]["offset"]["value_generator"] = lambda: self.bits(8) & 0b11111000
-
-        self.data["c.sw"] = OrderedDict()
-        self.data["c.sw"]["offset"] = OrderedDict()
-        self.data["c.sw"]["format"] = "CS"
-        self.data["c.sw"]["offset"]["value_generator"] = lambda: self.bits(7) & 0b1111100
-
-        self.data["c.sd"] = OrderedDict()
-        self.data["c.sd"]["offset"] = OrderedDict()
-        self.data["c.sd"]["format"] = "CS"
-        self.data["c.sd"]["offset"]["value_generator"] = lambda: self.bits(8) & 0b11111000
-
-        self.data["c.fsd"] = OrderedDict()
-        self.data["c.fsd"]["offset"] = OrderedDict()
-        self.data["c.fsd"]["format"] = "CS"
-        self.data["c.fsd"]["offset"]["value_generator"] = lambda: self.bits(8) & 0b11111000
-
-        # FIXME Not actually used yet, needs to be re-evaluated
-        self.data["c.j"] = OrderedDict()
-        self.data["c.j"]["offset"] = OrderedDict()
-        self.data["c.j"]["format"] = "CJ"
-        self.data["c.j"]["offset"]["value_generator"] = lambda: self.call_until_nonzero(lambda: self.twos_complement(self.bits(12) & 0b111111111110, 12))
 
-        self.data["c.beqz"] = OrderedDict()
-        self.data["c.beqz"]["offset"] = OrderedDict()
-        self.data["c.beqz"]["format"] = "CB"
-        self.data["c.beqz"]["offset"]["value_generator"] = lambda: self.call_until_nonzero(lambda: self.twos_complement(self.bits(9) & 0b111111110, 9))
-
-        self.data["c.bnez"] = OrderedDict()
-        self.data["c.bnez"]["offset"] = OrderedDict()
-        self.data["c.bnez"]["format"] = "CB"
-        self.data["c.bnez"]["offset"]["value_generator"] = lambda: self.call_until_nonzero(lambda: self.twos_complement(self.bits(9) & 0b111111110, 9))
-
-        self.data["c.li"] = OrderedDict()
-        self.data["c.li"]["imm"] = OrderedDict()
-        self.data["c.li"]["format"] = "CI"
-        self.data["c.li"]["imm"]["value_generator"] = lambda: self.twos_complement(self.bits(6), 6)
-
-        self.data["c.lui"] = OrderedDict()
-        self.data["c.lui"]["nzimm"] = OrderedDict()
-        self.data["c.lui"]["format"] = "CI"
-        self.data["c.lui"]["nzimm"]["value_generator"] = lambda: self.choose_from_ranges([(0xFFFE0, 0xFFFFF), (0x1, 0x1F)])
-
-        self.data["c.addi"] = OrderedDict()
-        self.data["c.addi"]["nzimm"] = OrderedDict()
-        self.data["c.addi"]["format"] = "CI"
-        self.data["c.addi"]["nzimm"]["value_generator"] = lambda: self.call_until_nonzero(lambda: self.twos_complement(self.bits(6), 6))
-
-        self.data["c.addiw"] = OrderedDict()
-        self.data["c.addiw"]["imm"] = OrderedDict()
-        self.data["c.addiw"]["format"] = "CI"
-        self.data["c.addiw"]["imm"]["value_generator"] = lambda: self.twos_complement(self.bits(6), 6)
-
-        self.data["c.addi16sp"] = OrderedDict()
-        self.data["c.addi16sp"]["nzimm"] = OrderedDict()
-        self.data["c.addi16sp"]["format"] = "CI"
-        self.data["c.addi16sp"]["nzimm"]["value_generator"] = lambda: self.call_until_nonzero(lambda: self.twos_complement(self.bits(10) & 0b1111110000, 10))
-
-        self.data["c.addi4spn"] = OrderedDict()
-        self.data["c.addi4spn"]["nzuimm"] = OrderedDict()
-        self.data["c.addi4spn"]["format"] = "CIW"
-        self.data["c.addi4spn"]["nzuimm"]["value_generator"] = lambda: self.call_until_nonzero(lambda: self.bits(10) & 0b1111111100)
-
-        self.data["c.slli"] = OrderedDict()
-        self.data["c.slli"]["shamt"] = OrderedDict()
-        self.data["c.slli"]["format"] = "CI"
-        self.data["c.slli"]["shamt"]["value_generator"] = lambda: self.call_until_nonzero(lambda: self.bits(6))
-
-        self.data["c.srli"] = OrderedDict()
-        self.data["c.srli"]["shamt"] = OrderedDict()
-        self.data["c.srli"]["format"] = "CB"
-        self.data["c.srli"]["shamt"]["value_generator"] = lambda: self.call_until_nonzero(lambda: self.bits(6))
-
-        self.data["c.srai"] = OrderedDict()
-        self.data["c.srai"]["shamt"] = OrderedDict()
-        self.data["c.srai"]["format"] = "CB"
-        self.data["c.srai"]["shamt"]["value_generator"] = lambda: self.call_until_nonzero(lambda: self.bits(6))
-
-        self.data["c.andi"] = OrderedDict()
-        self.data["c.andi"]["imm"] = OrderedDict()
-        self.data["c.andi"]["format"] = "CB"
-        self.data["c.andi"]["imm"]["value_generator"] = lambda: self.twos_complement(self.bits(6), 6)
-
-        self.data["fsw"] = OrderedDict()
-        self.data["fsw"]["imm"] = OrderedDict()
-        self.data["fsw"]["imm"]["value_generator"] = lambda: self.call_until_satisfied(lambda: self.bits(11), lambda x: x < (0x800 - 8))  # FIXME Preventing negative offsets
+    def twos_complement(self, value, num_bits):
+        return twos_complement(value, num_bits)
 
-        self.data["flw"] = OrderedDict()
-        self.data["flw"]["imm"] = OrderedDict()
-        self.data["flw"]["imm"]["value_generator"] = lambda: self.call_until_satisfied(lambda: self.bits(11), lambda x: x < (0x800 - 8))  # FIXME Preventing negative offsets
+    def get_constraints(self, instruction_name) -> Optional[dict[str, ImmConstraint]]:
+        return IMM_CONSTRAINTS.get(instruction_name, None)
 
-        self.data["fsd"] = OrderedDict()
-        self.data["fsd"]["imm"] = OrderedDict()
-        self.data["fsd"]["imm"]["value_generator"] = lambda: self.call_until_satisfied(lambda: self.bits(11), lambda x: x < (0x800 - 8))  # FIXME Preventing negative offsets
+    def get_format(self, instruction_name) -> Optional[str]:
+        return IMM_FORMATS.get(instruction_name, None)
 
-        self.data["fld"] = OrderedDict()
-        self.data["fld"]["imm"] = OrderedDict()
-        self.data["fld"]["imm"]["value_generator"] = lambda: self.call_until_satisfied(lambda: self.bits(11), lambda x: x < (0x800 - 8))  # FIXME Preventing negative offsets
+    def get_constraint(self, instruction_name, field_name) -> Optional[Callable[[], int]]:
+        constraint = IMM_CONSTRAINTS.get(instruction_name, {}).get(field_name, None)
+        if constraint is None:
+            return None
+        return lambda: constraint.sample(self.resource_db.rng)
 
-        self.data["flh"] = OrderedDict()
-        self.data["flh"]["imm"] = OrderedDict()
-        self.data["flh"]["imm"]["value_generator"] = lambda: self.call_until_satisfied(lambda: self.bits(11), lambda x: x < (0x800 - 8))  # FIXME Preventing negative offsets
+    def get_sole_value_generator(self, instruction_name) -> Optional[Callable[[], int]]:
+        for field_name in IMM_CONSTRAINTS.get(instruction_name, {}):
+            return self.get_constraint(instruction_name, field_name)
 
-        self.data["fsh"] = OrderedDict()
-        self.data["fsh"]["imm"] = OrderedDict()
-        self.data["fsh"]["imm"]["value_generator"] = lambda: self.call_until_satisfied(lambda: self.bits(11), lambda x: x < (0x800 - 8))  # FIXME Preventing negative offsets
+        return None
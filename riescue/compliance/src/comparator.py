@@ -2,10 +2,43 @@
 # SPDX-License-Identifier: Apache-2.0
 
 
+import csv
+import logging
+import re
+from dataclasses import dataclass
+from itertools import zip_longest
+from pathlib import Path
+from typing import Iterable, Optional, Union
+
 from riescue.compliance.src.riscv_dv.spike_log_to_trace_csv import process_spike_sim_log
+from riescue.compliance.src.riscv_dv.whisper_log_to_trace_csv import process_whisper_sim_log
 from riescue.compliance.config import Resource
-import re
-import csv
+
+log = logging.getLogger(__name__)
+
+# Label definition line, e.g. ``0000000080000000 <label>:``
+_LABEL_RE = re.compile(r"([0-9a-fA-F]+) \<(\w+)\>:")
+
+
+@dataclass
+class TraceMismatch:
+    """
+    Difference between the Spike and Whisper traces at one instruction.
+
+    :param row: Row of the trace CSVs, excluding the header
+    :param pc: Program counter, from the Spike trace unless it ended first
+    :param label: Testcase instruction label at ``pc``; empty if ``pc`` isn't a testcase instruction
+    :param field: Trace CSV column that differs. ``pc`` means the traces diverged and the rest weren't compared
+    :param spike: Spike value; empty if the Spike trace ended first
+    :param whisper: Whisper value; empty if the Whisper trace ended first
+    """
+
+    row: int
+    pc: str
+    label: str
+    field: str
+    spike: str
+    whisper: str
 
 
 class Comparator:
@@ -14,42 +47,142 @@ class Comparator:
         self.resource_db = resource_db
         self.spike_state_tracker = dict()
         self.whisper_state_tracker = dict()
+        self.mismatches: list[TraceMismatch] = []
+
+    def compare_logs(self, testcase, processed: Iterable[str] = ()):
+        """
+        Compare the Spike and Whisper traces of ``testcase``.
 
-    def compare_logs(self, testcase):
+        :param processed: ISS whose logs were already processed with :meth:`process_log`, e.g. as each ISS run finished.
+            Otherwise the Spike log is converted here and the Whisper trace CSV is expected to exist.
+        """
+        processed = set(processed)
         spike_log, spike_csv_log = testcase.get_spike_logs()
-        process_spike_sim_log(spike_log, spike_csv_log)
         whisper_log, whisper_csv_log = testcase.get_whisper_logs()
-        self.process_testcase(testcase, spike_csv_log, iss="spike")
-        self.process_testcase(testcase, whisper_csv_log, iss="whisper")
+        label_index = self.label_index(testcase.disassembly)
+        if "spike" not in processed:
+            process_spike_sim_log(spike_log, spike_csv_log)
+            self.process_testcase(testcase, spike_csv_log, iss="spike", label_index=label_index)
+        if "whisper" not in processed:
+            self.process_testcase(testcase, whisper_csv_log, iss="whisper", label_index=label_index)
         print("WHISPER")
         print(self.whisper_state_tracker)
         print("SPIKE")
         print(self.spike_state_tracker)
+        mismatches = self.compare_traces(testcase, spike_csv_log, whisper_csv_log, label_index=label_index)
+        for mismatch in mismatches:
+            log.warning(f"{mismatch.label or mismatch.pc}: {mismatch.field} differs, spike: {mismatch.spike!r}, whisper: {mismatch.whisper!r}")
+        self.mismatches.extend(mismatches)
 
-    def process_testcase(self, testcase, log, iss):
+    def process_log(self, testcase, iss: str) -> Path:
+        """
+        Convert the ``iss`` log of ``testcase`` to a trace CSV and record the state of every testcase instruction.
+        Only touches the state of ``iss``, so the logs of different ISS can be processed concurrently as each run finishes.
+
+        :param iss: ``spike`` or ``whisper``
+        :return: Path to the trace CSV
+        """
+        if iss == "spike":
+            iss_log, csv_log = testcase.get_spike_logs()
+            process_spike_sim_log(iss_log, csv_log)
+        elif iss == "whisper":
+            iss_log, csv_log = testcase.get_whisper_logs()
+            process_whisper_sim_log(iss_log, csv_log)
+        else:
+            raise ValueError(f"Invalid ISS: {iss}")
+        self.process_testcase(testcase, csv_log, iss=iss)
+        return csv_log
+
+    def process_testcase(self, testcase, log, iss, label_index: Optional[dict[str, str]] = None):
+        """
+        Record the first trace row of every testcase instruction.
+
+        Disassembly and trace are each read once, see :meth:`label_index` and :meth:`state_index`.
+
+        :param label_index: Label index of ``testcase.disassembly`` if already built
+        """
+        if label_index is None:
+            label_index = self.label_index(testcase.disassembly)
+        state_index = self.state_index(log)
         for instr in testcase.instrs:
-            addr = self.search_label(instr.label, testcase.disassembly)
-            modified_arch_state = self.extract_state(addr, log)
+            addr = label_index.get(instr.label)
+            modified_arch_state = state_index.get(addr) if addr else None
             if iss == "spike":
                 self.spike_state_tracker[instr.label] = modified_arch_state
             else:
                 self.whisper_state_tracker[instr.label] = modified_arch_state
 
-    def search_label(self, label, disassembly_file):
+    def label_index(self, disassembly_file: Union[str, Path]) -> dict[str, str]:
+        """
+        Map each label defined in the disassembly to its address, without leading zeros.
+        References to a label, e.g. a jump that comes before the label, are skipped.
+        """
+        index: dict[str, str] = {}
         with open(disassembly_file, "r") as dis_file:
-            lines = dis_file.readlines()
-            for line in lines:
-                label_dis = re.findall(r"\<(\w+)\>", line)
-                if len(label_dis):
-                    if label == label_dis[0]:
-                        return line.split()[0]
+            for line in dis_file:
+                label_dis = _LABEL_RE.search(line)
+                if label_dis is not None:
+                    index.setdefault(label_dis.group(2), label_dis.group(1).lstrip("0"))
+        return index
+
+    def state_index(self, csv_log: Union[str, Path]) -> dict[str, list[str]]:
+        """
+        Map each pc in a trace CSV, without leading zeros, to the first row that executed it.
+        """
+        index: dict[str, list[str]] = {}
+        with open(csv_log) as log_file:
+            for line in csv.reader(log_file):
+                if line:
+                    index.setdefault(line[0].lstrip("0"), line)
+        return index
+
+    def search_label(self, label, disassembly_file):
+        "Address of a single label. Use :meth:`label_index` to look up many"
+        return self.label_index(disassembly_file).get(label)
 
     def extract_state(self, addr, csv_log):
-        with open(csv_log) as log:
-            reader = csv.reader(log)
-            for line in reader:
-                # print(line)
-                # FIXME: Sometimes add was None, is that expected?
-                if addr:
-                    if addr.lstrip("0") in line[0]:
-                        return line
+        "First trace row at a single address. Use :meth:`state_index` to look up many"
+        # FIXME: Sometimes add was None, is that expected?
+        if not addr:
+            return None
+        return self.state_index(csv_log).get(addr.lstrip("0").rstrip(":"))
+
+    def compare_traces(
+        self,
+        testcase,
+        spike_csv_log: Union[str, Path],
+        whisper_csv_log: Union[str, Path],
+        fields: tuple[str, ...] = ("gpr",),
+        label_index: Optional[dict[str, str]] = None,
+    ) -> list[TraceMismatch]:
+        """
+        Walk both trace CSVs together and report where they differ.
+
+        Rows are compared in order. ``fields`` are compared for rows executing a testcase instruction.
+        The walk stops at the first row where the pcs differ, since the traces are no longer aligned after that.
+
+        :param testcase: Testcase the traces were run from
+        :param fields: Trace CSV columns to compare at testcase instructions
+        :param label_index: Label index of ``testcase.disassembly`` if already built
+        :return: Mismatches in trace order
+        """
+        if label_index is None:
+            label_index = self.label_index(testcase.disassembly)
+        addr_to_label = {label_index[instr.label]: instr.label for instr in testcase.instrs if instr.label in label_index}
+
+        mismatches: list[TraceMismatch] = []
+        with open(spike_csv_log) as spike_file, open(whisper_csv_log) as whisper_file:
+            for row, (spike, whisper) in enumerate(zip_longest(csv.DictReader(spike_file), csv.DictReader(whisper_file))):
+                spike_pc = spike["pc"].lstrip("0") if spike is not None else ""
+                whisper_pc = whisper["pc"].lstrip("0") if whisper is not None else ""
+                if spike is None or whisper is None or spike_pc != whisper_pc:
+                    pc = spike_pc or whisper_pc
+                    mismatches.append(TraceMismatch(row, pc, addr_to_label.get(pc, ""), "pc", spike_pc, whisper_pc))
+                    break
+                label = addr_to_label.get(spike_pc)
+                if label is None:
+                    continue
+                for field in fields:
+                    if spike[field] != whisper[field]:
+                        mismatches.append(TraceMismatch(row, spike_pc, label, field, spike[field], whisper[field]))
+        return mismatches
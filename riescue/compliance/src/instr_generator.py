@@ -3,8 +3,14 @@
 
 # pyright: strict
 
+import io
 import logging
-from typing import Sequence
+import multiprocessing
+import pickle
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from itertools import islice
+from typing import Any, Mapping, Optional, Sequence
 
 from riescue.compliance.config import Resource
 from riescue.compliance.lib.config_parser import ConfigParser
@@ -13,6 +19,35 @@ from riescue.compliance.lib.riscv_instrs.base import InstrBase
 
 log = logging.getLogger(__name__)
 
+# Instructions set up by the process pool. Set before the pool forks so workers inherit them, see :py:meth:`InstrGenerator._setup_in_parallel`
+_setup_order: list[InstrBase] = []
+_shared_objects: dict[int, Any] = {}
+_SETUP_CHUNK_SIZE = 64  #: Most instructions a worker sets up per task
+
+
+class _SharedPickler(pickle.Pickler):
+    "Pickles objects in ``_shared_objects`` by ``id()``. Forked workers have the same objects at the same ids"
+
+    def persistent_id(self, obj: Any) -> Optional[int]:
+        return id(obj) if id(obj) in _shared_objects else None
+
+
+class _SharedUnpickler(pickle.Unpickler):
+    def persistent_load(self, pid: Any) -> Any:
+        return _shared_objects[pid]
+
+
+def _setup_chunk(start: int, stop: int) -> bytes:
+    """
+    Process pool worker. Sets up ``_setup_order[start:stop]`` and returns their pickled attributes.
+    """
+    instructions = _setup_order[start:stop]
+    for instruction in instructions:
+        InstrGenerator.setup_instruction(instruction)
+    buffer = io.BytesIO()
+    _SharedPickler(buffer).dump([vars(instruction) for instruction in instructions])
+    return buffer.getvalue()
+
 
 class InstrGenerator:
     """
@@ -24,6 +59,9 @@ class InstrGenerator:
     Instantiates each instruction class and generates the setup code.
     Stops when out of instructions objects or the total line count of the setup code exceeds the Resource.max_instr_per_file limit.
 
+    When ``Resource.setup_jobs`` is set, each instruction is randomized from its own ``RandNum`` sub-stream keyed by its label,
+    so setup can run on ``setup_jobs`` processes and the output only depends on the seed, not on the number of processes.
+
     :param resource_db: Resource configuration database containing test parameters
     """
 
@@ -34,9 +72,12 @@ class InstrGenerator:
         self._lines_so_far = 0  #: Lines of assembly generated. Reset when :py:meth:`generate_instructions_assembly` is called.
         self._instr_instances: dict[str, InstrBase] = {}  #: Dictionary of instruction instances by label
         self._repeat_count = resource_db.rpt_cnt
+        self._repeats: Optional[Mapping[str, Sequence[int]]] = None  #: Repeat indices per instruction name. Set by :py:meth:`generate_instructions`
+        self._setup_jobs = resource_db.setup_jobs
+        self._fpgen_on = resource_db.fpgen_on
         self.rng = resource_db.rng
 
-    def generate_instructions(self, instruction_classes: Sequence[type[InstrBase]]) -> dict[str, InstrBase]:
+    def generate_instructions(self, instruction_classes: Sequence[type[InstrBase]], repeats: Optional[Mapping[str, Sequence[int]]] = None) -> dict[str, InstrBase]:
         """
         Instantiates ``InstrBase`` objects with Configurations for ``Resource.rpt_cnt`` times.
         Calls :py:meth:`InstrBase.randomize` and :py:meth:`InstrBase.pre_setup` for each instruction, generating intial assembly.
@@ -45,19 +86,25 @@ class InstrGenerator:
         Bails early if line limits exceeded.
 
         :param instruction_classes: Dictionary mapping instruction names to instruction classes
+        :param repeats: Repeat indices to generate for each instruction name, e.g. the share of a bringup shard. Instructions without repeats are skipped. Defaults to all ``Resource.rpt_cnt`` repeats
         """
 
         self._lines_so_far = 0
         self._instr_instances: dict[str, InstrBase] = {}
-        shuffled_instruction_classes: list[type[InstrBase]] = list(instruction_classes)
+        self._repeats = repeats
+        shuffled_instruction_classes: list[type[InstrBase]] = [instruction_class for instruction_class in instruction_classes if self._repeat_indices(instruction_class)]
 
         self.rng.shuffle(shuffled_instruction_classes)  # Shuffle
+        if self._setup_jobs is not None:
+            self._generate_from_substreams(self._setup_order(shuffled_instruction_classes))
+            return self._instr_instances
+
         remaining_instruction_objects: list[InstrBase] = []
 
         # Generate all the unelaborated instruction objects one set of configurations at a time, but start generating
         # code and keeping track of the line count so we have a chance to bail early.
         for instruction_class in shuffled_instruction_classes:
-            for rpt in range(self._repeat_count):
+            for rpt in self._repeat_indices(instruction_class):
                 instruction_objects = self._config_manager.generate_instruction_objects(instruction_class, rpt)
                 self.rng.shuffle(instruction_objects)  # Shuffle here so we dont bias towards the last configuration
                 if len(instruction_objects) > 0:
@@ -81,6 +128,12 @@ class InstrGenerator:
                 return self._instr_instances
         return self._instr_instances
 
+    def _repeat_indices(self, instruction_class: type[InstrBase]) -> Sequence[int]:
+        if self._repeats is None:
+            return range(self._repeat_count)
+        mnemonic: str = getattr(instruction_class, "name")  # class attribute set by InstrBuilder.build_dynamic_classes
+        return self._repeats.get(mnemonic, ())
+
     def _generate_and_update(self, instruction: InstrBase):
         """
         Randomizes and sets up instruction classes.
@@ -91,9 +144,93 @@ class InstrGenerator:
         # Generate code
         instruction.randomize()
         instruction.pre_setup()
+        return self._update(instruction)
+
+    def _update(self, instruction: InstrBase) -> bool:
+        """
+        Adds a set up instruction to the instruction instance dictionary, unless the line count exceeds the limit.
+        """
         self._lines_so_far += len(instruction.get_pre_setup())
         if self._lines_so_far > self._max_instruction_lines:
             return False
         self._instr_instances[instruction.label] = instruction
         log.debug("Added " + instruction.label + " instruction to instr_instances")
         return True
+
+    def _setup_order(self, shuffled_instruction_classes: list[type[InstrBase]]) -> list[InstrBase]:
+        """
+        Instantiates instructions in the order :py:meth:`generate_instructions` sets them up: one instruction per type first, then the remaining instructions shuffled.
+        """
+        order: list[InstrBase] = []
+        remaining_instruction_objects: list[InstrBase] = []
+        for instruction_class in shuffled_instruction_classes:
+            for rpt in self._repeat_indices(instruction_class):
+                instruction_objects = self._config_manager.generate_instruction_objects(instruction_class, rpt)
+                self.rng.shuffle(instruction_objects)
+                remaining_instruction_objects.extend(instruction_objects)
+            if len(remaining_instruction_objects) == 0:
+                return order
+            order.append(remaining_instruction_objects.pop())
+        self.rng.shuffle(remaining_instruction_objects)
+        return order + remaining_instruction_objects
+
+    @staticmethod
+    def setup_instruction(instruction: InstrBase) -> None:
+        """
+        Randomizes and sets up an instruction from the ``RandNum`` sub-stream keyed by its label.
+        """
+        with instruction.resource_db.rng.substream(instruction.label):
+            instruction.randomize()
+            instruction.pre_setup()
+
+    def _generate_from_substreams(self, order: list[InstrBase]) -> None:
+        """
+        Sets up instructions in ``order`` until the line limit is exceeded.
+        Uses a process pool when ``setup_jobs`` is greater than 1 and processes can be forked.
+
+        FPgen draws from its own generator rather than ``RandNum``, so FPgen runs are always set up serially to stay reproducible.
+        """
+        if self._setup_jobs is not None and self._setup_jobs > 1 and not self._fpgen_on and "fork" in multiprocessing.get_all_start_methods():
+            self._setup_in_parallel(order, self._setup_jobs)
+            return
+        for instruction in order:
+            self.setup_instruction(instruction)
+            if not self._update(instruction):
+                return
+
+    def _setup_in_parallel(self, order: list[InstrBase], jobs: int) -> None:
+        """
+        Sets up chunks of ``order`` on forked worker processes, merging them back in order.
+
+        Workers return the attributes of their instructions pickled, with objects that existed before the fork (``Resource``, configurations, instructions)
+        pickled by reference so they resolve to the parent's objects. Chunks are merged in order, so the line limit cuts off at the same instruction as a serial run.
+        Only a few chunks per worker are queued at a time, so little work is wasted past the cutoff.
+        """
+        global _setup_order, _shared_objects
+        resource_db = order[0].resource_db if order else None
+        shared: list[Any] = [resource_db, self._config_manager, *vars(resource_db).values()] if resource_db is not None else []
+        for instruction in order:
+            shared.extend((instruction, type(instruction), instruction.config, instruction.test_config))
+        _setup_order = order
+        _shared_objects = {id(obj): obj for obj in shared if obj is not None}
+
+        chunk_size = max(1, min(_SETUP_CHUNK_SIZE, len(order) // (jobs * 4)))
+        starts = iter(range(0, len(order), chunk_size))
+        executor = ProcessPoolExecutor(max_workers=jobs, mp_context=multiprocessing.get_context("fork"))
+        try:
+            # Keep a few chunks per worker in flight, so little work is wasted once the line limit is reached
+            in_flight: deque[tuple[int, Future[bytes]]] = deque((start, executor.submit(_setup_chunk, start, start + chunk_size)) for start in islice(starts, jobs * 2))
+            while in_flight:
+                start, chunk = in_flight.popleft()
+                next_start = next(starts, None)
+                if next_start is not None:
+                    in_flight.append((next_start, executor.submit(_setup_chunk, next_start, next_start + chunk_size)))
+                states: list[dict[str, Any]] = _SharedUnpickler(io.BytesIO(chunk.result())).load()
+                for instruction, state in zip(order[start : start + chunk_size], states):
+                    vars(instruction).update(state)
+                    if not self._update(instruction):
+                        return
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+            _setup_order = []
+            _shared_objects = {}
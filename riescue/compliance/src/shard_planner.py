@@ -0,0 +1,148 @@
+# SPDX-FileCopyrightText: © 2025 Tenstorrent AI ULC
+# SPDX-License-Identifier: Apache-2.0
+
+# pyright: strict
+
+import json
+import math
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Optional, Sequence
+
+from riescue.compliance.config import Resource
+from riescue.compliance.lib.riscv_instrs.base import InstrBase
+from riescue.lib.rand import RandNum
+
+# Average setup lines of one instruction object, measured on the rv_i, rv_f and rvv bringup tests
+SETUP_LINES = {"Int": 40, "Float": 8, "Vec": 10}
+DEFAULT_SETUP_LINES = 40
+
+
+@dataclass
+class Shard:
+    """
+    Share of a bringup test run as its own sub-test.
+
+    :param index: Shard number, from 0
+    :param seed: Seed of the sub-test
+    :param repeats: Repeat indices of each instruction name in the shard
+    :param cost: Estimated setup lines of the shard
+    """
+
+    index: int
+    seed: int
+    repeats: dict[str, list[int]] = field(default_factory=dict)
+    cost: int = 0
+
+
+def estimate_cost(instruction_class: type[InstrBase], resource: Resource) -> int:
+    """
+    Estimated setup lines of one repeat of ``instruction_class``, i.e. its configurations times the setup lines of an instruction of its type.
+
+    Follows how :py:meth:`ConfigManager.generate_instruction_objects` crosses configurations: sign and type of ``rd`` and ``vset_instr`` don't multiply,
+    and floating point instructions with source register configurations pick one. Configurations aren't checked against the instruction, so vector costs are an overestimate.
+    Needs configurations loaded, i.e. an :py:class:`InstrGenerator` constructed with ``resource``.
+    """
+    mnemonic: str = getattr(instruction_class, "name")  # class attributes set by InstrBuilder.build_dynamic_classes
+    instr_type: str = getattr(instruction_class, "type", "")
+    lines = SETUP_LINES.get(instr_type, DEFAULT_SETUP_LINES)
+    configs: Optional[dict[str, Any]] = resource.instr_configs.get(mnemonic)
+    if not configs:
+        return lines
+    if instr_type == "Float" and any(f"rs{i}sign" in configs for i in range(1, 4)):
+        return lines
+    combinations = math.prod(1 if name == "vset_instr" else len(values) for name, values in configs.items() if name not in ("rdsign", "rdtype"))
+    return lines * max(1, combinations)
+
+
+def shard_count(total_cost: int, max_lines: int) -> int:
+    "Number of shards so each shard's estimated setup lines fit in ``max_lines``"
+    return max(1, math.ceil(total_cost / max(1, max_lines)))
+
+
+def plan_shards(instruction_classes: Sequence[type[InstrBase]], resource: Resource, shards: int, rng: RandNum) -> list[Shard]:
+    """
+    Partition the repeats of ``instruction_classes`` into shards of similar estimated cost.
+    A repeat of an instruction is the smallest unit, so there are at most as many shards as repeats; empty shards are dropped.
+
+    Repeats are assigned most expensive first, each to the cheapest shard so far. Each shard gets a seed drawn from ``rng``.
+
+    :param shards: Number of shards. 0 picks the number from the estimated cost and ``Resource.max_instr_per_file``
+    :param rng: Draws the shard seeds
+    """
+    units: list[tuple[int, str, int]] = []
+    for instruction_class in instruction_classes:
+        mnemonic: str = getattr(instruction_class, "name")
+        cost = estimate_cost(instruction_class, resource)
+        units.extend((cost, mnemonic, rpt) for rpt in range(resource.rpt_cnt))
+    if shards == 0:
+        shards = shard_count(sum(cost for cost, _, _ in units), resource.max_instr_per_file)
+    shards = max(1, min(shards, len(units)))
+
+    planned = [Shard(index, rng.random_nbit(32)) for index in range(shards)]
+    for cost, mnemonic, rpt in sorted(units, key=lambda unit: -unit[0]):
+        shard = min(planned, key=lambda shard: (shard.cost, shard.index))
+        shard.repeats.setdefault(mnemonic, []).append(rpt)
+        shard.cost += cost
+    for shard in planned:
+        for rpts in shard.repeats.values():
+            rpts.sort()
+    return [shard for shard in planned if shard.repeats]
+
+
+@dataclass
+class ShardResult:
+    """
+    Outcome of a shard, as recorded in the shard report.
+
+    :param index: Shard number
+    :param seed: Seed of the sub-test
+    :param run_dir: Directory the sub-test ran in
+    :param instructions: Instruction names in the shard
+    :param estimated_lines: Estimated setup lines of the shard
+    :param passed: True if the sub-test was generated and passed on ISS
+    :param elf: Final ELF of the sub-test, if it passed
+    :param signature: Signature of the sub-test's final testcase, the path its ``.s``, ``.dis`` and ISS logs are named after
+    :param error: Reason the sub-test failed
+    """
+
+    index: int
+    seed: int
+    run_dir: str
+    instructions: list[str]
+    estimated_lines: int
+    passed: bool = False
+    elf: str = ""
+    signature: str = ""
+    error: str = ""
+
+
+def merge_shard_results(seed: int, shards: Sequence[Shard], results: Sequence[ShardResult]) -> dict[str, Any]:
+    """
+    Merge shard results into one report: overall pass/fail, the signature that covers each instruction repeat, and the per-shard results.
+
+    :param seed: Seed of the bringup test the shards were split from
+    :param shards: Planned shards, in the same order as ``results``
+    """
+    signatures: dict[str, dict[int, str]] = {}
+    for shard, result in zip(shards, results):
+        for mnemonic, rpts in shard.repeats.items():
+            for rpt in rpts:
+                signatures.setdefault(mnemonic, {})[rpt] = result.signature
+    return {
+        "seed": seed,
+        "passed": all(result.passed for result in results),
+        "signatures": {mnemonic: [by_rpt[rpt] for rpt in sorted(by_rpt)] for mnemonic, by_rpt in sorted(signatures.items())},
+        "shards": [asdict(result) for result in results],
+    }
+
+
+def shard_report_elfs(report: Path) -> list[Path]:
+    """
+    ELF of each passing shard in a shard report written by :py:func:`merge_shard_results`, in shard order.
+
+    :param report: Path to ``bringup_shards.json``
+    """
+    with open(report) as f:
+        shards: list[dict[str, Any]] = json.load(f)["shards"]
+    return [Path(shard["elf"]) for shard in shards if shard["passed"]]
@@ -617,11 +617,9 @@ class CsrDirectAccessAction(Action):
         return self.op in ["csrrwi", "csrrsi", "csrrci"]
 
     def _randomize_csr(self, ctx: LoweringContext) -> str:
-        """Select a random CSR valid for current privilege mode and operation."""
+        """Select a random CSR valid for current privilege mode and operation. Candidates are cached by ``ctx``, see :meth:`LoweringContext.csr_candidates`"""
         priv = ctx.env.priv.name.lower()
 
-        FILTERED_CSRS = ["mip", "mie", "sip", "sie", "satp"]  # Do not create new interrupts
-
         # Map privilege to Accessibility filter
         accessibility_map = {
             "m": "Machine",
@@ -631,68 +629,7 @@ class CsrDirectAccessAction(Action):
         accessibility = accessibility_map.get(priv, "Machine")
 
         is_read_only_op = self.op in ["csrrs", "csrrc", "csrrsi", "csrrci"] and (self.src is None or self.src == "zero") and (self.src_value == 0 or self.src_value is None)
-
-        names_to_csrs = []
-
-        if accessibility == "User":
-            csr_configs_exclude_machine = ctx.get_csr_manager().lookup_csrs(
-                match={"software-write": "W", "ISS_Support": "Yes"},
-                exclude={"Accessibility": "Machine"},
-            )
-
-            non_machine_csrs = list(csr_configs_exclude_machine.keys())
-
-            csr_configs_exclude_super = ctx.get_csr_manager().lookup_csrs(
-                match={"software-write": "W", "ISS_Support": "Yes"},
-                exclude={"Accessibility": "Supervisor"},
-            )
-
-            non_super_csrs = list(csr_configs_exclude_super.keys())
-
-            names_to_csrs += [csr for csr in non_machine_csrs if csr in non_super_csrs]
-
-        else:
-            csr_configs = ctx.get_csr_manager().lookup_csrs(
-                match={"Accessibility": accessibility, "software-write": "W", "ISS_Support": "Yes"},
-            )
-            if not csr_configs:
-                # Fallback: try without ISS_Support filter
-                csr_configs = ctx.get_csr_manager().lookup_csrs(
-                    match={"Accessibility": accessibility, "software-write": "W"},
-                )
-            names_to_csrs += list(csr_configs.keys())
-
-        if is_read_only_op:
-            if accessibility == "User":
-                csr_configs_exclude_machine = ctx.get_csr_manager().lookup_csrs(
-                    match={"software-read": "R", "ISS_Support": "Yes"},
-                    exclude={"Accessibility": "Machine"},
-                )
-
-                non_machine_csrs = list(csr_configs_exclude_machine.keys())
-
-                csr_configs_exclude_super = ctx.get_csr_manager().lookup_csrs(
-                    match={"software-read": "R", "ISS_Support": "Yes"},
-                    exclude={"Accessibility": "Supervisor"},
-                )
-
-                non_super_csrs = list(csr_configs_exclude_super.keys())
-
-                names_to_csrs += [csr for csr in non_machine_csrs if csr in non_super_csrs]
-
-            else:
-                csr_configs = ctx.get_csr_manager().lookup_csrs(
-                    match={"Accessibility": accessibility, "software-read": "R", "ISS_Support": "Yes"},
-                )
-                if not csr_configs:
-                    # Fallback: try without ISS_Support filter
-                    csr_configs = ctx.get_csr_manager().lookup_csrs(
-                        match={"Accessibility": accessibility, "software-read": "R"},
-                    )
-                names_to_csrs += list(csr_configs.keys())
-        names_to_csrs = [name for name in names_to_csrs if name not in FILTERED_CSRS]
-        csr_name = ctx.rng.choice(names_to_csrs)
-        return csr_name
+        return ctx.rng.choice(ctx.csr_candidates(accessibility, is_read_only_op))
 
     def expand(self, ctx: LoweringContext) -> Optional[list["Action"]]:
         """
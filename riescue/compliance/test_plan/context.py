@@ -15,6 +15,9 @@ from riescue.dtest_framework.config import FeatMgr
 if TYPE_CHECKING:
     from riescue.lib.csr_manager.csr_manager_interface import CsrManagerInterface
 
+# CSRs never picked for randomized CSR accesses. Do not create new interrupts
+FILTERED_CSRS = frozenset(["mip", "mie", "sip", "sie", "satp"])
+
 
 class _IDTracker:
     """
@@ -82,6 +85,7 @@ class LoweringContext:
         }
         self._built = False
         self._csr_manager: Optional["CsrManagerInterface"] = None
+        self._csr_candidates: dict[tuple[str, bool], tuple[str, ...]] = {}
 
     def get_csr_manager(self) -> "CsrManagerInterface":
         """Get or lazily initialize the CSR manager."""
@@ -91,6 +95,41 @@ class LoweringContext:
             self._csr_manager = CsrManagerInterface(self.rng)
         return self._csr_manager
 
+    def csr_candidates(self, accessibility: str, read_only: bool) -> tuple[str, ...]:
+        """
+        CSRs a randomized CSR access can pick from. Looked up once per key for the life of the context.
+
+        CSRs writable from ``accessibility`` come first, then CSRs readable from it for ``read_only`` accesses; a CSR in both is listed twice.
+        ``User`` accessibility is any CSR that isn't Machine or Supervisor only. :data:`FILTERED_CSRS` are left out.
+        Returned as a tuple since it's shared by every later lookup.
+
+        :param accessibility: ``Machine``, ``Supervisor`` or ``User``
+        :param read_only: True if the access doesn't write the CSR
+        """
+        key = (accessibility, read_only)
+        candidates = self._csr_candidates.get(key)
+        if candidates is None:
+            names = self._lookup_csr_names(accessibility, "software-write", "W")
+            if read_only:
+                names += self._lookup_csr_names(accessibility, "software-read", "R")
+            candidates = tuple(name for name in names if name not in FILTERED_CSRS)
+            self._csr_candidates[key] = candidates
+        return candidates
+
+    def _lookup_csr_names(self, accessibility: str, access: str, value: str) -> list[str]:
+        "Names of CSRs with ``access`` set to ``value`` that are accessible from ``accessibility``, preferring CSRs the ISS supports"
+        csr_manager = self.get_csr_manager()
+        if accessibility == "User":
+            non_machine_csrs = csr_manager.lookup_csrs(match={access: value, "ISS_Support": "Yes"}, exclude={"Accessibility": "Machine"})
+            non_super_csrs = set(csr_manager.lookup_csrs(match={access: value, "ISS_Support": "Yes"}, exclude={"Accessibility": "Supervisor"}))
+            return [csr for csr in non_machine_csrs if csr in non_super_csrs]
+
+        csr_configs = csr_manager.lookup_csrs(match={"Accessibility": accessibility, access: value, "ISS_Support": "Yes"})
+        if not csr_configs:
+            # Fallback: try without ISS_Support filter
+            csr_configs = csr_manager.lookup_csrs(match={"Accessibility": accessibility, access: value})
+        return list(csr_configs)
+
     def new_label(self) -> str:
         return self.id_tracker.new_label()
 
@@ -98,7 +98,21 @@ class TestPlanGenerator:
         excp_handler_post: Optional[str] = None,
     ) -> str:
         """
-        Generate a string of assembly code for the given :class:`DiscreteTest` objects and ``TestEnv``.
+        Generate a string of assembly code for the given :class:`DiscreteTest` objects and ``TestEnv``. See :meth:`generate_file` for the parameters.
+        """
+        return self.generate_file(discrete_tests, env, test_plan_name, excp_handler_pre=excp_handler_pre, excp_handler_post=excp_handler_post).emit()
+
+    def generate_file(
+        self,
+        discrete_tests: list[DiscreteTest],
+        env: TestEnv,
+        test_plan_name: str = "generated_test_plan",
+        excp_handler_pre: Optional[str] = None,
+        excp_handler_post: Optional[str] = None,
+    ) -> AssemblyFile:
+        """
+        Generate the :class:`AssemblyFile` for the given :class:`DiscreteTest` objects and ``TestEnv``.
+        Emit it for the assembly text, or use :meth:`AssemblyFile.build_pool` to hand its memory directives to RiescueD without parsing them.
 
         .. warning::
 
@@ -153,10 +167,7 @@ class TestPlanGenerator:
             text.blocks.append(TestCase([TextBlock(label="excp_handler_post", text=[post_body, "ret"])]))
 
         header = Header.from_env(env=env, plan_name=test_plan_name)
-        assembly_file = AssemblyFile(header=header, code=text, data=data)
-
-        # generate text
-        return assembly_file.emit()
+        return AssemblyFile(header=header, code=text, data=data)
 
     # internal methods #
 
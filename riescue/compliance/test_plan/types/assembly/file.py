@@ -1,9 +1,16 @@
 # SPDX-FileCopyrightText: © 2025 Tenstorrent AI ULC
 # SPDX-License-Identifier: Apache-2.0
 
+from pathlib import Path
+
+from riescue.dtest_framework.parser import Parser
+from riescue.dtest_framework.pool import Pool
+
 from .base import AssemblyBase
 from .header import Header
+from .page import Page
 from .segment import DataSegment, TextSegment
+from .global_function import GlobalFunction
 
 
 class AssemblyFile(AssemblyBase):
@@ -18,3 +25,34 @@ class AssemblyFile(AssemblyBase):
 
     def emit(self) -> str:
         return self.header.emit() + "\n\n" + self.code.emit() + "\n\n" + self.data.emit()
+
+    def pages(self) -> list[Page]:
+        "Pages requested by the data segment, in the order they're emitted"
+        pages: list[Page] = []
+        for block in self.data.blocks:
+            if isinstance(block, GlobalFunction):
+                pages.append(block.subroutine.page)
+            elif isinstance(block, Page):
+                pages.append(block)
+        return pages
+
+    def build_pool(self, testfile: Path) -> Pool:
+        """
+        Build a RiescueD ``Pool`` holding the ``;#random_addr``, ``;#reserve_memory`` and ``;#page_mapping`` entries of every page, straight from :meth:`Page.directives`.
+
+        Entries are added in the order :meth:`emit` writes them, so address generation matches parsing the emitted test.
+        Pass the pool to ``RiescueD`` with the emitted test, which then skips those directives when parsing it.
+
+        :param testfile: Test file name, used in parser messages
+        """
+        pool = Pool()
+        parser = Parser(testfile, pool=pool, lines=[])
+        handlers = {
+            "random_addr": parser.add_random_addr,
+            "reserve_memory": parser.add_reserve_memory,
+            "page_mapping": parser.add_page_mapping,
+        }
+        for page in self.pages():
+            for name, args in page.directives():
+                handlers[name](args)
+        return pool
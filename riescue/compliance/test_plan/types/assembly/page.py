@@ -78,7 +78,7 @@ class Page(AssemblyBase):
         sizes = ps if isinstance(ps, tuple) else (ps,)
         return ",".join(f"'{p.name.lower().replace('size_', '')}b'" for p in sizes)
 
-    def _generate_gstage_flags(self, gflags: Optional[PageFlags], gexclude_flags: Optional[PageFlags], vs_level: str, g_level: str) -> str:
+    def _generate_gstage_flags(self, gflags: Optional[PageFlags], gexclude_flags: Optional[PageFlags], vs_level: str, g_level: str) -> dict[str, int]:
         """
         Generate g-stage flag attributes for page_mapping directive.
 
@@ -88,9 +88,9 @@ class Page(AssemblyBase):
         :param g_level: "gleaf" or "gnonleaf" for G-stage
         """
         if gflags is None and gexclude_flags is None:
-            return ""
+            return {}
 
-        flags_dict = {}
+        flags_dict: dict[str, int] = {}
         if gflags is not None:
             if PageFlags.VALID in gflags:
                 flags_dict[f"v_{vs_level}_{g_level}"] = 1
@@ -127,9 +127,9 @@ class Page(AssemblyBase):
             if PageFlags.DIRTY in gexclude_flags:
                 flags_dict[f"d_{vs_level}_{g_level}"] = 0
 
-        return ", ".join(f"{k}={v}" for k, v in flags_dict.items())
+        return flags_dict
 
-    def _generate_vs_nonleaf_flags(self, nonleaf_flags: Optional[PageFlags], nonleaf_exclude_flags: Optional[PageFlags]) -> str:
+    def _generate_vs_nonleaf_flags(self, nonleaf_flags: Optional[PageFlags], nonleaf_exclude_flags: Optional[PageFlags]) -> dict[str, int]:
         """
         Generate VS-stage non-leaf flag attributes for page_mapping directive.
 
@@ -137,9 +137,9 @@ class Page(AssemblyBase):
         :param nonleaf_exclude_flags: VS-stage non-leaf flags to exclude/clear
         """
         if nonleaf_flags is None and nonleaf_exclude_flags is None:
-            return ""
+            return {}
 
-        flags_dict = {}
+        flags_dict: dict[str, int] = {}
         if nonleaf_flags is not None:
             if PageFlags.VALID in nonleaf_flags:
                 flags_dict["v_nonleaf"] = 1
@@ -176,63 +176,56 @@ class Page(AssemblyBase):
             if PageFlags.DIRTY in nonleaf_exclude_flags:
                 flags_dict["d_nonleaf"] = 0
 
-        return ", ".join(f"{k}={v}" for k, v in flags_dict.items())
+        return flags_dict
 
-    def emit(self) -> str:
-        "Generate code needed to request memory allocation"
-        code: list[str] = []
+    def directives(self) -> list[tuple[str, dict[str, str]]]:
+        """
+        RiescueD directives requesting this page, as directive name and arguments written the way they appear in the test.
+
+        :meth:`emit` writes them as ``;#<name>(<args>)``. RiescueD's ``Parser.add_random_addr``, ``add_reserve_memory`` and ``add_page_mapping``
+        take the same arguments, so a ``Pool`` can be filled from them without parsing the emitted text.
+        """
+        directives: list[tuple[str, dict[str, str]]] = []
 
-        page_flags = []
+        page_flags: dict[str, int] = {}
         if self.flags is not None:
             # these flags are always set or unset
-            if PageFlags.VALID in self.flags:
-                page_flags.append("v=1")
-            else:
-                page_flags.append("v=0")
-            if PageFlags.READ in self.flags:
-                page_flags.append("r=1")
-            else:
-                page_flags.append("r=0")
-            if PageFlags.WRITE in self.flags:
-                page_flags.append("w=1")
-            else:
-                page_flags.append("w=0")
-            if PageFlags.EXECUTE in self.flags:
-                page_flags.append("x=1")
-            else:
-                page_flags.append("x=0")
+            page_flags["v"] = 1 if PageFlags.VALID in self.flags else 0
+            page_flags["r"] = 1 if PageFlags.READ in self.flags else 0
+            page_flags["w"] = 1 if PageFlags.WRITE in self.flags else 0
+            page_flags["x"] = 1 if PageFlags.EXECUTE in self.flags else 0
             if PageFlags.USER in self.flags:
-                page_flags.append("u=1")
+                page_flags["u"] = 1
             if PageFlags.GLOBAL in self.flags:
-                page_flags.append("g=1")
+                page_flags["g"] = 1
             if PageFlags.ACCESSED in self.flags:
-                page_flags.append("a=1")
+                page_flags["a"] = 1
             if PageFlags.DIRTY in self.flags:
-                page_flags.append("d=1")
+                page_flags["d"] = 1
         if self.exclude_flags is not None:
             if PageFlags.VALID in self.exclude_flags:
-                page_flags.append("v=0")
+                page_flags["v"] = 0
             if PageFlags.READ in self.exclude_flags:
-                page_flags.append("r=0")
+                page_flags["r"] = 0
             if PageFlags.WRITE in self.exclude_flags:
-                page_flags.append("w=0")
+                page_flags["w"] = 0
             if PageFlags.EXECUTE in self.exclude_flags:
-                page_flags.append("x=0")
+                page_flags["x"] = 0
             if PageFlags.USER in self.exclude_flags:
-                page_flags.append("u=0")
+                page_flags["u"] = 0
             if PageFlags.GLOBAL in self.exclude_flags:
-                page_flags.append("g=0")
+                page_flags["g"] = 0
             if PageFlags.ACCESSED in self.exclude_flags:
-                page_flags.append("a=0")
+                page_flags["a"] = 0
             if PageFlags.DIRTY in self.exclude_flags:
-                page_flags.append("d=0")
+                page_flags["d"] = 0
         if self.modify:
-            page_flags.append("modify_pt=1")
+            page_flags["modify_pt"] = 1
         if self.modify_leaf:
-            page_flags.append("modify_leaf_pt=1")
+            page_flags["modify_leaf_pt"] = 1
         if self.modify_nonleaf:
-            page_flags.append("modify_nonleaf_pt=1")
-        page_flags_str = ", ".join(page_flags)
+            page_flags["modify_nonleaf_pt"] = 1
+        page_flag_args = {k: str(v) for k, v in page_flags.items()}
 
         # Generate multiple page mappings based on num_pages
         pages_to_generate = self.num_pages or 1
@@ -274,85 +267,59 @@ class Page(AssemblyBase):
         # so the base VA/PA are aligned correctly for superpages across the full 64-bit space.
         and_mask = f"0x{(~(first_page_size_bytes - 1)) & 0xFFFF_FFFF_FFFF_FFFF:016x}"
 
-        or_mask = self.or_mask
-
         lin_size = size + 0x1000 if self.buffer_page else size  # just make the VM a bit larger than the actual memory, and don't map it
         if self.start_addr is None:
-            lin = f";#random_addr(name={self.name},  type=linear, size=0x{lin_size:x}, and_mask={and_mask}"
-            phys = f";#random_addr(name={self.phys_name},  type=physical, size=0x{size:x}, and_mask={and_mask}"
-            if or_mask:
-                lin += f", or_mask={or_mask}"
-                phys += f", or_mask={or_mask}"
-            # code.append(f";#random_addr(name={self.name},  type=linear, size=0x{size:x}, and_mask={and_mask}")
-            # code.append(f";#random_addr(name={self.phys_name},  type=physical, size=0x{self.size:x}, and_mask={and_mask}, or_mask={or_mask})")
+            lin = {"name": self.name, "type": "linear", "size": f"0x{lin_size:x}", "and_mask": and_mask}
+            phys = {"name": self.phys_name, "type": "physical", "size": f"0x{size:x}", "and_mask": and_mask}
+            address_directive = "random_addr"
         else:
-            lin = f";#reserve_memory(name={self.name}, start_addr=0x{self.start_addr:x},  type=linear, size=0x{lin_size:x}"
-            phys = f";#reserve_memory(name={self.phys_name}, start_addr=0x{self.start_addr:x},  type=physical, size=0x{size:x}"
-            if or_mask:
-                lin += f", or_mask={or_mask}"
-                phys += f", or_mask={or_mask}"
-
-            # code.append(f";#reserve_memory(name={self.name}, start_addr=0x{self.start_addr:x},  type=linear, size=0x{size:x}, or_mask={or_mask})")
-            # code.append(f";#reserve_memory(name={self.phys_name}, start_addr=0x{self.start_addr:x},  type=physical, size=0x{self.size:x}, or_mask={or_mask})")
-        code.append(lin + ")")
-        code.append(phys + ")")
+            lin = {"name": self.name, "start_addr": f"0x{self.start_addr:x}", "type": "linear", "size": f"0x{lin_size:x}"}
+            phys = {"name": self.phys_name, "start_addr": f"0x{self.start_addr:x}", "type": "physical", "size": f"0x{size:x}"}
+            address_directive = "reserve_memory"
+        if self.or_mask:
+            lin["or_mask"] = self.or_mask
+            phys["or_mask"] = self.or_mask
+        directives.append((address_directive, lin))
+        directives.append((address_directive, phys))
 
         for i in range(pages_to_generate):
             if i == 0:
                 # First page uses base names and calculated page size
-                lin_name = self.name
-                phys_name = self.phys_name
-                page_mapping_str = f"lin_name={lin_name}, phys_name={phys_name}"
-                page_mapping_str += f", pagesize=[{first_page_size_str}]"
-
-                if page_flags_str:
-                    page_mapping_str += f", {page_flags_str}"
+                page_mapping = {"lin_name": self.name, "phys_name": self.phys_name, "pagesize": f"[{first_page_size_str}]"}
+                page_mapping.update(page_flag_args)
 
                 # Add VS-stage non-leaf flags
-                vs_nonleaf_flags_str = self._generate_vs_nonleaf_flags(self.nonleaf_flags, self.nonleaf_exclude_flags)
-                if vs_nonleaf_flags_str:
-                    page_mapping_str += f", {vs_nonleaf_flags_str}"
+                page_mapping.update({k: str(v) for k, v in self._generate_vs_nonleaf_flags(self.nonleaf_flags, self.nonleaf_exclude_flags).items()})
 
                 # Add g-stage page sizes if provided
                 if self.vleaf_page_size is not None:
-                    page_mapping_str += f", gstage_vs_leaf_pagesize=[{self._fmt_page_sizes(self.vleaf_page_size)}]"
+                    page_mapping["gstage_vs_leaf_pagesize"] = f"[{self._fmt_page_sizes(self.vleaf_page_size)}]"
                 if self.vnonleaf_page_size is not None:
-                    page_mapping_str += f", gstage_vs_nonleaf_pagesize=[{self._fmt_page_sizes(self.vnonleaf_page_size)}]"
-
-                # Generate g-stage flag strings for each combination independently
-                leaf_gleaf_flags = self._generate_gstage_flags(self.leaf_gleaf_flags, self.leaf_gleaf_exclude_flags, "leaf", "gleaf")
-                nonleaf_gleaf_flags = self._generate_gstage_flags(self.nonleaf_gleaf_flags, self.nonleaf_gleaf_exclude_flags, "nonleaf", "gleaf")
-                leaf_gnonleaf_flags = self._generate_gstage_flags(self.leaf_gnonleaf_flags, self.leaf_gnonleaf_exclude_flags, "leaf", "gnonleaf")
-                nonleaf_gnonleaf_flags = self._generate_gstage_flags(self.nonleaf_gnonleaf_flags, self.nonleaf_gnonleaf_exclude_flags, "nonleaf", "gnonleaf")
-
-                # Append g-stage flags to page_mapping_str
-                if leaf_gleaf_flags:
-                    page_mapping_str += f", {leaf_gleaf_flags}"
-                if nonleaf_gleaf_flags:
-                    page_mapping_str += f", {nonleaf_gleaf_flags}"
-                if leaf_gnonleaf_flags:
-                    page_mapping_str += f", {leaf_gnonleaf_flags}"
-                if nonleaf_gnonleaf_flags:
-                    page_mapping_str += f", {nonleaf_gnonleaf_flags}"
+                    page_mapping["gstage_vs_nonleaf_pagesize"] = f"[{self._fmt_page_sizes(self.vnonleaf_page_size)}]"
+
+                # Add g-stage flags for each combination independently
+                for gflags, gexclude_flags, vs_level, g_level in (
+                    (self.leaf_gleaf_flags, self.leaf_gleaf_exclude_flags, "leaf", "gleaf"),
+                    (self.nonleaf_gleaf_flags, self.nonleaf_gleaf_exclude_flags, "nonleaf", "gleaf"),
+                    (self.leaf_gnonleaf_flags, self.leaf_gnonleaf_exclude_flags, "leaf", "gnonleaf"),
+                    (self.nonleaf_gnonleaf_flags, self.nonleaf_gnonleaf_exclude_flags, "nonleaf", "gnonleaf"),
+                ):
+                    page_mapping.update({k: str(v) for k, v in self._generate_gstage_flags(gflags, gexclude_flags, vs_level, g_level).items()})
             else:
                 # Subsequent pages use offset names and 4kb page size
                 # Start subsequent pages after the first page size + 0x1000 for each page
                 offset = i * 0x1000  # i=1 gives 0x200000 + 0x1000 = 0x201000
-                lin_name = f"{self.name}+0x{offset:x}"
-                phys_name = f"{self.phys_name}+0x{offset:x}"
-                page_mapping_str = f"lin_name={lin_name}, phys_name={phys_name}"
-
-                # Use 4kb page size for subsequent mappings
-                page_mapping_str += ", pagesize=['4kb']"
+                page_mapping = {"lin_name": f"{self.name}+0x{offset:x}", "phys_name": f"{self.phys_name}+0x{offset:x}", "pagesize": "['4kb']"}
+                page_mapping.update(page_flag_args)
+            directives.append(("page_mapping", page_mapping))
 
-                if page_flags_str:
-                    page_mapping_str += f", {page_flags_str}"
-
-            code.append(f";#page_mapping({page_mapping_str})")
+        return directives
 
+    def emit(self) -> str:
+        "Generate code needed to request memory allocation"
+        code = [f";#{name}({', '.join(f'{k}={v}' for k, v in args.items())})" for name, args in self.directives()]
         if self.alignment is not None:
             code.append(f".align {self.alignment}")
-
         code.append(f";#init_memory @{self.name}")
         return "\n".join(code)
 
@@ -49,6 +49,7 @@ class TpMode(BaseMode[TpCfg]):
     def add_arguments(parser: argparse.ArgumentParser) -> None:
         parser.add_argument("--isa", type=str, default="rv64imfdah_zicsr_zk_zicond_zicbom_zicbop_zicboz_svadu_svinval_zawrs_zihintpause_zihintntl", help="ISA to use")
         parser.add_argument("--test_plan", dest="test_plan_name", type=str, default="zicond", help="Test plan to use")
+        parser.add_argument("--no_test_source", action="store_true", help="Don't write the generated test plan assembly (.s) file. The test is passed to RiescueD in memory either way")
 
     def run(self, seed: int, toolchain: Toolchain, cl_args: Optional[argparse.Namespace] = None) -> Path:
         """
@@ -122,7 +123,7 @@ class TpMode(BaseMode[TpCfg]):
         env = generator.solve(discrete_tests, env_constraints)
 
         # cfg.featmgr.hypervisor = env.hypervisor
-        test = generator.generate(
+        assembly_file = generator.generate_file(
             discrete_tests,
             env,
             cfg.test_plan_name,
@@ -133,13 +134,18 @@ class TpMode(BaseMode[TpCfg]):
         # write test file
         output_name = cl_args.output_file if cl_args is not None and getattr(cl_args, "output_file", None) else f"tp_{cfg.test_plan_name}_{cfg.seed}"
         test_assembly_file = self.run_dir / f"{output_name}.s"
-        with open(test_assembly_file, "w") as f:
-            f.write(test)
-        with open(test_assembly_file, "w") as f:
-            f.write(test)
 
-        # run riescued to generate ELF file, reuse featmg, toolchain
-        rd = RiescueD(testfile=test_assembly_file, seed=cfg.seed, toolchain=toolchain, run_dir=self.run_dir)
+        # run riescued to generate ELF file, reuse featmg, toolchain. The test is handed over in memory, the .s file is only written as an artifact.
+        # Page memory directives go straight into the pool, so RiescueD only parses the remaining directives from the text
+        rd = RiescueD(
+            testfile=test_assembly_file,
+            seed=cfg.seed,
+            toolchain=toolchain,
+            run_dir=self.run_dir,
+            test_source=assembly_file.emit(),
+            write_testfile=cfg.write_test_source,
+            pool=assembly_file.build_pool(test_assembly_file),
+        )
         rd.generate(cfg.featmgr)
         generated_files = rd.build(cfg.featmgr)
         if toolchain.simulator is None:
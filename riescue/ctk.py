@@ -14,6 +14,7 @@ from riescue.compliance import BringupMode, TpMode
 from riescue.compliance.base import BaseMode
 from riescue.compliance.config import ResourceBuilder, TpBuilder, Resource, TpCfg
 from riescue.compliance.config.resource_builder import ResourceConfig
+from riescue.compliance.src.shard_planner import shard_report_elfs
 from riescue.lib.toolchain import Compiler, Disassembler, Spike, Whisper
 from riescue.lib.rand import initial_random_seed
 from riescue.lib.cli_base import CliBase
@@ -319,6 +320,9 @@ class Ctk(CliBase):
 
                 test = runner.generate(cfg, toolchain=self.toolchain)
                 all_tests.append(test)
+                if test.name == "bringup_shards.json":
+                    # Sharded bringup tests return the shard report, keep every shard's ELF too
+                    all_tests.extend(shard_report_elfs(test))
             except Exception as e:
                 log.error(f"Error generating test for {runner.__class__.__name__}: {e}.Reproduce with \n\t{metadata.repro}")
                 raise e
@@ -23,6 +23,7 @@ class GeneratedFiles:
     selfcheck_asm: Optional[Path] = None  # Selfcheck dump assembly (set when relink_selfcheck)
     selfcheck_obj: Optional[Path] = None  # Selfcheck dump object (set when relink_selfcheck)
     selfcheck_dump: Optional[Path] = None  # Selfcheck dump hex file (set when dump_selfcheck=True)
+    budget: Optional[Path] = None  # Estimated image size and instruction count (set by generate)
 
     @classmethod
     def from_testname(cls, test_name: str, run_dir: Path) -> "GeneratedFiles":
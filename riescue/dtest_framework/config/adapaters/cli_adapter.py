@@ -33,6 +33,10 @@ class CliAdapter(Adapter):
 
         if cmdline.single_assembly_file is not None:
             featmgr.single_assembly_file = cmdline.single_assembly_file
+        if cmdline.incremental is not None:
+            featmgr.incremental = cmdline.incremental
+        if cmdline.bulk_random_data is not None:
+            featmgr.bulk_random_data = cmdline.bulk_random_data
         if cmdline.force_alignment is not None:
             featmgr.force_alignment = cmdline.force_alignment
         if cmdline.c_used is not None:
@@ -43,6 +47,22 @@ class CliAdapter(Adapter):
             featmgr.inc_path = cmdline.inc_path
         if cmdline.selfcheck is not None:
             featmgr.selfcheck = cmdline.selfcheck
+        if cmdline.selfcheck_compact is not None:
+            featmgr.selfcheck_compact = cmdline.selfcheck_compact
+        if cmdline.static_pte_access is not None:
+            featmgr.static_pte_access = cmdline.static_pte_access
+        if cmdline.linker_segment_gap is not None:
+            featmgr.linker_segment_gap = cmdline.linker_segment_gap
+        if cmdline.linker_max_segments is not None:
+            featmgr.linker_max_segments = cmdline.linker_max_segments
+        if cmdline.compact_hart_context is not None:
+            featmgr.compact_hart_context = cmdline.compact_hart_context
+        if cmdline.instruction_budget is not None:
+            featmgr.instruction_budget = cmdline.instruction_budget
+        if cmdline.image_size_budget is not None:
+            featmgr.image_size_budget = cmdline.image_size_budget
+        if cmdline.fail_over_budget is not None:
+            featmgr.fail_over_budget = cmdline.fail_over_budget
         if featmgr.selfcheck or featmgr.cfiles is not None or featmgr.c_used:
             featmgr.save_restore_gprs = True
         if cmdline.compiler_include_dir is not None:
@@ -66,6 +86,8 @@ class CliAdapter(Adapter):
             featmgr.identity_map_code = cmdline.identity_map_code
         if cmdline.repeat_times is not None:
             featmgr.repeat_times = cmdline.repeat_times
+        if cmdline.scheduler_order is not None:
+            featmgr.scheduler_order = RV.SchedulerOrder.str_to_enum(cmdline.scheduler_order)
         if cmdline.log_test_execution is not None:
             featmgr.log_test_execution = cmdline.log_test_execution
 
@@ -3,14 +3,13 @@
 
 from __future__ import annotations
 import logging
-import json
 from typing import TYPE_CHECKING
 from pathlib import Path
 
 import riescue.lib.enums as RV
 from riescue.dtest_framework.parser import ParsedTestHeader
 from .adapter import Adapter
-from ..cpu_config import CpuConfig
+from ..cpu_config_cache import cpu_config_cache
 
 if TYPE_CHECKING:
     from ..builder import FeatMgrBuilder
@@ -23,16 +22,13 @@ class CpuConfigAdapter(Adapter):
     Adapater for test environment configuration from the ``cpu_config.json`` file.
 
     Currently just sets the ``cpu_config``, ``memory``, and ``reset_pc`` fields of the ``FeatMgrBuilder``.
-    Any additional fields are ignored.
+    Any additional fields are ignored. Files are parsed once per process, see :mod:`riescue.dtest_framework.config.cpu_config_cache`.
     """
 
     def apply(self, builder: FeatMgrBuilder, src: Path) -> FeatMgrBuilder:
         featmgr = builder.featmgr
 
-        with open(src, "r") as f:
-            cfg = json.load(f)
-
-        cpu_config = CpuConfig.from_dict(cfg, feature_overrides=" ".join(builder.features))
+        cfg, cpu_config = cpu_config_cache().load(src, feature_overrides=" ".join(builder.features))
 
         # legacy support for htif in memmap. This should probably be an explict field to make it clear where it's coming from
         try:
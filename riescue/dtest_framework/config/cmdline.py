@@ -149,6 +149,20 @@ def add_arguments(parser: argparse.ArgumentParser) -> None:
         default=None,
         help="Indicates that all assembly is written to a single file. Ignoring this option means writing to a handful of .inc files",
     )
+    test_generation_args.add_argument(
+        "--incremental",
+        action="store_true",
+        default=None,
+        help="Reuse the cached elaboration (addresses, page tables, runtime, equates, linker script) from a previous run in the same run directory when only the test body changed. "
+        "Requires a fixed --seed to hit the cache",
+    )
+    test_generation_args.add_argument(
+        "--bulk_random_data",
+        action="store_true",
+        default=None,
+        help="Draw ;#random_data values with one vectorized call per data type instead of one call per directive. "
+        "Faster for tests with many ;#random_data directives, but picks different values for the same --seed",
+    )
     test_generation_args.add_argument(
         "--force_alignment",
         action="store_true",
@@ -223,12 +237,70 @@ def add_arguments(parser: argparse.ArgumentParser) -> None:
         help="Number of times each discrete test should be run",
         type=int,
     )
+    test_generation_args.add_argument(
+        "--scheduler_order",
+        default=None,
+        choices=["static", "iterate", "shuffle"],
+        help="Single hart test ordering. 'static' stores every run of every test in a sequence shuffled at generation time. "
+        "'iterate' and 'shuffle' store each test once and repeat the sequence repeat_times at runtime, 'shuffle' reorders it before each repetition",
+        type=str,
+    )
     test_generation_args.add_argument(
         "--selfcheck",
         action="store_true",
         default=None,
         help="Enable selfchecking at the end of each discrete test by compiling in golden data from a run of the test in Whisper",
     )
+    test_generation_args.add_argument(
+        "--selfcheck_compact",
+        action="store_true",
+        default=None,
+        help="Compute the selfcheck checksum with a loop over a table of state to check instead of unrolled code for every value. Smaller code, same checksum",
+    )
+    test_generation_args.add_argument(
+        "--static_pte_access",
+        action="store_true",
+        default=None,
+        help="Resolve ;#read_pte/;#write_pte to the PTE address at elaboration time so the syscall does a single load or store instead of a page table walk. "
+        "Entries not known at elaboration time still use the walk",
+    )
+    test_generation_args.add_argument(
+        "--linker_segment_gap",
+        type=lambda x: int(x, 0),
+        default=None,
+        help="Put sections up to this many bytes apart in the same PT_LOAD segment, padding the gap. Sections a page apart always share a segment. Default 0",
+    )
+    test_generation_args.add_argument(
+        "--linker_max_segments",
+        type=int,
+        default=None,
+        help="Most PT_LOAD segments in the linker script. Sections with the smallest gaps are merged until the count fits, where they can share a segment",
+    )
+    test_generation_args.add_argument(
+        "--compact_hart_context",
+        action="store_true",
+        default=None,
+        help="Allocate the hart contexts of multi-hart tests from one .rept template instead of per-hart copies. The loader sets each hart's sp and mhartid. "
+        "Same layout, much less assembly for many harts",
+    )
+    test_generation_args.add_argument(
+        "--instruction_budget",
+        type=lambda x: int(x, 0),
+        default=None,
+        help="Warn at elaboration time when the estimated instructions over all harts exceed this, e.g. the ISS instruction limit. Estimates are written to <testname>_budget.json",
+    )
+    test_generation_args.add_argument(
+        "--image_size_budget",
+        type=lambda x: int(x, 0),
+        default=None,
+        help="Warn at elaboration time when the estimated bytes emitted over all sections exceed this, e.g. the emulator memory image limit",
+    )
+    test_generation_args.add_argument(
+        "--fail_over_budget",
+        action="store_true",
+        default=None,
+        help="Fail elaboration instead of warning when --instruction_budget or --image_size_budget is exceeded",
+    )
     test_generation_args.add_argument(
         "--compiler-include-dir",
         type=Path,
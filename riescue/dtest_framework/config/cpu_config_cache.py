@@ -0,0 +1,86 @@
+# SPDX-FileCopyrightText: © 2025 Tenstorrent AI ULC
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Process-wide cache of parsed cpu config files.
+
+Building a :class:`FeatMgr` reads, parses and validates the cpu config JSON into a :class:`CpuConfig`, :class:`Memory` and :class:`FeatureDiscovery`.
+Batch runs, test plans and bringup build one per test from the same few files.
+:class:`CpuConfigCache` keeps the parsed config keyed by the file's resolved path and a hash of its contents, so an edited file is parsed again.
+
+Each load gets its own ``CpuConfig`` with a copy of the ``Memory``, whose range lists callers can modify, and a ``FeatureDiscovery`` with the test's feature overrides applied.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+from dataclasses import dataclass, replace
+from pathlib import Path
+from typing import Any, Optional
+
+from .cpu_config import CpuConfig
+
+log = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class CachedCpuConfig:
+    """
+    Parsed cpu config file.
+
+    :param cfg: Parsed JSON. Shared between loads, so must not be modified
+    :param cpu_config: Config parsed without feature overrides
+    """
+
+    cfg: dict[str, Any]
+    cpu_config: CpuConfig
+
+
+class CpuConfigCache:
+    """
+    Parsed cpu config files, kept for the life of the process.
+    """
+
+    def __init__(self):
+        self.entries: dict[tuple[Path, str], CachedCpuConfig] = {}
+
+    def load(self, path: Path, feature_overrides: Optional[str] = None) -> tuple[dict[str, Any], CpuConfig]:
+        """
+        Parsed JSON and ``CpuConfig`` of the file at ``path``, parsing it on a miss.
+
+        :param path: Path to the cpu config file
+        :param feature_overrides: optional string containing feature overrides. E.g. ``ext_v.enable ext_f.disable``
+        :return: Parsed JSON, which must not be modified, and a ``CpuConfig`` with its own ``Memory`` and ``FeatureDiscovery``
+        """
+        resolved = Path(path).resolve()
+        content = resolved.read_bytes()
+        key = (resolved, hashlib.sha256(content).hexdigest())
+        entry = self.entries.get(key)
+        if entry is None:
+            cfg = json.loads(content)
+            entry = CachedCpuConfig(cfg=cfg, cpu_config=CpuConfig.from_dict(cfg))
+            # Keep only the latest contents of each file
+            self.entries = {k: v for k, v in self.entries.items() if k[0] != resolved}
+            self.entries[key] = entry
+        else:
+            log.debug(f"Reusing parsed cpu config {resolved}")
+
+        features = entry.cpu_config.features.overlay(feature_overrides)
+        cpu_config = replace(entry.cpu_config, memory=entry.cpu_config.memory.copy(), features=features, debug_mode=features.is_feature_enabled("debug"))
+        return entry.cfg, cpu_config
+
+    def clear(self) -> None:
+        self.entries.clear()
+
+
+_cpu_config_cache: Optional[CpuConfigCache] = None
+
+
+def cpu_config_cache() -> CpuConfigCache:
+    "Process-wide :class:`CpuConfigCache`"
+    global _cpu_config_cache
+    if _cpu_config_cache is None:
+        _cpu_config_cache = CpuConfigCache()
+    return _cpu_config_cache
@@ -129,6 +129,8 @@ class FeatMgr:
 
     # Generation options
     single_assembly_file: bool = False
+    incremental: bool = False  # Reuse cached elaboration when only the test body changed
+    bulk_random_data: bool = False  # Draw ;#random_data values in bulk with BulkNumGen
     force_alignment: bool = False
     c_used: bool = False
     more_os_pages: bool = False
@@ -141,9 +143,18 @@ class FeatMgr:
     randomize_code_location: bool = False
     identity_map_code: bool = False
     repeat_times: int = 3
+    scheduler_order: RV.SchedulerOrder = RV.SchedulerOrder.STATIC
     cfiles: Optional[list[Path]] = None
     inc_path: Optional[list[Path]] = None
     selfcheck: bool = False
+    selfcheck_compact: bool = False
+    static_pte_access: bool = False  # Resolve ;#read_pte/;#write_pte to PTE addresses at elaboration time
+    linker_segment_gap: int = 0  # Largest gap in bytes between sections padded to share a PT_LOAD segment
+    linker_max_segments: Optional[int] = None  # Most PT_LOAD segments in the linker script, merging the smallest gaps first
+    compact_hart_context: bool = False  # Emit multi-hart contexts from one .rept template, with per-hart fields set by the loader
+    instruction_budget: Optional[int] = None  # Most estimated instructions over all harts before warning at elaboration time
+    image_size_budget: Optional[int] = None  # Most estimated bytes over all sections before warning at elaboration time
+    fail_over_budget: bool = False  # Fail elaboration instead of warning when a budget is exceeded
     save_restore_gprs: bool = False
     log_test_execution: bool = False
 
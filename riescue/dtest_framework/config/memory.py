@@ -3,7 +3,7 @@
 
 from __future__ import annotations
 import logging
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from abc import ABC, abstractmethod
 from typing import Any, Union, Optional, Mapping
 
@@ -336,6 +336,18 @@ class Memory:
     reserved_ranges: list[BaseMem] = field(default_factory=list)
     custom_ranges: list[CustomRange] = field(default_factory=list)
 
+    def copy(self) -> Memory:
+        """
+        Returns a copy with its own range lists and ranges. The ``Memory`` is frozen but its lists and ranges aren't.
+        """
+        return Memory(
+            dram_ranges=[replace(dram) for dram in self.dram_ranges],
+            io_ranges=[replace(io) for io in self.io_ranges],
+            secure_ranges=[replace(secure) for secure in self.secure_ranges],
+            reserved_ranges=[replace(reserved) for reserved in self.reserved_ranges],
+            custom_ranges=[replace(custom) for custom in self.custom_ranges],
+        )
+
     def to_dict(self) -> dict[str, Any]:
         """
         Returns a dictionary representation of the memory object.
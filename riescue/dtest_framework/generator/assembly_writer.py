@@ -10,11 +10,17 @@ from __future__ import annotations
 import re
 import logging
 import shutil
+import tempfile
+from bisect import bisect_left, bisect_right
+from contextlib import contextmanager
+from dataclasses import dataclass
+from itertools import chain, islice
 from pathlib import Path
-from typing import Any, cast
+from typing import IO, Any, Iterable, Iterator, Sequence, cast
 
 import riescue.lib.enums as RV
 from riescue.lib.rand import RandNum
+from riescue.lib.numgen import BulkNumGen
 from riescue.lib.csr_manager.csr_manager_interface import CsrManagerInterface
 from riescue.dtest_framework.lib.dtest_instruction_helper import DtestInstructionHelper
 from riescue.dtest_framework.lib.sdtrig import (
@@ -25,15 +31,126 @@ from riescue.dtest_framework.lib.sdtrig import (
     build_tdata1_etrigger,
 )
 from riescue.dtest_framework.pool import Pool
-from riescue.dtest_framework.parser import Parser, ParsedPageMapping
-from riescue.dtest_framework.lib.page_map import Page
+from riescue.dtest_framework.parser import Parser, ParsedPageMapping, ParsedRandomFill
+from riescue.dtest_framework.lib.page_map import Page, PteWalk
 from riescue.dtest_framework.config import FeatMgr
 from riescue.dtest_framework.runtime import Runtime
 from riescue.dtest_framework.artifacts import GeneratedFiles
+from riescue.dtest_framework.generator.elaboration_cache import CachedElaboration
 
 log = logging.getLogger(__name__)
 
 
+@dataclass
+class _FindReplaceState:
+    """State carried between lines by :meth:`AssemblyWriter.find_and_replace_assembly`, so assembly can be rewritten in several streamed passes"""
+
+    section_code_found: bool = False
+    in_pma_hint: bool = False
+    trigger_config_idx: int = 0
+    trigger_disable_idx: int = 0
+    trigger_enable_idx: int = 0
+    random_fill_idx: int = 0
+
+
+@contextmanager
+def _open_rasm(rasm: Path | Sequence[str]) -> Iterator[Iterable[str]]:
+    "Lines of a .rasm file, or the lines of a test held in memory"
+    if isinstance(rasm, Path):
+        with open(rasm, "r") as input_file:
+            yield input_file
+    else:
+        yield rasm
+
+
+def _split_lines(chunks: Iterable[str], tail: list[str] | None = None) -> Iterator[str]:
+    """
+    Split a stream of text chunks into lines. Equivalent to ``"".join(chunks).split("\\n")`` without holding the joined text.
+
+    :param chunks: Text chunks, may contain any number of newlines
+    :param tail: If provided, the unterminated last line is appended here instead of being yielded
+    """
+    pending = ""
+    for chunk in chunks:
+        parts = chunk.split("\n")
+        if len(parts) == 1:
+            pending += chunk
+            continue
+        yield pending + parts[0]
+        yield from islice(parts, 1, len(parts) - 1)
+        pending = parts[-1]
+    if tail is None:
+        yield pending
+    else:
+        tail.append(pending)
+
+
+def _pte_address_key(lin_name: str, level: int, g_level: int | None) -> str:
+    "Key for a resolved ``;#read_pte``/``;#write_pte`` target in :attr:`CachedElaboration.pte_addresses`"
+    return f"{lin_name},{level},{g_level if g_level is not None else -1}"
+
+
+_MAX_CAPPED_GAP = 0x100000  #: Largest gap padded to meet ``FeatMgr.linker_max_segments``, so a cap can't create a huge ELF
+
+
+def _plan_load_segments(
+    sections: list[tuple[str, int, int]],
+    max_gap: int = 0,
+    max_segments: int | None = None,
+    dram_ranges: list[tuple[int, int]] | None = None,
+) -> tuple[list[int], int]:
+    """
+    Assign address-sorted sections to ``PT_LOAD`` segments.
+
+    Sections are assumed to span at least a page, since their sizes aren't known until link time.
+    Two sections next to each other in VMA order can share a segment when their VMA and LMA differ by the same amount, and no other section is loaded between them.
+    The gap between them is padded in the ELF file, so the padding is loaded too. Gaps are only padded inside a DRAM range, never over IO.
+
+    Sections that are a page apart are always merged, along with sections up to ``max_gap`` bytes further apart.
+    If there are still more than ``max_segments`` segments, the smallest remaining gaps up to :data:`_MAX_CAPPED_GAP` are merged until there are few enough.
+
+    :param sections: ``(name, vma, lma)`` of each section, sorted by VMA
+    :param max_gap: Largest gap in bytes to pad
+    :param max_segments: Most segments to create, if possible
+    :param dram_ranges: Inclusive ``(start, end)`` physical ranges that padding may be loaded into. No gaps are padded if not provided
+    :return: Segment index for each section, and the total bytes of padding
+    """
+    page_size = 0x1000
+    lmas = sorted(lma for _, _, lma in sections)
+
+    # gaps[i] is the padding to merge section i into the segment of section i - 1, for sections that can be merged
+    gaps: dict[int, int] = {}
+    for i in range(1, len(sections)):
+        _, prev_vma, prev_lma = sections[i - 1]
+        _, vma, lma = sections[i]
+        gap = vma - prev_vma - page_size
+        if gap < 0 or vma - prev_vma != lma - prev_lma:
+            continue
+        if bisect_left(lmas, lma) != bisect_right(lmas, prev_lma):
+            continue  # another section is loaded in between
+        if gap > 0 and not any(start <= prev_lma and lma - 1 <= end for start, end in dram_ranges or []):
+            continue
+        gaps[i] = gap
+
+    merged = {i for i, gap in gaps.items() if gap <= max_gap}
+    num_segments = len(sections) - len(merged)
+    if max_segments is not None and num_segments > max_segments:
+        capped_gaps = [i for i in gaps.keys() - merged if gaps[i] <= _MAX_CAPPED_GAP]
+        for i in sorted(capped_gaps, key=lambda i: (gaps[i], i))[: num_segments - max_segments]:
+            merged.add(i)
+        num_segments = len(sections) - len(merged)
+        if num_segments > max_segments:
+            log.warning(f"Could not fit {len(sections)} sections in {max_segments} segments, using {num_segments}")
+
+    seg_indices: list[int] = []
+    seg_id = -1
+    for i in range(len(sections)):
+        if i not in merged:
+            seg_id += 1
+        seg_indices.append(seg_id)
+    return seg_indices, sum(gaps[i] for i in merged)
+
+
 class AssemblyWriter:
     """
     This handles generating and writing assembly code. It's responsible for writing:
@@ -72,14 +189,23 @@ class AssemblyWriter:
             self.code_offset = self.rng.random_in_range(0, 0x3F * 5, 16)
         self.single_assembly_file = self.featmgr.single_assembly_file or self.featmgr.linux_mode
 
-    def write(self, rasm: Path, generated_files: GeneratedFiles) -> None:
+        # Incremental elaboration state. include_files tracks generated .inc files so they can be cached,
+        # cached_elaboration is set when reusing a previous elaboration
+        self.include_files: list[Path] = []
+        self.cached_elaboration: CachedElaboration | None = None
+        self._prefix_lines: list[str] = []
+        self._prefix_tail = ""
+        self._section_code_found = False
+        self._page_mappings_by_phys_name: dict[str, ParsedPageMapping] | None = None
+
+    def write(self, rasm: Path | Sequence[str], generated_files: GeneratedFiles) -> None:
         """
         Generates and writes all files.
 
         - Always writes assembly file and linker script.
         - Conditionally writes equates, pagetables, and runtime files (.inc files).
 
-        :param rasm: Path to the input RASM file
+        :param rasm: Path to the input RASM file, or its lines if the test is held in memory
         :param generated_files: Generated files container
         """
 
@@ -87,6 +213,60 @@ class AssemblyWriter:
         self.create_linker_script(generated_files.linker_script)
         self.create_c_files(generated_files)
 
+    def write_incremental(self, rasm: Path | Sequence[str], generated_files: GeneratedFiles, cached: CachedElaboration) -> None:
+        """
+        Writes all files from a cached elaboration. Only the test body is run through :meth:`find_and_replace_assembly`;
+        include files and linker script are restored from the cache.
+
+        :param rasm: Path to the input RASM file, or its lines if the test is held in memory
+        :param generated_files: Generated files container
+        :param cached: Elaboration from a previous run with the same key
+        """
+        self.cached_elaboration = cached
+        for name, content in cached.include_files.items():
+            include_file = self.run_dir / name
+            if not include_file.exists() or include_file.read_text() != content:
+                include_file.write_text(content)
+        self.create_assembly_files(rasm, generated_files)
+        with open(generated_files.linker_script, "w") as linker_file:
+            linker_file.write(cached.linker_script)
+        self.create_c_files(generated_files)
+
+    def export_elaboration(self, key: str, generated_files: GeneratedFiles) -> CachedElaboration:
+        """
+        Collect the products of a full :meth:`write` so they can be cached.
+
+        :param key: Elaboration key
+        :param generated_files: Generated files container passed to :meth:`write`
+        """
+        pte_pagesizes: dict[str, list[str | None]] = {}
+        for lin_name in self.pool.parsed_page_mappings_with_lin_name:
+            pagesizes = self._get_pte_pagesizes(lin_name)
+            if pagesizes is not None and isinstance(pagesizes[0], RV.RiscvPageSizes):
+                pte_pagesizes[lin_name] = [p.name if isinstance(p, RV.RiscvPageSizes) else None for p in pagesizes]
+        pte_addresses: dict[str, int] = {}
+        if self.featmgr.static_pte_access and self.featmgr.paging_mode != RV.RiscvPagingModes.DISABLE:
+            max_levels = RV.RiscvPagingModes.max_levels(self.featmgr.paging_mode)
+            g_levels: list[int | None] = [None]
+            if self.featmgr.paging_g_mode != RV.RiscvPagingModes.DISABLE:
+                g_levels += list(range(RV.RiscvPagingModes.max_levels(self.featmgr.paging_g_mode)))
+            for lin_name in self.pool.parsed_page_mappings_with_lin_name:
+                for level in range(max_levels + 1):
+                    for g_level in g_levels:
+                        pte_address = self._get_static_pte_address(lin_name, level, g_level)
+                        if pte_address is not None:
+                            pte_addresses[_pte_address_key(lin_name, level, g_level)] = pte_address
+        return CachedElaboration(
+            key=key,
+            prefix_lines=self._prefix_lines,
+            prefix_tail=self._prefix_tail,
+            section_code_found=self._section_code_found,
+            include_files={f.name: f.read_text() for f in self.include_files},
+            linker_script=generated_files.linker_script.read_text(),
+            pte_pagesizes=pte_pagesizes,
+            pte_addresses=pte_addresses,
+        )
+
     def _generate_aplic_header(self) -> list[str]:
         aplic_header_content: list[str] = []
         if self.featmgr.io_maplic_addr is not None:
@@ -121,36 +301,67 @@ class AssemblyWriter:
         assert self.featmgr.rvmodel_macros is not None, "rvmodel_macros must be set before assembly generation"
         shutil.copy(self.featmgr.rvmodel_macros, self.run_dir / "rvmodel_macros.h")
 
-    def create_assembly_files(self, rasm: Path, generated_files: GeneratedFiles) -> None:
+    def create_assembly_files(self, rasm: Path | Sequence[str], generated_files: GeneratedFiles) -> None:
         """
         Generates assembly file and any conditional files. E.g equates, pagetables, :class:`Runtime` files.
 
         Splits input file into headers and test code, generates runtime code then equates.
 
-        :param rasm: Path to the input RASM file
+        :param rasm: Path to the input RASM file, or its lines if the test is held in memory
         :param generated_files: Generated files container
         """
-        header_section, test_section = self.split_rasm_sections(rasm)
-        runtime_sections = self.generate_runtime_sections()
-        equates_section = self.generate_equates_section()
-        data_section = self.generate_data_section()
-
-        # Prepend #include for rvmodel_macros.h so I/O macros are always available
-        # This must come before equates so macros are available in the opsys #include
-        rvmodel_include: list[str] = ['#include "rvmodel_macros.h"\n']
-
-        if self.pool.init_aplic_interrupts:
-            aplic_imsic_assembly = self.generate_aplic_imsic_assembly()
-            assembly_content = header_section + rvmodel_include + equates_section + aplic_imsic_assembly + runtime_sections + test_section + data_section
-        else:
-            assembly_content = header_section + rvmodel_include + equates_section + runtime_sections + test_section + data_section
+        header_section, test_section_start = self._scan_rasm_sections(rasm)
+        state = _FindReplaceState()
+        with open(generated_files.assembly, "w") as assembly_file, tempfile.TemporaryFile("w+") as runtime_spool:
+            prefix_tail: list[str] = []
+            prefix_lines: Iterable[str]
+            if self.cached_elaboration is not None:
+                prefix_lines = self.cached_elaboration.prefix_lines
+                prefix_tail.append(self.cached_elaboration.prefix_tail)
+                state.section_code_found = self.cached_elaboration.section_code_found
+            else:
+                # Equates are generated after the runtime but come first in the file, so the runtime is spooled to disk instead of held in memory
+                runtime_spool.writelines(self.generate_runtime_sections())
+                runtime_spool.seek(0)
+
+                # Prepend #include for rvmodel_macros.h so I/O macros are always available
+                # This must come before equates so macros are available in the opsys #include
+                rvmodel_include: list[str] = ['#include "rvmodel_macros.h"\n']
+                aplic_imsic_assembly = self.generate_aplic_imsic_assembly() if self.pool.init_aplic_interrupts else []
+                prefix_chunks = chain(header_section, rvmodel_include, self.generate_equates_section(), aplic_imsic_assembly, runtime_spool)
+
+                # The unterminated last line of the prefix is joined with the test body, so the prefix can be reused for incremental elaboration
+                prefix_lines = self.find_and_replace_assembly(_split_lines(prefix_chunks, tail=prefix_tail), state)
+                if self.featmgr.incremental:
+                    prefix_lines = self._record_prefix_lines(prefix_lines)
+            separator = self._write_lines(assembly_file, prefix_lines, separator="")
+            self._prefix_tail = prefix_tail[0]
+            self._section_code_found = state.section_code_found
+
+            # apply find and replace to test code
+            body_chunks = chain(prefix_tail, self._iter_rasm_lines(rasm, test_section_start), self.generate_data_section())
+            self._write_lines(assembly_file, self.find_and_replace_assembly(_split_lines(body_chunks), state), separator)
+
+    def _record_prefix_lines(self, lines: Iterable[str]) -> Iterator[str]:
+        "Pass lines through, keeping a copy for :meth:`export_elaboration`"
+        for line in lines:
+            self._prefix_lines.append(line)
+            yield line
+
+    def _write_lines(self, file: IO[str], lines: Iterable[str], separator: str) -> str:
+        """
+        Write lines joined by newlines as they are produced.
 
-        # apply find and replace to all code
-        all_assembly = "".join(assembly_content)
-        with open(generated_files.assembly, "w") as assembly_file:
-            assembly_file.write("\n".join(self.find_and_replace_assembly(all_assembly)))
+        :param separator: Written before the first line; empty at the start of the file
+        :return: Separator for the next call
+        """
+        for line in lines:
+            file.write(separator)
+            file.write(line)
+            separator = "\n"
+        return separator
 
-    def split_rasm_sections(self, rasm: Path) -> tuple[list[str], list[str]]:
+    def split_rasm_sections(self, rasm: Path | Sequence[str]) -> tuple[list[str], list[str]]:
         """
         Read .rasm file and return a series of sections. Need to find where to split the test code from header code.
 
@@ -167,34 +378,50 @@ class AssemblyWriter:
         This ensures includes are placed before all code sections.
 
         """
-        with open(rasm, "r") as input_file:
-            lines = input_file.readlines()
-
-        # find where to split tests, the first occurrence of any code section
-        code_section_idx = None
-        code_super_0_idx = None
-        code_machine_0_idx = None
-        for i, line in enumerate(lines):
-            if ".section .code" in line and "_" not in line and code_section_idx is None:
-                code_section_idx = i
-            if ".section .code_super_0" in line and code_super_0_idx is None:
-                code_super_0_idx = i
-            if ".section .code_machine_0" in line and code_machine_0_idx is None:
-                code_machine_0_idx = i
-
-        if code_section_idx is None:
-            raise ValueError(f"Couldn't find a .section .code section in input file, {rasm.name}.")
-
-        # Use the earliest (lowest line number) of the found code sections
-        test_section_start_idx = code_section_idx
-        if code_super_0_idx is not None and code_super_0_idx < test_section_start_idx:
-            test_section_start_idx = code_super_0_idx
-        if code_machine_0_idx is not None and code_machine_0_idx < test_section_start_idx:
-            test_section_start_idx = code_machine_0_idx
-
-        header_section = lines[:test_section_start_idx]
-        test_section = lines[test_section_start_idx:]
-        return header_section, test_section
+        header_section, test_section_start = self._scan_rasm_sections(rasm)
+        return header_section, list(self._iter_rasm_lines(rasm, test_section_start))
+
+    def _scan_rasm_sections(self, rasm: Path | Sequence[str]) -> tuple[list[str], int]:
+        """
+        Stream through the .rasm file to find the start of the test section, see :meth:`split_rasm_sections`.
+        The test section is the first line with any of the code sections.
+
+        :return: Header section lines and the line index where the test section starts
+        """
+        header_section: list[str] = []
+        test_section_start_idx = None
+        code_section_found = False
+        with _open_rasm(rasm) as input_file:
+            for i, line in enumerate(input_file):
+                is_code_section = ".section .code" in line and "_" not in line
+                if is_code_section or ".section .code_super_0" in line or ".section .code_machine_0" in line:
+                    if test_section_start_idx is None:
+                        test_section_start_idx = i
+                    if is_code_section:
+                        code_section_found = True
+                        break
+                elif test_section_start_idx is None:
+                    header_section.append(line)
+
+        if not code_section_found or test_section_start_idx is None:
+            raise ValueError(f"Couldn't find a .section .code section in input file, {rasm.name if isinstance(rasm, Path) else self.testname}.")
+        return header_section, test_section_start_idx
+
+    def _iter_rasm_lines(self, rasm: Path | Sequence[str], start: int) -> Iterator[str]:
+        "Stream lines of the .rasm file starting from line index ``start``"
+        with _open_rasm(rasm) as input_file:
+            yield from islice(input_file, start, None)
+
+    @property
+    def _fs_enabled(self) -> bool:
+        "True if FS is never Off while the test runs: the loader turns it on with F/D, and ``--fs_randomization`` doesn't pick Off"
+        fp_supported = self.featmgr.is_feature_supported("f") or self.featmgr.is_feature_supported("d")
+        return fp_supported and not (self.featmgr.fs_randomization > 0 and 0 in self.featmgr.fs_randomization_values)
+
+    @property
+    def _vs_enabled(self) -> bool:
+        "True if VS is never Off while the test runs: the loader turns it on with V, and ``--vs_randomization`` doesn't pick Off"
+        return self.featmgr.is_feature_supported("v") and not (self.featmgr.vs_randomization > 0 and 0 in self.featmgr.vs_randomization_values)
 
     def _emit_direct_csr(self, line: str, csr_name: str, access_type: str) -> str:
         """Emit direct csrr/csrw/csrs/csrc instructions (fallback when csr_manager unavailable)."""
@@ -207,7 +434,33 @@ class AssemblyWriter:
             return line + f"\ncsrc {csr_asm}, t2\n"
         return line + f"\ncsrw {csr_asm}, t2\n"
 
-    def find_and_replace_assembly(self, assembly_content: str) -> list[str]:
+    _DATA_DIRECTIVES = {1: ".byte", 2: ".half", 4: ".word", 8: ".dword"}
+
+    def _random_fill_block(self, fill: ParsedRandomFill, index: int, values_per_line: int = 8) -> str:
+        """
+        Generate the values for a ``;#random_fill`` in one vectorized draw and format them as data.
+
+        Each fill draws from its own stream of the test seed, so values don't depend on other randomization.
+        With ``incbin=1`` the values are written in the target's byte order to ``<testname>_random_fill_<index>.bin`` and pulled in with ``.incbin``,
+        except with ``single_assembly_file`` where everything has to stay in the .S file.
+
+        :param fill: Parsed directive
+        :param index: Ordinal of the directive in the test, used as the stream id
+        :param values_per_line: Values per data directive line
+        """
+        values = BulkNumGen(self.rng.get_seed(), stream=index).rand_type(fill.data_type, fill.count, fill.and_mask, fill.or_mask)
+        size = values.dtype.itemsize
+        if fill.incbin and not self.single_assembly_file:
+            bin_file = self.run_dir / f"{self.testname}_random_fill_{index}.bin"
+            byte_order = ">" if self.featmgr.big_endian else "<"
+            values.astype(f"{byte_order}u{size}").tofile(bin_file)
+            return f'.incbin "{bin_file.name}"\n'
+        directive = self._DATA_DIRECTIVES[size]
+        hex_values = [f"0x{v:0{size * 2}x}" for v in values.tolist()]
+        lines = [f"{directive} " + ", ".join(hex_values[i : i + values_per_line]) for i in range(0, len(hex_values), values_per_line)]
+        return "\n".join(lines) + "\n"
+
+    def find_and_replace_assembly(self, lines: Iterable[str], state: _FindReplaceState | None = None) -> Iterator[str]:
         """
         Handle overwritting text from input file to output assembly file. Currently handles:
 
@@ -217,34 +470,33 @@ class AssemblyWriter:
         - ;#test_passed, ;#test_failed
 
 
-        :param lines: List of lines from input file
-        :return: List of lines with text replaced
+        Lines are rewritten as they are consumed, so arbitrarily large assembly can be streamed through.
+
+        :param lines: Lines of assembly, without newlines
+        :param state: State from rewriting preceding assembly. Defaults to the start of a file
+        :return: Iterator of lines with text replaced
         """
         priority = ["user", "super", "machine"]
         init_mem_sections = self.pool.get_parsed_init_mem_addrs()
-        section_code_found = False
-
-        parsed_lines: list[str] = []
-        in_pma_hint = False
-        trigger_config_idx = 0
-        trigger_disable_idx = 0
-        trigger_enable_idx = 0
-        for line in assembly_content.split("\n"):
+        if state is None:
+            state = _FindReplaceState()
+
+        for line in lines:
             # Filter out PMA hint directives - they are processed by parser and should not appear in output
             # Handle multi-line directives
             stripped = line.strip()
             if stripped.startswith(";#pma_hint"):
-                in_pma_hint = True
+                state.in_pma_hint = True
                 continue
-            if in_pma_hint:
+            if state.in_pma_hint:
                 # Continue skipping until we find the closing parenthesis
                 if ")" in stripped and not stripped.startswith("#"):
-                    in_pma_hint = False
+                    state.in_pma_hint = False
                 continue
 
             # replace .section .code, with .section .code, "ax" or "aw"
-            if ".section .code," in line and not section_code_found:
-                section_code_found = True
+            if ".section .code," in line and not state.section_code_found:
+                state.section_code_found = True
                 line = '.section .code, "ax"' if not (self.featmgr.single_assembly_file and not self.featmgr.wysiwyg and len(self.featmgr.hooks) == 0) else '.section .code, "aw"'
 
             # replace ;#init_memory with .section .lin_name, "aw" or .section .lin_name, "ax"
@@ -288,8 +540,8 @@ class AssemblyWriter:
             parsed_line = line.strip()
             if parsed_line.startswith(";#trigger_config("):
                 configs = self.pool.get_parsed_trigger_configs()
-                if trigger_config_idx < len(configs) and self.featmgr.get_summary().get("SDTRIG_SUPPORTED", 0):
-                    cfg = configs[trigger_config_idx]
+                if state.trigger_config_idx < len(configs) and self.featmgr.get_summary().get("SDTRIG_SUPPORTED", 0):
+                    cfg = configs[state.trigger_config_idx]
                     tselect_id, tdata1_id, tdata2_id = cfg.csr_ids
                     flag_name = "machine_csr_jump_table_flags"
                     sys_call = "0xf0001005"
@@ -330,15 +582,15 @@ class AssemblyWriter:
                         code += f"{addr_insn}\nli x31, {flag_name}\n" f"li t0, {tdata2_id}\nsd t0, 0(x31)\n" f"li x31, {sys_call}\necall\n"
                     code += f"li t2, 0x{tdata1_val:x}\nli x31, {flag_name}\n" f"li t0, {tdata1_id}\nsd t0, 0(x31)\n" f"li x31, {sys_call}\necall\n"
                     line = line + "\n" + code
-                trigger_config_idx += 1
-                parsed_lines.append(line)
+                state.trigger_config_idx += 1
+                yield line
                 continue
 
             # replace ;#trigger_disable with tselect + tdata1=0
             if parsed_line.startswith(";#trigger_disable("):
                 disables = self.pool.get_parsed_trigger_disable()
-                if trigger_disable_idx < len(disables) and self.featmgr.get_summary().get("SDTRIG_SUPPORTED", 0):
-                    cfg = disables[trigger_disable_idx]
+                if state.trigger_disable_idx < len(disables) and self.featmgr.get_summary().get("SDTRIG_SUPPORTED", 0):
+                    cfg = disables[state.trigger_disable_idx]
                     csr_acc = self.pool.get_parsed_csr_accesses()
                     tselect_acc = csr_acc.get("tselect", {}).get("write_force_machine")
                     tdata1_acc = csr_acc.get("tdata1", {}).get("write_force_machine")
@@ -349,15 +601,15 @@ class AssemblyWriter:
                         code += f"li t2, {cfg.index}\nli x31, {flag_name}\nli t0, {tselect_acc.csr_id}\nsd t0, 0(x31)\nli x31, {sys_call}\necall\n"
                         code += f"li t2, 0\nli x31, {flag_name}\nli t0, {tdata1_acc.csr_id}\nsd t0, 0(x31)\nli x31, {sys_call}\necall\n"
                         line = line + "\n" + code
-                trigger_disable_idx += 1
-                parsed_lines.append(line)
+                state.trigger_disable_idx += 1
+                yield line
                 continue
 
             # replace ;#trigger_enable - restore tdata1 from prior config for same index
             if parsed_line.startswith(";#trigger_enable("):
                 enables = self.pool.get_parsed_trigger_enable()
-                if trigger_enable_idx < len(enables) and self.featmgr.get_summary().get("SDTRIG_SUPPORTED", 0):
-                    cfg = enables[trigger_enable_idx]
+                if state.trigger_enable_idx < len(enables) and self.featmgr.get_summary().get("SDTRIG_SUPPORTED", 0):
+                    cfg = enables[state.trigger_enable_idx]
                     configs = self.pool.get_parsed_trigger_configs()
                     prev_cfg = next((c for c in reversed(configs) if c.index == cfg.index), None)
                     csr_acc = self.pool.get_parsed_csr_accesses()
@@ -390,8 +642,17 @@ class AssemblyWriter:
                         code += f"li t2, {cfg.index}\nli x31, {flag_name}\nli t0, {tselect_acc.csr_id}\nsd t0, 0(x31)\nli x31, {sys_call}\necall\n"
                         code += f"li t2, 0x{tdata1_val:x}\nli x31, {flag_name}\n" f"li t0, {tdata1_acc.csr_id}\nsd t0, 0(x31)\n" f"li x31, {sys_call}\necall\n"
                         line = line + "\n" + code
-                trigger_enable_idx += 1
-                parsed_lines.append(line)
+                state.trigger_enable_idx += 1
+                yield line
+                continue
+
+            # replace ;#random_fill with a packed block of random values
+            if parsed_line.startswith(";#random_fill("):
+                fills = self.pool.get_parsed_random_fills()
+                if state.random_fill_idx < len(fills):
+                    line = line + "\n" + self._random_fill_block(fills[state.random_fill_idx], state.random_fill_idx)
+                state.random_fill_idx += 1
+                yield line
                 continue
 
             # replace ;#csr_rw with csrr/csrw instructions or system call to jump table
@@ -487,7 +748,12 @@ class AssemblyWriter:
                     if read_write_set_clear in ("write_subfield", "read_subfield") and directive_field:
                         subfield = {directive_field: str(directive_value or 0)}
 
-                    use_syscall = (force_machine_rw_line and test_priv_mode != "machine") or ((priv_mode_prio < csr_prio or no_virtualized_on_hypervisor) and direct_rw != "true")
+                    # The directive's privilege is guessed from the CSR name. Skip the syscall when the test can access the CSR directly, e.g. vstart from user mode
+                    virtualized = self.featmgr.env == RV.RiscvTestEnv.TEST_ENV_VIRTUALIZED and self.featmgr.priv_mode != RV.RiscvPrivileges.MACHINE
+                    accessible = csr_config is not None and csr_mgr.accessible_from(
+                        csr_config, self.featmgr.priv_mode, virtualized=virtualized, fs_enabled=self._fs_enabled, vs_enabled=self._vs_enabled
+                    )
+                    use_syscall = (force_machine_rw_line and test_priv_mode != "machine") or ((priv_mode_prio < csr_prio or no_virtualized_on_hypervisor) and direct_rw != "true" and not accessible)
 
                     if use_syscall:
                         code_to_replace = ""
@@ -523,7 +789,7 @@ class AssemblyWriter:
                         else:
                             line = self._emit_direct_csr(line, csr_name, access_type)
 
-            # replace ;#read_pte with syscall to walk handler
+            # replace ;#read_pte with syscall to PTE access handler
             parsed_line = line.strip()
             if parsed_line.startswith(";#read_pte"):
                 pattern = r"^;#read_pte\((?P<lin_name>\w+),\s*(?P<level>\d+|leaf|nonleaf|final)(?:,\s*(?P<g_level>\d+|leaf|nonleaf))?\)"
@@ -532,21 +798,10 @@ class AssemblyWriter:
                     lin_name = match.group("lin_name")
                     level, g_level = self._resolve_pte_levels(lin_name, match.group("level"), match.group("g_level"))
 
-                    # Generate code to store VA, level, and g_level into pte_access_flags, then ecall
-                    g_level_value = g_level if g_level is not None else -1
-                    code_to_replace = "li x31, pte_access_flags\n"
-                    code_to_replace += f"li t0, {lin_name}\n"
-                    code_to_replace += "sd t0, 0(x31)\n"  # [0] = VA
-                    code_to_replace += f"li t0, {level}\n"
-                    code_to_replace += "sd t0, 8(x31)\n"  # [1] = level
-                    code_to_replace += f"li t0, {g_level_value}\n"
-                    code_to_replace += "sd t0, 16(x31)\n"  # [2] = g_level (-1 = no g-stage)
-                    code_to_replace += "li x31, 0xf0001007\n"
-                    code_to_replace += "ecall\n"
-
+                    code_to_replace = self._pte_access_code(lin_name, level, g_level, is_write=False)
                     line = line + "\n" + code_to_replace
 
-            # replace ;#write_pte with syscall to walk handler
+            # replace ;#write_pte with syscall to PTE access handler
             parsed_line = line.strip()
             if parsed_line.startswith(";#write_pte"):
                 pattern = r"^;#write_pte\((?P<lin_name>\w+),\s*(?P<level>\d+|leaf|nonleaf|final)(?:,\s*(?P<g_level>\d+|leaf|nonleaf))?\)"
@@ -555,19 +810,7 @@ class AssemblyWriter:
                     lin_name = match.group("lin_name")
                     level, g_level = self._resolve_pte_levels(lin_name, match.group("level"), match.group("g_level"))
 
-                    # Generate code to store VA, level, and g_level into pte_access_flags, then ecall
-                    # t2 should already contain the value to write before the ecall
-                    g_level_value = g_level if g_level is not None else -1
-                    code_to_replace = "li x31, pte_access_flags\n"
-                    code_to_replace += f"li t0, {lin_name}\n"
-                    code_to_replace += "sd t0, 0(x31)\n"  # [0] = VA
-                    code_to_replace += f"li t0, {level}\n"
-                    code_to_replace += "sd t0, 8(x31)\n"  # [1] = level
-                    code_to_replace += f"li t0, {g_level_value}\n"
-                    code_to_replace += "sd t0, 16(x31)\n"  # [2] = g_level (-1 = no g-stage)
-                    code_to_replace += "li x31, 0xf0001008\n"
-                    code_to_replace += "ecall\n"
-
+                    code_to_replace = self._pte_access_code(lin_name, level, g_level, is_write=True)
                     line = line + "\n" + code_to_replace
 
             parsed_line = line.strip()
@@ -581,59 +824,65 @@ class AssemblyWriter:
                 replaced_lines = self.runtime.test_failed()
                 line = line + "\n\t" + "\n\t".join(replaced_lines)
 
-            parsed_lines.append(line)
+            yield line
 
-        return parsed_lines
-
-    def generate_runtime_sections(self) -> list[str]:
+    def generate_runtime_sections(self) -> Iterator[str]:
         """
         Generate and write pagetable and all runtime sections.
-        This calls all :class:`Runtime` modules to generate code, and should be called before :meth:`generate_equates_section`
+        This calls all :class:`Runtime` modules to generate code, and must be consumed before :meth:`generate_equates_section`
+
+        Code is written to the .inc files as it is generated. With ``single_assembly_file`` the code is yielded instead.
 
-        :return: List of strings containing pagetables and runtime sections
+        :return: Iterator of text chunks containing pagetables and runtime sections
         """
 
-        generated_sections: list[str] = []
         # write pagetables into generated section
         if self.featmgr.paging_mode != RV.RiscvPagingModes.DISABLE or self.featmgr.paging_g_mode != RV.RiscvPagingModes.DISABLE:
-            pagetables_assembly = "\n".join(self._generate_pagetable_assembly())
+            pagetables_assembly = self._generate_pagetable_assembly()
 
             if self.single_assembly_file:
-                generated_sections.append("\n## pagetables ##\n" + pagetables_assembly)
+                yield "\n## pagetables ##\n"
+                yield from self._join_lines(pagetables_assembly)
             else:
                 pagetables_inc_file = self.run_dir / f"{self.testname}_pagetables.inc"
-                with open(pagetables_inc_file, "w") as f:
-                    f.write(pagetables_assembly + "\n")
-                generated_sections.append(f'\n.include "{pagetables_inc_file.name}"\n')
+                self._write_include(pagetables_inc_file, pagetables_assembly)
+                yield f'\n.include "{pagetables_inc_file.name}"\n'
 
         # generate runtime includes, adding to start of file
-        runtime_sections: list[str] = []
         for runtime_name, runtime_code in self.runtime.generate():
-            runtime_assembly = "\n".join(runtime_code)
-
             if self.single_assembly_file:
-                runtime_sections.append(f"\n## {runtime_name} ##\n" + runtime_assembly)
+                yield f"\n## {runtime_name} ##\n"
+                yield from self._join_lines(runtime_code)
             else:
                 include_file = self.run_dir / f"{self.testname}_{runtime_name}.inc"
-                with open(include_file, "w") as f:
-                    f.write(runtime_assembly + "\n")
-                runtime_sections.append(f'#include "{include_file.name}"\n')
+                self._write_include(include_file, runtime_code)
+                yield f'#include "{include_file.name}"\n'
 
         if self.featmgr.c_used:
-            runtime_sections.append(
-                """
+            yield """
             .balign 16, 0
             __c__stack_addr:
                 .dword __c__stack
             """
-            )
 
         # Debug ROM section: ;#discrete_debug_test() body + DRET epilogue
         debug_rom_section = self._generate_debug_rom_section()
         if debug_rom_section:
-            runtime_sections.append(debug_rom_section)
-
-        return generated_sections + runtime_sections
+            yield debug_rom_section
+
+    def _join_lines(self, lines: Iterable[str]) -> Iterator[str]:
+        "Lazy equivalent of ``'\\n'.join(lines)``"
+        separator = ""
+        for line in lines:
+            yield separator + line
+            separator = "\n"
+
+    def _write_include(self, include_file: Path, lines: Iterable[str]) -> None:
+        "Stream lines into a generated include file"
+        with open(include_file, "w") as f:
+            f.writelines(self._join_lines(lines))
+            f.write("\n")
+        self.include_files.append(include_file)
 
     # Assembly emitted when user writes ;#dret in ;#discrete_debug_test() body (restore DPC, return from debug mode)
     _DEBUG_ROM_DRET_ASM = """
@@ -1051,6 +1300,7 @@ __set_aplic_isr:
             with open(aplic_assembly_path, "w") as f:
                 f.write(aplic_assembly_inc_content)
             f.close()
+            self.include_files.append(aplic_assembly_path)
             ret.append(f'.include "{aplic_assembly_inc}"\n')
 
         return ret
@@ -1072,26 +1322,23 @@ __c__stack:
 
         return ret
 
-    def generate_equates_section(self) -> list[str]:
+    def generate_equates_section(self) -> Iterator[str]:
         """
-        Generate the equates section, return all code in a list of strings.
+        Generate the equates section. Writes the equates .inc file, or yields the equates with ``single_assembly_file``
 
         ..note::
 
             This *must* be called last, since :class:`Runtime` needs to populate the equates sections
         """
         # generate equates, this needs to be done last but appear first in the file for li instructions to work
-        equates_section: list[str] = []
-
-        equates_assembly = "\n".join(self._generate_equates_assembly())
+        equates_assembly = self._generate_equates_assembly()
         if self.single_assembly_file:
-            equates_section.append("## equates ##\n" + equates_assembly)
+            yield "## equates ##\n"
+            yield from self._join_lines(equates_assembly)
         else:
             equates_inc_file = self.run_dir / f"{self.testname}_equates.inc"
-            with open(equates_inc_file, "w") as equates_file:
-                equates_file.write(equates_assembly + "\n")
-            equates_section.append(f'.include "{equates_inc_file.name}"\n')
-        return equates_section
+            self._write_include(equates_inc_file, equates_assembly)
+            yield f'.include "{equates_inc_file.name}"\n'
 
     def create_linker_script(self, linker_script: Path) -> None:
         """
@@ -1119,26 +1366,13 @@ __c__stack:
                 log.debug(f"{section_name} -> vma=0x{vma:016x}, lma=0x{lma:016x}")
                 sections.append((print_section_name, vma, lma))
 
-            # Group contiguous sections into the same segment.  Two adjacent
-            # sections are contiguous when *both* their VMAs and LMAs are
-            # exactly one page (4 KB) apart, so the linker can pack them into
-            # a single LOAD segment without file-offset gaps.
-            PAGE_SIZE = 0x1000
-            seg_indices: list[int] = []
-            seg_id = 0
-            for i, (_, vma, lma) in enumerate(sections):
-                if i == 0:
-                    seg_indices.append(seg_id)
-                else:
-                    prev_vma = sections[i - 1][1]
-                    prev_lma = sections[i - 1][2]
-                    if vma - prev_vma == PAGE_SIZE and lma - prev_lma == PAGE_SIZE:
-                        # Contiguous with previous section — same segment
-                        seg_indices.append(seg_id)
-                    else:
-                        seg_id += 1
-                        seg_indices.append(seg_id)
-            num_segments = seg_id + 1 if sections else 0
+            # Sort by address so sections that are contiguous in memory end up next to each other, then group them into segments.
+            sections.sort(key=lambda section: (section[1], section[2]))
+            memory = self.featmgr.memory
+            dram_ranges = [(dram.start, dram.end) for dram in chain(memory.dram_ranges, memory.secure_ranges)]
+            seg_indices, padding = _plan_load_segments(sections, self.featmgr.linker_segment_gap, self.featmgr.linker_max_segments, dram_ranges)
+            num_segments = seg_indices[-1] + 1 if sections else 0
+            log.info(f"Linker script: {len(sections)} sections in {num_segments} PT_LOAD segments, 0x{padding:x} bytes of padding")
 
             # Emit PHDRS block — one PT_LOAD per segment group, none with
             # FILEHDR/PHDRS so the ELF/program headers are not mapped into
@@ -1172,29 +1406,25 @@ __c__stack:
         "Helper function to prefix hex linear names with __auto_secname_"
         return f"__auto_secname_{n}"
 
-    def _generate_pagetable_assembly(self) -> list[str]:
+    def _generate_pagetable_assembly(self) -> Iterator[str]:
         """
-        Generate pagetables text, return it as a list of strings.
+        Generate pagetables text. Page tables for each map are created as the previous map's lines are consumed.
 
-        :param pt_file_handle: Filehandle to write pagetables to
-        :return: List of strings containing pagetables assembly
+        :return: Iterator of lines containing pagetables assembly
         """
-        # Create pagetables here
-        pagetable_content: list[str] = []
         # Handle the vs-stage pagetables first since we need to know the guest physical
         # address to generate the g-stage pagetables
         for map in self.pool.get_page_maps().values():
             if not map.g_map and map.paging_mode != RV.RiscvPagingModes.DISABLE:
                 map.create_pagetables(self.rng)
-                pagetable_content.append("\n".join(map.generate_pagetables_assembly()))
+                yield from map.generate_pagetables_assembly()
 
         # Now that the vs-stage pagetables are generated, handle the g-stage pagetables
         if self.featmgr.paging_g_mode != RV.RiscvPagingModes.DISABLE:
             for map in self.pool.get_page_maps().values():
                 if map.g_map:
                     map.create_pagetables(self.rng)
-                    pagetable_content.append("\n".join(map.generate_pagetables_assembly()))
-        return pagetable_content
+                    yield from map.generate_pagetables_assembly()
 
     def _resolve_pte_levels(
         self,
@@ -1210,13 +1440,13 @@ __c__stack:
         :returns: Tuple of (level, g_level) as integers (g_level is None when not specified).
         :raises ValueError: On invalid combinations (e.g. 'final' without g_level).
         """
-        page = self._get_page_for_addr_name(lin_name)
+        pagesizes = self._get_pte_pagesizes(lin_name)
 
         if level_str in ("leaf", "nonleaf", "final"):
-            if page is None:
+            if pagesizes is None:
                 raise ValueError(f";#read_pte/;#write_pte: cannot resolve '{level_str}' — no page found for '{lin_name}'")
             paging_mode = self.featmgr.paging_mode
-            pagesize: RV.RiscvPageSizes = page.pagesize
+            pagesize: RV.RiscvPageSizes = pagesizes[0]
             leaf_level = RV.RiscvPagingModes.max_levels(paging_mode) - 1 - RV.RiscvPageSizes.pt_leaf_level(pagesize)
             if level_str == "leaf":
                 level = leaf_level
@@ -1232,15 +1462,15 @@ __c__stack:
         g_level: int | None = None
         if g_level_str is not None:
             if g_level_str in ("leaf", "nonleaf"):
-                if page is None:
+                if pagesizes is None:
                     raise ValueError(f";#read_pte/;#write_pte: cannot resolve g_level='{g_level_str}' — no page found for '{lin_name}'")
                 g_paging_mode = self.featmgr.paging_g_mode
                 if level_str == "final":
-                    g_pagesize = page.gstage_vs_leaf_pagesize
+                    g_pagesize = pagesizes[1]
                     if g_pagesize is None:
                         raise ValueError(f";#read_pte/;#write_pte: cannot resolve g_level='{g_level_str}' — gstage_vs_leaf_pagesize not set for '{lin_name}'")
                 else:  # "leaf", "nonleaf", or integer level
-                    g_pagesize = page.gstage_vs_nonleaf_pagesize
+                    g_pagesize = pagesizes[2]
                     if g_pagesize is None:
                         raise ValueError(f";#read_pte/;#write_pte: cannot resolve g_level='{g_level_str}' — gstage_vs_nonleaf_pagesize not set for '{lin_name}'")
                 g_leaf_level = RV.RiscvPagingModes.max_levels(g_paging_mode) - 1 - RV.RiscvPageSizes.pt_leaf_level(g_pagesize)
@@ -1250,23 +1480,138 @@ __c__stack:
 
         return (level, g_level)
 
+    def _pte_access_code(self, lin_name: str, level: int, g_level: int | None, is_write: bool) -> str:
+        """
+        Code for a ``;#read_pte``/``;#write_pte`` directive. For writes, t2 should already contain the value to write before the ecall.
+
+        With ``static_pte_access`` the PTE address is resolved here and the syscall does a single load or store.
+        Otherwise, or if the PTE address isn't known at elaboration time, the syscall walks the page tables at runtime.
+        """
+        pte_address = self._get_static_pte_address(lin_name, level, g_level) if self.featmgr.static_pte_access else None
+        if pte_address is not None:
+            code = "li x31, pte_access_flags\n"
+            code += f"li t0, 0x{pte_address:x}\n"
+            code += "sd t0, 0(x31)\n"  # [0] = PTE address
+            code += f"li x31, {'0xf000100a' if is_write else '0xf0001009'}\n"
+            code += "ecall\n"
+            return code
+
+        # Store VA, level, and g_level into pte_access_flags, then ecall
+        g_level_value = g_level if g_level is not None else -1
+        code = "li x31, pte_access_flags\n"
+        code += f"li t0, {lin_name}\n"
+        code += "sd t0, 0(x31)\n"  # [0] = VA
+        code += f"li t0, {level}\n"
+        code += "sd t0, 8(x31)\n"  # [1] = level
+        code += f"li t0, {g_level_value}\n"
+        code += "sd t0, 16(x31)\n"  # [2] = g_level (-1 = no g-stage)
+        code += f"li x31, {'0xf0001008' if is_write else '0xf0001007'}\n"
+        code += "ecall\n"
+        return code
+
+    def _get_static_pte_address(self, lin_name: str, level: int, g_level: int | None) -> int | None:
+        """
+        Return the physical address of the PTE the runtime page table walk would reach, or None if it isn't known at elaboration time.
+
+        Follows the same steps as the walk in :class:`SysCalls`: the ``map_os`` tables (``satp``) down to ``level``, then for ``g_level``
+        the ``map_hyp`` tables (``hgatp``) for the guest physical address of that entry, using the g-stage walk linked to the vs-stage walk.
+        Levels count from the root, 0 being the root.
+        """
+        if self.cached_elaboration is not None:
+            return self.cached_elaboration.pte_addresses.get(_pte_address_key(lin_name, level, g_level))
+        if self.featmgr.paging_mode == RV.RiscvPagingModes.DISABLE or "map_os" not in self.pool.get_page_maps():
+            return None
+        os_map = self.pool.get_page_map("map_os")
+        walk = os_map.get_pte_walk(lin_name)
+        if walk is None or not walk.entries or walk.page.lin_addr is None:
+            return None
+
+        leaf = walk.entries[-1]
+        leaf_level = os_map.max_levels - 1 - leaf.level
+        if level <= leaf_level:
+            pt_entry = walk.entry_at_level(os_map.max_levels - 1 - level)
+            if pt_entry is None or pt_entry.address is None:
+                return None
+            table_base = pt_entry.address & ~0xFFF
+        elif level == leaf_level + 1 and g_level is not None:
+            # One level past the leaf the walk indexes into the final page
+            table_base = (leaf.get_value() >> 10) << 12
+        else:
+            return None
+        address = table_base + self._pte_index_offset(walk.page.lin_addr, os_map.max_levels, level)
+        if g_level is None:
+            return address
+
+        if self.featmgr.paging_g_mode == RV.RiscvPagingModes.DISABLE or "map_hyp" not in self.pool.get_page_maps():
+            return None
+        g_map = self.pool.get_page_map("map_hyp")
+        if level > 0:
+            # The table holding this entry is the guest physical page the entry one level up points to
+            g_walk = walk.g_stage.get(os_map.max_levels - level)
+        else:
+            # The root table comes from vsatp, no vs-stage entry points to it
+            g_walk = g_map.get_pte_walk_for_address(address)
+        if g_walk is None:
+            return None
+        g_entry = g_walk.entry_at_level(g_map.max_levels - 1 - g_level)
+        if g_entry is None or g_entry.address is None:
+            return None
+        return (g_entry.address & ~0xFFF) + self._pte_index_offset(address, g_map.max_levels, g_level)
+
+    @staticmethod
+    def _pte_index_offset(address: int, max_levels: int, level: int) -> int:
+        "Byte offset of the entry for ``address`` in its table at walk ``level``, 0 being the root. Same VPN shift as the runtime walk, so NAPOT pages index the same entry"
+        return ((address >> (12 + 9 * (max_levels - 1 - level))) & 0x1FF) * 8
+
+    def _get_pte_pagesizes(self, lin_name: str) -> tuple[RV.RiscvPageSizes, RV.RiscvPageSizes | None, RV.RiscvPageSizes | None] | None:
+        """Return (pagesize, gstage_vs_leaf_pagesize, gstage_vs_nonleaf_pagesize) for this lin_name, or None if no page was found."""
+        if self.cached_elaboration is not None:
+            names = self.cached_elaboration.pte_pagesizes.get(lin_name)
+            if names is None:
+                return None
+            pagesize, leaf_pagesize, nonleaf_pagesize = names
+            return (
+                RV.RiscvPageSizes[cast(str, pagesize)],
+                RV.RiscvPageSizes[leaf_pagesize] if leaf_pagesize is not None else None,
+                RV.RiscvPageSizes[nonleaf_pagesize] if nonleaf_pagesize is not None else None,
+            )
+        page = self._get_page_for_addr_name(lin_name)
+        if page is None:
+            return None
+        return (page.pagesize, page.gstage_vs_leaf_pagesize, page.gstage_vs_nonleaf_pagesize)
+
     def _get_page_for_addr_name(self, lin_name: str) -> Page | None:
         """Return a Page for this lin_name, or None if not found."""
+        walk = self._get_pte_walk(lin_name)
+        if walk is not None:
+            return walk.page
+        # Pages without pagetables, e.g. when paging is disabled
         map_names = self.pool.get_parsed_page_mapping_with_lin_name(lin_name)
         if map_names and self.pool.page_exists(lin_name, map_names[0]):
             return self.pool.get_page(lin_name, map_names[0])
         return None
 
+    def _get_pte_walk(self, lin_name: str) -> PteWalk | None:
+        """Return the page table walk for this lin_name in its first map, or None if no pagetables were created for it."""
+        if not self.pool.parsed_page_mapping_with_lin_name_exists(lin_name):
+            return None
+        map_names = self.pool.get_parsed_page_mapping_with_lin_name(lin_name)
+        if not map_names:
+            return None
+        return self.pool.get_page_map(map_names[0]).get_pte_walk(lin_name)
+
     def _get_page_mapping_for_addr_name(self, addr_name: str) -> ParsedPageMapping | None:
         """Return a ParsedPageMapping for this equate name if it is a lin_name or phys_name."""
         if self.pool.parsed_page_mapping_with_lin_name_exists(addr_name):
             map_names = self.pool.get_parsed_page_mapping_with_lin_name(addr_name)
             if map_names:
                 return self.pool.get_parsed_page_mapping(addr_name, map_names[0])
-        for ppm in self.pool.get_parsed_page_mappings().values():
-            if ppm.phys_name == addr_name:
-                return ppm
-        return None
+        if self._page_mappings_by_phys_name is None:
+            # First mapping wins when several lin_names share a phys_name
+            self._page_mappings_by_phys_name = {}
+            for ppm in self.pool.get_parsed_page_mappings().values():
+                self._page_mappings_by_phys_name.setdefault(ppm.phys_name, ppm)
+        return self._page_mappings_by_phys_name.get(addr_name)
 
     def _format_page_mapping_comment(self, ppm: ParsedPageMapping) -> str:
         """Format ParsedPageMapping attributes as a ;#page_mapping(...) comment line."""
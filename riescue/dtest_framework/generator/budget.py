@@ -0,0 +1,483 @@
+# SPDX-FileCopyrightText: © 2025 Tenstorrent AI ULC
+# SPDX-License-Identifier: Apache-2.0
+
+# pyright: strict
+
+"""
+Elaboration-time size and instruction count budgets.
+
+Regressions limit how many instructions an ISS runs (Whisper and Spike stop at ``--whisper_max_instr`` / ``--spike_max_instr``) and how large a memory image an emulator loads.
+Without an estimate, a test over either limit is only found after it's compiled and ran.
+:func:`estimate_budget` walks the emitted assembly, following includes and expanding macros and ``.rept`` blocks, and adds up
+
+- bytes emitted per section, and
+- straight-line instructions per discrete test, plus the runtime paths each run of a test takes: ``test_passed``, the scheduler dispatch, the selfcheck routine and
+  the trap and syscall paths for every ``ecall`` and expected exception.
+
+Loops and branches aren't followed, every instruction of a path is counted once. Pseudo-instructions count as their expansion and nothing is compressed,
+so sizes are an upper bound and instruction counts are approximate.
+"""
+
+import ast
+import json
+import logging
+import operator
+import re
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Callable, Optional
+
+import riescue.lib.enums as RV
+from riescue.dtest_framework.artifacts import GeneratedFiles
+from riescue.dtest_framework.config import FeatMgr
+from riescue.dtest_framework.pool import Pool
+
+log = logging.getLogger(__name__)
+
+# Bytes of each element of a data directive
+DATA_DIRECTIVE_SIZES = {
+    ".byte": 1,
+    ".half": 2,
+    ".2byte": 2,
+    ".short": 2,
+    ".word": 4,
+    ".4byte": 4,
+    ".long": 4,
+    ".int": 4,
+    ".float": 4,
+    ".single": 4,
+    ".dword": 8,
+    ".8byte": 8,
+    ".quad": 8,
+    ".double": 8,
+}
+# Pseudo-instructions expanding to an auipc pair
+TWO_INSTRUCTION_PSEUDOS = {"la", "lla", "lga", "call", "tail"}
+# Load and store mnemonics, which expand to an auipc pair when given a symbol instead of ``offset(reg)``
+MEMORY_ACCESS = {"lb", "lh", "lw", "ld", "lbu", "lhu", "lwu", "flh", "flw", "fld", "sb", "sh", "sw", "sd", "fsh", "fsw", "fsd"}
+# ``li`` of a value not known at elaboration time, e.g. a label address
+UNKNOWN_LI_INSTRUCTIONS = 2
+
+# Runtime paths, as (start label, first label after the path). Labels are emitted by the runtime generators
+PASSED_PATH = ("test_passed", "test_failed")
+SCHEDULER_PATH = ("scheduler__dispatch", "scheduler__finished")
+SELFCHECK_PATH = ("selfcheck__save_or_check", "selfcheck__do_check")
+SYSCALL_PATH = ("syscalls__syscall_dispatch", "syscalls__syscall_jump_table")
+LOADER_PATH = ("_start", "loader__panic")
+EOT_PATH = ("eot__end_test", "eot__halt")
+TEST_SETUP = "test_setup"
+TEST_CLEANUP = "test_cleanup"
+
+_LABEL = re.compile(r"^\s*([A-Za-z_.$][\w.$]*|\d+)\s*:")
+_MODULE_MARKER = re.compile(r"^## (\w+) ##$")
+_INCLUDE = re.compile(r'^\s*(?:#include|\.include)\s+"([^"]+)"')
+_BINARY_OPS: dict[type, Callable[[int, int], int]] = {
+    ast.Add: operator.add,
+    ast.Sub: operator.sub,
+    ast.Mult: operator.mul,
+    ast.Div: operator.floordiv,
+    ast.FloorDiv: operator.floordiv,
+    ast.Mod: operator.mod,
+    ast.LShift: operator.lshift,
+    ast.RShift: operator.rshift,
+    ast.BitOr: operator.or_,
+    ast.BitAnd: operator.and_,
+    ast.BitXor: operator.xor,
+}
+_UNARY_OPS: dict[type, Callable[[int], int]] = {ast.USub: operator.neg, ast.UAdd: operator.pos, ast.Invert: operator.invert}
+
+
+@dataclass
+class DiscreteTestEstimate:
+    """
+    Estimated instructions of a discrete test.
+
+    :param body: Straight-line instructions from the test label to the next test or section
+    :param ecalls: ``ecall`` instructions in the body
+    :param expected_traps: Expected exceptions set up in the body with ``OS_SETUP_CHECK_EXCP``
+    :param per_run: Instructions of one run, including runtime paths
+    :param runs: Times the test runs on each hart
+    :param total: Instructions of all runs on one hart
+    """
+
+    body: int = 0
+    ecalls: int = 0
+    expected_traps: int = 0
+    per_run: int = 0
+    runs: int = 0
+    total: int = 0
+
+
+@dataclass
+class BudgetEstimate:
+    """
+    Static estimate of a test's image size and dynamic instruction count.
+
+    :param sections: Bytes emitted per section
+    :param image_size: Bytes emitted over all sections
+    :param paths: Instructions of each runtime path
+    :param discrete_tests: Estimate of each discrete test
+    :param instructions_per_hart: Instructions a hart runs, from the loader to the end of test
+    :param instructions: Instructions all harts run
+    :param over_budget: Budgets that are exceeded
+    """
+
+    sections: dict[str, int] = field(default_factory=dict)
+    image_size: int = 0
+    paths: dict[str, int] = field(default_factory=dict)
+    discrete_tests: dict[str, DiscreteTestEstimate] = field(default_factory=dict)
+    instructions_per_hart: int = 0
+    instructions: int = 0
+    over_budget: list[str] = field(default_factory=list)
+
+    def write(self, path: Path) -> None:
+        "Write the estimate as JSON"
+        with open(path, "w") as f:
+            json.dump(asdict(self), f, indent=2)
+
+
+@dataclass
+class _Region:
+    "Instructions from a label to the next one"
+
+    module: str
+    label: str
+    instructions: int = 0
+
+
+def li_instructions(value: int) -> int:
+    "Instructions ``li`` expands to for a 64-bit ``value``, following the assembler's lui/addi/slli sequence"
+    value &= (1 << 64) - 1
+    if value >= 1 << 63:
+        value -= 1 << 64
+    if -2048 <= value < 2048:
+        return 1
+    if -(1 << 31) <= value < (1 << 31):
+        return 2 if value & 0xFFF else 1
+    low = ((value & 0xFFF) ^ 0x800) - 0x800
+    high = (value - low) >> 12
+    while not high & 1:
+        high >>= 1
+    return li_instructions(high) + 1 + (1 if low else 0)
+
+
+def evaluate(expression: str, symbols: dict[str, int]) -> Optional[int]:
+    "Value of an integer assembler expression, or None if it uses unknown symbols or unsupported syntax"
+    expression = expression.strip()
+    if expression in symbols:
+        return symbols[expression]
+    try:
+        return int(expression, 0)
+    except ValueError:
+        pass
+    try:
+        tree = ast.parse(expression, mode="eval")
+    except SyntaxError:
+        return None
+
+    def value(node: ast.AST) -> Optional[int]:
+        if isinstance(node, ast.Constant) and isinstance(node.value, int):
+            return int(node.value)
+        if isinstance(node, ast.Name):
+            return symbols.get(node.id)
+        if isinstance(node, ast.BinOp) and type(node.op) in _BINARY_OPS:
+            left, right = value(node.left), value(node.right)
+            if left is None or right is None or (isinstance(node.op, (ast.Div, ast.FloorDiv, ast.Mod)) and right == 0):
+                return None
+            if isinstance(node.op, (ast.LShift, ast.RShift)) and not 0 <= right < 128:
+                return None
+            return _BINARY_OPS[type(node.op)](left, right)
+        if isinstance(node, ast.UnaryOp) and type(node.op) in _UNARY_OPS:
+            operand = value(node.operand)
+            return None if operand is None else _UNARY_OPS[type(node.op)](operand)
+        return None
+
+    return value(tree.body)
+
+
+class _AssemblyWalker:
+    """
+    Walks assembly statements, counting section bytes and instructions per label.
+
+    :param run_dir: Directory includes are resolved in
+    :param testname: Prefix of generated include files, stripped to name runtime modules
+    :param discrete_tests: Names of discrete test labels
+    """
+
+    def __init__(self, run_dir: Path, testname: str, discrete_tests: list[str]):
+        self.run_dir = run_dir
+        self.testname = testname
+        self.discrete_tests = set(discrete_tests)
+        self.symbols: dict[str, int] = {}
+        self.macros: dict[str, list[str]] = {}
+        self.sections: dict[str, int] = {}
+        self.section = ".text"
+        self.section_stack: list[str] = []
+        self.scales: list[int] = [1]
+        self.module = "test"
+        self.regions: list[_Region] = [_Region(self.module, "")]
+        self.tests: dict[str, DiscreteTestEstimate] = {}
+        self.current_test: Optional[DiscreteTestEstimate] = None
+        self._macro: Optional[list[str]] = None
+        self._macro_depth = 0
+        self._expanding: list[str] = []
+        self._included: set[Path] = set()
+        self._continued = False
+
+    def walk_file(self, path: Path) -> None:
+        "Walk a file and the files it includes"
+        if path in self._included or not path.is_file():
+            log.debug(f"Not counting missing or repeated include {path}")
+            return
+        self._included.add(path)
+        with open(path, "r") as f:
+            for line in f:
+                self.walk_line(line)
+
+    def walk_line(self, line: str) -> None:
+        stripped = line.strip()
+        if self._continued or stripped.startswith("#define"):
+            # C preprocessor macro bodies are expanded where they're used, which is counted as one instruction
+            self._continued = stripped.endswith("\\")
+            return
+        include = _INCLUDE.match(stripped)
+        if include is not None and self._macro is None:
+            self._enter_include(include.group(1))
+            return
+        marker = _MODULE_MARKER.match(stripped)
+        if marker is not None:
+            self._set_module(marker.group(1))
+            return
+        for statement in stripped.split(";"):
+            comment = statement.find("#")
+            if comment != -1:
+                self.walk_statement(statement[:comment])
+                break
+            self.walk_statement(statement)
+
+    def walk_statement(self, statement: str) -> None:
+        statement = statement.strip()
+        if self._macro is not None:
+            self._capture_macro(statement)
+            return
+        label = _LABEL.match(statement)
+        while label is not None:
+            self._label(label.group(1))
+            statement = statement[label.end() :].strip()
+            label = _LABEL.match(statement)
+        if not statement:
+            return
+        mnemonic, _, operands = statement.partition(" ")
+        mnemonic = mnemonic.strip().lower()
+        operands = operands.strip()
+        if mnemonic == "os_setup_check_excp" and self.current_test is not None:
+            self.current_test.expected_traps += self.scale
+        if mnemonic.startswith("."):
+            self._directive(mnemonic, operands)
+        elif mnemonic in self.macros:
+            self._expand_macro(mnemonic)
+        else:
+            self._instruction(mnemonic, operands)
+
+    def span(self, start: str, stop: str) -> int:
+        "Instructions from label ``start`` to the first label starting with ``stop``, within the module of ``start``"
+        total = 0
+        module: Optional[str] = None
+        for region in self.regions:
+            if module is None:
+                if region.label == start:
+                    module = region.module
+                    total = region.instructions
+            elif region.module != module or region.label.startswith(stop):
+                break
+            else:
+                total += region.instructions
+        return total
+
+    def modules(self) -> list[str]:
+        return list(dict.fromkeys(region.module for region in self.regions))
+
+    @property
+    def scale(self) -> int:
+        return self.scales[-1]
+
+    def _enter_include(self, name: str) -> None:
+        path = self.run_dir / name
+        stem = Path(name).stem
+        module = stem[len(self.testname) + 1 :] if stem.startswith(f"{self.testname}_") else stem
+        outer = self.module
+        self._set_module(module)
+        self.walk_file(path)
+        self._set_module(outer)
+
+    def _set_module(self, module: str) -> None:
+        self.module = module
+        self.regions.append(_Region(module, ""))
+
+    def _label(self, label: str) -> None:
+        if label.isdigit():
+            return
+        self.regions.append(_Region(self.module, label))
+        if label in self.discrete_tests or label in (TEST_SETUP, TEST_CLEANUP):
+            self.current_test = self.tests.setdefault(label, DiscreteTestEstimate())
+
+    def _emit(self, size: int) -> None:
+        self.sections[self.section] = self.sections.get(self.section, 0) + size * self.scale
+
+    def _align(self, alignment: int) -> None:
+        if alignment > 1:
+            self._emit(-self.sections.get(self.section, 0) % alignment)
+
+    def _switch_section(self, section: str) -> None:
+        self.section = section
+        self.current_test = None
+
+    def _directive(self, directive: str, operands: str) -> None:
+        args = [arg.strip() for arg in operands.split(",")] if operands else []
+        if directive in DATA_DIRECTIVE_SIZES:
+            self._emit(DATA_DIRECTIVE_SIZES[directive] * len(args))
+        elif directive in (".space", ".skip", ".zero"):
+            self._emit(self._value(args[0]) if args else 0)
+        elif directive == ".fill":
+            repeat = self._value(args[0]) if args else 0
+            size = self._value(args[1]) if len(args) > 1 else 1
+            self._emit(repeat * min(size, 8))
+        elif directive in (".string", ".asciz", ".ascii"):
+            text = self._string(operands)
+            self._emit(len(text) + (0 if directive == ".ascii" else 1))
+        elif directive == ".balign":
+            self._align(self._value(args[0]) if args else 1)
+        elif directive in (".align", ".p2align"):
+            self._align(1 << self._value(args[0]) if args else 1)
+        elif directive in (".equ", ".set") and len(args) >= 2:
+            value = evaluate(",".join(args[1:]), self.symbols)
+            if value is not None:
+                self.symbols[args[0]] = value
+        elif directive == ".section":
+            self._switch_section(args[0].split()[0] if args else self.section)
+        elif directive in (".text", ".data", ".bss", ".rodata"):
+            self._switch_section(directive)
+        elif directive == ".pushsection":
+            self.section_stack.append(self.section)
+            self._switch_section(args[0].split()[0] if args else self.section)
+        elif directive == ".popsection" and self.section_stack:
+            self._switch_section(self.section_stack.pop())
+        elif directive == ".rept":
+            self.scales.append(self.scale * max(0, self._value(operands)))
+        elif directive == ".irp":
+            self.scales.append(self.scale * max(0, len(args) - 1))
+        elif directive == ".endr" and len(self.scales) > 1:
+            self.scales.pop()
+        elif directive == ".macro":
+            self._macro = self.macros.setdefault(re.split(r"[\s,]", operands, 1)[0].lower(), [])
+            self._macro.clear()
+            self._macro_depth = 1
+
+    def _capture_macro(self, statement: str) -> None:
+        assert self._macro is not None
+        directive = statement.split(" ", 1)[0].lower()
+        if directive == ".macro":
+            self._macro_depth += 1
+        elif directive == ".endm":
+            self._macro_depth -= 1
+            if self._macro_depth == 0:
+                self._macro = None
+                return
+        self._macro.append(statement)
+
+    def _expand_macro(self, name: str) -> None:
+        "Walk the macro body. Arguments aren't substituted and every ``.if`` branch is counted"
+        if name in self._expanding:
+            return
+        self._expanding.append(name)
+        for statement in self.macros[name]:
+            self.walk_statement(statement)
+        self._expanding.pop()
+
+    def _instruction(self, mnemonic: str, operands: str) -> None:
+        count = 1
+        if mnemonic == "li":
+            value = evaluate(operands.split(",", 1)[-1], self.symbols) if "," in operands else None
+            count = UNKNOWN_LI_INSTRUCTIONS if value is None else li_instructions(value)
+        elif mnemonic in TWO_INSTRUCTION_PSEUDOS or (mnemonic in MEMORY_ACCESS and "(" not in operands):
+            count = 2
+        self._emit(count * (2 if mnemonic.startswith("c.") else 4))
+        self.regions[-1].instructions += count * self.scale
+        if self.current_test is not None:
+            self.current_test.body += count * self.scale
+            if mnemonic == "ecall":
+                self.current_test.ecalls += self.scale
+
+    def _value(self, expression: str) -> int:
+        value = evaluate(expression, self.symbols)
+        return value if value is not None else 0
+
+    @staticmethod
+    def _string(operands: str) -> str:
+        try:
+            text = ast.literal_eval(operands)
+        except (ValueError, SyntaxError):
+            return operands.strip('"')
+        return text if isinstance(text, str) else operands
+
+
+def estimate_budget(generated_files: GeneratedFiles, run_dir: Path, pool: Pool, featmgr: FeatMgr) -> BudgetEstimate:
+    """
+    Estimate the image size and instruction count of an elaborated test from its emitted assembly.
+
+    Each run of a discrete test costs its body, ``test_passed``, a scheduler dispatch and, with selfcheck, the selfcheck routine.
+    Tests not running in machine mode also take the trap and syscall paths to get back to the scheduler. Every ``ecall`` in the body takes
+    the trap and syscall paths and every expected exception the trap path. A hart also runs the loader, ``test_setup``, ``test_cleanup`` and the end of test code.
+    All harts are assumed to run every test.
+
+    :param generated_files: Files written by the :class:`AssemblyWriter`
+    :param run_dir: Directory the files were written to
+    :param pool: Pool with the discrete tests
+    :param featmgr: Configured feature manager
+    """
+    walker = _AssemblyWalker(run_dir, pool.testname, list(pool.discrete_tests))
+    walker.walk_file(generated_files.assembly)
+
+    trap = max((walker.span(f"{module}__trap_handler", f"{module}__trap_panic") for module in walker.modules() if module.startswith("trap_handler")), default=0)
+    paths = {
+        "test_passed": walker.span(*PASSED_PATH),
+        "scheduler": walker.span(*SCHEDULER_PATH),
+        "selfcheck": walker.span(*SELFCHECK_PATH),
+        "trap": trap,
+        "syscall": walker.span(*SYSCALL_PATH),
+        "loader": walker.span(*LOADER_PATH),
+        "end_of_test": walker.span(*EOT_PATH),
+    }
+    dispatch = paths["test_passed"] + paths["scheduler"] + paths["selfcheck"]
+    if featmgr.priv_mode != RV.RiscvPrivileges.MACHINE:
+        dispatch += paths["trap"] + paths["syscall"]
+
+    estimate = BudgetEstimate(sections=dict(sorted(walker.sections.items())), paths=paths)
+    estimate.image_size = sum(walker.sections.values())
+    per_hart = paths["loader"] + paths["end_of_test"]
+    for name, test in walker.tests.items():
+        test.per_run = test.body + dispatch + test.ecalls * (paths["trap"] + paths["syscall"]) + test.expected_traps * paths["trap"]
+        test.runs = 1 if name in (TEST_SETUP, TEST_CLEANUP) else max(featmgr.repeat_times, 1)
+        test.total = test.per_run * test.runs
+        per_hart += test.total
+    estimate.discrete_tests = walker.tests
+    estimate.instructions_per_hart = per_hart
+    estimate.instructions = per_hart * max(featmgr.num_cpus, 1)
+    return estimate
+
+
+def check_budget(estimate: BudgetEstimate, featmgr: FeatMgr) -> None:
+    """
+    Compare an estimate with ``featmgr.instruction_budget`` and ``featmgr.image_size_budget``, recording exceeded budgets in ``estimate.over_budget``.
+    Logs a warning, or raises a ``ValueError`` with ``featmgr.fail_over_budget``.
+    """
+    if featmgr.instruction_budget is not None and estimate.instructions > featmgr.instruction_budget:
+        estimate.over_budget.append(f"estimated {estimate.instructions} instructions exceeds --instruction_budget {featmgr.instruction_budget}")
+    if featmgr.image_size_budget is not None and estimate.image_size > featmgr.image_size_budget:
+        estimate.over_budget.append(f"estimated image size {estimate.image_size} bytes exceeds --image_size_budget {featmgr.image_size_budget}")
+    if not estimate.over_budget:
+        return
+    message = "Test over budget: " + "; ".join(estimate.over_budget)
+    if featmgr.fail_over_budget:
+        raise ValueError(message)
+    log.warning(message)
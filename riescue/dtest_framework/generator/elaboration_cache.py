@@ -0,0 +1,169 @@
+# SPDX-FileCopyrightText: © 2025 Tenstorrent AI ULC
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Incremental re-elaboration support.
+
+Elaborating a test (address generation, page tables, runtime and equates) only depends on the parsed directives, the :class:`FeatMgr` configuration and the seed.
+When iterating on a directed test, the instruction body usually changes far more often than any of those.
+:class:`ElaborationCache` stores the products of a full elaboration next to the test outputs so that a later run with an identical key
+only needs to rewrite the test body.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import enum
+import functools
+import hashlib
+import json
+import logging
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Optional
+
+from riescue.dtest_framework.pool import Pool
+from riescue.dtest_framework.config import FeatMgr
+
+log = logging.getLogger(__name__)
+
+# Bump when the layout of the cache file changes
+CACHE_VERSION = 1
+
+# Pool attributes that aren't prefixed with parsed_ but are still set by the parser
+_POOL_PARSED_STATE = ("init_aplic_interrupts", "ext_aplic_interrupts", "max_aplic_irq", "runtime_files", "testname")
+
+
+@dataclass
+class CachedElaboration:
+    """
+    Products of a full elaboration needed to rewrite only the test body.
+
+    :param key: Elaboration key, see :meth:`ElaborationCache.compute_key`
+    :param prefix_lines: Find-and-replaced assembly lines that come before the test body (header, equates, runtime)
+    :param prefix_tail: Unterminated last line of the prefix; joined with the test body before find-and-replace
+    :param section_code_found: True if the prefix already contained the first ``.section .code,``
+    :param include_files: Generated include file names mapped to their contents
+    :param linker_script: Linker script contents
+    :param pte_pagesizes: ``lin_name`` mapped to ``[pagesize, gstage_vs_leaf_pagesize, gstage_vs_nonleaf_pagesize]`` enum names, used to resolve ``;#read_pte``/``;#write_pte`` levels
+    :param pte_addresses: ``"lin_name,level,g_level"`` mapped to the PTE address resolved for ``;#read_pte``/``;#write_pte`` with ``static_pte_access``
+    """
+
+    key: str
+    prefix_lines: list[str]
+    prefix_tail: str
+    section_code_found: bool
+    include_files: dict[str, str] = field(default_factory=dict)
+    linker_script: str = ""
+    pte_pagesizes: dict[str, list[Optional[str]]] = field(default_factory=dict)
+    pte_addresses: dict[str, int] = field(default_factory=dict)
+
+
+class ElaborationCache:
+    """
+    Single-entry elaboration cache stored as JSON in the run directory.
+
+    :param cache_file: Path to the cache file
+    """
+
+    def __init__(self, cache_file: Path):
+        self.cache_file = cache_file
+
+    @classmethod
+    def for_test(cls, run_dir: Path, testname: str) -> "ElaborationCache":
+        "Create the cache for a test in its run directory"
+        return cls(run_dir / f".{testname}.elab_cache.json")
+
+    @staticmethod
+    def compute_key(pool: Pool, featmgr: FeatMgr, seed: int, header: list[str]) -> str:
+        """
+        Hash everything that elaboration depends on, other than the test body.
+
+        :param pool: Pool holding the parsed directives. Must be called before any addresses or page tables are generated
+        :param featmgr: Configured feature manager
+        :param seed: Test seed
+        :param header: Lines of the test file before the first code section
+        :return: Hex digest
+        """
+        h = hashlib.sha256()
+        h.update(f"version:{CACHE_VERSION}:{_framework_fingerprint()}\n".encode())
+        h.update(f"seed:{seed}\n".encode())
+        h.update("header:".encode())
+        for line in header:
+            h.update(line.encode())
+        for name, value in vars(pool).items():
+            if name.startswith("parsed_") or name.startswith("raw_parsed_") or name in _POOL_PARSED_STATE:
+                h.update(f"pool.{name}:{_fingerprint(value, frozenset())}\n".encode())
+        for f in dataclasses.fields(featmgr):
+            h.update(f"featmgr.{f.name}:{_fingerprint(getattr(featmgr, f.name), frozenset())}\n".encode())
+        return h.hexdigest()
+
+    def load(self, key: str) -> Optional[CachedElaboration]:
+        """
+        Load the cached elaboration if it matches ``key``.
+
+        :return: Cached elaboration, or None on a miss or unreadable cache
+        """
+        if not self.cache_file.exists():
+            return None
+        try:
+            with open(self.cache_file, "r") as f:
+                data = json.load(f)
+            cached = CachedElaboration(**data)
+        except (OSError, ValueError, TypeError) as e:
+            log.warning(f"Ignoring unreadable elaboration cache {self.cache_file}: {e}")
+            return None
+        if cached.key != key:
+            log.info("Elaboration cache miss, directives or configuration changed")
+            return None
+        return cached
+
+    def store(self, elaboration: CachedElaboration) -> None:
+        "Write elaboration to the cache file, replacing any previous entry"
+        with open(self.cache_file, "w") as f:
+            json.dump(dataclasses.asdict(elaboration), f)
+
+
+@functools.lru_cache(maxsize=None)
+def _framework_fingerprint() -> str:
+    "Fingerprint of the generator sources so edits to the framework invalidate cached elaborations. Computed once per process"
+    package_dir = Path(__file__).parents[2]
+    h = hashlib.sha256()
+    for sub_dir in ("dtest_framework", "lib"):
+        for path in sorted((package_dir / sub_dir).rglob("*")):
+            if path.is_file() and path.suffix != ".pyc":
+                stat = path.stat()
+                h.update(f"{path}:{stat.st_mtime_ns}:{stat.st_size}\n".encode())
+    return h.hexdigest()
+
+
+def _fingerprint(obj: Any, seen: frozenset[int]) -> str:
+    """
+    Stable, process-independent text representation of ``obj``.
+
+    Dict and list ordering is kept since directive order affects generation. Sets are sorted.
+    Callables are represented by their qualified name and bytecode so hook changes invalidate the cache.
+    """
+    if obj is None or isinstance(obj, (bool, int, float, str, bytes)):
+        return repr(obj)
+    if isinstance(obj, enum.Enum):
+        return f"{type(obj).__name__}.{obj.name}"
+    if isinstance(obj, Path):
+        return repr(str(obj))
+    if id(obj) in seen:
+        return f"<{type(obj).__name__}>"
+    seen = seen | {id(obj)}
+    if isinstance(obj, (list, tuple)):
+        return "[" + ",".join(_fingerprint(o, seen) for o in obj) + "]"
+    if isinstance(obj, (set, frozenset)):
+        return "{" + ",".join(sorted(_fingerprint(o, seen) for o in obj)) + "}"
+    if isinstance(obj, dict):
+        return "{" + ",".join(f"{_fingerprint(k, seen)}:{_fingerprint(v, seen)}" for k, v in obj.items()) + "}"
+    code = getattr(obj, "__code__", None)
+    if code is not None:
+        return f"{getattr(obj, '__module__', '')}.{getattr(obj, '__qualname__', '')}:{hashlib.sha256(code.co_code).hexdigest()}:{_fingerprint(code.co_consts, seen)}"
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        return type(obj).__name__ + "(" + ",".join(f"{f.name}={_fingerprint(getattr(obj, f.name), seen)}" for f in dataclasses.fields(obj)) + ")"
+    if hasattr(obj, "__dict__"):
+        return type(obj).__name__ + "(" + ",".join(f"{k}={_fingerprint(v, seen)}" for k, v in vars(obj).items()) + ")"
+    return type(obj).__qualname__
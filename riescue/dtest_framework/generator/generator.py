@@ -5,7 +5,7 @@ import re
 import io
 import logging
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Sequence, Union
 import copy
 
 import riescue.dtest_framework.lib.addrgen as addrgen
@@ -14,18 +14,24 @@ import riescue.lib.enums as RV
 from riescue.dtest_framework.runtime.selfcheck import SELFCHECK_CHECKSUM_SIZE
 from riescue.dtest_framework.runtime.test_execution_logger import TEST_EXECUTION_DATA_PER_HART_SIZE
 from riescue.lib.address import Address
-from riescue.lib.numgen import NumGen
+from riescue.lib.numgen import BulkNumGen, NumGen
 from riescue.lib.rand import RandNum
 from riescue.dtest_framework.pool import Pool
 from riescue.dtest_framework.parser import PmaInfo, ParsedPageMapping, Parser, ParsedRandomAddress, ParsedRandomData
 from riescue.dtest_framework.config import FeatMgr
 from riescue.dtest_framework.lib.page_map import Page, PageMap
 from riescue.dtest_framework.generator.assembly_writer import AssemblyWriter
+from riescue.dtest_framework.generator.elaboration_cache import ElaborationCache
+from riescue.dtest_framework.generator.budget import check_budget, estimate_budget
 from riescue.dtest_framework.artifacts import GeneratedFiles
 from riescue.dtest_framework.config.memory import IoRange
 
 log = logging.getLogger(__name__)
 
+BITS_TYPE_RE = re.compile(r"bits(\d+)")
+# ;#random_fill directives use their index as the BulkNumGen stream, so ;#random_data draws from a stream past any index
+RANDOM_DATA_STREAM = 1 << 32
+
 
 class Generator:
     """
@@ -456,10 +462,29 @@ class Generator:
 
         return address
 
-    def generate(self, file_in: Path, generated_files: GeneratedFiles):
+    def generate(self, file_in: Union[Path, Sequence[str]], generated_files: GeneratedFiles):
         """
         Generate random data, randomize addresses, create page mappings, reserve memory, and write all files
+
+        When ``featmgr.incremental`` is set and the parsed directives, configuration and seed match a previous run in ``run_dir``,
+        the cached elaboration is reused and only the test body is rewritten.
+
+        :param file_in: Test file, or its lines if the test is held in memory
         """
+        cache = None
+        if self.featmgr.incremental:
+            cache = ElaborationCache.for_test(self.run_dir, self.testname)
+            header_section, _ = self.writer.split_rasm_sections(file_in)
+            key = ElaborationCache.compute_key(self.pool, self.featmgr, self.rng.get_seed(), header_section)
+            cached = cache.load(key)
+            if cached is not None:
+                log.info(f"Reusing cached elaboration from {cache.cache_file}")
+                # Page mapping resolution doesn't use the RNG and is needed to rewrite ;#init_memory sections
+                self.process_raw_parsed_page_mappings()
+                self.writer.write_incremental(rasm=file_in, generated_files=generated_files, cached=cached)
+                self.check_budget(generated_files)
+                return
+
         # The order of calling following functions is very important, please do not change
         # unless you know what you are doing
         self.process_raw_parsed_page_mappings()
@@ -473,21 +498,73 @@ class Generator:
         self.generate_init_mem()
 
         self.writer.write(rasm=file_in, generated_files=generated_files)
+        if cache is not None:
+            cache.store(self.writer.export_elaboration(key, generated_files))
+        self.check_budget(generated_files)
+
+    def check_budget(self, generated_files: GeneratedFiles):
+        """
+        Estimate image size and instruction count from the written files, record them in ``<testname>_budget.json`` and check them against the configured budgets.
+        Skipped unless ``instruction_budget`` or ``image_size_budget`` is set, since the estimate walks all of the emitted assembly.
+        """
+        if self.featmgr.instruction_budget is None and self.featmgr.image_size_budget is None:
+            return
+        estimate = estimate_budget(generated_files, self.run_dir, self.pool, self.featmgr)
+        log.info(f"Estimated image size {estimate.image_size} bytes, {estimate.instructions} instructions")
+        try:
+            check_budget(estimate, self.featmgr)
+        finally:
+            generated_files.budget = self.run_dir / f"{self.testname}_budget.json"
+            estimate.write(generated_files.budget)
 
     def generate_data(self):
+        if self.featmgr.bulk_random_data:
+            self.generate_bulk_data()
+            return
         for name, random_data in self.pool.get_parsed_data().items():
-            data_type = random_data.type
-            rand_val = 0
-            if "bits" in data_type:
-                num_bits = int(re.findall(r"bits(\d+)", data_type)[0])
-                or_mask = random_data.or_mask & (2**num_bits - 1)
-                if num_bits == 1:
-                    rand_val = (self.rng.get_rand_bits(1) & random_data.and_mask) | or_mask
-                else:
-                    rand_val = (self.rng.random_in_bitrange(1, num_bits - 1) & random_data.and_mask) | or_mask
-            elif "fp" in data_type or "int" in data_type:
-                rand_val = self.numgen.rand_num(RV.DataType[data_type.upper()])
-            self.pool.add_random_datum(random_data.name, rand_val)
+            self.pool.add_random_datum(random_data.name, self.random_datum(random_data))
+
+    def random_datum(self, random_data: ParsedRandomData) -> int:
+        "Draw a single ``;#random_data`` value from the test's ``RandNum``"
+        data_type = random_data.type
+        rand_val = 0
+        if "bits" in data_type:
+            num_bits = int(BITS_TYPE_RE.findall(data_type)[0])
+            or_mask = random_data.or_mask & (2**num_bits - 1)
+            if num_bits == 1:
+                rand_val = (self.rng.get_rand_bits(1) & random_data.and_mask) | or_mask
+            else:
+                rand_val = (self.rng.random_in_bitrange(1, num_bits - 1) & random_data.and_mask) | or_mask
+        elif "fp" in data_type or "int" in data_type:
+            rand_val = self.numgen.rand_num(RV.DataType[data_type.upper()])
+        return rand_val
+
+    def generate_bulk_data(self):
+        """
+        Draw ``;#random_data`` values with one :class:`BulkNumGen` call per type and mask combination instead of one ``RandNum`` call per directive.
+        Values come from a separate stream seeded by the test seed, so enabling ``bulk_random_data`` changes the values picked for a given seed.
+        FP16 values aren't NaN-boxed. ``bitsN`` wider than 64 bits still use :meth:`random_datum`.
+        """
+        groups: dict[tuple[str, int, int], list[str]] = {}
+        for name, random_data in self.pool.get_parsed_data().items():
+            if "bits" in random_data.type:
+                num_bits = int(BITS_TYPE_RE.findall(random_data.type)[0])
+                if num_bits > 64:
+                    self.pool.add_random_datum(random_data.name, self.random_datum(random_data))
+                    continue
+                key = (f"bits{num_bits}", random_data.and_mask, random_data.or_mask)
+            elif "fp" in random_data.type or "int" in random_data.type:
+                key = (random_data.type.lower(), 0xFFFFFFFFFFFFFFFF, 0)
+            else:
+                self.pool.add_random_datum(random_data.name, 0)
+                continue
+            groups.setdefault(key, []).append(random_data.name)
+
+        bulk = BulkNumGen(self.rng.get_seed(), stream=RANDOM_DATA_STREAM)
+        for (data_type, and_mask, or_mask), names in groups.items():
+            values = bulk.rand_type(data_type, len(names), and_mask, or_mask)
+            for name, value in zip(names, values.tolist()):
+                self.pool.add_random_datum(name, value)
 
     def handle_res_mem(self):
         for name, parsed_res_mem in self.pool.get_parsed_res_mems().items():
@@ -9,7 +9,8 @@ create pagetables for every page inside the page_map
 
 from __future__ import annotations
 import logging
-from typing import TYPE_CHECKING, Optional, TextIO
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Iterator, Optional, TextIO
 
 import riescue.dtest_framework.lib.addrgen as addrgen
 import riescue.lib.enums as RV
@@ -25,6 +26,9 @@ if TYPE_CHECKING:
 
 log = logging.getLogger(__name__)
 
+# Address mask for each pagesize, used to find the page containing an address
+_PAGESIZE_MASKS = [(pagesize, RV.RiscvPageSizes.address_mask(pagesize)) for pagesize in RV.RiscvPageSizes]
+
 
 class Page:
     """
@@ -479,6 +483,29 @@ class Page:
         self.pt_entries.append(pt_entry)
 
 
+@dataclass
+class PteWalk:
+    """
+    Page table entries created for a page in one map, in the order they were created (root to leaf).
+
+    :param page: Page the entries translate
+    :param entries: Page table entries; each has its ``level``, ``address`` and current ``get_value()``
+    :param g_stage: For vs-stage maps with g-stage enabled, vs-stage entry level mapped to the g-stage walk of the
+        guest physical page that entry points to (the next table, or the final page for the leaf)
+    """
+
+    page: Page
+    entries: list[pagetables.PTEntry] = field(default_factory=list)
+    g_stage: dict[int, PteWalk] = field(default_factory=dict)
+
+    def entry_at_level(self, level: int) -> Optional[pagetables.PTEntry]:
+        "Return the entry at PTE level ``level``, root being ``max_levels - 1``"
+        for pt_entry in self.entries:
+            if pt_entry.level == level:
+                return pt_entry
+        return None
+
+
 class PageMap:
     def __init__(self, name: str, paging_mode: RV.RiscvPagingModes, pool: "Pool", featmgr: FeatMgr, addrgen: AddrGen, g_map: bool = False):
         self.name: str = name
@@ -499,6 +526,10 @@ class PageMap:
         self.pt_pages: dict[str, Page] = dict()
         self.base_addr: Optional[int] = None
         self.basetable: Optional[pagetables.PTTable] = None  # Set to PTTable after initialize()
+        # Page table walk per page name, filled by create_pagetables()
+        self.pte_index: dict[str, PteWalk] = dict()
+        # pte_index keyed by (page address, pagesize), built on first use by get_pte_walk_for_address()
+        self._pte_walks_by_addr: Optional[dict[tuple[int, RV.RiscvPageSizes], PteWalk]] = None
 
     def initialize(self) -> None:
         # Create the sptrb page
@@ -643,7 +674,7 @@ class PageMap:
         """
         for page_name in self.pages:
             page = self.pool.get_page(page_name=page_name, map_name=self.name)
-            page.create_pagetables(rng=rng, page_map=self)
+            self._create_page_pagetables(rng, page)
 
         # The above method might have added some additional pages to modify the pagetables themselves
         # if the modify_pt=1 is present in the ;page_mapping()
@@ -651,14 +682,62 @@ class PageMap:
         for page_name, page in self.pt_pages.items():
             self.pool.add_page(page=page, map_names=[self.name])
             page = self.pool.get_page(page_name=page_name, map_name=self.name)
-            page.create_pagetables(rng=rng, page_map=self)
+            self._create_page_pagetables(rng, page)
+
+        self._pte_walks_by_addr = None
+        if self.g_map:
+            self._link_g_stage_walks()
+
+    def _create_page_pagetables(self, rng: RandNum, page: Page) -> None:
+        """
+        Create pagetables for a page and index the entries created for it in this map.
+        Pages in private maps can share ``pt_entries`` with their ``map_os`` copy, so only the newly added entries belong to this map.
+        """
+        first_entry = len(page.pt_entries)
+        page.create_pagetables(rng=rng, page_map=self)
+        self.pte_index[page.name] = PteWalk(page=page, entries=page.pt_entries[first_entry:])
 
-    def generate_pagetables_assembly(self) -> list[str]:
-        pagetables = self._generate_pagetable_hierarchy()
-        pagetables += self.generate_page_debug_comments()
-        return pagetables
+    def _link_g_stage_walks(self) -> None:
+        """
+        Attach this g-stage map's walks to the vs-stage entries whose guest physical address it maps.
+        vs-stage maps are created before g-stage maps, see :meth:`AssemblyWriter._generate_pagetable_assembly`.
+        """
+        for vs_map in self.pool.get_page_maps().values():
+            if vs_map.g_map:
+                continue
+            for walk in vs_map.pte_index.values():
+                for pt_entry in walk.entries:
+                    g_walk = self.get_pte_walk_for_address(pt_entry.get_base_addr())
+                    if g_walk is not None:
+                        walk.g_stage[pt_entry.level] = g_walk
+
+    def get_pte_walk(self, name: str) -> Optional[PteWalk]:
+        """
+        Return the page table walk for page ``name`` in this map, or None if no pagetables were created for it.
+        """
+        return self.pte_index.get(name)
 
-    def _generate_pagetable_hierarchy(self, basetable: Optional[pagetables.PTTable] = None) -> list[str]:
+    def get_pte_walk_for_address(self, address: int) -> Optional[PteWalk]:
+        """
+        Return the page table walk for the page in this map containing ``address``, or None if no page maps it.
+        For g-stage maps ``address`` is a guest physical address.
+        """
+        if self._pte_walks_by_addr is None:
+            self._pte_walks_by_addr = dict()
+            for walk in self.pte_index.values():
+                if walk.page.lin_addr is not None:
+                    self._pte_walks_by_addr.setdefault((walk.page.lin_addr, walk.page.pagesize), walk)
+        for pagesize, mask in _PAGESIZE_MASKS:
+            walk = self._pte_walks_by_addr.get((address & mask, pagesize))
+            if walk is not None:
+                return walk
+        return None
+
+    def generate_pagetables_assembly(self) -> Iterator[str]:
+        yield from self._generate_pagetable_hierarchy()
+        yield from self.generate_page_debug_comments()
+
+    def _generate_pagetable_hierarchy(self, basetable: Optional[pagetables.PTTable] = None) -> Iterator[str]:
         """
         Recursively traverse and generate assembly for pagetable hierarchy.
 
@@ -674,10 +753,9 @@ class PageMap:
             basetable = self.basetable
 
         # Print the table itself
-        content = self._print_table_entries(table=basetable)
+        yield from self._print_table_entries(table=basetable)
         for pt_entry in basetable.get_entries():
-            content += self._generate_pagetable_hierarchy(basetable=pt_entry.basetable)
-        return content
+            yield from self._generate_pagetable_hierarchy(basetable=pt_entry.basetable)
 
     def _print_table_entries(self, table: pagetables.PTTable) -> list[str]:
         """
@@ -710,18 +788,36 @@ class PageMap:
             page_table_entries.append(f"            #attrs: {pt_entry.pt_attr}")
         return page_table_entries
 
-    def generate_page_debug_comments(self) -> list[str]:
+    def generate_page_debug_comments(self) -> Iterator[str]:
         """
         Generate debug comments mapping pages to pagetable entries.
 
         :return: Comment lines documenting page mappings and their pagetable entries
         """
-        page_table_entries = []
-        page_table_entries.append("\n#==========================================================")
-        page_table_entries.append(f"#printing pagetables for debug: map: {self.name}, base_addr: {self.sptbr:016x}, paging_mode: {self.paging_mode}")
-        page_table_entries.append("#==========================================================")
-        for page in self.pages.values():
-            page_table_entries.append(f"\n#Page: {page.name}, 0x{page.lin_addr:016x} -> {page.phys_name}, 0x{page.phys_addr:016x}, pagesize:{page.pagesize}")
-            for pt_entry in page.pt_entries:
-                page_table_entries.append(f"#level: {pt_entry.level}: base_addr: 0x{pt_entry.get_base_addr():016x}, value: {pt_entry.get_value():016x}, attr: {pt_entry.pt_attr}, map:")
-        return page_table_entries
+        yield "\n#=========================================================="
+        yield f"#printing pagetables for debug: map: {self.name}, base_addr: {self.sptbr:016x}, paging_mode: {self.paging_mode}"
+        yield "#=========================================================="
+        for walk in self.pte_index.values():
+            page = walk.page
+            yield f"\n#Page: {page.name}, 0x{page.lin_addr:016x} -> {page.phys_name}, 0x{page.phys_addr:016x}, pagesize:{page.pagesize}"
+            for pt_entry in walk.entries:
+                yield f"#level: {pt_entry.level}: base_addr: 0x{pt_entry.get_base_addr():016x}, value: {pt_entry.get_value():016x}, attr: {pt_entry.pt_attr}, map:"
+        if self.g_map:
+            yield from self._generate_g_stage_debug_comments()
+
+    def _generate_g_stage_debug_comments(self) -> Iterator[str]:
+        """
+        Generate debug comments listing the g-stage page each vs-stage entry's guest physical address falls in.
+        vs-stage debug comments are emitted before the g-stage map links them, so the links are printed with the g-stage map.
+
+        :return: Comment lines for each linked vs-stage entry
+        """
+        for vs_map in self.pool.get_page_maps().values():
+            if vs_map.g_map:
+                continue
+            for walk in vs_map.pte_index.values():
+                if not walk.g_stage:
+                    continue
+                yield f"\n#g-stage for map: {vs_map.name}, page: {walk.page.name}"
+                for level, g_walk in walk.g_stage.items():
+                    yield f"#level: {level}: g_page: {g_walk.page.name}, 0x{g_walk.page.lin_addr:016x} -> {g_walk.page.phys_name}, 0x{g_walk.page.phys_addr:016x}"
@@ -467,6 +467,7 @@ class PTEntry:
         self.pt_attr: PTAttrs = pt_attr
         self.level: int = level
         self.leaf: bool = False
+        self.address: Optional[int] = None  # Address of this entry, set when inserted into its table
 
     def get_base_addr(self) -> int:
         return self.basetable.base_addr
@@ -677,6 +678,7 @@ class Pagetables:
             # print(f'PTEntry: Creating non-leaf entry for {self.page.name} at level {pt_level} with pt_attr: {pt_attr}, {pt_attr.get_value():x}')
             pt_entry = PTEntry(basetable=next_basetable, pt_attr=pt_attr, level=pt_level)
             base_table.insert_entry(entry=pt_entry, index=index)
+            pt_entry.address = self._entry_address(base_table, index)
             # print(f'create basetable: {base_table}')
             # print(f'insert entry {pt_entry.get_base_addr():x} for page {self.page.lin_addr:x} at index {index*8:x} \
             #       at level {pt_level} into {base_table.base_addr:x} with map {self.page_map.name}')
@@ -755,6 +757,7 @@ class Pagetables:
                 napot_entry = PTEntry(basetable=napot_leaf_basetable, pt_attr=napot_pt_attr, level=pt_level)
                 napot_entry.leaf = True
                 base_table.insert_entry(entry=napot_entry, index=napot_index)
+                napot_entry.address = self._entry_address(base_table, napot_index)
 
             log.debug(
                 f"insert NAPOT 64KB leaf entries for page {self.page.name} {self.page.lin_addr:x} "
@@ -769,6 +772,7 @@ class Pagetables:
             # Also mark the pt_entry as leaf, so we can error out if any other address tried to use this as non-leaf
             pt_entry.leaf = True
             base_table.insert_entry(entry=pt_entry, index=index)
+            pt_entry.address = self._entry_address(base_table, index)
             log.debug(
                 f"insert leaf entry {pt_entry.get_base_addr():x} for page {self.page.name} {self.page.lin_addr:x} at index {index*8:x} \
                 at level {pt_level} into {base_table.base_addr:x} with map {self.page_map.name}, {self.page}",
@@ -876,6 +880,12 @@ class Pagetables:
 
         return (size, mask, pagesize)
 
+    def _entry_address(self, table: PTTable, index: int) -> int:
+        """
+        Address of the entry at index in table
+        """
+        return table.base_addr + index * RV.RiscvPagingModes.pt_entry_size(mode=self.page_map.paging_mode)
+
     def calc_index_from_va(self, level: int) -> int:
         """
         Calculate the index for a given level of pagetable
@@ -338,6 +338,16 @@ class Routines:
             remu a0, t1, t2
         """
 
+    @classmethod
+    def place_xorshift(cls, seed_reg: str, work_reg: str) -> str:
+        "XORshift step, replaces the 64-bit seed in ``seed_reg`` with the next value. Seed must be non-zero."
+        return f"""slli {work_reg}, {seed_reg}, 21
+                xor {seed_reg}, {seed_reg}, {work_reg}
+                srli {work_reg}, {seed_reg}, 35
+                xor {seed_reg}, {seed_reg}, {work_reg}
+                slli {work_reg}, {seed_reg}, 4
+                xor {seed_reg}, {seed_reg}, {work_reg}"""
+
     # If this seed address is shared this is not a threadsafe routine, okay for non-sharing or for critical section.
     @classmethod
     def place_rng_unsafe_reg(
@@ -365,12 +375,7 @@ class Routines:
                 ld t0, (t1)
 
                 # Generate new seed
-                slli t1, t0, 21
-                xor t0, t0, t1
-                srli t1, t0, 35
-                xor t0, t0, t1
-                slli t1, t0, 4
-                xor t0, t0, t1
+                {Routines.place_xorshift(seed_reg="t0", work_reg="t1")}
 
                 # Store updated seed element for this hart
                 mv t1, {seed_addr_reg}
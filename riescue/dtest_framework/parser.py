@@ -3,7 +3,7 @@
 
 import re
 import logging
-from typing import Optional, TYPE_CHECKING, Tuple, Union
+from typing import Callable, Optional, Sequence, TYPE_CHECKING, Tuple, Union
 from dataclasses import dataclass, field
 from pathlib import Path
 
@@ -21,6 +21,66 @@ log = logging.getLogger(__name__)
 _RND_ADDR_STR_KEY_A = r"name|type|pma_memory_type|pma_amo_type|pma_cacheability|"
 _RND_ADDR_STR_KEY_B = r"pma_combining|pma_routing_to|custom_region"
 _RANDOM_ADDR_STRING_KEYS = re.compile(_RND_ADDR_STR_KEY_A + _RND_ADDR_STR_KEY_B)
+# ;#page_mapping() arguments that stay string literals or are parsed separately
+_PAGE_MAPPING_STRING_KEYS = re.compile(r"pagesize|g_(.+)|v_(.+)|a_(.+)|d_(.+)|u_(.+)|w_(.+)|r_(.+)|x_(.+)|page_maps|secure")
+
+# Directive name at the start of a line, e.g. ``random_addr`` for ``;#random_addr(...)`` or ``test.`` for ``;#test.name``
+_DIRECTIVE_NAME_RE = re.compile(r";#(test\.|\w+)")
+
+# Directive patterns, compiled once instead of on every parsed line
+_RESERVE_MEMORY_RE = re.compile(r"^;#(reserve_memory)\((.+)\)")
+_RANDOM_DATA_RE = re.compile(r"^;#(random_data)\((.+)\)")
+_RANDOM_ADDR_RE = re.compile(r"^;#(random_addr)\((.+)\)")
+_ADDR_TYPE_RE = re.compile(r"([a-z]+)(\d*)")
+_PAGE_MAPPING_RE = re.compile(r"^;#(page_mapping)\((.+)\)")
+_PAGE_MAP_RE = re.compile(r"^;#(page_map)\((.+)\)")
+_TEST_HEADER_RE = re.compile(r";#test.(\w*)(.*)")
+_DISCRETE_TEST_RE = re.compile(r"^;#(discrete_test)\((.+)\)")
+_DISCRETE_DEBUG_TEST_RE = re.compile(r"^;#discrete_debug_test\s*\(\s*\)\s*$")
+_INIT_MEMORY_NAME_RE = re.compile(r"@(.+)")
+_SECTION_NAME_RE = re.compile(r".section .(\w+)")
+_VECTORED_INTERRUPT_RE = re.compile(r"^;#vectored_interrupt\((?P<index>\w*),\s*(?P<label>\w*)\)")
+_CUSTOM_HANDLER_RE = re.compile(r"^;#custom_handler\((?P<num>\d+),\s*(?P<label>\w+)\)")
+_VECTOR_DELEGATION_RE = re.compile(r"^;#vector_delegation\((?P<num>\d+),\s*(?P<mode>\w+)\)")
+_SET_APLIC_ATTR_RE = re.compile(r"^;#set_aplic_attr\((.*?)\)")
+_ENABLE_EXT_INTR_ID_RE = re.compile(r"^;#enable_ext_intr_id\((.*?)\)")
+_APLIC_ARG_RE = re.compile(r"(\w+)=([^,]+)")
+_CSR_RW_RE = re.compile(r"^;#csr_rw\((.+)\)")
+_CSR_RW_ARG_SPLIT_RE = re.compile(r",\s*(?![^\[]*\])")
+_PMA_HINT_RE = re.compile(r"^;#(pma_hint)\((.+)\)")
+_TRIGGER_CONFIG_RE = re.compile(r"^;#trigger_config\((.+)\)")
+_TRIGGER_DISABLE_RE = re.compile(r"^;#trigger_disable\((.+)\)")
+_TRIGGER_ENABLE_RE = re.compile(r"^;#trigger_enable\((.+)\)")
+_RANDOM_FILL_RE = re.compile(r"^;#random_fill\((.+)\)")
+
+# ;#page_mapping() list and per-level attribute patterns
+_PAGESIZE_LIST_RE = re.compile(r"\bpagesize=\[.*?\]")
+_GSTAGE_VS_LEAF_PAGESIZE_LIST_RE = re.compile(r"gstage_vs_leaf_pagesize=\[.*?\]")
+_GSTAGE_VS_NONLEAF_PAGESIZE_LIST_RE = re.compile(r"gstage_vs_nonleaf_pagesize=\[.*?\]")
+_PAGE_MAPS_LIST_RE = re.compile(r"page_maps=\[.*?\]")
+_PAGE_MAPPING_LIST_RES = {
+    "pagesize": _PAGESIZE_LIST_RE,
+    "gstage_vs_leaf_pagesize": _GSTAGE_VS_LEAF_PAGESIZE_LIST_RE,
+    "gstage_vs_nonleaf_pagesize": _GSTAGE_VS_NONLEAF_PAGESIZE_LIST_RE,
+    "page_maps": _PAGE_MAPS_LIST_RE,
+}
+# ;#page_mapping() list argument to the ParsedPageMapping field holding it
+_PAGE_MAPPING_LIST_FIELDS = {
+    "pagesize": "pagesizes",
+    "gstage_vs_leaf_pagesize": "gstage_vs_leaf_pagesizes",
+    "gstage_vs_nonleaf_pagesize": "gstage_vs_nonleaf_pagesizes",
+    "page_maps": "page_maps",
+}
+_BRACKETED_RE = re.compile(r"\[(.*?)\]")
+_DIGITS_RE = re.compile(r"(\d+)")
+_PAGE_MAPPING_LEVELS = ("nonleaf", "leaf_gleaf", "leaf_gnonleaf", "nonleaf_gleaf", "nonleaf_gnonleaf")
+_PAGE_MAPPING_ATTR_RES = {
+    name: re.compile(rf"{name}=(\d+)")
+    for name in (
+        *(f"{bit}_{level}" for bit in ("v", "a", "d", "g", "u", "w", "r", "x", "pbmt", "n") for level in _PAGE_MAPPING_LEVELS),
+        "secure",
+    )
+}
 
 
 class Parser:
@@ -41,10 +101,19 @@ class Parser:
 
     FIXME: If required parameters are missing from the header, the parser will continue. There should be a validate method and/or better type checking to error handle missing parameters.
     e.g.
+
+    :param filename: Test file to parse
+    :param pool: Pool to store parsed directives in
+    :param lines: Lines of a test held in memory, parsed instead of reading ``filename``
+    :param skip_directives: Directives whose entries are already in ``pool``, e.g. :attr:`MEMORY_DIRECTIVES` added with :meth:`add_random_addr`. Their lines are ignored
     """
 
-    def __init__(self, filename: Path, pool: "Pool"):
+    #: Directives that request memory. A pool built from a RiescueC test plan already holds these
+    MEMORY_DIRECTIVES = ("reserve_memory", "random_addr", "page_mapping")
+
+    def __init__(self, filename: Path, pool: "Pool", lines: Optional[list[str]] = None, skip_directives: Sequence[str] = ()):
         self.filename = filename
+        self.lines = lines
         self.reserve_memory = dict()
         self.random_data = dict()
         self.random_addrs = dict()
@@ -59,92 +128,78 @@ class Parser:
         self._collecting_discrete_debug_test = False
         self._discrete_debug_test_body: list[str] = []
 
-    def parse(self):
-        with open(self.filename, "r") as file:
-            contents = file.readlines()
-
-        for line in contents:
-            # If we were collecting ;#discrete_debug_test body, check for terminator
-            if self._collecting_discrete_debug_test:
-                stripped = line.strip()
-                if line.startswith(";#") or stripped.startswith(".section"):
-                    self.pool.set_parsed_discrete_debug_test(self._discrete_debug_test_body)
-                    self._collecting_discrete_debug_test = False
-                    self._discrete_debug_test_body = []
-                else:
-                    self._discrete_debug_test_body.append(line.rstrip("\n"))
-                    continue  # do not process this line as a directive
-
-            if line.startswith(";#discrete_debug_test"):
-                self._parse_discrete_debug_test_start(line)
-                continue
-
-            # Match the ;#random(), ;#random_addr(), ;#page_mapping() and ;#page_map() syntax
-            # ;#random(name=lin1, data_type=32bits, and_mask=0xfffff000, or_mask=0x00000001)
-            # ;#random_addr(name=lin1, type=linear32, size=0x1000, and_mask=0xfffff000)
-            # ;#page_mapping(lin_name=lin1, phys_name=phys1, v=1, r=1, w=1)
-            # ;#page_map(name=map1, mode=sv57)
-            if line.startswith(";#reserve_memory("):
-                self.parse_reserve_memory(line)
-
-            if line.startswith(";#random_data("):
-                self.parse_random_data(line)
-
-            if line.startswith(";#random_addr("):
-                self.parse_random_addr(line)
-
-            if line.startswith(";#page_mapping("):
-                self.parse_page_mappings(line)
-
-            if line.startswith(";#page_map("):
-                self.parse_page_maps(line)
-
-            if line.startswith(";#test."):
-                self.parse_test_header(line)
-
-            if line.startswith(";#discrete_test") and not line.startswith(";#discrete_debug_test"):
-                self.parse_discrete_test(line)
-
-            if line.startswith(";#init_memory"):
-                self.parse_init_mem(line)
-
-            if line.startswith(";#vectored_interrupt"):
-                self.parse_vectored_interrupt(line)
-
-            if line.startswith(";#custom_handler"):
-                self.parse_custom_handler(line)
-
-            if line.startswith(";#vector_delegation"):
-                self.parse_vector_delegation(line)
-
-            if line.startswith(";#enable_ext_intr_id"):
-                self.parse_enable_ext_intr_id(line)
-
-            if line.startswith(";#set_aplic_attr"):
-                self.parse_set_aplic_attr(line)
-
-            if line.startswith(";#pma_hint("):
-                self.parse_pma_hint(line)
-
-            if line.strip().startswith(";#trigger_config("):
-                self.parse_trigger_config(line.strip())
-            if line.strip().startswith(";#trigger_disable("):
-                self.parse_trigger_disable(line.strip())
-            if line.strip().startswith(";#trigger_enable("):
-                self.parse_trigger_enable(line.strip())
+        # Directive name (text after ;# up to the first non-word character) to handler
+        self.directive_handlers: dict[str, Callable[[str], None]] = {
+            "discrete_debug_test": self._parse_discrete_debug_test_start,
+            "reserve_memory": self.parse_reserve_memory,
+            "random_data": self.parse_random_data,
+            "random_addr": self.parse_random_addr,
+            "page_mapping": self.parse_page_mappings,
+            "page_map": self.parse_page_maps,
+            "test.": self.parse_test_header,
+            "discrete_test": self.parse_discrete_test,
+            "init_memory": self.parse_init_mem,
+            "vectored_interrupt": self.parse_vectored_interrupt,
+            "custom_handler": self.parse_custom_handler,
+            "vector_delegation": self.parse_vector_delegation,
+            "enable_ext_intr_id": self.parse_enable_ext_intr_id,
+            "set_aplic_attr": self.parse_set_aplic_attr,
+            "pma_hint": self.parse_pma_hint,
+            "trigger_config": self.parse_trigger_config,
+            "trigger_disable": self.parse_trigger_disable,
+            "trigger_enable": self.parse_trigger_enable,
+            "csr_rw": self.parse_csr_rw,
+            "random_fill": self.parse_random_fill,
+        }
+        # Directives that may be indented inside code, e.g. ``    ;#csr_rw(mstatus, read)``
+        self.indented_directives = {"trigger_config", "trigger_disable", "trigger_enable", "csr_rw", "random_fill"}
+        for name in skip_directives:
+            del self.directive_handlers[name]
 
-            # Only consider strip after all non-riscv directives are removed
-            line = line.strip()
+    def parse(self):
+        """
+        Stream the test file line by line and dispatch each ``;#<name>`` directive to its handler.
 
-            if line.startswith(".section"):
-                self.parse_sections(line)
-            if line.startswith(";#csr_rw"):
-                self.parse_csr_rw(line)
+        Directives must start at the beginning of the line, except for those in :attr:`indented_directives` which are passed the stripped line.
+        """
+        if self.lines is not None:
+            for line in self.lines:
+                self.parse_line(line)
+        else:
+            with open(self.filename, "r") as file:
+                for line in file:
+                    self.parse_line(line)
 
         # End of file: flush any remaining ;#discrete_debug_test body
         if self._collecting_discrete_debug_test:
             self.pool.set_parsed_discrete_debug_test(self._discrete_debug_test_body)
 
+    def parse_line(self, line: str) -> None:
+        "Parse a single line of the test file"
+        stripped = line.strip()
+
+        # If we were collecting ;#discrete_debug_test body, check for terminator
+        if self._collecting_discrete_debug_test:
+            if line.startswith(";#") or stripped.startswith(".section"):
+                self.pool.set_parsed_discrete_debug_test(self._discrete_debug_test_body)
+                self._collecting_discrete_debug_test = False
+                self._discrete_debug_test_body = []
+            else:
+                self._discrete_debug_test_body.append(line.rstrip("\n"))
+                return  # do not process this line as a directive
+
+        if stripped.startswith(";#"):
+            directive = _DIRECTIVE_NAME_RE.match(stripped)
+            if directive is not None:
+                name = directive.group(1)
+                if name in self.indented_directives:
+                    self.directive_handlers[name](stripped)
+                elif line.startswith(";#") and name in self.directive_handlers:
+                    self.directive_handlers[name](line)
+        elif stripped.startswith(".section"):
+            # Only consider strip after all non-riscv directives are removed
+            self.parse_sections(stripped)
+
     def _parse_discrete_debug_test_start(self, line: str) -> None:
         """Parse ;#discrete_debug_test or ;#discrete_debug_test() and start collecting body lines. Only one per test file."""
         if self._collecting_discrete_debug_test:
@@ -153,31 +208,37 @@ class Parser:
             raise ValueError("multiple ;#discrete_debug_test() not allowed; only one per test file")
         # Accept ;#discrete_debug_test or ;#discrete_debug_test() (no parameters)
         stripped = line.strip()
-        if stripped != ";#discrete_debug_test" and not re.match(r"^;#discrete_debug_test\s*\(\s*\)\s*$", stripped):
+        if stripped != ";#discrete_debug_test" and not _DISCRETE_DEBUG_TEST_RE.match(stripped):
             raise ValueError(";#discrete_debug_test() does not take parameters; use ;#discrete_debug_test or ;#discrete_debug_test()")
         self._discrete_debug_test_body = []
         self._collecting_discrete_debug_test = True
 
     def parse_reserve_memory(self, line):
-        pattern = r"^;#(reserve_memory)\((.+)\)"
-        match = re.match(pattern, line)
+        match = _RESERVE_MEMORY_RE.match(line)
         if match:
-            res_mem = ParsedReserveMemory()
-            args = match.group(2).replace(" ", "")
-            args = args.split(",")
-            for arg in args:
-                var = arg.split("=")[0]
-                val = arg.split("=")[1]
-                if re.match(r"(size)", var):
-                    val = int(val, 0)
+            self.add_reserve_memory(self._split_directive_args(match.group(2)))
+
+    def add_reserve_memory(self, args: dict[str, str]) -> "ParsedReserveMemory":
+        """
+        Add a ``;#reserve_memory`` entry to the pool from its arguments.
+
+        Shared by :meth:`parse_reserve_memory` and callers that build the pool without test text, e.g. a RiescueC test plan.
+
+        :param args: Directive arguments as they appear in the test, e.g. ``{"name": "page0", "size": "0x1000"}``
+        """
+        res_mem = ParsedReserveMemory()
+        for var, val in args.items():
+            if var.startswith("size"):
+                res_mem.__setattr__(var, int(val, 0))
+            else:
                 res_mem.__setattr__(var, val)
-            res_mem.name = f"__res_mem_{(res_mem.addr_type)}{res_mem.start_addr}"
-            self.reserve_memory[res_mem.name] = [res_mem]
-            self.pool.add_parsed_res_mem(res_mem)
+        res_mem.name = f"__res_mem_{(res_mem.addr_type)}{res_mem.start_addr}"
+        self.reserve_memory[res_mem.name] = [res_mem]
+        self.pool.add_parsed_res_mem(res_mem)
+        return res_mem
 
     def parse_random_data(self, line):
-        pattern = r"^;#(random_data)\((.+)\)"
-        match = re.match(pattern, line)
+        match = _RANDOM_DATA_RE.match(line)
         if match:
             rnd_inst = ParsedRandomData()
             args = match.group(2).replace(" ", "")
@@ -185,532 +246,114 @@ class Parser:
             for arg in args:
                 var = arg.split("=")[0]
                 val = arg.split("=")[1]
-                if not (re.match(r"(name|type)", var)):
+                if not var.startswith(("name", "type")):
                     val = int(val, 0)
                 rnd_inst.__setattr__(var, val)
             self.random_data[rnd_inst.name] = [rnd_inst]
             self.pool.add_parsed_data(rnd_inst)
 
     def parse_random_addr(self, line):
-        pattern = r"^;#(random_addr)\((.+)\)"
-        match = re.match(pattern, line)
+        match = _RANDOM_ADDR_RE.match(line)
         if match:
-            rnd_inst = ParsedRandomAddress()
-            args = match.group(2).replace(" ", "")
-            args = args.split(",")
-            for arg in args:
-                var = arg.split("=")[0]
-                val = arg.split("=")[1]
-                if not _RANDOM_ADDR_STRING_KEYS.match(var):
-                    val = int(val, 0)
-                if re.match(r"in_pma", var):
+            self.add_random_addr(self._split_directive_args(match.group(2)))
+
+    def add_random_addr(self, args: dict[str, str]) -> "ParsedRandomAddress":
+        """
+        Add a ``;#random_addr`` entry to the pool from its arguments.
+
+        Shared by :meth:`parse_random_addr` and callers that build the pool without test text, e.g. a RiescueC test plan.
+
+        :param args: Directive arguments as they appear in the test, e.g. ``{"name": "lin0", "type": "linear", "size": "0x1000"}``
+        """
+        rnd_inst = ParsedRandomAddress()
+        for var, val in args.items():
+            if not _RANDOM_ADDR_STRING_KEYS.match(var):
+                val = int(val, 0)
+            if var.startswith("in_pma"):
+                rnd_inst.pma_info = PmaInfo()
+                rnd_inst.pma_info.__setattr__(var, val)
+            if var.startswith("pma_"):
+                if rnd_inst.pma_info is None:
                     rnd_inst.pma_info = PmaInfo()
-                    rnd_inst.pma_info.__setattr__(var, val)
-                if re.match(r"pma_", var):
-                    if rnd_inst.pma_info is None:
-                        rnd_inst.pma_info = PmaInfo()
-                    rnd_inst.pma_info.__setattr__(var, val)
-                if re.match(r"(type)", var):
-                    match = re.findall(r"([a-z]+)(\d*)", str(val))[0]
-                    if len(match) == 2:
-                        if match[1] != "":
-                            addr_bits = int(match[1])
-                            val = match[0]
-                            rnd_inst.__setattr__("addr_bits", addr_bits)
-                            # print(f'addr_bits: {addr_bits}, val: {val}')
-                    elif len(match) == 1:
-                        # Only linear|physical was specified
+                rnd_inst.pma_info.__setattr__(var, val)
+            if var.startswith("type"):
+                match = _ADDR_TYPE_RE.findall(str(val))[0]
+                if len(match) == 2:
+                    if match[1] != "":
+                        addr_bits = int(match[1])
                         val = match[0]
-                    # val = int(val, 0)
-                rnd_inst.__setattr__(var, val)
-            self.random_addrs[rnd_inst.name] = [rnd_inst]
-            log.debug(f"Adding random_addr: {rnd_inst.name} to pool")
-            self.pool.add_parsed_addr(rnd_inst)
+                        rnd_inst.__setattr__("addr_bits", addr_bits)
+                elif len(match) == 1:
+                    # Only linear|physical was specified
+                    val = match[0]
+            rnd_inst.__setattr__(var, val)
+        self.random_addrs[rnd_inst.name] = [rnd_inst]
+        log.debug(f"Adding random_addr: {rnd_inst.name} to pool")
+        self.pool.add_parsed_addr(rnd_inst)
+        return rnd_inst
 
     def parse_page_mappings(self, line):
-        pattern = r"^;#(page_mapping)\((.+)\)"
-        pagemap_str = ""
-        pagesize_str = ""
-        gstage_vs_leaf_pagesize_str = ""
-        gstage_vs_nonleaf_pagesize_str = ""
-        # Also add gstage_vs attributes for v, r, w, x, u, g, a, d, pbmt, n, rsw, reserved
-        v_nonleaf_str = ""
-        v_leaf_gleaf_str = ""
-        v_leaf_gnonleaf_str = ""
-        v_nonleaf_gleaf_str = ""
-        v_nonleaf_gnonleaf_str = ""
-        a_nonleaf_str = ""
-        a_leaf_gleaf_str = ""
-        a_leaf_gnonleaf_str = ""
-        a_nonleaf_gleaf_str = ""
-        a_nonleaf_gnonleaf_str = ""
-        d_nonleaf_str = ""
-        d_leaf_gleaf_str = ""
-        d_leaf_gnonleaf_str = ""
-        d_nonleaf_gleaf_str = ""
-        d_nonleaf_gnonleaf_str = ""
-        g_nonleaf_str = ""
-        g_nonleaf_str = ""
-        g_leaf_gleaf_str = ""
-        g_leaf_gnonleaf_str = ""
-        g_nonleaf_gleaf_str = ""
-        g_nonleaf_gnonleaf_str = ""
-        u_nonleaf_str = ""
-        u_leaf_gleaf_str = ""
-        u_leaf_gnonleaf_str = ""
-        u_nonleaf_gleaf_str = ""
-        u_nonleaf_gnonleaf_str = ""
-        r_nonleaf_str = ""
-        r_leaf_gleaf_str = ""
-        r_leaf_gnonleaf_str = ""
-        r_nonleaf_gleaf_str = ""
-        r_nonleaf_gnonleaf_str = ""
-        w_nonleaf_str = ""
-        w_leaf_gleaf_str = ""
-        w_leaf_gnonleaf_str = ""
-        w_nonleaf_gleaf_str = ""
-        w_nonleaf_gnonleaf_str = ""
-        x_nonleaf_str = ""
-        x_leaf_gleaf_str = ""
-        x_leaf_gnonleaf_str = ""
-        x_nonleaf_gleaf_str = ""
-        x_nonleaf_gnonleaf_str = ""
-        pbmt_nonleaf_str = ""
-        pbmt_nonleaf_gleaf_str = ""
-        pbmt_nonleaf_gnonleaf_str = ""
-        pbmt_leaf_gleaf_str = ""
-        pbmt_leaf_gnonleaf_str = ""
-        n_nonleaf_str = ""
-        n_nonleaf_gleaf_str = ""
-        n_nonleaf_gnonleaf_str = ""
-        n_leaf_gleaf_str = ""
-        n_leaf_gnonleaf_str = ""
-        secure_str = ""
-
-        if "pagesize=" in line:
-            pagesize_str = re.findall(r" pagesize=\[.*?\]", line)[0]
-        if "gstage_vs_leaf_pagesize=" in line:
-            gstage_vs_leaf_pagesize_str = re.findall(r"gstage_vs_leaf_pagesize=\[.*?\]", line)[0]
-        if "gstage_vs_nonleaf_pagesize=" in line:
-            gstage_vs_nonleaf_pagesize_str = re.findall(r"gstage_vs_nonleaf_pagesize=\[.*?\]", line)[0]
-        if "v_nonleaf=" in line:
-            v_nonleaf_str = re.findall(r"v_nonleaf=(\d+)", line)[0]
-        if "v_leaf_gleaf=" in line:
-            v_leaf_gleaf_str = re.findall(r"v_leaf_gleaf=(\d+)", line)[0]
-        if "v_leaf_gnonleaf=" in line:
-            v_leaf_gnonleaf_str = re.findall(r"v_leaf_gnonleaf=(\d+)", line)[0]
-        if "v_nonleaf_gleaf=" in line:
-            v_nonleaf_gleaf_str = re.findall(r"v_nonleaf_gleaf=(\d+)", line)[0]
-        if "v_nonleaf_gnonleaf=" in line:
-            v_nonleaf_gnonleaf_str = re.findall(r"v_nonleaf_gnonleaf=(\d+)", line)[0]
-        if "a_nonleaf=" in line:
-            a_nonleaf_str = re.findall(r"a_nonleaf=(\d+)", line)[0]
-        if "a_leaf_gleaf=" in line:
-            a_leaf_gleaf_str = re.findall(r"a_leaf_gleaf=(\d+)", line)[0]
-        if "a_leaf_gnonleaf=" in line:
-            a_leaf_gnonleaf_str = re.findall(r"a_leaf_gnonleaf=(\d+)", line)[0]
-        if "a_nonleaf_gleaf=" in line:
-            a_nonleaf_gleaf_str = re.findall(r"a_nonleaf_gleaf=(\d+)", line)[0]
-        if "a_nonleaf_gnonleaf=" in line:
-            a_nonleaf_gnonleaf_str = re.findall(r"a_nonleaf_gnonleaf=(\d+)", line)[0]
-        if "d_nonleaf=" in line:
-            d_nonleaf_str = re.findall(r"d_nonleaf=(\d+)", line)[0]
-        if "d_leaf_gleaf=" in line:
-            d_leaf_gleaf_str = re.findall(r"d_leaf_gleaf=(\d+)", line)[0]
-        if "d_leaf_gnonleaf=" in line:
-            d_leaf_gnonleaf_str = re.findall(r"d_leaf_gnonleaf=(\d+)", line)[0]
-        if "d_nonleaf_gleaf=" in line:
-            d_nonleaf_gleaf_str = re.findall(r"d_nonleaf_gleaf=(\d+)", line)[0]
-        if "d_nonleaf_gnonleaf=" in line:
-            d_nonleaf_gnonleaf_str = re.findall(r"d_nonleaf_gnonleaf=(\d+)", line)[0]
-        if "g_nonleaf=" in line:
-            g_nonleaf_str = re.findall(r"g_nonleaf=(\d+)", line)[0]
-        if "g_leaf_gleaf=" in line:
-            g_leaf_gleaf_str = re.findall(r"g_leaf_gleaf=(\d+)", line)[0]
-        if "g_leaf_gnonleaf=" in line:
-            g_leaf_gnonleaf_str = re.findall(r"g_leaf_gnonleaf=(\d+)", line)[0]
-        if "g_nonleaf_gleaf=" in line:
-            g_nonleaf_gleaf_str = re.findall(r"g_nonleaf_gleaf=(\d+)", line)[0]
-        if "g_nonleaf_gnonleaf=" in line:
-            g_nonleaf_gnonleaf_str = re.findall(r"g_nonleaf_gnonleaf=(\d+)", line)[0]
-        if "u_nonleaf=" in line:
-            u_nonleaf_str = re.findall(r"u_nonleaf=(\d+)", line)[0]
-        if "u_leaf_gleaf=" in line:
-            u_leaf_gleaf_str = re.findall(r"u_leaf_gleaf=(\d+)", line)[0]
-        if "u_leaf_gnonleaf=" in line:
-            u_leaf_gnonleaf_str = re.findall(r"u_leaf_gnonleaf=(\d+)", line)[0]
-        if "u_nonleaf_gleaf=" in line:
-            u_nonleaf_gleaf_str = re.findall(r"u_nonleaf_gleaf=(\d+)", line)[0]
-        if "u_nonleaf_gnonleaf=" in line:
-            u_nonleaf_gnonleaf_str = re.findall(r"u_nonleaf_gnonleaf=(\d+)", line)[0]
-        if "w_nonleaf=" in line:
-            w_nonleaf_str = re.findall(r"w_nonleaf=(\d+)", line)[0]
-        if "w_leaf_gleaf=" in line:
-            w_leaf_gleaf_str = re.findall(r"w_leaf_gleaf=(\d+)", line)[0]
-        if "w_leaf_gnonleaf=" in line:
-            w_leaf_gnonleaf_str = re.findall(r"w_leaf_gnonleaf=(\d+)", line)[0]
-        if "w_nonleaf_gleaf=" in line:
-            w_nonleaf_gleaf_str = re.findall(r"w_nonleaf_gleaf=(\d+)", line)[0]
-        if "w_nonleaf_gnonleaf=" in line:
-            w_nonleaf_gnonleaf_str = re.findall(r"w_nonleaf_gnonleaf=(\d+)", line)[0]
-        if "r_nonleaf=" in line:
-            r_nonleaf_str = re.findall(r"r_nonleaf=(\d+)", line)[0]
-        if "r_leaf_gleaf=" in line:
-            r_leaf_gleaf_str = re.findall(r"r_leaf_gleaf=(\d+)", line)[0]
-        if "r_leaf_gnonleaf=" in line:
-            r_leaf_gnonleaf_str = re.findall(r"r_leaf_gnonleaf=(\d+)", line)[0]
-        if "r_nonleaf_gleaf=" in line:
-            r_nonleaf_gleaf_str = re.findall(r"r_nonleaf_gleaf=(\d+)", line)[0]
-        if "r_nonleaf_gnonleaf=" in line:
-            r_nonleaf_gnonleaf_str = re.findall(r"r_nonleaf_gnonleaf=(\d+)", line)[0]
-        if "x_nonleaf=" in line:
-            x_nonleaf_str = re.findall(r"x_nonleaf=(\d+)", line)[0]
-        if "x_leaf_gleaf=" in line:
-            x_leaf_gleaf_str = re.findall(r"x_leaf_gleaf=(\d+)", line)[0]
-        if "x_leaf_gnonleaf=" in line:
-            x_leaf_gnonleaf_str = re.findall(r"x_leaf_gnonleaf=(\d+)", line)[0]
-        if "x_nonleaf_gleaf=" in line:
-            x_nonleaf_gleaf_str = re.findall(r"x_nonleaf_gleaf=(\d+)", line)[0]
-        if "x_nonleaf_gnonleaf=" in line:
-            x_nonleaf_gnonleaf_str = re.findall(r"x_nonleaf_gnonleaf=(\d+)", line)[0]
-        if "pbmt_nonleaf=" in line:
-            pbmt_nonleaf_str = re.findall(r"pbmt_nonleaf=(\d+)", line)[0]
-        if "pbmt_nonleaf_gleaf=" in line:
-            pbmt_nonleaf_gleaf_str = re.findall(r"pbmt_nonleaf_gleaf=(\d+)", line)[0]
-        if "pbmt_nonleaf_gnonleaf=" in line:
-            pbmt_nonleaf_gnonleaf_str = re.findall(r"pbmt_nonleaf_gnonleaf=(\d+)", line)[0]
-        if "pbmt_leaf_gleaf=" in line:
-            pbmt_leaf_gleaf_str = re.findall(r"pbmt_leaf_gleaf=(\d+)", line)[0]
-        if "pbmt_leaf_gnonleaf=" in line:
-            pbmt_leaf_gnonleaf_str = re.findall(r"pbmt_leaf_gnonleaf=(\d+)", line)[0]
-        if "n_nonleaf=" in line:
-            n_nonleaf_str = re.findall(r"n_nonleaf=(\d+)", line)[0]
-        if "n_nonleaf_gleaf=" in line:
-            n_nonleaf_gleaf_str = re.findall(r"n_nonleaf_gleaf=(\d+)", line)[0]
-        if "n_nonleaf_gnonleaf=" in line:
-            n_nonleaf_gnonleaf_str = re.findall(r"n_nonleaf_gnonleaf=(\d+)", line)[0]
-        if "n_leaf_gleaf=" in line:
-            n_leaf_gleaf_str = re.findall(r"n_leaf_gleaf=(\d+)", line)[0]
-        if "n_leaf_gnonleaf=" in line:
-            n_leaf_gnonleaf_str = re.findall(r"n_leaf_gnonleaf=(\d+)", line)[0]
-        if "secure=" in line:
-            secure_str = re.findall(r"secure=(\d+)", line)[0]
-
-        if "page_maps=" in line:
-            pagemap_str = re.findall(r"page_maps=\[.*?\]", line)[0]
-        line = line.replace(pagesize_str, "")
-        line = line.replace(gstage_vs_leaf_pagesize_str, "")
-        line = line.replace(gstage_vs_nonleaf_pagesize_str, "")
-        line = line.replace(pagemap_str, "")
-        match = re.match(pattern, line)
+        # List arguments contain commas, so they're cut out of the line before splitting the rest on commas
+        list_args = {}
+        for var, list_re in _PAGE_MAPPING_LIST_RES.items():
+            found = list_re.search(line)
+            if found:
+                list_args[var] = found.group(0).split("=", 1)[1]
+                line = line[: found.start()] + line[found.end() :]
+        match = _PAGE_MAPPING_RE.match(line)
         if match:
-            ppm_inst = ParsedPageMapping()
-            ppm_inst.__setattr__("source_line", line)
-            generate_time_process_args = []
-            args = match.group(2).replace(" ", "")
-            args = args.split(",")
-            args = list(filter(None, args))
-            for arg in args:
-                var = arg.split("=")[0]
-                val = arg.split("=")[1]
+            args = self._split_directive_args(match.group(2))
+            args.update(list_args)
+            self.add_page_mapping(args, source_line=line)
 
-                if var == "lin_name" or var == "phys_name" or var == "lin_addr" or var == "phys_addr":
-                    generate_time_process_args.append([var, val])
-                elif not (re.match(r"pagesize|g_(.+)|v_(.+)|a_(.+)|d_(.+)|u_(.+)|w_(.+)|r_(.+)|x_(.+)|page_maps|secure", var)):
-                    val = int(val, 0)
+    def add_page_mapping(self, args: dict[str, str], source_line: str = "") -> "ParsedPageMapping":
+        """
+        Add a ``;#page_mapping`` entry to the pool's raw page mappings from its arguments.
 
+        Shared by :meth:`parse_page_mappings` and callers that build the pool without test text, e.g. a RiescueC test plan.
+        ``lin_name``, ``phys_name``, ``lin_addr`` and ``phys_addr`` are resolved at generate time, per-level attributes such as ``v_nonleaf`` or ``pbmt_leaf_gleaf``
+        are converted to ``bool``/``int``, and list arguments (``pagesize``, ``gstage_vs_leaf_pagesize``, ``gstage_vs_nonleaf_pagesize``, ``page_maps``) become lists.
+
+        :param args: Directive arguments as they appear in the test, e.g. ``{"lin_name": "lin0", "phys_name": "phys0", "v": "1", "pagesize": "['4kb']"}``
+        :param source_line: Directive text, used in error messages
+        """
+        ppm_inst = ParsedPageMapping()
+        ppm_inst.__setattr__("source_line", source_line)
+        generate_time_process_args = []
+        for var, val in args.items():
+            if var in _PAGE_MAPPING_LIST_FIELDS:
+                ppm_inst.__setattr__(_PAGE_MAPPING_LIST_FIELDS[var], _BRACKETED_RE.findall(val)[0].replace(" ", "").replace("'", "").split(","))
+            elif var in _PAGE_MAPPING_ATTR_RES:
+                level_val = int(_DIGITS_RE.findall(val)[0])
+                ppm_inst.__setattr__(var, level_val if var.startswith(("pbmt_", "n_")) else bool(level_val))
+            elif var == "lin_name" or var == "phys_name" or var == "lin_addr" or var == "phys_addr":
+                generate_time_process_args.append([var, val])
+                ppm_inst.__setattr__(var, val)
+            elif not _PAGE_MAPPING_STRING_KEYS.match(var):
+                ppm_inst.__setattr__(var, int(val, 0))
+            else:
                 ppm_inst.__setattr__(var, val)
 
-            # Refactor following code
-            if v_nonleaf_str != "":
-                # Remove spaces, quotes and convert to python list
-                extracted = re.findall(r"(\d+)", v_nonleaf_str)[0].replace(" ", "").replace("'", "").split(",")
-                ppm_inst.v_nonleaf = bool(int(extracted[0]))
-
-            if a_nonleaf_str != "":
-                # Remove spaces, quotes and convert to python list
-                extracted = re.findall(r"(\d+)", a_nonleaf_str)[0].replace(" ", "").replace("'", "").split(",")
-                ppm_inst.a_nonleaf = bool(int(extracted[0]))
-
-            if d_nonleaf_str != "":
-                # Remove spaces, quotes and convert to python list
-                extracted = re.findall(r"(\d+)", d_nonleaf_str)[0].replace(" ", "").replace("'", "").split(",")
-                ppm_inst.d_nonleaf = bool(int(extracted[0]))
-
-            if u_nonleaf_str != "":
-                # Remove spaces, quotes and convert to python list
-                extracted = re.findall(r"(\d+)", u_nonleaf_str)[0].replace(" ", "").replace("'", "").split(",")
-                ppm_inst.u_nonleaf = bool(int(extracted[0]))
-
-            if w_nonleaf_str != "":
-                # Remove spaces, quotes and convert to python list
-                extracted = re.findall(r"(\d+)", w_nonleaf_str)[0].replace(" ", "").replace("'", "").split(",")
-                ppm_inst.w_nonleaf = bool(int(extracted[0]))
-
-            if r_nonleaf_str != "":
-                # Remove spaces, quotes and convert to python list
-                extracted = re.findall(r"(\d+)", r_nonleaf_str)[0].replace(" ", "").replace("'", "").split(",")
-                ppm_inst.r_nonleaf = bool(int(extracted[0]))
-
-            if x_nonleaf_str != "":
-                # Remove spaces, quotes and convert to python list
-                extracted = re.findall(r"(\d+)", x_nonleaf_str)[0].replace(" ", "").replace("'", "").split(",")
-                ppm_inst.x_nonleaf = bool(int(extracted[0]))
-
-            if v_leaf_gleaf_str != "":
-                # Remove spaces, quotes and convert to python list
-                extracted = re.findall(r"(\d+)", v_leaf_gleaf_str)[0].replace(" ", "").replace("'", "").split(",")
-                ppm_inst.v_leaf_gleaf = bool(int(extracted[0]))
-
-            if v_leaf_gnonleaf_str != "":
-                # Remove spaces, quotes and convert to python list
-                extracted = re.findall(r"(\d+)", v_leaf_gnonleaf_str)[0].replace(" ", "").replace("'", "").split(",")
-                ppm_inst.v_leaf_gnonleaf = bool(int(extracted[0]))
-
-            if v_nonleaf_gleaf_str != "":
-                # Remove spaces, quotes and convert to python list
-                extracted = re.findall(r"(\d+)", v_nonleaf_gleaf_str)[0].replace(" ", "").replace("'", "").split(",")
-                ppm_inst.v_nonleaf_gleaf = bool(int(extracted[0]))
-
-            if v_nonleaf_gnonleaf_str != "":
-                # Remove spaces, quotes and convert to python list
-                extracted = re.findall(r"(\d+)", v_nonleaf_gnonleaf_str)[0].replace(" ", "").replace("'", "").split(",")
-                ppm_inst.v_nonleaf_gnonleaf = bool(int(extracted[0]))
-
-            if a_leaf_gleaf_str != "":
-                # Remove spaces, quotes and convert to python list
-                extracted = re.findall(r"(\d+)", a_leaf_gleaf_str)[0].replace(" ", "").replace("'", "").split(",")
-                ppm_inst.a_leaf_gleaf = bool(int(extracted[0]))
-
-            if a_leaf_gnonleaf_str != "":
-                # Remove spaces, quotes and convert to python list
-                extracted = re.findall(r"(\d+)", a_leaf_gnonleaf_str)[0].replace(" ", "").replace("'", "").split(",")
-                ppm_inst.a_leaf_gnonleaf = bool(int(extracted[0]))
-
-            if a_nonleaf_gleaf_str != "":
-                # Remove spaces, quotes and convert to python list
-                extracted = re.findall(r"(\d+)", a_nonleaf_gleaf_str)[0].replace(" ", "").replace("'", "").split(",")
-                ppm_inst.a_nonleaf_gleaf = bool(int(extracted[0]))
-
-            if a_nonleaf_gnonleaf_str != "":
-                # Remove spaces, quotes and convert to python list
-                extracted = re.findall(r"(\d+)", a_nonleaf_gnonleaf_str)[0].replace(" ", "").replace("'", "").split(",")
-                ppm_inst.a_nonleaf_gnonleaf = bool(int(extracted[0]))
-
-            if d_leaf_gleaf_str != "":
-                # Remove spaces, quotes and convert to python list
-                extracted = re.findall(r"(\d+)", d_leaf_gleaf_str)[0].replace(" ", "").replace("'", "").split(",")
-                ppm_inst.d_leaf_gleaf = bool(int(extracted[0]))
-
-            if d_leaf_gnonleaf_str != "":
-                # Remove spaces, quotes and convert to python list
-                extracted = re.findall(r"(\d+)", d_leaf_gnonleaf_str)[0].replace(" ", "").replace("'", "").split(",")
-                ppm_inst.d_leaf_gnonleaf = bool(int(extracted[0]))
-
-            if d_nonleaf_gleaf_str != "":
-                # Remove spaces, quotes and convert to python list
-                extracted = re.findall(r"(\d+)", d_nonleaf_gleaf_str)[0].replace(" ", "").replace("'", "").split(",")
-                ppm_inst.d_nonleaf_gleaf = bool(int(extracted[0]))
-
-            if d_nonleaf_gnonleaf_str != "":
-                # Remove spaces, quotes and convert to python list
-                extracted = re.findall(r"(\d+)", d_nonleaf_gnonleaf_str)[0].replace(" ", "").replace("'", "").split(",")
-                ppm_inst.d_nonleaf_gnonleaf = bool(int(extracted[0]))
-
-            if g_nonleaf_str != "":
-                # Remove spaces, quotes and convert to python list
-                extracted = re.findall(r"(\d+)", g_nonleaf_str)[0].replace(" ", "").replace("'", "").split(",")
-                ppm_inst.g_nonleaf = bool(int(extracted[0]))
-
-            if g_leaf_gleaf_str != "":
-                # Remove spaces, quotes and convert to python list
-                extracted = re.findall(r"(\d+)", g_leaf_gleaf_str)[0].replace(" ", "").replace("'", "").split(",")
-                ppm_inst.g_leaf_gleaf = bool(int(extracted[0]))
-
-            if g_leaf_gnonleaf_str != "":
-                # Remove spaces, quotes and convert to python list
-                extracted = re.findall(r"(\d+)", g_leaf_gnonleaf_str)[0].replace(" ", "").replace("'", "").split(",")
-                ppm_inst.g_leaf_gnonleaf = bool(int(extracted[0]))
-
-            if g_nonleaf_gleaf_str != "":
-                # Remove spaces, quotes and convert to python list
-                extracted = re.findall(r"(\d+)", g_nonleaf_gleaf_str)[0].replace(" ", "").replace("'", "").split(",")
-                ppm_inst.g_nonleaf_gleaf = bool(int(extracted[0]))
-
-            if g_nonleaf_gnonleaf_str != "":
-                # Remove spaces, quotes and convert to python list
-                extracted = re.findall(r"(\d+)", g_nonleaf_gnonleaf_str)[0].replace(" ", "").replace("'", "").split(",")
-                ppm_inst.g_nonleaf_gnonleaf = bool(int(extracted[0]))
-
-            if u_leaf_gleaf_str != "":
-                # Remove spaces, quotes and convert to python list
-                extracted = re.findall(r"(\d+)", u_leaf_gleaf_str)[0].replace(" ", "").replace("'", "").split(",")
-                ppm_inst.u_leaf_gleaf = bool(int(extracted[0]))
-
-            if u_leaf_gnonleaf_str != "":
-                # Remove spaces, quotes and convert to python list
-                extracted = re.findall(r"(\d+)", u_leaf_gnonleaf_str)[0].replace(" ", "").replace("'", "").split(",")
-                ppm_inst.u_leaf_gnonleaf = bool(int(extracted[0]))
-
-            if u_nonleaf_gleaf_str != "":
-                # Remove spaces, quotes and convert to python list
-                extracted = re.findall(r"(\d+)", u_nonleaf_gleaf_str)[0].replace(" ", "").replace("'", "").split(",")
-                ppm_inst.u_nonleaf_gleaf = bool(int(extracted[0]))
-
-            if u_nonleaf_gnonleaf_str != "":
-                # Remove spaces, quotes and convert to python list
-                extracted = re.findall(r"(\d+)", u_nonleaf_gnonleaf_str)[0].replace(" ", "").replace("'", "").split(",")
-                ppm_inst.u_nonleaf_gnonleaf = bool(int(extracted[0]))
-
-            if w_leaf_gleaf_str != "":
-                # Remove spaces, quotes and convert to python list
-                extracted = re.findall(r"(\d+)", w_leaf_gleaf_str)[0].replace(" ", "").replace("'", "").split(",")
-                ppm_inst.w_leaf_gleaf = bool(int(extracted[0]))
-
-            if w_leaf_gnonleaf_str != "":
-                # Remove spaces, quotes and convert to python list
-                extracted = re.findall(r"(\d+)", w_leaf_gnonleaf_str)[0].replace(" ", "").replace("'", "").split(",")
-                ppm_inst.w_leaf_gnonleaf = bool(int(extracted[0]))
-
-            if w_nonleaf_gleaf_str != "":
-                # Remove spaces, quotes and convert to python list
-                extracted = re.findall(r"(\d+)", w_nonleaf_gleaf_str)[0].replace(" ", "").replace("'", "").split(",")
-                ppm_inst.w_nonleaf_gleaf = bool(int(extracted[0]))
-
-            if w_nonleaf_gnonleaf_str != "":
-                # Remove spaces, quotes and convert to python list
-                extracted = re.findall(r"(\d+)", w_nonleaf_gnonleaf_str)[0].replace(" ", "").replace("'", "").split(",")
-                ppm_inst.w_nonleaf_gnonleaf = bool(int(extracted[0]))
-
-            if r_leaf_gleaf_str != "":
-                # Remove spaces, quotes and convert to python list
-                extracted = re.findall(r"(\d+)", r_leaf_gleaf_str)[0].replace(" ", "").replace("'", "").split(",")
-                ppm_inst.r_leaf_gleaf = bool(int(extracted[0]))
-
-            if r_leaf_gnonleaf_str != "":
-                # Remove spaces, quotes and convert to python list
-                extracted = re.findall(r"(\d+)", r_leaf_gnonleaf_str)[0].replace(" ", "").replace("'", "").split(",")
-                ppm_inst.r_leaf_gnonleaf = bool(int(extracted[0]))
-
-            if r_nonleaf_gleaf_str != "":
-                # Remove spaces, quotes and convert to python list
-                extracted = re.findall(r"(\d+)", r_nonleaf_gleaf_str)[0].replace(" ", "").replace("'", "").split(",")
-                ppm_inst.r_nonleaf_gleaf = bool(int(extracted[0]))
-
-            if r_nonleaf_gnonleaf_str != "":
-                # Remove spaces, quotes and convert to python list
-                extracted = re.findall(r"(\d+)", r_nonleaf_gnonleaf_str)[0].replace(" ", "").replace("'", "").split(",")
-                ppm_inst.r_nonleaf_gnonleaf = bool(int(extracted[0]))
-
-            if x_leaf_gleaf_str != "":
-                # Remove spaces, quotes and convert to python list
-                extracted = re.findall(r"(\d+)", x_leaf_gleaf_str)[0].replace(" ", "").replace("'", "").split(",")
-                ppm_inst.x_leaf_gleaf = bool(int(extracted[0]))
-
-            if x_leaf_gnonleaf_str != "":
-                # Remove spaces, quotes and convert to python list
-                extracted = re.findall(r"(\d+)", x_leaf_gnonleaf_str)[0].replace(" ", "").replace("'", "").split(",")
-                ppm_inst.x_leaf_gnonleaf = bool(int(extracted[0]))
-
-            if x_nonleaf_gleaf_str != "":
-                # Remove spaces, quotes and convert to python list
-                extracted = re.findall(r"(\d+)", x_nonleaf_gleaf_str)[0].replace(" ", "").replace("'", "").split(",")
-                ppm_inst.x_nonleaf_gleaf = bool(int(extracted[0]))
-
-            if x_nonleaf_gnonleaf_str != "":
-                # Remove spaces, quotes and convert to python list
-                extracted = re.findall(r"(\d+)", x_nonleaf_gnonleaf_str)[0].replace(" ", "").replace("'", "").split(",")
-                ppm_inst.x_nonleaf_gnonleaf = bool(int(extracted[0]))
-
-            if pbmt_nonleaf_str != "":
-                extracted = re.findall(r"(\d+)", pbmt_nonleaf_str)[0]
-                ppm_inst.pbmt_nonleaf = int(extracted)
-
-            if pbmt_nonleaf_gleaf_str != "":
-                extracted = re.findall(r"(\d+)", pbmt_nonleaf_gleaf_str)[0]
-                ppm_inst.pbmt_nonleaf_gleaf = int(extracted)
-
-            if pbmt_nonleaf_gnonleaf_str != "":
-                extracted = re.findall(r"(\d+)", pbmt_nonleaf_gnonleaf_str)[0]
-                ppm_inst.pbmt_nonleaf_gnonleaf = int(extracted)
-
-            if pbmt_leaf_gleaf_str != "":
-                extracted = re.findall(r"(\d+)", pbmt_leaf_gleaf_str)[0]
-                ppm_inst.pbmt_leaf_gleaf = int(extracted)
-
-            if pbmt_leaf_gnonleaf_str != "":
-                extracted = re.findall(r"(\d+)", pbmt_leaf_gnonleaf_str)[0]
-                ppm_inst.pbmt_leaf_gnonleaf = int(extracted)
-
-            if n_nonleaf_str != "":
-                extracted = re.findall(r"(\d+)", n_nonleaf_str)[0]
-                ppm_inst.n_nonleaf = int(extracted)
-
-            if n_nonleaf_gleaf_str != "":
-                extracted = re.findall(r"(\d+)", n_nonleaf_gleaf_str)[0]
-                ppm_inst.n_nonleaf_gleaf = int(extracted)
-
-            if n_nonleaf_gnonleaf_str != "":
-                extracted = re.findall(r"(\d+)", n_nonleaf_gnonleaf_str)[0]
-                ppm_inst.n_nonleaf_gnonleaf = int(extracted)
-
-            if n_leaf_gleaf_str != "":
-                extracted = re.findall(r"(\d+)", n_leaf_gleaf_str)[0]
-                ppm_inst.n_leaf_gleaf = int(extracted)
-
-            if n_leaf_gnonleaf_str != "":
-                extracted = re.findall(r"(\d+)", n_leaf_gnonleaf_str)[0]
-                ppm_inst.n_leaf_gnonleaf = int(extracted)
-
-            if pagesize_str != "":
-                # Extract actual sizes from "pagesize=['4kb', '2mb', '1gb', '512gb', '256tb', 'any'])"
-                # Remove spaces, quotes and convert to python list
-                extracted = re.findall(r"\[(.*?)\]", pagesize_str)[0].replace(" ", "").replace("'", "").split(",")
-                ppm_inst.pagesizes = extracted
-
-            if gstage_vs_leaf_pagesize_str != "":
-                # Extract actual sizes from "pagesize=['4kb', '2mb', '1gb', '512gb', '256tb', 'any'])"
-                # Remove spaces, quotes and convert to python list
-                extracted = re.findall(r"\[(.*?)\]", gstage_vs_leaf_pagesize_str)[0].replace(" ", "").replace("'", "").split(",")
-                ppm_inst.gstage_vs_leaf_pagesizes = extracted
-
-            if gstage_vs_nonleaf_pagesize_str != "":
-                # Extract actual sizes from "pagesize=['4kb', '2mb', '1gb', '512gb', '256tb', 'any'])"
-                # Remove spaces, quotes and convert to python list
-                extracted = re.findall(r"\[(.*?)\]", gstage_vs_nonleaf_pagesize_str)[0].replace(" ", "").replace("'", "").split(",")
-                ppm_inst.gstage_vs_nonleaf_pagesizes = extracted
-
-            if secure_str != "":
-                # Remove spaces, quotes and convert to python list
-                extracted = re.findall(r"(\d+)", secure_str)[0].replace(" ", "").replace("'", "").split(",")
-                ppm_inst.secure = bool(int(extracted[0]))
-
-                # set secure flag for parsed addresses that's included in page mapping
-                if ppm_inst.secure:
-                    parsed_addrs = self.pool.get_parsed_addrs()
-                    for lin_addr, phys_addr in generate_time_process_args:
-                        if lin_addr in parsed_addrs:
-                            parsed_addr = parsed_addrs[lin_addr]
-                            parsed_addr.secure = True
-                            self.pool.add_parsed_addr(parsed_addr, force_overwrite=True)
-                        if phys_addr in parsed_addrs:
-                            parsed_addr = parsed_addrs[phys_addr]
-                            parsed_addr.secure = True
-                            self.pool.add_parsed_addr(parsed_addr, force_overwrite=True)
-
-            if pagemap_str != "":
-                # Extract actual sizes from "pagesize=['4kb', '2mb', '1gb', '512gb', '256tb', 'any'])"
-                # Remove spaces, quotes and convert to python list
-                extracted = re.findall(r"\[(.*?)\]", pagemap_str)[0].replace(" ", "").replace("'", "").split(",")
-                ppm_inst.page_maps = extracted
-
-            ppm_inst.__setattr__("pagemap_str", pagemap_str)
-            ppm_inst.__setattr__("gen_time_proc", generate_time_process_args)
-            self.pool.add_raw_parsed_page_mapping(ppm_inst)
+        # set secure flag for parsed addresses that's included in page mapping
+        if ppm_inst.secure:
+            parsed_addrs = self.pool.get_parsed_addrs()
+            for lin_addr, phys_addr in generate_time_process_args:
+                if lin_addr in parsed_addrs:
+                    parsed_addr = parsed_addrs[lin_addr]
+                    parsed_addr.secure = True
+                    self.pool.add_parsed_addr(parsed_addr, force_overwrite=True)
+                if phys_addr in parsed_addrs:
+                    parsed_addr = parsed_addrs[phys_addr]
+                    parsed_addr.secure = True
+                    self.pool.add_parsed_addr(parsed_addr, force_overwrite=True)
+
+        ppm_inst.__setattr__("pagemap_str", f"page_maps={args['page_maps']}" if "page_maps" in args else "")
+        ppm_inst.__setattr__("gen_time_proc", generate_time_process_args)
+        self.pool.add_raw_parsed_page_mapping(ppm_inst)
+        return ppm_inst
 
     def parse_page_maps(self, line):
-        pattern = r"^;#(page_map)\((.+)\)"
-        match = re.match(pattern, line)
+        match = _PAGE_MAP_RE.match(line)
         if match:
             pm_inst = ParsedPageMap()
             args = match.group(2).replace(" ", "")
@@ -718,15 +361,14 @@ class Parser:
             for arg in args:
                 var = arg.split("=")[0]
                 val = arg.split("=")[1]
-                if re.match(r"name", var):
+                if var.startswith("name"):
                     pm_inst.name = val
-                if re.match(r"mode", var):
+                if var.startswith("mode"):
                     pm_inst.mode = val
             self.pool.add_parsed_page_map(pm_inst)
 
     def parse_test_header(self, line):
-        pattern = r";#test.(\w*)(.*)"
-        match = re.match(pattern, line)
+        match = _TEST_HEADER_RE.match(line)
         if match is None:
             raise ValueError(f"Invalid test header line: {line}")
         var = match.group(1).strip()
@@ -735,8 +377,7 @@ class Parser:
         self.pool.add_test_header(self.test_header)
 
     def parse_discrete_test(self, line):
-        pattern = r"^;#(discrete_test)\((.+)\)"
-        match = re.match(pattern, line)
+        match = _DISCRETE_TEST_RE.match(line)
         if match:
             arg = match.group(2).replace(" ", "")
             testname = arg.split("=")[1]
@@ -745,7 +386,7 @@ class Parser:
 
     @staticmethod
     def separate_lin_name_map(line: str) -> list[Union[str, list[str]]]:
-        lin_name_maps: str = re.findall(r"@(.+)", line)[0]
+        lin_name_maps: str = _INIT_MEMORY_NAME_RE.findall(line)[0]
         lin_name_maps_sep = lin_name_maps.split(":")
         ret: list[Union[str, list[str]]] = []
         if len(lin_name_maps_sep) == 1:
@@ -760,7 +401,7 @@ class Parser:
         return ret
 
     def parse_init_mem(self, line):
-        lin_name = re.findall(r"@(.+)", line)[0]
+        lin_name = _INIT_MEMORY_NAME_RE.findall(line)[0]
         lin_name_maps = self.separate_lin_name_map(line)
         # FIXME: this should be a stronger type instead of a tuple of str + list
         if len(lin_name_maps[1]) == 0:
@@ -777,13 +418,12 @@ class Parser:
                 self.pool.add_parsed_init_mem_addr(f"{lin_name}_{m.strip()}")
 
     def parse_sections(self, line):
-        section_name = re.findall(r".section .(\w+)", line)[0]
+        section_name = _SECTION_NAME_RE.findall(line)[0]
         self.pool.add_parsed_sections(section_name)
 
     def parse_vectored_interrupt(self, line):
         "Format is #;vectored_interrupt(INDEX, LABEL) where INDEX is an integer or a named interrupt bit (e.g. SSI)"
-        pattern = r"^;#vectored_interrupt\((?P<index>\w*),\s*(?P<label>\w*)\)"
-        match = re.match(pattern, line)
+        match = _VECTORED_INTERRUPT_RE.match(line)
         if match:
             index = match.group("index")
             label = match.group("label")
@@ -801,8 +441,7 @@ class Parser:
 
     def parse_custom_handler(self, line):
         """Format: ;#custom_handler(NUM, LABEL) for per-discrete_test custom interrupt handler."""
-        pattern = r"^;#custom_handler\((?P<num>\d+),\s*(?P<label>\w+)\)"
-        match = re.match(pattern, line.strip())
+        match = _CUSTOM_HANDLER_RE.match(line.strip())
         if match:
             vector_num = int(match.group("num"), 0)
             label = match.group("label")
@@ -811,8 +450,7 @@ class Parser:
 
     def parse_vector_delegation(self, line):
         """Format: ;#vector_delegation(NUM, MODE) where MODE is 'supervisor' or 'machine'."""
-        pattern = r"^;#vector_delegation\((?P<num>\d+),\s*(?P<mode>\w+)\)"
-        match = re.match(pattern, line.strip())
+        match = _VECTOR_DELEGATION_RE.match(line.strip())
         if match:
             vector_num = int(match.group("num"), 0)
             mode = match.group("mode").lower()
@@ -833,10 +471,9 @@ class Parser:
         set_aplic_attr_args = {
             "max_aplic_irq": self.set_aplic_attr_max_aplic_irq,
         }
-        args = re.search(r"^;#set_aplic_attr\((.*?)\)", line)
-        pattern = r"(\w+)=([^,]+)"
+        args = _SET_APLIC_ATTR_RE.search(line)
         if args:
-            var_val_pairs = re.findall(pattern, args.group(1))
+            var_val_pairs = _APLIC_ARG_RE.findall(args.group(1))
             for var_val in var_val_pairs:
                 var = var_val[0].strip()
                 try:
@@ -923,12 +560,11 @@ class Parser:
             "state": self.enable_ext_intr_arg_state,
         }
         self.pool.init_aplic_interrupts = True
-        args = re.search(r"^;#enable_ext_intr_id\((.*?)\)", line)
-        pattern = r"(\w+)=([^,]+)"
+        args = _ENABLE_EXT_INTR_ID_RE.search(line)
         if not args:
             return
 
-        var_val_pairs = re.findall(pattern, args.group(1))
+        var_val_pairs = _APLIC_ARG_RE.findall(args.group(1))
         intr_num_found = False
         intr_num = 1
         for var_val in var_val_pairs:
@@ -960,13 +596,12 @@ class Parser:
         - Old: ;#csr_rw(csr_name, action, direct_rw [, force_machine_rw])
         - New: ;#csr_rw(csr, action [, field=, value=, bit=, force_machine=])
         """
-        pattern = r"^;#csr_rw\((.+)\)"
-        match = re.match(pattern, line.strip())
+        match = _CSR_RW_RE.match(line.strip())
         if not match:
             return
 
         inner = match.group(1).strip()
-        parts = [p.strip() for p in re.split(r",\s*(?![^\[]*\])", inner)]
+        parts = [p.strip() for p in _CSR_RW_ARG_SPLIT_RE.split(inner)]
 
         if len(parts) < 2:
             return
@@ -1027,8 +662,7 @@ class Parser:
         ;#pma_hint(name=test, combinations=[{memory_type=memory, cacheability=cacheable, rwx=rwx}])
         ;#pma_hint(name=test, memory_types=[memory, io], cacheability=[cacheable, noncacheable])
         """
-        pattern = r"^;#(pma_hint)\((.+)\)"
-        match = re.match(pattern, line)
+        match = _PMA_HINT_RE.match(line)
         if not match:
             return
 
@@ -1077,8 +711,7 @@ class Parser:
                                addr=SYM, action=breakpoint [, size=1|2|4|8] [, chain=0|1]
                                [, match=equal] [, priv_mode=[m,s,u]] [, count=N] [, pending=0])
         """
-        pattern = r"^;#trigger_config\((.+)\)"
-        match = re.match(pattern, line.strip())
+        match = _TRIGGER_CONFIG_RE.match(line.strip())
         if not match:
             return
         args = self._parse_directive_args(match.group(1))
@@ -1145,8 +778,7 @@ class Parser:
 
     def parse_trigger_disable(self, line: str) -> None:
         """Parse ;#trigger_disable(index=N)"""
-        pattern = r"^;#trigger_disable\((.+)\)"
-        match = re.match(pattern, line.strip())
+        match = _TRIGGER_DISABLE_RE.match(line.strip())
         if not match:
             return
         args = self._parse_directive_args(match.group(1))
@@ -1157,8 +789,7 @@ class Parser:
 
     def parse_trigger_enable(self, line: str) -> None:
         """Parse ;#trigger_enable(index=N)"""
-        pattern = r"^;#trigger_enable\((.+)\)"
-        match = re.match(pattern, line.strip())
+        match = _TRIGGER_ENABLE_RE.match(line.strip())
         if not match:
             return
         args = self._parse_directive_args(match.group(1))
@@ -1167,6 +798,35 @@ class Parser:
         self.pool.add_parsed_trigger_enable(cfg)
         self.parsed_trigger_id += 1
 
+    def parse_random_fill(self, line: str) -> None:
+        """
+        Parse ;#random_fill(type=bits32, count=256, and_mask=0xff, or_mask=0x0, incbin=0)
+
+        ``type`` and ``count`` are required. ``and_mask`` and ``or_mask`` apply to ``bitsN`` types, ``incbin=1`` requests a binary file.
+        """
+        match = _RANDOM_FILL_RE.match(line.strip())
+        if not match:
+            return
+        args = self._parse_directive_args(match.group(1))
+        if "type" not in args or "count" not in args:
+            raise ValueError(f"random_fill requires type and count: {line.strip()}")
+        fill = ParsedRandomFill(data_type=str(args["type"]), count=int(str(args["count"]), 0))
+        if "and_mask" in args:
+            fill.and_mask = int(str(args["and_mask"]), 0)
+        if "or_mask" in args:
+            fill.or_mask = int(str(args["or_mask"]), 0)
+        if "incbin" in args:
+            fill.incbin = bool(int(str(args["incbin"]), 0))
+        self.pool.add_parsed_random_fill(fill)
+
+    @staticmethod
+    def _split_directive_args(args_str: str) -> dict[str, str]:
+        "Split ``name=value`` directive arguments on commas. Doesn't handle lists, see :meth:`_parse_directive_args`"
+        args = {}
+        for arg in filter(None, args_str.replace(" ", "").split(",")):
+            args[arg.split("=")[0]] = arg.split("=")[1]
+        return args
+
     def _parse_directive_args(self, args_str: str) -> dict:
         """
         Parse directive arguments into dictionary.
@@ -1360,6 +1020,17 @@ class ParsedRandomData:
     or_mask: int = 0x0
 
 
+@dataclass
+class ParsedRandomFill:
+    """Parsed ;#random_fill directive. Expands to a block of ``count`` random values of ``data_type`` in place."""
+
+    data_type: str = ""
+    count: int = 0
+    and_mask: int = 0xFFFFFFFFFFFFFFFF
+    or_mask: int = 0x0
+    incbin: bool = False
+
+
 @dataclass
 class ParsedReserveMemory:
     addr: str = ""
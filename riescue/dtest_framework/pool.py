@@ -16,6 +16,7 @@ from riescue.dtest_framework.parser import (
     PmaInfo,
     ParsedTestHeader,
     ParsedRandomData,
+    ParsedRandomFill,
     ParsedReserveMemory,
     ParsedRandomAddress,
     ParsedPageMapping,
@@ -91,6 +92,7 @@ class Pool:
         self.parsed_trigger_configs: list[ParsedTriggerConfig] = []
         self.parsed_trigger_disable: list[ParsedTriggerDisable] = []
         self.parsed_trigger_enable: list[ParsedTriggerEnable] = []
+        self.parsed_random_fills: list[ParsedRandomFill] = []
 
         # Structures to hold processed data
         self.discrete_tests: dict[str, DiscreteTest] = dict()
@@ -324,6 +326,13 @@ class Pool:
     def get_parsed_trigger_enable(self) -> list[ParsedTriggerEnable]:
         return self.parsed_trigger_enable
 
+    # parsed_random_fill
+    def add_parsed_random_fill(self, fill: ParsedRandomFill) -> None:
+        self.parsed_random_fills.append(fill)
+
+    def get_parsed_random_fills(self) -> list[ParsedRandomFill]:
+        return self.parsed_random_fills
+
     # random structures
     # random_data setters and getters
     def add_random_datum(self, key: str, val: int) -> None:
@@ -49,6 +49,7 @@ class Runtime:
             xlen=RV.Xlen.XLEN64,
             hart_count=self.featmgr.num_cpus,
             amo_enabled=self.featmgr.feature.is_enabled("a"),
+            compact_hart_context=self.featmgr.compact_hart_context,
         )
 
         self.variable_manager.register_hart_variable("check_excp", 0x1, size=1)
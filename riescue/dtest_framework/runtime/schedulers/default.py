@@ -38,14 +38,30 @@ class DefaultScheduler(Scheduler):
         self.variable_manager.register_hart_variable(name="num_runs", value=0)
         self.num_runs = self.variable_manager.get_variable("num_runs")
 
+        # With runtime repeat, os_test_sequence holds each test once and num_runs counts down one repetition at a time.
+        # num_rounds counts the repetitions left. With SHUFFLE, scheduler__order is a fresh permutation of os_test_sequence for each repetition
+        if self.runtime_repeat:
+            self.num_rounds = self.variable_manager.register_hart_variable(name="num_rounds", value=0)
+            if self.featmgr.scheduler_order == RV.SchedulerOrder.SHUFFLE:
+                self.scheduler_seed = self.variable_manager.register_hart_variable(name="scheduler__seed", value=self.rng.get_rand_bits(64) | 1)
+                self.order = self.variable_manager.register_hart_variable(name="scheduler__order", value=0, element_count=max(len(self.dtests_sequence), 1))
+
     def scheduler_init(self) -> str:
         """
         Assumes hart context is already in tp. Sets up num_runs for run.
         This runs number of tests + test_cleanup
+
+        With runtime repeat, num_runs starts at 1 so the first dispatch starts the first repetition.
         """
         code = ""
 
-        num_runs_init_value = len(self.dtests_sequence) + 1
+        if self.runtime_repeat:
+            num_runs_init_value = 1
+            num_rounds = max(self.featmgr.repeat_times, 0)
+            code += f"li t0, {num_rounds} # setting num_rounds to {num_rounds}\n "
+            code += self.num_rounds.store(src_reg="t0") + "\n"
+        else:
+            num_runs_init_value = len(self.dtests_sequence) + 1
         code += f"li t0, {num_runs_init_value} # setting num_runs to {num_runs_init_value}\n "
         code += self.num_runs.store(src_reg="t0")
         code += super().scheduler_init()
@@ -67,11 +83,26 @@ class DefaultScheduler(Scheduler):
         scheduler__load_num_runs:
             {self.num_runs.load(dest_reg="t1")}
             beqz t1, {self.scheduler_finished_label}
+        """
+        if self.runtime_repeat:
+            code += self._next_round()
 
+        code += f"""
         scheduler__decrement_num_runs:
             addi t2, t1, -1
             {self.num_runs.store(src_reg="t2")}
         """
+        if self.featmgr.scheduler_order == RV.SchedulerOrder.SHUFFLE:
+            code += f"""
+        # t2 = scheduler__order[t2 - 1], position 0 (test_cleanup) isn't shuffled
+        scheduler__load_order:
+            beqz t2, scheduler__order_loaded
+            {self.order.load_immediate("t0")}
+            slli t3, t2, 3
+            add t0, t0, t3
+            ld t2, -8(t0)
+        scheduler__order_loaded:
+        """
 
         # Store current test index for RVCP pass/fail messages
         # t2 contains the decremented num_runs which is the index into os_test_sequence
@@ -99,3 +130,56 @@ class DefaultScheduler(Scheduler):
         """
 
         return code
+
+    def _next_round(self) -> str:
+        """
+        Runtime repeat: when only test_cleanup is left in os_test_sequence (num_runs == 1) and repetitions remain, start the next repetition.
+        Expects num_runs in t1, leaves num_runs for the next repetition in t1.
+        """
+        num_tests = len(self.dtests_sequence)
+        code = f"""
+        # (num_runs == 1 && num_rounds != 0) start next repetition, otherwise continue (runs test_cleanup on the last one)
+        scheduler__check_round:
+            li t0, 1
+            bne t1, t0, scheduler__decrement_num_runs
+            {self.num_rounds.load(dest_reg="t3")}
+            beqz t3, scheduler__decrement_num_runs
+            addi t3, t3, -1
+            {self.num_rounds.store(src_reg="t3")}
+        """
+        if self.featmgr.scheduler_order == RV.SchedulerOrder.SHUFFLE:
+            code += self._shuffle_order()
+        code += f"""
+        scheduler__start_round:
+            li t1, {num_tests + 1}
+        """
+        return code
+
+    def _shuffle_order(self) -> str:
+        """
+        Fill scheduler__order with a new permutation of os_test_sequence positions 1..M using an inside-out Fisher-Yates shuffle.
+        Random numbers come from an XORshift of the hart-local scheduler__seed.
+        """
+        return f"""
+        scheduler__shuffle:
+            {self.scheduler_seed.load(dest_reg="t5")}
+            {self.order.load_immediate("t4")}
+            li t3, 0                    # i
+        scheduler__shuffle_loop:
+            li t0, {len(self.dtests_sequence)}
+            bgeu t3, t0, scheduler__shuffle_done
+            {Routines.place_xorshift(seed_reg="t5", work_reg="t0")}
+            addi t0, t3, 1
+            remu t0, t5, t0             # j = rand % (i + 1)
+            slli t0, t0, 3
+            add t0, t4, t0              # t0 = &order[j]
+            slli t1, t3, 3
+            add t1, t4, t1              # t1 = &order[i]
+            ld t2, 0(t0)
+            sd t2, 0(t1)                # order[i] = order[j]
+            addi t3, t3, 1
+            sd t3, 0(t0)                # order[j] = i + 1
+            j scheduler__shuffle_loop
+        scheduler__shuffle_done:
+            {self.scheduler_seed.store(src_reg="t5")}
+        """
@@ -42,8 +42,9 @@ class Scheduler(AssemblyGenerator, ABC):
             self.current_test_index = self.variable_manager.register_hart_variable("current_test_index", value=0xFFFFFFFF)
 
         self.dtests_sequence: list[str]
-        if self.featmgr.repeat_times == -1 or self.mp_parallel:
-            self.dtests_sequence = [test for test in dtests]  # Schedule is randomized at runtime for linux mode and for parallel mp mode.
+        self.runtime_repeat = self.featmgr.scheduler_order != RV.SchedulerOrder.STATIC  #: Each test is stored once and repeated at runtime
+        if self.featmgr.repeat_times == -1 or self.mp_parallel or self.runtime_repeat:
+            self.dtests_sequence = [test for test in dtests]  # Schedule is randomized at runtime for linux mode, parallel mp mode, and runtime repeat.
         else:
             self.dtests_sequence = [test for test in dtests for _ in range(self.featmgr.repeat_times)]
         self.rng.shuffle(self.dtests_sequence)
@@ -244,11 +245,11 @@ scheduler__test_cleanup_ptr:
         Essentially the array is``os_test_sequence = ["test_cleanup", "test01", "test02", ...]``,
         which can be indexed by the ``num_runs`` variable to get the next test to run
 
-        .. note:: Not scalable for large repeat_times values
+        .. note:: Not scalable for large repeat_times values with ``scheduler_order=static``
             This stores the self.dtests_sequence list into memory.
             Since self.dtest_sequences is the tests repeated repeat_times times, it has a size of O(MxN) for M tests and N ``repeat_times``.
 
-            This can be optimized in the future using a static array of M tests and iterating through the array N times at runtime.
+            ``scheduler_order=iterate`` or ``shuffle`` store the M tests once and repeat them N times at runtime, see :class:`DefaultScheduler`.
 
         Since test_cleanup is always ran last, it is inlcuded in ``os_test_sequence``.
         This is a bit faster than setting a flag in scheduler__finished to check if test_cleanup has been ran.
@@ -13,6 +13,11 @@ process each 8-byte state value directly using add. Both accumulators are stored
 via sd (16 bytes total per test phase). This dramatically reduces selfcheck data
 size while still detecting state mismatches.
 
+With ``selfcheck_compact``, register resources are first copied to a hart-local
+snapshot and a single loop folds the memory ranges listed in a descriptor table,
+instead of unrolling the fold for every value. Values are folded in the same order,
+so both modes produce the same checksum.
+
 Memory Layout (per-hart):
 +0x00: used_bytes (8 bytes) - how many bytes written so far
 +0x08: checksum data (16 bytes per test phase: sum1 then sum2)
@@ -20,6 +25,7 @@ Memory Layout (per-hart):
 
 import logging
 from abc import ABC, abstractmethod
+from typing import Optional
 
 import riescue.lib.enums as RV
 from riescue.dtest_framework.runtime.assembly_generator import AssemblyGenerator, RuntimeContext
@@ -31,12 +37,24 @@ log = logging.getLogger(__name__)
 SELFCHECK_CHECKSUM_SIZE = 16
 
 
+def fletcher_update() -> str:
+    """Return the Fletcher fold sequence with mod 2^64-1 reduction (value already in t0). Clobbers t1."""
+    return """
+            add t5, t5, t0
+            sltu t1, t5, t0
+            add t5, t5, t1
+            add t6, t6, t5
+            sltu t1, t6, t5
+            add t6, t6, t1
+        """
+
+
 class CheckResource(ABC):
     """
     Abstract base for a single checkable resource.
 
     Each CheckResource instance represents ONE resource to be checksummed.
-    Subclasses must implement generate_checksum_update_code().
+    Subclasses must implement generate_checksum_update_code() and generate_snapshot_code().
 
     Register convention:
       t0       - scratch (load value here before folding)
@@ -61,16 +79,31 @@ class CheckResource(ABC):
         """
         pass
 
+    @property
+    @abstractmethod
+    def num_values(self) -> int:
+        """Number of 8-byte values folded into the checksum."""
+        pass
+
+    def memory_variable(self) -> Optional[Variable]:
+        """
+        Hart variable already holding this resource's values, folded in place by the compact checksum loop.
+        None if the values need to be copied to the snapshot with :py:meth:`generate_snapshot_code`.
+        """
+        return None
+
+    @abstractmethod
+    def generate_snapshot_code(self, snapshot: Variable, index: int) -> str:
+        """
+        Generate asm that stores this resource's values to ``snapshot[index:index + num_values]``, in fold order.
+
+        May use t0, t1, t2 as scratch.
+        """
+        pass
+
     def _fletcher_update(self) -> str:
         """Return the Fletcher fold sequence with mod 2^64-1 reduction (value already in t0)."""
-        return """
-            add t5, t5, t0
-            sltu t1, t5, t0
-            add t5, t5, t1
-            add t6, t6, t5
-            sltu t1, t6, t5
-            add t6, t6, t1
-        """
+        return fletcher_update()
 
 
 class VariableResource(CheckResource):
@@ -97,6 +130,23 @@ class VariableResource(CheckResource):
         code += "\n"
         return code
 
+    @property
+    def num_values(self) -> int:
+        return self._variable.element_count
+
+    def memory_variable(self) -> Optional[Variable]:
+        return self._variable
+
+    def generate_snapshot_code(self, snapshot: Variable, index: int) -> str:
+        "Copy each element to the snapshot. The compact loop folds the variable in place, see :py:meth:`memory_variable`"
+        code = ""
+        for i in range(self._variable.element_count):
+            code += f"""
+            {self._variable.load('t0', index=i)}
+            {snapshot.store('t0', temp_reg='t1', index=index + i)}
+            """
+        return code
+
 
 class CsrResource(CheckResource):
     """Folds a single CSR value into the Fletcher checksum."""
@@ -112,6 +162,16 @@ class CsrResource(CheckResource):
         {self._fletcher_update()}
         """
 
+    @property
+    def num_values(self) -> int:
+        return 1
+
+    def generate_snapshot_code(self, snapshot: Variable, index: int) -> str:
+        return f"""
+        csrr t0, {self._csr_name}
+        {snapshot.store('t0', temp_reg='t1', index=index)}
+        """
+
 
 class FpRegisterResource(CheckResource):
     """Folds a single floating-point register into the Fletcher checksum."""
@@ -122,24 +182,36 @@ class FpRegisterResource(CheckResource):
 
     def generate_checksum_update_code(self) -> str:
         """Generate assembly to move FP register bits to t0 and fold into checksum."""
-        move_instr = "fmv.x.d" if self._has_d_extension else "fmv.x.w"
         return f"""
         # Checksum FP register: f{self._reg_num}
-        {move_instr} t0, f{self._reg_num}
+        {self._move_instr()} t0, f{self._reg_num}
         {self._fletcher_update()}
         """
 
+    @property
+    def num_values(self) -> int:
+        return 1
+
+    def generate_snapshot_code(self, snapshot: Variable, index: int) -> str:
+        return f"""
+        {self._move_instr()} t0, f{self._reg_num}
+        {snapshot.store('t0', temp_reg='t1', index=index)}
+        """
+
+    def _move_instr(self) -> str:
+        return "fmv.x.d" if self._has_d_extension else "fmv.x.w"
+
 
 class VectorRegisterResource(CheckResource):
     """Folds a single vector register into the Fletcher checksum via scratch memory."""
 
-    def __init__(self, reg_num: int, vlen_bytes: int, scratch_var: Variable):
+    def __init__(self, reg_num: int, vlen_bytes: int, scratch_var: Optional[Variable] = None):
         """
         Initialize vector register resource.
 
         :param reg_num: Vector register number (0-31)
         :param vlen_bytes: Size of each vector register in bytes (from vlenb CSR)
-        :param scratch_var: Hart-local scratch variable for memory-based access
+        :param scratch_var: Hart-local scratch variable for memory-based access. Not needed when only the snapshot code is used
         """
         self._reg_num = reg_num
         self._vlen_bytes = vlen_bytes
@@ -152,6 +224,8 @@ class VectorRegisterResource(CheckResource):
 
         Uses vs1r.v to store without modifying vtype, then loads 8-byte chunks.
         """
+        if self._scratch_var is None:
+            raise ValueError(f"Checksum code for v{self._reg_num} needs a scratch variable")
         num_chunks = self._vlen_bytes // 8
 
         chunk_code = ""
@@ -167,6 +241,16 @@ class VectorRegisterResource(CheckResource):
         {chunk_code}
         """
 
+    @property
+    def num_values(self) -> int:
+        return self._vlen_bytes // 8
+
+    def generate_snapshot_code(self, snapshot: Variable, index: int) -> str:
+        return f"""
+        {snapshot.load_immediate('t2', index=index)}
+        vs1r.v v{self._reg_num}, (t2)
+        """
+
 
 class Selfcheck(AssemblyGenerator):
     """
@@ -216,13 +300,22 @@ class Selfcheck(AssemblyGenerator):
             self._resources.append(CsrResource("vl"))
             self._resources.append(CsrResource("vstart"))
 
-            # Register scratch area for memory-based vector store (vlen_bytes / 8 elements of 8 bytes each)
-            selfcheck_vec_scratch = self.variable_manager.register_hart_variable("selfcheck_vec_scratch", value=0, element_count=vlen_bytes // 8)
+            # Register scratch area for memory-based vector store (vlen_bytes / 8 elements of 8 bytes each). Compact mode stores to the snapshot instead
+            selfcheck_vec_scratch = None
+            if not self.featmgr.selfcheck_compact:
+                selfcheck_vec_scratch = self.variable_manager.register_hart_variable("selfcheck_vec_scratch", value=0, element_count=vlen_bytes // 8)
 
             # Add vector registers v0-v31
             for i in range(32):
                 self._resources.append(VectorRegisterResource(i, vlen_bytes, selfcheck_vec_scratch))
 
+        # Compact mode copies register resources to a snapshot so the checksum loop only reads memory
+        self.snapshot: Optional[Variable] = None
+        if self.featmgr.selfcheck_compact:
+            snapshot_values = sum(r.num_values for r in self._resources if r.memory_variable() is None)
+            if snapshot_values:
+                self.snapshot = self.variable_manager.register_hart_variable("selfcheck_snapshot", value=0, element_count=snapshot_values)
+
         # Register equate for per-hart size (8 byte header + 16 bytes per checkpoint)
         per_hart_size = 8 + SELFCHECK_CHECKSUM_SIZE * self.featmgr.repeat_times * (len(self.pool.discrete_tests) + 2)
         self.register_equate("selfcheck_per_hart_size", f"0x{per_hart_size:x}")
@@ -257,11 +350,7 @@ class Selfcheck(AssemblyGenerator):
 # Uses: t0-t4 (caller-saved)
 selfcheck__decide_save_or_check:
     # hart_offset = hart_id * per_hart_size
-    csrr t0, mhartid                # Read hart ID directly (always M-mode)
-    li t1, selfcheck_per_hart_size  # Per-hart size (from equate)
-    mul t0, t0, t1
-    li t1, selfcheck_data_pa        # Base PA address from equate
-    add t4, t0, t1                  # t4 = this hart's state_save base
+    {self._hart_base('t4')}
 
     ld t0, 0(t4)                    # t0 = used_bytes
     beqz t0, selfcheck__decided_save
@@ -275,6 +364,14 @@ selfcheck__decided_save:
     ret
 """
 
+    def _hart_base(self, dest: str) -> str:
+        """Generate code computing this hart's state_save base into ``dest``. Uses t0, t1."""
+        return f"""csrr t0, mhartid                # Read hart ID directly (always M-mode)
+    li t1, selfcheck_per_hart_size  # Per-hart size (from equate)
+    mul t0, t0, t1
+    li t1, selfcheck_data_pa        # Base PA address from equate
+    add {dest}, t0, t1                  # {dest} = this hart's state_save base"""
+
     def _generate_save_or_check_routine(self) -> str:
         """
         Generate the selfcheck__save_or_check routine.
@@ -285,7 +382,12 @@ selfcheck__decided_save:
         3. Folds each resource into the checksum
         4. Branches on selfcheck_mode: save or check
         """
-        resource_checksum_code = "\n".join(r.generate_checksum_update_code() for r in self._resources)
+        if self.featmgr.selfcheck_compact:
+            snapshot_code, resource_checksum_code, descriptor_table = self._generate_compact_checksum()
+        else:
+            snapshot_code = ""
+            descriptor_table = ""
+            resource_checksum_code = "\n".join(r.generate_checksum_update_code() for r in self._resources)
 
         return f"""
 # Selfcheck save-or-check routine
@@ -293,12 +395,8 @@ selfcheck__decided_save:
 # Uses: t0-t2, t5, t6 (caller-saved); t3 = hart state_save base (preserved); t4 = scratch
 selfcheck__save_or_check:
     # 1. Get hart ID and calculate state_save base (preserved in t3)
-    csrr t0, mhartid                # Read hart ID directly (always M-mode)
-    li t1, selfcheck_per_hart_size  # Per-hart size (from equate)
-    mul t0, t0, t1
-    li t1, selfcheck_data_pa        # Base PA address from equate
-    add t3, t0, t1                  # t3 = this hart's state_save base
-
+    {self._hart_base('t3')}
+    {snapshot_code}
     # 2. Init Fletcher accumulators
     li t5, 0                        # sum1 = 0
     li t6, 0                        # sum2 = 0
@@ -335,4 +433,72 @@ selfcheck__do_check:
     addi t0, t0, {SELFCHECK_CHECKSUM_SIZE}
     {self.check_offset.store('t0')}
     ret
+{descriptor_table}"""
+
+    def memory_segments(self) -> list[tuple[int, int]]:
+        """
+        Returns the ``(start, end)`` byte offsets from the hart context folded by the compact checksum loop, in fold order.
+        Adjacent ranges are merged.
+        """
+        segments: list[tuple[int, int]] = []
+        index = 0
+        for resource in self._resources:
+            variable = resource.memory_variable()
+            if variable is not None:
+                start = variable.offset
+            elif self.snapshot is not None:
+                start = self.snapshot.offset + index * self.snapshot.size
+                index += resource.num_values
+            else:
+                raise ValueError("Compact selfcheck needs a snapshot for register resources")
+            end = start + resource.num_values * 8
+            if segments and segments[-1][1] == start:
+                segments[-1] = (segments[-1][0], end)
+            else:
+                segments.append((start, end))
+        return segments
+
+    def _generate_compact_checksum(self) -> tuple[str, str, str]:
+        """
+        Generate the snapshot code, the checksum loop and its descriptor table for ``selfcheck_compact``.
+
+        Register resources are stored to the snapshot, then one loop walks the descriptor table of
+        ``(start, end)`` offsets from tp and folds each 8-byte value. Uses t0-t2 and t4, and restores t3 after the loop.
+        """
+        snapshot_code = ""
+        index = 0
+        for resource in self._resources:
+            if resource.memory_variable() is None and self.snapshot is not None:
+                snapshot_code += resource.generate_snapshot_code(self.snapshot, index)
+                index += resource.num_values
+        if snapshot_code:
+            snapshot_code = "\n    # Copy register resources to the checksum snapshot" + snapshot_code
+
+        descriptors = "\n".join(f"    .dword {start}, {end}" for start, end in self.memory_segments())
+        checksum_loop = f"""
+    la t4, selfcheck__descriptors
+selfcheck__next_segment:
+    ld t2, 0(t4)                    # t2 = segment start, offset from tp
+    ld t3, 8(t4)                    # t3 = segment end, offset from tp
+    add t2, t2, tp
+    add t3, t3, tp
+selfcheck__fold_loop:
+    ld t0, 0(t2)
+    {fletcher_update()}
+    addi t2, t2, 8
+    bltu t2, t3, selfcheck__fold_loop
+    addi t4, t4, 16
+    la t1, selfcheck__descriptors_end
+    bltu t4, t1, selfcheck__next_segment
+
+    # t3 was the segment end, get the state_save base back
+    {self._hart_base('t3')}
+"""
+        descriptor_table = f"""
+# Compact selfcheck segments: start, end byte offsets from tp
+.balign 8, 0
+selfcheck__descriptors:
+{descriptors}
+selfcheck__descriptors_end:
 """
+        return snapshot_code, checksum_loop, descriptor_table
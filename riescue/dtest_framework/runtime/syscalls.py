@@ -46,6 +46,9 @@ class SysCalls(TrapHandler):
         code += self.os_fn_f0001006()  # Supervisor mode jump table for CSR R/W
         code += self.os_fn_f0001007()  # Loop-based PTE read walk (inline in handler)
         code += self.os_fn_f0001008()  # Loop-based PTE write walk (inline in handler)
+        if self.featmgr.static_pte_access:
+            code += self.os_fn_f0001009()  # PTE read from an address resolved at elaboration time
+            code += self.os_fn_f000100a()  # PTE write to an address resolved at elaboration time
         code += self.os_get_hart_context()  # Used to get hartid
         if self.featmgr.cfiles is not None:
             code += self.os_fn_70003001()  # Memory allocation API
@@ -79,79 +82,104 @@ class SysCalls(TrapHandler):
         # FIXME: This is a hacky fix for the scheduler not being able to get hartid in os_end_test if test_priv is in U mode.
         # os_end_test should be able to assume tp is set, scheduler should already have tp set, atm it doesn't
         # OR os_end_test shouldn't rely on hartid / tp
+        groups = self.syscall_groups()
         code += f"""
-            # The function number is in x31
+            # The function number is in x31. Select the jump table for group x31[31:12]
+        {self.label_prefix}syscall_dispatch:
+            srli t0, x31, 12
+        """
+        for group in groups:
+            code += f"""
+            li t1, 0x{group:x}
+            beq t0, t1, {self.label_prefix}syscall_group_{group:x}
+            """
+        code += f"""
+            j {self.label_prefix}syscall_not_found
+        """
 
-        {self.label_prefix}syscall_check_schedule_next_test:
-            li t0, 0xf0000001  # schedule next test
-            # special case since this isn't going to do an mret/sret. Need to restore context here.
-            bne t0, x31, {self.label_prefix}syscall_check_fail_test
+        # Index the group's jump table with x31[11:0] - 1, anything past the end of the table is not a syscall
+        for group, handlers in groups.items():
+            code += f"""
+        {self.label_prefix}syscall_group_{group:x}:
+            slli t0, x31, 52
+            srli t0, t0, 52        # t0 = x31[11:0]
+            addi t0, t0, -1        # syscall numbers start at 1
+            li t1, {len(handlers)}
+            bgeu t0, t1, {self.label_prefix}syscall_not_found
+            slli t0, t0, 3
+            la t1, {self.label_prefix}syscall_jump_table_{group:x}
+            add t0, t0, t1
+            ld t0, 0(t0)
+            jr t0
+            """
+
+        # scheduler system calls
+        # special case since these aren't going to do an mret/sret. Need to restore context here.
+        code += f"""
+        {self.label_prefix}syscall_schedule_next_test:
             {selfcheck_code}
             {self.restore_trap_handler()}
             j enter_scheduler
 
-        {self.label_prefix}syscall_check_fail_test:
-            li t0, 0xf0000002  # fail test
-            bne t0, x31, {self.label_prefix}syscall_check_end_test_without_failure
+        {self.label_prefix}syscall_fail_test:
             {self.restore_trap_handler()}
             j test_failed
 
-        {self.label_prefix}syscall_check_end_test_without_failure:
-            li t0, 0xf0000003  # end test without failure
-            bne t0, x31, {self.label_prefix}syscall_check_switch_machine_mode
+        {self.label_prefix}syscall_end_test_without_failure:
             {self.restore_trap_handler()}
             j os_end_test
-            """
-
-        # non scheduler system calls
-        # these all use trap_exit to return to test code, so they should automatically restore context
-        code += f"""
-
-            {self.label_prefix}syscall_check_switch_machine_mode:
-            li t0, 0xf0001001    # Switch to machine mode
-            beq x31, t0, {self.label_prefix}os_fn_f0001001
-
-            {self.label_prefix}syscall_check_switch_super_mode:
-            li t0, 0xf0001002    # Switch to super mode
-            beq x31, t0, {self.label_prefix}os_fn_f0001002
-
-            {self.label_prefix}syscall_check_switch_user_mode:
-            li t0, 0xf0001003    # Switch to user mode
-            beq x31, t0, {self.label_prefix}os_fn_f0001003
-
-            {self.label_prefix}syscall_check_switch_test_mode:
-            li t0, 0xf0001004    # Switch to test mode
-            beq x31, t0, {self.label_prefix}os_fn_f0001004
-
-            {self.label_prefix}syscall_machine_csr_rw:
-            li t0, 0xf0001005    # Machine mode jump table for CSR R/W
-            beq x31, t0, {self.label_prefix}os_fn_f0001005
-
-            {self.label_prefix}syscall_supervisor_csr_rw:
-            li t0, 0xf0001006    # Supervisor mode jump table for CSR R/W
-            beq x31, t0, {self.label_prefix}os_fn_f0001006
-
-            {self.label_prefix}syscall_machine_pte_read:
-            li t0, 0xf0001007    # Machine mode jump table for PTE read
-            beq x31, t0, {self.label_prefix}os_fn_f0001007
+        """
 
-            {self.label_prefix}syscall_machine_pte_write:
-            li t0, 0xf0001008    # Machine mode jump table for PTE write
-            beq x31, t0, {self.label_prefix}os_fn_f0001008
+        # non scheduler system calls use trap_exit to return to test code, so they should automatically restore context
+        code += "\n.balign 8, 0"
+        for group, handlers in groups.items():
+            code += f"\n{self.label_prefix}syscall_jump_table_{group:x}:\n"
+            code += "\n".join(f"    .dword {self.label_prefix}{handler:<40} # 0x{group:x}{i + 1:03x}" for i, handler in enumerate(handlers))
 
-            {self.label_prefix}syscall_check_get_hart_context:
-            li t0, 0xf0002001    # Get hart context
-            beq x31, t0, {self.label_prefix}os_get_hart_context
+        # Not a syscall, restore the cause for the check exception path
+        code += f"""
+        {self.label_prefix}syscall_not_found:
+            csrr t1, {self.xcause}
         """
-        if self.featmgr.cfiles is not None:
-            code += f"""
-                li t0, 0x70003001   # memmap
-                beq x31, t0, {self.label_prefix}os_fn_70003001
-
-            """
 
         return code
 
+    def syscall_groups(self) -> dict[int, list[str]]:
+        """
+        Syscall handlers by group, ``x31[31:12]``. The handler for syscall ``(group << 12) | n`` is entry ``n - 1``.
+        Groups are checked in order, so the most frequently used group comes first.
+        """
+        groups = {
+            0xF0001: [
+                "os_fn_f0001001",  # Switch to machine mode
+                "os_fn_f0001002",  # Switch to super mode
+                "os_fn_f0001003",  # Switch to user mode
+                "os_fn_f0001004",  # Switch to test mode
+                "os_fn_f0001005",  # Machine mode jump table for CSR R/W
+                "os_fn_f0001006",  # Supervisor mode jump table for CSR R/W
+                "os_fn_f0001007",  # Machine mode jump table for PTE read
+                "os_fn_f0001008",  # Machine mode jump table for PTE write
+            ],
+            0xF0000: [
+                "syscall_schedule_next_test",
+                "syscall_fail_test",
+                "syscall_end_test_without_failure",
+            ],
+            0xF0002: [
+                "os_get_hart_context",
+            ],
+        }
+        if self.featmgr.static_pte_access:
+            groups[0xF0001] += [
+                "os_fn_f0001009",  # PTE read, address resolved at elaboration time
+                "os_fn_f000100a",  # PTE write, address resolved at elaboration time
+            ]
+        if self.featmgr.cfiles is not None:
+            groups[0x70003] = [
+                "os_fn_70003001",  # memmap
+            ]
+        return groups
+
     def os_fn_f0001001(self) -> str:
         """
         f0001001 : Switch to machine mode
@@ -343,6 +371,61 @@ class SysCalls(TrapHandler):
         code += self._generate_pte_walk(is_write=True)
         return code
 
+    def os_fn_f0001009(self) -> str:
+        """
+        f0001009 : Read PTE at an address resolved at elaboration time
+        """
+        code = f"""
+            {self.label_prefix}os_fn_f0001009:
+                # f0001009 : Read PTE at pte_access_flags[0]
+        """
+        code += self._generate_static_pte_access(is_write=False)
+        return code
+
+    def os_fn_f000100a(self) -> str:
+        """
+        f000100a : Write PTE at an address resolved at elaboration time
+        """
+        code = f"""
+            {self.label_prefix}os_fn_f000100a:
+                # f000100a : Write PTE at pte_access_flags[0]
+        """
+        code += self._generate_static_pte_access(is_write=True)
+        return code
+
+    def _generate_static_pte_access(self, is_write: bool) -> str:
+        """
+        Generate a single PTE load or store for ``;#read_pte``/``;#write_pte`` targets resolved by the generator, see ``--static_pte_access``.
+
+        Parameters are passed via shared memory (pte_access_flags):
+          [0] = physical address of the PTE
+
+        Registers clobbered: t0, t1, x31
+        For write, t2 must contain the value to write (set by caller before ecall). Cached translations are flushed after the write.
+        Returns to test mode the same way as :meth:`_generate_pte_walk`.
+        """
+        pte_access_flags = self.variable_manager.get_variable("pte_access_flags")
+        if not is_write:
+            access = "ld t2, 0(t1)               # read PTE into t2"
+        elif self.featmgr.env == RV.RiscvTestEnv.TEST_ENV_VIRTUALIZED:
+            access = """sd t2, 0(t1)               # write t2 to PTE
+            hfence.vvma
+            hfence.gvma"""
+        else:
+            access = """sd t2, 0(t1)               # write t2 to PTE
+            sfence.vma"""
+
+        return f"""
+            {pte_access_flags.load(dest_reg="t1", index=0)}
+            {access}
+
+            # Save ecall return address (epc+4) and return to test mode
+            csrr t0, {self.xepc}
+            addi t0, t0, 4
+            {self.os_save_ecall_fn_epc.store("t0")}
+            j {self.label_prefix}os_fn_f0001004
+        """
+
     def _generate_pte_walk(self, is_write: bool) -> str:
         """
         Generate a loop-based page table walk inline in the syscall handler.
@@ -6,6 +6,7 @@
 from typing import Any
 import logging
 
+import riescue.lib.enums as RV
 from riescue.dtest_framework.runtime.assembly_generator import AssemblyGenerator
 from riescue.dtest_framework.runtime.schedulers import DefaultScheduler, LinuxModeScheduler, ParallelScheduler, SimultaneousScheduler
 
@@ -46,6 +47,8 @@ class TestScheduler(AssemblyGenerator):
 
         if self.featmgr.repeat_times == -1 and not self.featmgr.linux_mode:
             raise ValueError("Can only use repeat_times == -1 with linux mode")
+        if self.featmgr.scheduler_order != RV.SchedulerOrder.STATIC and (self.featmgr.linux_mode or self.mp_active):
+            raise ValueError("scheduler_order iterate and shuffle are only supported by the single hart scheduler")
 
         self.scheduler: AssemblyGenerator
         if self.featmgr.linux_mode:
@@ -744,7 +744,8 @@ class TrapHandler(AssemblyGenerator):
           ``trap_entry + 4 * cause``.  The vector table entries are ``j <handler>``
           instructions whose targets handle the interrupt and execute ``xret``
           directly (no context save/restore needed — identical to HW vectored mode).
-        - if exception (MSB clear): runs any FeatMgr exception handler overrides
+        - if exception (MSB clear): dispatches overridden causes through the FeatMgr
+          exception handler override table (see :py:meth:`exception_override_dispatch`)
           before saving context, then (on fall-through) saves context and branches
           to :py:attr:`exception_handler_label` for full exception processing.
         - routine :py:attr:`interrupt_handler_label` handles the APLIC dispatch
@@ -752,27 +753,10 @@ class TrapHandler(AssemblyGenerator):
         - jumps to :py:attr:`trap_exit_label` to restore context and return to test code
         """
 
-        # Build FeatMgr-registered exception handler override dispatch once — it runs
-        # before save_context() in both APLIC and non-APLIC paths so the handler body
-        # is responsible for its own register discipline and ends with ctx.xret.
-        # t0 still holds xcause from the initial read; t1 is used as a scratch for
-        # the cause compare.  Non-overridden causes fall through to save_context().
-        excp_dispatch_body = ""
-        for cause, (label, _) in self.featmgr.exception_handler_overrides.items():
-            cause_delegated = bool((self.featmgr.medeleg >> cause) & 1)
-            cause_mode = RV.RiscvPrivileges.SUPER if cause_delegated else RV.RiscvPrivileges.MACHINE
-            if cause_mode == self.deleg_mode:
-                excp_dispatch_body += f"            li t1, {cause}\n            beq t0, t1, {label}\n"
-
-        # Only emit the comment block when at least one override is registered for
-        # this privilege level, so the generated asm stays clean otherwise.
-        if excp_dispatch_body:
-            excp_dispatch = f"""            # FeatMgr exception handler overrides — matched before context save.
-            # t0 still holds {self.xcause} from the initial read above; only t1
-            # was clobbered by the interrupt-vs-exception test.
-{excp_dispatch_body}"""
-        else:
-            excp_dispatch = ""
+        # FeatMgr-registered exception handler override dispatch runs before save_context()
+        # in both APLIC and non-APLIC paths so the handler body is responsible for its own
+        # register discipline and ends with ctx.xret.
+        excp_dispatch, excp_dispatch_table = self.exception_override_dispatch()
 
         if self.pool.init_aplic_interrupts:
             # APLIC path: xcause is read BEFORE save_context() so the exception-override
@@ -819,7 +803,7 @@ class TrapHandler(AssemblyGenerator):
 
             {self.label_prefix}exception_path:
 {excp_dispatch}            {self.save_context()}
-            j {self.exception_handler_label}
+            j {self.exception_handler_label}{excp_dispatch_table}
             """
         else:
             # Non-APLIC path: check xcause BEFORE saving context.
@@ -848,11 +832,56 @@ class TrapHandler(AssemblyGenerator):
 
             {self.label_prefix}exception_path:
 {excp_dispatch}            {self.save_context()}
-            j {self.exception_handler_label}
+            j {self.exception_handler_label}{excp_dispatch_table}
             """
 
         return ret
 
+    def exception_override_dispatch(self) -> tuple[str, str]:
+        """
+        Generates the dispatch to FeatMgr exception handler overrides for this privilege level, and the table it indexes.
+
+        Overridden causes are looked up in a table of handler pointers indexed by xcause, so every exception pays the same
+        few instructions no matter how many overrides are registered. Entries for causes without an override point at
+        ``exception_path_save_context`` and fall through to :py:meth:`save_context`, as do causes past the end of the table.
+
+        Expects t0 = xcause and only t1 clobbered. Handlers are entered with t0 = xcause.
+
+        :return: dispatch code placed at ``exception_path``, and the pointer table. Both are empty if no override is registered for this privilege level.
+        """
+        overrides: dict[int, str] = {}
+        for cause, (label, _) in self.featmgr.exception_handler_overrides.items():
+            cause_delegated = bool((self.featmgr.medeleg >> cause) & 1)
+            cause_mode = RV.RiscvPrivileges.SUPER if cause_delegated else RV.RiscvPrivileges.MACHINE
+            if cause_mode == self.deleg_mode:
+                overrides[cause] = label
+        if not overrides:
+            return "", ""
+
+        save_context_label = f"{self.label_prefix}exception_path_save_context"
+        table_label = f"{self.label_prefix}exception_override_table"
+        num_entries = max(overrides) + 1
+        dispatch = f"""            # FeatMgr exception handler overrides, matched before context save.
+            # t0 still holds {self.xcause} from the initial read above; only t1
+            # was clobbered by the interrupt-vs-exception test.
+            li t1, {num_entries}
+            bgeu t0, t1, {save_context_label}      # no override past the end of the table
+            la t1, {table_label}
+            slli t0, t0, 3
+            add t1, t1, t0
+            ld t1, 0(t1)
+            csrr t0, {self.xcause}                 # handlers are entered with t0 = {self.xcause}
+            jr t1
+            {save_context_label}:
+"""
+        entries = "\n".join(f"                .dword {overrides.get(cause, save_context_label)}  # cause {cause}" for cause in range(num_entries))
+        table = f"""
+            .balign 8, 0
+            {table_label}:
+{entries}
+"""
+        return dispatch, table
+
     def trap_exit(self) -> str:
         """
         Trap exit code. Restores GPRs and returns to test code.
@@ -123,6 +123,49 @@ hart_context_{hart_id}:
 
         return intial_context + "\n".join(hart_local_variables)
 
+    def allocate_template(self, hart_count: int) -> str:
+        """
+        Compact hart context for all harts. Emits one context with ``.rept``, so the text grows with the number of variables instead of harts times variables.
+        Layout matches :py:meth:`allocate` with padding, so ``hart_context_<n>`` labels are equates at :py:meth:`per_hart_size` multiples.
+
+        Fields that differ between harts, the hart's sp and ``mhartid``, are zero in the template and set by the loader, see :py:meth:`VariableManager.initialize`.
+        Arrays are filled with ``.fill`` when the value fits in 32 bits (``.fill`` only takes 32-bit values), otherwise with a nested ``.rept``.
+
+        :param hart_count: Number of hart contexts to allocate
+        """
+        context: list[str] = [
+            "",
+            ".balign 64, 0",
+            f"{self.context_name(0)}:",
+            f".rept {hart_count}",
+            f".{self.swap_type:<5} {0:<30} # hart's sp, set by loader",
+            f".{self.swap_type:<5} {0:<30} # test's sp",
+        ]
+        for variable in self._variables.values():
+            if variable.name == "mhartid":
+                value = 0
+                comment = f"# {variable.description or variable.name}, set by loader"
+            else:
+                value = variable.value
+                comment = f"# {variable.description or variable.name}"
+            if variable.element_count == 1:
+                context.append(f".{self.swap_type:<5} {value:<30} {comment}")
+            elif 0 <= value < 1 << 32:
+                context.append(f".fill  {f'{variable.element_count}, {self.variable_size}, {value}':<30} {comment}[{variable.element_count}]")
+            else:
+                context.append(f".rept {variable.element_count:<30} {comment}[{variable.element_count}]")
+                context.append(f".{self.swap_type:<5} {value}")
+                context.append(".endr")
+
+        per_hart_size = self.per_hart_size()
+        bytes_allocated = self.variable_size * self._num_internal_variables + sum(self.variable_size * variable.element_count for variable in self._variables.values())
+        if per_hart_size > bytes_allocated:
+            context.append(f".space {per_hart_size - bytes_allocated:<30} # padding to 64-byte boundary")
+        context.append(".endr")
+        for hart_id in range(1, hart_count):
+            context.append(f".equ {self.context_name(hart_id)}, {self.context_name(0)} + {per_hart_size * hart_id}")
+        return "\n".join(context)
+
     def per_hart_size(self) -> int:
         """Return the size of a single hart context in bytes, including 64-byte alignment padding."""
         bytes_allocated = self.variable_size * self._num_internal_variables
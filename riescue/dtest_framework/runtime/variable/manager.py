@@ -17,6 +17,7 @@ class VariableManager:
 
     Instantiates per-hart variables
 
+    :param compact_hart_context: Allocate hart contexts of multi-hart tests from one ``.rept`` template, with per-hart fields set by the loader
     """
 
     def __init__(
@@ -26,13 +27,16 @@ class VariableManager:
         hart_count: int,
         amo_enabled: bool,
         hart_stack_size: int = 0x1000,
+        compact_hart_context: bool = False,
     ):
         self.data_section_name = data_section_name
         self.hart_count = hart_count
         self.xlen = xlen
         self.amo_enabled = amo_enabled
+        self.compact_hart_context = compact_hart_context and hart_count > 1
 
         self.hart_context_table_name = "hart_context_table"
+        self.hart_stack_table_name = "hart_stack_end_table"
 
         self._hart_context = HartContext(xlen=xlen, amo_enabled=self.amo_enabled)
         self._hart_stack = HartStack(xlen=xlen, stack_size=hart_stack_size)
@@ -121,6 +125,18 @@ load_hart_context:
     {load_instr} tp, 0(t0)
     csrw mscratch, tp
         """
+        if self.compact_hart_context:
+            store_instr = "sw" if self.xlen == RV.Xlen.XLEN32 else "sd"
+            code += f"""
+    # Set per-hart fields of the hart context template
+    csrr t0, mhartid
+    {store_instr} t0, {self.get_variable("mhartid").offset}(tp)
+    la t1, {self.hart_stack_table_name}
+    slli t0, t0, {hart_table_offset}
+    add t0, t0, t1
+    {load_instr} t0, 0(t0)
+    {store_instr} t0, 0(tp)
+        """
 
         if va_scratch_regs:
             va_writes = "\n    ".join(f"csrw {scratch}, tp" for scratch in va_scratch_regs)
@@ -146,7 +162,14 @@ load_hart_context:
     # table of hart context VA pointers
 {self.hart_context_table_name}:
 {va_entries}
-load_hart_context_done:
+"""
+        if self.compact_hart_context:
+            stack_entries = "\n".join(f"    {var_type} {self._hart_context.hart_stack_name(hartid, end=True)}" for hartid in range(self.hart_count))
+            code += f"""    # table of hart stack pointers
+{self.hart_stack_table_name}:
+{stack_entries}
+"""
+        code += """load_hart_context_done:
 """
         return code
 
@@ -207,8 +230,11 @@ load_hart_context_done:
 
         allocate_code.append("# Hart-local storage")
         allocate_code.append(f'.section .{self.data_section_name}, "aw"')
-        for hartid in range(self.hart_count):
-            allocate_code.append(self._hart_context.allocate(hart_id=hartid))
+        if self.compact_hart_context:
+            allocate_code.append(self._hart_context.allocate_template(self.hart_count))
+        else:
+            for hartid in range(self.hart_count):
+                allocate_code.append(self._hart_context.allocate(hart_id=hartid))
         for hartid in range(self.hart_count):
             allocate_code.append(self._hart_stack.allocate(hart_id=hartid))
         return "\n" + "\n".join(allocate_code)
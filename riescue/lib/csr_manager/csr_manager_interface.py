@@ -3,11 +3,25 @@
 
 from typing import Any, Optional
 
+import riescue.lib.enums as RV
 from riescue.lib.rand import RandNum
 from riescue.lib.csr_manager.csr_manager_config import CsrManager
 
 
 class CsrManagerInterface:
+    # Lowest privilege that can access a CSR, encoded in address bits [9:8]
+    USER_LEVEL = 0
+    SUPERVISOR_LEVEL = 1
+    HYPERVISOR_LEVEL = 2
+    MACHINE_LEVEL = 3
+
+    # Counters gated by mcounteren/scounteren below machine mode. The runtime doesn't program the counter enables
+    COUNTER_CSRS = (range(0xC00, 0xC20), range(0xC80, 0xCA0))
+    # CSRs that trap while mstatus.FS is Off: fflags, frm, fcsr
+    FS_CSRS = frozenset([0x001, 0x002, 0x003])
+    # CSRs that trap while mstatus.VS is Off: vstart, vxsat, vxrm, vcsr, vl, vtype, vlenb
+    VS_CSRS = frozenset([0x008, 0x009, 0x00A, 0x00F, 0xC20, 0xC21, 0xC22])
+
     def __init__(self, rng: RandNum):
         self._csr_manager = CsrManager(rng)
         self._csr_manager.build()
@@ -73,3 +87,58 @@ class CsrManagerInterface:
                     except ValueError:
                         pass
         return None
+
+    @staticmethod
+    def csr_address(csr_config: dict[str, Any]) -> Optional[int]:
+        """
+        Returns the 12-bit address of a CSR returned by :py:meth:`lookup_csr_by_name` or :py:meth:`lookup_csr_by_address`, or None if it has no address.
+        """
+        cfg_addr = list(csr_config.values())[0].config.get("address")
+        if cfg_addr is None:
+            return None
+        if isinstance(cfg_addr, int):
+            # Addresses without hex letters are stored as ints of their hex digits, e.g. sstatus is 100
+            cfg_addr = str(cfg_addr)
+        try:
+            return int(str(cfg_addr), 16) & 0xFFF
+        except ValueError:
+            return None
+
+    def privilege_level(self, csr_config: dict[str, Any]) -> Optional[int]:
+        """
+        Returns the lowest privilege level that can access a CSR, from CSR address bits [9:8] (:py:attr:`USER_LEVEL` to :py:attr:`MACHINE_LEVEL`).
+        Returns None if the CSR has no address.
+        """
+        addr = self.csr_address(csr_config)
+        if addr is None:
+            return None
+        return (addr >> 8) & 0x3
+
+    def accessible_from(self, csr_config: dict[str, Any], priv_mode: RV.RiscvPrivileges, virtualized: bool = False, fs_enabled: bool = False, vs_enabled: bool = False) -> bool:
+        """
+        Check if a CSR can be accessed directly from ``priv_mode`` without trapping.
+
+        Debug mode CSRs (0x7B0-0x7BF) and CSRs without an address are never accessible.
+        Hypervisor CSRs are not accessible from virtualized supervisor mode.
+        Counters (:py:attr:`COUNTER_CSRS`) are only accessible from machine mode, since the counter enables aren't programmed.
+        Floating point and vector CSRs (:py:attr:`FS_CSRS`, :py:attr:`VS_CSRS`) are only accessible when ``mstatus.FS`` / ``mstatus.VS`` are known to be on.
+
+        :param csr_config: CSR returned by :py:meth:`lookup_csr_by_name` or :py:meth:`lookup_csr_by_address`
+        :param priv_mode: privilege mode the access runs in
+        :param virtualized: True if ``priv_mode`` is a virtualized mode (VS/VU)
+        :param fs_enabled: True if ``mstatus.FS`` (and ``vsstatus.FS`` when virtualized) is never Off while the test runs
+        :param vs_enabled: True if ``mstatus.VS`` (and ``vsstatus.VS`` when virtualized) is never Off while the test runs
+        """
+        addr = self.csr_address(csr_config)
+        if addr is None or 0x7B0 <= addr <= 0x7BF:
+            return False
+        if (addr in self.FS_CSRS and not fs_enabled) or (addr in self.VS_CSRS and not vs_enabled):
+            return False
+        level = (addr >> 8) & 0x3
+        if priv_mode == RV.RiscvPrivileges.MACHINE:
+            return True
+        if any(addr in counters for counters in self.COUNTER_CSRS):
+            return False
+        if priv_mode == RV.RiscvPrivileges.SUPER:
+            return level == self.USER_LEVEL or level == self.SUPERVISOR_LEVEL or (level == self.HYPERVISOR_LEVEL and not virtualized)
+        return level == self.USER_LEVEL
@@ -628,6 +628,31 @@ class RiscvMPMode(MyEnum):
             raise ValueError(f"mp_mode: {mp_mode} is unrecognized")
 
 
+class SchedulerOrder(MyEnum):
+    """
+    Order that the single hart scheduler runs discrete tests in.
+
+    - STATIC: every run of every test is stored in the test sequence, shuffled at generation time. Sequence is O(M x N) for M tests and N ``repeat_times``
+    - ITERATE: each test is stored once and the sequence is repeated ``repeat_times`` times at runtime
+    - SHUFFLE: each test is stored once and the sequence is reshuffled at runtime before each repetition
+    """
+
+    STATIC = auto()
+    ITERATE = auto()
+    SHUFFLE = auto()
+
+    @classmethod
+    def str_to_enum(cls, scheduler_order: str) -> "SchedulerOrder":
+        if scheduler_order == "static":
+            return cls.STATIC
+        elif scheduler_order == "iterate":
+            return cls.ITERATE
+        elif scheduler_order == "shuffle":
+            return cls.SHUFFLE
+        else:
+            raise ValueError(f"scheduler_order: {scheduler_order} is unrecognized")
+
+
 class HookPoint(MyEnum):
     """
     Enumerated hooks for runtime code.
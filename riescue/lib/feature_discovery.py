@@ -328,6 +328,23 @@ class FeatureDiscovery:
 
         return fd
 
+    def overlay(self, test_features: Optional[str] = None) -> "FeatureDiscovery":
+        """
+        Create a copy with test header overrides applied, leaving this instance unchanged.
+        Used to share one parsed instance between tests, e.g. from the cpu config cache.
+        The copy shares the configuration of each feature until an override or randomization replaces it, so it's cheap to make.
+
+        Args:
+            test_features: Test header features string (e.g., "ext_v.enable ext_fp.disable")
+
+        Returns:
+            FeatureDiscovery instance with its own copy of the features
+        """
+        fd = FeatureDiscovery(dict(self.features))
+        if test_features:
+            fd._apply_test_feature_overrides(test_features)
+        return fd
+
     def is_feature_supported(self, feature_name: str) -> bool:
         """
         Check if a feature is supported.
@@ -561,7 +578,7 @@ class FeatureDiscovery:
                 if randomize_percent > 0:
                     # Generate random number and enable if within percentage
                     if rng.random() * 100 < randomize_percent:
-                        feature_config["enabled"] = True
+                        self.features[feature_name] = {**feature_config, "enabled": True}
                         log.info(f"Randomly enabled feature: {feature_name}")
 
     def _apply_test_feature_overrides(self, test_features: str) -> None:
@@ -596,12 +613,11 @@ class FeatureDiscovery:
                 if feature_name not in self.features:
                     self.features[feature_name] = {"supported": True, "enabled": False, "randomize": 0}
 
-                # Apply the action
+                # Apply the action. Feature dicts are replaced rather than modified since overlays share them
                 if action == "enable":
-                    self.features[feature_name]["enabled"] = True
-                    self.features[feature_name]["supported"] = True
+                    self.features[feature_name] = {**self.features[feature_name], "enabled": True, "supported": True}
                 elif action == "disable":
-                    self.features[feature_name]["enabled"] = False
+                    self.features[feature_name] = {**self.features[feature_name], "enabled": False}
             elif token == "wysiwyg":
                 # Handle wysiwyg as a special boolean feature
                 self.features["wysiwyg"] = True
@@ -3,7 +3,11 @@
 
 # pyright: strict
 
-from typing import Union
+import re
+from typing import Optional, Union
+
+import numpy as np
+import numpy.typing as npt
 
 import riescue.lib.enums as RV
 import riescue.lib.common as common
@@ -227,9 +231,18 @@ class NumGen:
         """
         self.rng = rng  # ; RandNum instance
 
-        self.opts: dict[RV.NumGenOps, dict[Union[bool, RV.SpecialFpNums], int]] = {}
-        self.opts[RV.NumGenOps.select_special_num] = {True: 5, False: 95}
-        self.opts[RV.NumGenOps.special_num] = {
+        self.opts: dict[RV.NumGenOps, dict[Union[bool, RV.SpecialFpNums], int]] = self.weighted_opts()
+
+    @staticmethod
+    def weighted_opts() -> dict[RV.NumGenOps, dict[Union[bool, RV.SpecialFpNums], int]]:
+        """Return the default option weights used to bias number generation.
+
+        :return: Dictionary of option to ``{choice: weight}``
+        :rtype: dict
+        """
+        opts: dict[RV.NumGenOps, dict[Union[bool, RV.SpecialFpNums], int]] = {}
+        opts[RV.NumGenOps.select_special_num] = {True: 5, False: 95}
+        opts[RV.NumGenOps.special_num] = {
             RV.SpecialFpNums.canonical_nan: 20,
             RV.SpecialFpNums.pos_inf: 10,
             RV.SpecialFpNums.neg_inf: 10,
@@ -238,10 +251,11 @@ class NumGen:
             RV.SpecialFpNums.pos_sat: 5,
             RV.SpecialFpNums.neg_sat: 5,
         }
-        self.opts[RV.NumGenOps.subnormal] = {True: 10, False: 90}
-        self.opts[RV.NumGenOps.fractional] = {True: 100, False: 0}
-        self.opts[RV.NumGenOps.low_fidelity] = {True: 0, False: 100}
-        self.opts[RV.NumGenOps.nan_box] = {True: 90, False: 10}
+        opts[RV.NumGenOps.subnormal] = {True: 10, False: 90}
+        opts[RV.NumGenOps.fractional] = {True: 100, False: 0}
+        opts[RV.NumGenOps.low_fidelity] = {True: 0, False: 100}
+        opts[RV.NumGenOps.nan_box] = {True: 90, False: 10}
+        return opts
 
     def default_genops(self):
         """Configure generator with safe default options.
@@ -363,3 +377,152 @@ class NumGen:
         if opts[RV.NumGenOps.nan_box] and data_type == RV.DataType.FP16:
             num = num | 0xFFFF0000
         return num
+
+
+class BulkNumGen:
+    """
+    Vectorized counterpart of :class:`NumGen` that draws whole arrays of typed values with one NumPy call per field.
+
+    Values come from a NumPy ``Generator`` seeded from the test seed and a stream id rather than from the test's :class:`RandNum`,
+    so bulk data does not shift any other randomization and the same ``(seed, stream)`` always produces the same array.
+
+    Integer types are uniform over their width. Floating point types use the :class:`NumGen` option weights for special values,
+    low fidelity values, subnormals and fractional values. Arrays hold element-sized values, so FP16 values are not NaN-boxed.
+
+    :param seed: Test seed
+    :param stream: Stream id, e.g. the index of the directive being filled
+    :param opts: Option weights, defaults to :meth:`NumGen.weighted_opts`
+
+    .. code-block:: python
+
+       bulk = BulkNumGen(seed=42, stream=0)
+       values = bulk.rand_nums(1024, RV.DataType.FP32)  # numpy uint32 array
+    """
+
+    _ELEMENT_DTYPES = {1: np.uint8, 2: np.uint16, 4: np.uint32, 8: np.uint64}
+    _TYPE_RE = re.compile(r"^(bits|int|fp)(\d+)$")
+
+    def __init__(self, seed: int, stream: int = 0, opts: Optional[dict[RV.NumGenOps, dict[Union[bool, RV.SpecialFpNums], int]]] = None):
+        self.np_rng = np.random.default_rng(np.random.SeedSequence([seed & 0xFFFFFFFFFFFFFFFF, stream]))
+        self.opts = opts if opts is not None else NumGen.weighted_opts()
+
+    @classmethod
+    def element_dtype(cls, num_bits: int) -> type[np.unsignedinteger[npt.NBitBase]]:
+        "Smallest unsigned NumPy dtype that holds ``num_bits``"
+        for size, dtype in cls._ELEMENT_DTYPES.items():
+            if num_bits <= size * 8:
+                return dtype
+        raise ValueError(f"Unsupported element width: {num_bits} bits. Should be at most 64 bits.")
+
+    def _raw(self, count: int) -> npt.NDArray[np.uint64]:
+        "``count`` uniformly distributed 64-bit values"
+        return self.np_rng.integers(0, 0xFFFFFFFFFFFFFFFF, size=count, dtype=np.uint64, endpoint=True)
+
+    def _top_bits(self, count: int, num_bits: int) -> npt.NDArray[np.uint64]:
+        "``count`` uniformly distributed ``num_bits``-bit values"
+        return self._raw(count) >> np.uint64(64 - num_bits)
+
+    def _weighted(self, weights: dict[Union[bool, RV.SpecialFpNums], int], count: int) -> npt.NDArray[np.intp]:
+        "Index into ``weights`` for each of ``count`` draws"
+        w = np.array(list(weights.values()), dtype=np.float64)
+        return self.np_rng.choice(len(w), size=count, p=w / w.sum())
+
+    def _mask(self, opt: RV.NumGenOps, count: int) -> npt.NDArray[np.bool_]:
+        "Boolean array that is True where option ``opt`` was selected"
+        choices = list(self.opts[opt].keys())
+        return np.array([bool(c) for c in choices], dtype=np.bool_)[self._weighted(self.opts[opt], count)]
+
+    def rand_bits(self, count: int, num_bits: int, and_mask: int = 0xFFFFFFFFFFFFFFFF, or_mask: int = 0) -> npt.NDArray[np.uint64]:
+        """Generate values the way ``;#random_data`` does for ``bitsN``: a random bit length below ``num_bits - 1``, then random bits of that length.
+
+        :param count: Number of values
+        :param num_bits: Width in bits, 1 to 64
+        :param and_mask: Mask ANDed with each value
+        :param or_mask: Mask ORed into each value, truncated to ``num_bits``
+        :return: ``uint64`` array of ``count`` values
+        :raises ValueError: If ``num_bits`` is out of range
+        """
+        if not 1 <= num_bits <= 64:
+            raise ValueError(f"Invalid bit width: {num_bits}. Should be between 1 and 64.")
+        if num_bits == 1:
+            values = self._top_bits(count, 1)
+        else:
+            lengths = self.np_rng.integers(1, max(num_bits - 1, 2), size=count, dtype=np.uint64)
+            values = self._raw(count) >> (np.uint64(64) - lengths)
+        and_mask &= 0xFFFFFFFFFFFFFFFF
+        or_mask &= (1 << num_bits) - 1
+        return (values & np.uint64(and_mask)) | np.uint64(or_mask)
+
+    def rand_nums(self, count: int, data_type: RV.DataType) -> npt.NDArray[np.unsignedinteger[npt.NBitBase]]:
+        """Generate ``count`` random numbers of ``data_type``, vectorized equivalent of :meth:`NumGen.rand_num`.
+
+        :param count: Number of values
+        :param data_type: Integer or floating point data type
+        :return: Array of element-sized unsigned values
+        :raises ValueError: If data_type isn't a supported type
+        """
+        if RV.DataType.is_int(data_type):
+            width = Widths(data_type).payload
+            if width is None:
+                raise ValueError(f"Unsupported data type: {data_type}. Should be an integer or floating point type.")
+            return self._top_bits(count, width).astype(self.element_dtype(width))
+        if not RV.DataType.is_fp(data_type):
+            raise ValueError(f"Unsupported data type: {data_type}. Should be an integer or floating point type.")
+
+        offsets = FpOffsets(data_type)
+        if offsets.exponent is None or offsets.sign is None:
+            raise ValueError(f"Unsupported data type: {data_type}. Should be an integer or floating point type.")
+        mantissa_bits = offsets.exponent
+        exponent_bits = offsets.sign - offsets.exponent
+        width = offsets.sign + 1
+
+        sign = self._top_bits(count, 1) << np.uint64(offsets.sign)
+        exponent = self._top_bits(count, exponent_bits)
+        mantissa = self._top_bits(count, mantissa_bits)
+        exponent[self._mask(RV.NumGenOps.subnormal, count)] = 0
+        mantissa[self._mask(RV.NumGenOps.fractional, count)] = 0
+        values = sign | (exponent << np.uint64(offsets.exponent)) | mantissa
+
+        # Priority matches NumGen.rand_num: low fidelity, then special numbers, then randomized fields
+        special_table = {
+            RV.DataType.FP8: NumGen.special_nums_fp8,
+            RV.DataType.FP16: NumGen.special_nums_fp16,
+            RV.DataType.FP32: NumGen.special_nums_fp32,
+            RV.DataType.FP64: NumGen.special_nums_fp64,
+        }[data_type]
+        special_weights = self.opts[RV.NumGenOps.special_num]
+        specials = np.array([special_table[s] for s in special_weights if isinstance(s, RV.SpecialFpNums)], dtype=np.uint64)
+        select_special = self._mask(RV.NumGenOps.select_special_num, count)
+        values[select_special] = specials[self._weighted(special_weights, int(select_special.sum()))]
+
+        low_fidelity_table = {
+            RV.DataType.FP8: NumGen.low_fidelity_fp8,
+            RV.DataType.FP16: NumGen.low_fidelity_fp16,
+            RV.DataType.FP32: NumGen.low_fidelity_fp32,
+            RV.DataType.FP64: NumGen.low_fidelity_fp64,
+        }[data_type]
+        low_fidelity = self._mask(RV.NumGenOps.low_fidelity, count)
+        values[low_fidelity] = np.array(low_fidelity_table, dtype=np.uint64)[self.np_rng.integers(0, len(low_fidelity_table), size=int(low_fidelity.sum()))]
+        return values.astype(self.element_dtype(width))
+
+    def rand_type(self, data_type: str, count: int, and_mask: int = 0xFFFFFFFFFFFFFFFF, or_mask: int = 0) -> npt.NDArray[np.unsignedinteger[npt.NBitBase]]:
+        """Generate ``count`` values for a ``;#random_data``-style type string.
+
+        :param data_type: ``bitsN``, ``intN`` or ``fpN``
+        :param count: Number of values
+        :param and_mask: Mask ANDed with ``bitsN`` values
+        :param or_mask: Mask ORed into ``bitsN`` values
+        :return: Array using the smallest unsigned dtype that holds the type
+        :raises ValueError: If data_type isn't a supported type
+        """
+        match = self._TYPE_RE.match(data_type)
+        if match is None:
+            raise ValueError(f"Unsupported data type: {data_type}. Should be bitsN, intN or fpN.")
+        kind, num_bits = match.group(1), int(match.group(2))
+        if kind == "bits":
+            return self.rand_bits(count, num_bits, and_mask, or_mask).astype(self.element_dtype(num_bits))
+        try:
+            rv_type = RV.DataType[data_type.upper()]
+        except KeyError:
+            raise ValueError(f"Unsupported data type: {data_type}. Should be bitsN, intN or fpN.") from None
+        return self.rand_nums(count, rv_type)
@@ -5,8 +5,10 @@
 
 import random
 import abc
+import hashlib
 import uuid
-from typing import TypeVar, Optional, Sequence
+from contextlib import contextmanager
+from typing import TypeVar, Optional, Sequence, Iterator
 
 T = TypeVar("T")
 U = TypeVar("U")
@@ -336,6 +338,30 @@ class RandNum:
         """
         return self.rand.randrange(start, stop, step)
 
+    @contextmanager
+    def substream(self, *key: object) -> Iterator[None]:
+        """
+        Draw from an independent stream derived from the seed and ``key`` until the context exits, then resume the original stream.
+
+        Objects holding a reference to this instance draw from the sub-stream too.
+        The values drawn only depend on the seed and ``key``, not on what was drawn before.
+
+        :param key: Values identifying the sub-stream, e.g. a label. Compared by ``repr()``
+
+        .. code-block:: python
+
+            rand = RandNum(seed=42)
+            with rand.substream("add_0"):
+                rand.random_nbit(32)  # Same value regardless of earlier draws
+        """
+        state = self.rand.getstate()
+        digest = hashlib.sha256(repr((self.seed, key)).encode()).digest()
+        self.rand.seed(int.from_bytes(digest, "little"))
+        try:
+            yield
+        finally:
+            self.rand.setstate(state)
+
     def get_uuid(self) -> str:
         """
         Return a random UUID string after ensuring it is unique across all instances of this class
@@ -0,0 +1,109 @@
+# SPDX-FileCopyrightText: © 2025 Tenstorrent AI ULC
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Cache of toolchain capability probes.
+
+Probing a tool, e.g. running ``spike --help`` to check for a flag, spawns a process on every run.
+:class:`CapabilityCache` keys probe results by the executable's resolved path, modification time and size, and stores them as JSON in the user cache directory.
+Every process using the same executable shares the results, and they're probed again once the executable is rebuilt.
+"""
+
+import json
+import logging
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+log = logging.getLogger(__name__)
+
+# Bump when the layout of the cache file or the meaning of a probe changes
+CACHE_VERSION = 1
+
+
+def default_cache_file() -> Path:
+    "Cache file in ``$RIESCUE_CACHE_DIR`` if set, otherwise ``$XDG_CACHE_HOME/riescue`` or ``~/.cache/riescue``"
+    cache_dir = os.environ.get("RIESCUE_CACHE_DIR")
+    if not cache_dir:
+        cache_dir = str(Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "riescue")
+    return Path(cache_dir) / "toolchain_capabilities.json"
+
+
+class CapabilityCache:
+    """
+    Probe results for executables, persisted to ``cache_file``. Results must be JSON serializable.
+    If the cache file can't be read or written, results are only kept for this process.
+
+    :param cache_file: Path to the cache file. Defaults to :func:`default_cache_file`
+    """
+
+    def __init__(self, cache_file: Optional[Path] = None):
+        self.cache_file = cache_file if cache_file is not None else default_cache_file()
+        self.entries: Optional[dict[str, dict[str, Any]]] = None
+
+    @staticmethod
+    def executable_key(executable: Path) -> str:
+        "Key for an executable; changes when the executable is replaced or rebuilt"
+        resolved = Path(executable).resolve()
+        stat = resolved.stat()
+        return f"{resolved}:{stat.st_mtime_ns}:{stat.st_size}"
+
+    def get(self, executable: Path, probe: str, compute: Callable[[], Any]) -> Any:
+        """
+        Result of ``probe`` for ``executable``, calling ``compute`` on a miss. Exceptions from ``compute`` aren't cached.
+
+        :param executable: Path to the probed executable
+        :param probe: Name of the probe, e.g. ``"help_flags"``
+        :param compute: Runs the probe
+        """
+        key = self.executable_key(executable)
+        if self.entries is None:
+            self.entries = self._load()
+        probes = self.entries.get(key, {})
+        if probe in probes:
+            return probes[probe]
+
+        value = compute()
+        self.entries.setdefault(key, {})[probe] = value
+        self._store(key, probe, value)
+        return value
+
+    def _load(self) -> dict[str, dict[str, Any]]:
+        try:
+            with open(self.cache_file, "r") as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            log.warning(f"Ignoring unreadable toolchain capability cache {self.cache_file}: {e}")
+            return {}
+        if not isinstance(data, dict) or data.get("version") != CACHE_VERSION:
+            return {}
+        return data.get("executables", {})
+
+    def _store(self, key: str, probe: str, value: Any) -> None:
+        """
+        Merge one result into the cache file. Other processes may have added results since it was loaded, so the file is re-read first.
+        The file is replaced atomically, so concurrent readers never see a partial write; a concurrent writer's result may be lost and is probed again later.
+        """
+        entries = self._load()
+        entries.setdefault(key, {})[probe] = value
+        try:
+            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+            with tempfile.NamedTemporaryFile("w", dir=self.cache_file.parent, prefix=f".{self.cache_file.name}.", delete=False) as f:
+                json.dump({"version": CACHE_VERSION, "executables": entries}, f)
+            os.replace(f.name, self.cache_file)
+        except OSError as e:
+            log.debug(f"Couldn't write toolchain capability cache {self.cache_file}: {e}")
+
+
+_capability_cache: Optional[CapabilityCache] = None
+
+
+def capability_cache() -> CapabilityCache:
+    "Process-wide :class:`CapabilityCache` using the default cache file"
+    global _capability_cache
+    if _capability_cache is None:
+        _capability_cache = CapabilityCache()
+    return _capability_cache
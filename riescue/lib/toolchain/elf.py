@@ -0,0 +1,57 @@
+# SPDX-FileCopyrightText: © 2025 Tenstorrent AI ULC
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Minimal ELF symbol table reader, used instead of running ``nm`` to look up symbol addresses.
+"""
+
+import struct
+from pathlib import Path
+
+SHT_SYMTAB = 2
+STT_SECTION = 3
+STT_FILE = 4
+SHN_UNDEF = 0
+
+
+def read_symbols(elf_file: Path) -> dict[str, int]:
+    """
+    Read the defined symbols of a 32 or 64-bit ELF file, like the symbols ``nm`` lists.
+    Section and file symbols are skipped. If a name is defined more than once, the last definition is used.
+
+    :param elf_file: Path to the ELF file
+    :return: symbol name mapped to its value
+    :raises ValueError: if ``elf_file`` isn't an ELF file
+    """
+    data = Path(elf_file).read_bytes()
+    if data[:4] != b"\x7fELF":
+        raise ValueError(f"{elf_file} is not an ELF file")
+    is_64 = data[4] == 2
+    endian = "<" if data[5] == 1 else ">"
+
+    if is_64:
+        (shoff,) = struct.unpack_from(f"{endian}Q", data, 0x28)
+        shentsize, shnum = struct.unpack_from(f"{endian}HH", data, 0x3A)
+        section_format, symbol_format = f"{endian}IIQQQQIIQQ", f"{endian}IBBHQQ"
+    else:
+        (shoff,) = struct.unpack_from(f"{endian}I", data, 0x20)
+        shentsize, shnum = struct.unpack_from(f"{endian}HH", data, 0x2E)
+        section_format, symbol_format = f"{endian}IIIIIIIIII", f"{endian}IIIBBH"
+
+    sections = [struct.unpack_from(section_format, data, shoff + i * shentsize) for i in range(shnum)]
+    symbols: dict[str, int] = {}
+    for _, sh_type, _, _, sh_offset, sh_size, sh_link, _, _, sh_entsize in sections:
+        if sh_type != SHT_SYMTAB or not sh_entsize:
+            continue
+        strtab_offset = sections[sh_link][4]
+        for offset in range(sh_offset, sh_offset + sh_size, sh_entsize):
+            if is_64:
+                st_name, st_info, _, st_shndx, st_value, _ = struct.unpack_from(symbol_format, data, offset)
+            else:
+                st_name, st_value, _, st_info, _, st_shndx = struct.unpack_from(symbol_format, data, offset)
+            if st_name == 0 or st_shndx == SHN_UNDEF or st_info & 0xF in (STT_SECTION, STT_FILE):
+                continue
+            name_start = strtab_offset + st_name
+            name = data[name_start : data.index(b"\0", name_start)].decode()
+            symbols[name] = st_value
+    return symbols
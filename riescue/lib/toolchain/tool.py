@@ -2,6 +2,7 @@
 # SPDX-License-Identifier: Apache-2.0
 
 import os
+import re
 import argparse
 import subprocess
 import shutil
@@ -10,10 +11,14 @@ from abc import ABC, abstractmethod
 from typing import Optional
 from pathlib import Path
 
+from riescue.lib.toolchain.capability_cache import capability_cache
 from riescue.lib.toolchain.exceptions import ToolchainError, ToolFailureType
 
 log = logging.getLogger(__name__)
 
+# (env_name, env value, tool_name, PATH) mapped to the executable found for them
+_found_executables: dict[tuple[str, str, str, str], Path] = {}
+
 
 class Tool(ABC):
     """
@@ -38,10 +43,21 @@ class Tool(ABC):
         Searches for executable. Checks for Path tool_path if provided
         if no tool_path, checks for env_name environment variable
         if no env_name, checks for tool_name in PATH
+
+        Executables found through the environment are remembered for the process, as long as the environment doesn't change and the executable still exists.
         """
         log.debug("Searching for executable")
         if tool_path is not None and tool_path.exists():
             return tool_path
+        key = (env_name, os.environ.get(env_name, "") if env_name else "", tool_name, os.environ.get("PATH", ""))
+        found = _found_executables.get(key)
+        if found is None or not found.exists():
+            found = self._search_environment(env_name, tool_name)
+            _found_executables[key] = found
+        return found
+
+    def _search_environment(self, env_name: str, tool_name: str) -> Path:
+        "Check for env_name environment variable, then tool_name in PATH"
         if env_name:
             env_path = os.environ.get(env_name)
             if env_path:
@@ -281,11 +297,13 @@ class Spike(Tool):
         spike_isa: str = "",
         third_party_spike: bool = False,
         spike_max_instr: int = 2000000,
+        spike_trace: bool = True,
     ):
         if spike_args is None:
             spike_args = []
 
-        args = spike_args + ["-l", "--log-commits"]
+        args = list(spike_args)
+        self.trace = spike_trace
         tool_name = "spike" if third_party_spike else "tt_spike"
 
         if spike_isa:
@@ -312,10 +330,18 @@ class Spike(Tool):
         spike_parser.add_argument("--spike_isa", type=str, default=None, help="ISA string to pass to ISS --isa")
         spike_parser.add_argument("--third_party_spike", action="store_true", help="Use public version of spike. Default is internal spike")
         spike_parser.add_argument("--spike_max_instr", type=int, default=2000000, help="Max instructions to simulate on spike")
+        spike_parser.add_argument("--spike_no_trace", action="store_true", help="Don't log commits for passing runs. Failing runs are rerun with the commit log enabled")
 
     @classmethod
     def from_clargs(cls, args: argparse.Namespace):
-        return cls(spike_path=args.spike_path, spike_args=args.spike_args, spike_isa=args.spike_isa, third_party_spike=args.third_party_spike, spike_max_instr=args.spike_max_instr)
+        return cls(
+            spike_path=args.spike_path,
+            spike_args=args.spike_args,
+            spike_isa=args.spike_isa,
+            third_party_spike=args.third_party_spike,
+            spike_max_instr=args.spike_max_instr,
+            spike_trace=not args.spike_no_trace,
+        )
 
     def _classify(self, process: subprocess.CompletedProcess, output_file: Optional[Path]):
         if process.returncode != 0:
@@ -324,26 +350,42 @@ class Spike(Tool):
     def run(self, output_file=None, cwd=None, timeout=90, args: Optional[list[str]] = None):
         raise NotImplementedError("Use run_iss() instead of run() for this tool.")
 
+    @staticmethod
+    def _spike_help_flags(spike_executable) -> list[str]:
+        "Flags listed by ``spike --help``"
+        result = subprocess.run(
+            [spike_executable, "--help"],
+            text=True,
+            capture_output=True,
+            timeout=10,
+        )
+        combined_output = (result.stdout or "") + (result.stderr or "")
+        return sorted(set(re.findall(r"(?<![\w-])--?[A-Za-z][\w-]*", combined_output)))
+
     @staticmethod
     def _spike_supports_misaligned(spike_executable) -> bool:
-        """Check if the spike executable supports the --misaligned flag."""
+        """Check if the spike executable supports the --misaligned flag. ``--help`` output is probed once per spike build, see :class:`CapabilityCache`"""
         try:
-            result = subprocess.run(
-                [spike_executable, "--help"],
-                text=True,
-                capture_output=True,
-                timeout=10,
-            )
-            combined_output = (result.stdout or "") + (result.stderr or "")
-            return "--misaligned" in combined_output
+            flags = capability_cache().get(spike_executable, "help_flags", lambda: Spike._spike_help_flags(spike_executable))
         except (subprocess.TimeoutExpired, OSError):
             return False
+        return "--misaligned" in flags
+
+    def run_iss(self, elf_file: Path, output_file, cwd=None, timeout=60, args: Optional[list[str]] = None, trace: Optional[bool] = None) -> subprocess.CompletedProcess:
+        """
+        Run spike on ``elf_file``, piping output and commit log to ``output_file``.
 
-    def run_iss(self, elf_file: Path, output_file, cwd=None, timeout=60, args: Optional[list[str]] = None) -> subprocess.CompletedProcess:
+        :param trace: Log commits to ``output_file``. Defaults to ``spike_trace``.
+            Without a commit log, pass/fail comes from the exit code and a failing run is rerun with the commit log.
+        """
         if args is not None:
-            extra_args = args
+            extra_args = list(args)  # copied, a failing run is rerun with the same args
         else:
             extra_args = []
+        if trace is None:
+            trace = self.trace
+        if trace:
+            extra_args[:0] = ["-l", "--log-commits"]
 
         isa = self.spike_isa
 
@@ -360,4 +402,10 @@ class Spike(Tool):
         if self.varch:
             extra_args.append(f"--varch=vlen:{self.varch['vlen']},elen:{self.varch['elen']}")
         extra_args.extend([str(elf_file)])
-        return super().run(output_file=output_file, cwd=cwd, timeout=timeout, args=extra_args)
+        try:
+            return super().run(output_file=output_file, cwd=cwd, timeout=timeout, args=extra_args)
+        except ToolchainError:
+            if trace:
+                raise
+            log.info("Spike run failed without a commit log, rerunning with commit log enabled")
+            return self.run_iss(elf_file, output_file, cwd=cwd, timeout=timeout, args=args, trace=True)
@@ -8,6 +8,7 @@ from typing import Optional
 from pathlib import Path
 import re
 
+from riescue.lib.toolchain.elf import read_symbols
 from riescue.lib.toolchain.tool import Tool
 from riescue.lib.toolchain.exceptions import ToolchainError, ToolFailureType
 
@@ -26,6 +27,7 @@ class Whisper(Tool):
         whisper_memory_size: str = "",
         whisper_dumpmem: Optional[str] = None,
         whisper_startpc: Optional[int] = None,
+        whisper_trace: bool = True,
     ):
         if whisper_args is None:
             whisper_args = []
@@ -45,6 +47,9 @@ class Whisper(Tool):
         if whisper_startpc:
             args += ["--startpc", whisper_startpc]
         self.dumpmem_arg = whisper_dumpmem
+        self.trace = whisper_trace
+        self.log_file: Optional[Path] = None
+        self.console_file: Optional[Path] = None
         super().__init__(path=whisper_path, env_name="WHISPER_PATH", tool_name="whisper", args=args)
 
     @staticmethod
@@ -58,6 +63,7 @@ class Whisper(Tool):
         whisper_parser.add_argument("--whisper_memory_size", type=str, default="0x10000000000000000", help="Size of whisper memory")
         whisper_parser.add_argument("--whisper_dumpmem", required=False, type=str, default=None, help="Dump memory command to pass to the simulator. Use @ to reference symbols in elf file")
         whisper_parser.add_argument("--whisper_startpc", required=False, type=int, default=None, help="Start pc to pass to the simulator")
+        whisper_parser.add_argument("--whisper_no_trace", action="store_true", help="Don't write an instruction trace for passing runs. Failing runs are rerun with the trace enabled")  # noqa: E501
         # fmt: on
 
     @classmethod
@@ -77,11 +83,12 @@ class Whisper(Tool):
             whisper_memory_size=args.whisper_memory_size,
             whisper_dumpmem=args.whisper_dumpmem,
             whisper_startpc=args.whisper_startpc,
+            whisper_trace=not args.whisper_no_trace,
         )
 
     def process_dumpmem_arg(self, elf_file: Path, dumpmem_arg: str) -> str:
         """
-        Replaces occurrences of @symbol in the input string with their values from nm output of the ELF file.
+        Replaces occurrences of @symbol in the input string with their values from the ELF file's symbol table.
         Also performs basic arithmetic operations using eval.
 
         Args:
@@ -89,7 +96,7 @@ class Whisper(Tool):
         dumpmem_arg (str): The dumpmem argument string to process.
 
         Returns:
-        str: String with all @variables replaced with their nm values (hex strings).
+        str: String with all @variables replaced with their symbol values (hex strings).
         """
 
         # 1. Collect all @xxx variables in the string
@@ -97,23 +104,13 @@ class Whisper(Tool):
         if not varnames:
             return dumpmem_arg
 
-        # 2. Run nm and collect their values
+        # 2. Read their values from the symbol table
         try:
-            nm_out = subprocess.check_output(["nm", str(elf_file)], encoding="utf-8")
-        except subprocess.CalledProcessError as e:
-            print(f"Error running nm: {e}")
+            symvals = {sym: hex(value) for sym, value in read_symbols(elf_file).items()}
+        except (OSError, ValueError) as e:
+            print(f"Error reading symbols: {e}")
             return dumpmem_arg
 
-        # Build symbol name -> value dict
-        symvals = {}
-        for line in nm_out.splitlines():
-            line = line.strip()
-            # Typical nm line: 0000000010020000 D breadcrumbs_phys
-            m = re.match(r"^([0-9a-fA-F]+)\s+\w\s+(.+)$", line)
-            if m:
-                addr, sym = m.groups()
-                symvals[sym] = hex(int(addr, 16))
-
         # 3. Replace @var in the string
         def repl(match):
             var = match.group(1)
@@ -133,31 +130,46 @@ class Whisper(Tool):
     def run(self, output_file=None, cwd=None, timeout=90, args: Optional[list[str]] = None):
         raise NotImplementedError("Use run_iss() instead of run() for this tool.")
 
-    def run_iss(self, elf_file: Path, output_file, cwd=None, timeout=60, args: Optional[list[str]] = None) -> subprocess.CompletedProcess:
+    def run_iss(self, elf_file: Path, output_file, cwd=None, timeout=60, args: Optional[list[str]] = None, trace: Optional[bool] = None) -> subprocess.CompletedProcess:
         """
         Whisper is a special run case since output file is an argument for command instead of pipe
+
+        :param trace: Write the instruction trace to ``output_file``. Defaults to ``whisper_trace``.
+            Without a trace, pass/fail comes from the exit code and a failing run is rerun with the trace so the error has a ``tohost`` value and log.
         """
         if args is not None:
-            extra_args = args
+            extra_args = list(args)  # copied, a failing run is rerun with the same args
         else:
             extra_args = []
+        if trace is None:
+            trace = self.trace
 
         if self.dumpmem_arg:
             extra_args.extend(["--dumpmem", self.process_dumpmem_arg(elf_file, self.dumpmem_arg)])
 
         extra_args.extend([str(elf_file)])
-        self.log_file = output_file
-        extra_args.extend(["--logfile", str(self.log_file)])
+        if trace:
+            self.log_file = output_file
+            extra_args.extend(["--logfile", str(self.log_file)])
+        else:
+            self.log_file = None
+            output_file.unlink(missing_ok=True)  # don't leave a trace from an earlier run behind
         # Capture console output (HTIF and UART) by piping process stdout to file
         self.console_file = output_file.parent / (output_file.stem + "_stdout.log")
         whisper_config_json_path = str(self.check_filepath(self.whisper_config_json))  # resolve relative path
         extra_args.extend(["--configfile", whisper_config_json_path])
-        return super().run(output_file=self.console_file, cwd=cwd, timeout=timeout, args=extra_args)
+        try:
+            return super().run(output_file=self.console_file, cwd=cwd, timeout=timeout, args=extra_args)
+        except ToolchainError:
+            if trace:
+                raise
+            log.info("Whisper run failed without a trace, rerunning with trace enabled")
+            return self.run_iss(elf_file, output_file, cwd=cwd, timeout=timeout, args=args, trace=True)
 
     def _classify(self, process: subprocess.CompletedProcess, output_file: Optional[Path]):
         # stdout+stderr are merged into console_file; read it back for error classification
         stderr = process.stderr or ""
-        if not stderr and self.console_file and self.console_file.exists():
+        if not stderr and self.console_file is not None and self.console_file.exists():
             stderr = self.console_file.read_text()
         print(f"process.stderr={stderr}")
 
@@ -177,24 +189,37 @@ class Whisper(Tool):
                         break
                 self._raise_toolchain_error(process, ToolFailureType.ILLEGAL_INSTRUCTIONS, error_line, log_path=self.log_file)
 
+            elif self.log_file is None:
+                pass  # no trace, pass/fail only
             elif self.log_file.exists():
-                with open(self.log_file, "r") as f:
-                    log_lines = f.readlines()
-                if log_lines == []:
+                if self.log_file.stat().st_size == 0:
                     self._raise_toolchain_error(process, ToolFailureType.BAD_CONFIG, "\t" + stderr.replace("\n", "\n\t"))
                 else:
-                    last_write = self._find_tohost_write(log_lines)
+                    last_write = self._find_tohost_write(self.log_file)
                     tohost_value = int(last_write.split()[7], 16)
                     self._raise_toolchain_error(process, ToolFailureType.TOHOST_FAIL, stderr, fail_code=tohost_value, log_path=self.log_file)
             else:
                 log.error(f"Couldn't find a log file at {self.log_file}")
             self._raise_toolchain_error(process, ToolFailureType.NONZERO_EXIT, stderr)
 
-    def _find_tohost_write(self, log_lines: list[str]):
-        "Assumes the last line is a write to the tohost address, doesn't check what the tohost address is"
-        i = -1
-        last_line = log_lines[i]
-        while not last_line.startswith("#"):
-            i -= 1
-            last_line = log_lines[i]
-        return last_line.strip()
+    def _find_tohost_write(self, log_file: Path, block_size: int = 1 << 16) -> str:
+        """
+        Assumes the last line starting with ``#`` is a write to the tohost address, doesn't check what the tohost address is.
+        Reads the log backwards from the end in ``block_size`` blocks, so only the tail of a large trace is read.
+        """
+        with open(log_file, "rb") as f:
+            position = f.seek(0, 2)
+            tail = b""
+            while position > 0:
+                read_size = min(block_size, position)
+                position -= read_size
+                f.seek(position)
+                tail = f.read(read_size) + tail
+                lines = tail.split(b"\n")
+                # first line may be incomplete until the start of the file is reached
+                complete_lines = lines[1:] if position > 0 else lines
+                for line in reversed(complete_lines):
+                    if line.startswith(b"#"):
+                        return line.decode().strip()
+                tail = lines[0]
+        raise IndexError(f"No tohost write found in {log_file}")
@@ -131,6 +131,7 @@ class RiescueC(CliBase):
         :param seed: The seed to use for the random number generator. Defaults to a random number in range 0 to 2^32
         :param toolchain: Configured ``Toolchain`` object. If none provided, a default ``Toolchain`` object will be used (assumes whisper and spike are available in environment)
         :param run_dir: The directory to run the test in. Defaults to current directory
+        :return: Path to the ELF test file, or to the shard report with ``--shards``, see :py:meth:`BringupMode.generate`
         """
 
         bringup_mode = BringupMode(run_dir=run_dir, conf=conf)
@@ -41,6 +41,11 @@ class RiescueD(CliBase):
     :param run_dir: The directory to run the test in. Defaults to current directory
     :param seed: The seed to use for the random number generator. Defaults to a random number in range 0 to 2^32
     :param toolchain: The ``Toolchain`` to use for the test. Defaults to a default ``Toolchain`` object if not provided
+    :param test_source: Test assembly held in memory, e.g. generated by a RiescueC test plan. Parsed and generated from directly, without reading ``testfile``.
+        ``testfile`` only names the test, and is written with ``test_source`` if ``write_testfile`` is set
+    :param write_testfile: Write ``test_source`` to ``testfile`` as an artifact
+    :param pool: Pool already holding the test's :attr:`Parser.MEMORY_DIRECTIVES`, e.g. built by RiescueC from its test plan.
+        Those directives are skipped when parsing the test, everything else is parsed as usual
     """
 
     package_path = Path(__file__).parent
@@ -52,11 +57,21 @@ class RiescueD(CliBase):
         run_dir: Path = Path("."),
         seed: Optional[int] = None,
         toolchain: Optional[Toolchain] = None,
+        test_source: Optional[str] = None,
+        write_testfile: bool = False,
+        pool: Optional[Pool] = None,
     ):
         self.run_dir = run_dir.resolve()
         self.run_dir.mkdir(parents=True, exist_ok=True)
 
-        self.testfile = self._resolve_path(testfile)
+        self.test_source: Optional[list[str]] = None
+        if test_source is None:
+            self.testfile = self._resolve_path(testfile)
+        else:
+            self.testfile = testfile if testfile.is_absolute() else self.run_dir / testfile
+            self.test_source = test_source.splitlines(keepends=True)
+            if write_testfile:
+                self.testfile.write_text(test_source)
         self.testname = self.testfile.stem
         self.cpuconfig = self._resolve_path(cpuconfig if cpuconfig is not None else Path("dtest_framework/lib/config.json"))
         self.generated_files = GeneratedFiles.from_testname(self.testname, self.run_dir)
@@ -72,9 +87,10 @@ class RiescueD(CliBase):
 
         log.info(f"Initialized RiescueD with seed: {self.rng.get_seed()}")
         log.debug("Initializing pool")
-        self.pool = Pool()
+        self.pool = pool if pool is not None else Pool()
         self.pool.testname = self.testname
-        parser = Parser(self.testfile, pool=self.pool)
+        skip_directives = Parser.MEMORY_DIRECTIVES if pool is not None else ()
+        parser = Parser(self.testfile, pool=self.pool, lines=self.test_source, skip_directives=skip_directives)
 
         self.parsed_data = parser
 
@@ -276,10 +292,11 @@ class RiescueD(CliBase):
         :returns: The internal :attr:`generated_files` instance, a :class:`GeneratedFiles` object containing paths to generated files.
         """
         # Copy test s file to current directory
-        try:
-            shutil.copy(self.testfile, self.run_dir)
-        except shutil.SameFileError:
-            pass
+        if self.test_source is None:
+            try:
+                shutil.copy(self.testfile, self.run_dir)
+            except shutil.SameFileError:
+                pass
 
         # review this part (is it necessary? Should this be done in FeatMgr or inside pool?)
         for test in self.pool.parsed_discrete_tests.keys():
@@ -300,7 +317,7 @@ class RiescueD(CliBase):
 
         # Call various generators
         test_gen = Generator(rng=self.rng, pool=self.pool, featmgr=featmgr, run_dir=self.run_dir)
-        test_gen.generate(file_in=self.testfile, generated_files=self.generated_files)
+        test_gen.generate(file_in=self.testfile if self.test_source is None else self.test_source, generated_files=self.generated_files)
         return self.generated_files
 
     def build(self, featmgr: FeatMgr, relink_selfcheck: bool = False, generator: Optional[Generator] = None) -> GeneratedFiles:
@@ -401,6 +418,7 @@ class RiescueD(CliBase):
         iss: Union[Spike, Whisper],
         whisper_config_json_override: Optional[Path] = None,
         dump_selfcheck: bool = False,
+        trace: Optional[bool] = None,
     ) -> Path:
         """
         Run test code through ISS
@@ -409,6 +427,7 @@ class RiescueD(CliBase):
         :param iss: ``Spike`` or ``Whisper`` object
         :param whisper_config_json_override: Optional path to whisper config json file to override default
         :param dump_selfcheck: Dump selfcheck_data region to disk after ISS run (requires Whisper)
+        :param trace: Write the instruction trace to the ISS log. Defaults to the ISS setting; always enabled in wysiwyg mode, which checks the trace for the exit value
         :return: Path to ISS log file
         """
 
@@ -421,6 +440,7 @@ class RiescueD(CliBase):
         # Later we parse whisper log to find out what was the last value written to the x31 to indicate pass|fail
         failed_pc = None
         if featmgr.wysiwyg:
+            trace = True
             # Read file <testname>.dis and find <failed>
             with open(self.generated_files.dis, "r") as f:
                 disasm_lines = f.readlines()
@@ -492,6 +512,7 @@ class RiescueD(CliBase):
             cwd=self.run_dir,
             timeout=120,
             args=iss_args,
+            trace=trace,
         )
 
         # In wysiwyg mode, we need to parse the log file to find out what was the last value written to the x31
@@ -0,0 +1,80 @@
+# SPDX-FileCopyrightText: © 2025 Tenstorrent AI ULC
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Peak-RSS benchmark for :class:`AssemblyWriter`.
+
+Elaborates a large synthetic test in a child process and reports the peak RSS growth while the writer runs.
+The writer streams lines to the file as they are produced, so the growth should stay small as the test grows.
+
+Usage::
+
+    python -m tests.benchmarks.assembly_writer_benchmark --tests 2000 --body_lines 200 --pages 2000
+"""
+
+import argparse
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from riescue.dtest_framework.generator.assembly_writer import AssemblyWriter
+from tests.dtest_framework.synthetic import elaborate, write_synthetic_test
+
+
+def _max_rss_mb() -> float:
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def _run_child(testfile: Path, run_dir: Path, single_assembly_file: bool) -> None:
+    "Elaborate once and print peak RSS before and after AssemblyWriter.write"
+    rss_before_write = [0.0]
+
+    original_write = AssemblyWriter.write
+
+    def write(self, *args, **kwargs):
+        rss_before_write[0] = _max_rss_mb()
+        return original_write(self, *args, **kwargs)
+
+    AssemblyWriter.write = write  # type: ignore[method-assign]
+
+    start = time.perf_counter()
+    generated_files = elaborate(testfile, run_dir, single_assembly_file=single_assembly_file)
+    elapsed = time.perf_counter() - start
+    size_mb = generated_files.assembly.stat().st_size / (1024 * 1024)
+    print(f"{rss_before_write[0]:.1f} {_max_rss_mb():.1f} {size_mb:.1f} {elapsed:.2f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tests", type=int, default=500, help="Number of discrete tests")
+    parser.add_argument("--body_lines", type=int, default=200, help="Instruction lines per discrete test")
+    parser.add_argument("--pages", type=int, default=500, help="Number of page mappings")
+    parser.add_argument("--single_assembly_file", action="store_true", help="Inline runtime, page tables and equates in the .S file")
+    parser.add_argument("--child", nargs=2, metavar=("TESTFILE", "RUN_DIR"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        testfile, run_dir = args.child
+        _run_child(Path(testfile), Path(run_dir), args.single_assembly_file)
+        return
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp_dir = Path(tmp)
+        testfile = write_synthetic_test(tmp_dir / "synthetic.s", args.tests, args.body_lines, args.pages)
+        print(f"test: {args.tests} discrete tests x {args.body_lines} lines, {args.pages} page mappings, single_assembly_file={args.single_assembly_file}")
+        run_dir = tmp_dir / "run"
+        run_dir.mkdir()
+        cmd = [sys.executable, "-m", "tests.benchmarks.assembly_writer_benchmark", "--child", str(testfile), str(run_dir)]
+        if args.single_assembly_file:
+            cmd.append("--single_assembly_file")
+        result = subprocess.run(cmd, check=True, capture_output=True, text=True)
+        before, peak, size, elapsed = (float(v) for v in result.stdout.split()[-4:])
+        print(f"{'rss before write MB':>20} {'peak rss MB':>12} {'writer delta MB':>16} {'.S MB':>8} {'elapsed s':>10}")
+        print(f"{before:>20.1f} {peak:>12.1f} {peak - before:>16.1f} {size:>8.1f} {elapsed:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
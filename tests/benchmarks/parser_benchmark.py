@@ -0,0 +1,50 @@
+# SPDX-FileCopyrightText: © 2025 Tenstorrent AI ULC
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Throughput benchmark for :class:`Parser`.
+
+Writes a large synthetic test and reports how many lines per second :meth:`Parser.parse` processes, best of ``--repeat`` runs.
+
+Usage::
+
+    python -m tests.benchmarks.parser_benchmark --tests 2000 --body_lines 200 --pages 2000
+"""
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+from riescue.dtest_framework.parser import Parser
+from riescue.dtest_framework.pool import Pool
+from tests.dtest_framework.synthetic import write_synthetic_test
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tests", type=int, default=1000, help="Number of discrete tests")
+    parser.add_argument("--body_lines", type=int, default=200, help="Instruction lines per discrete test")
+    parser.add_argument("--pages", type=int, default=1000, help="Number of page mappings")
+    parser.add_argument("--repeat", type=int, default=3, help="Number of timed runs")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        testfile = write_synthetic_test(Path(tmp) / "synthetic.s", args.tests, args.body_lines, args.pages)
+        with open(testfile) as f:
+            num_lines = sum(1 for _ in f)
+
+        best = float("inf")
+        for _ in range(args.repeat):
+            pool = Pool()
+            pool.testname = testfile.stem
+            start = time.perf_counter()
+            Parser(testfile, pool=pool).parse()
+            best = min(best, time.perf_counter() - start)
+
+    print(f"test: {args.tests} discrete tests x {args.body_lines} lines, {args.pages} page mappings, {num_lines} lines")
+    print(f"parse: {best:.3f} s, {num_lines / best:,.0f} lines/s")
+
+
+if __name__ == "__main__":
+    main()
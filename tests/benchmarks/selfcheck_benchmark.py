@@ -0,0 +1,78 @@
+# SPDX-FileCopyrightText: © 2026 Tenstorrent AI ULC
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Code size and checkpoint cost benchmark for :class:`Selfcheck`.
+
+Elaborates a selfcheck test once per mode and reports the instructions and table bytes in the selfcheck routine:
+
+- ``unrolled``: one load and Fletcher fold per checked value
+- ``compact``: ``--selfcheck_compact``, registers are copied to a snapshot and one loop folds the ranges in a descriptor table
+
+With ``--run_iss``, also builds and runs each mode through the full selfcheck flow and reports the retired ISS instructions of the
+checking run divided by the number of checkpoints. The rest of the test is the same in both modes, so the difference is the change in
+cost per checkpoint. This needs the RISC-V toolchain and Whisper.
+
+Usage::
+
+    python -m tests.benchmarks.selfcheck_benchmark --run_iss
+"""
+
+import argparse
+import re
+import struct
+import tempfile
+from pathlib import Path
+
+import riescue
+from riescue.riescued import RiescueD
+from tests.dtest_framework.synthetic import elaborate, routine_size
+
+DEFAULT_TEST = Path(riescue.__file__).parent / "dtest_framework/tests/test_selfcheck.s"
+_TRACE_LINE_RE = re.compile(r"^#\d+ \d+ ")
+
+
+def iss_instructions_per_checkpoint(testfile: Path, run_dir: Path, seed: int, compact: bool) -> float:
+    "Run the selfcheck flow and the checking run on Whisper, return retired instructions divided by the number of checkpoints"
+    args = ["--testfile", str(testfile), "--run_dir", str(run_dir), "--seed", str(seed), "--selfcheck", "--run_iss", "--iss", "whisper"]
+    if compact:
+        args.append("--selfcheck_compact")
+    rd = RiescueD.run_cli(args)
+    dump = rd.generated_files.selfcheck_dump
+    assert dump is not None
+    data = bytearray()
+    for line in dump.read_text().splitlines()[1:]:
+        data.extend(int(byte, 16) for byte in line.split())
+    checkpoints = struct.unpack_from("<Q", data, 0)[0] // 16
+    with open(run_dir / f"{rd.testname}_whisper.log", "r") as f:
+        instructions = sum(1 for line in f if _TRACE_LINE_RE.match(line))
+    return instructions / checkpoints
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--testfile", type=Path, default=DEFAULT_TEST, help="Test to elaborate, defaults to test_selfcheck.s")
+    parser.add_argument("--seed", type=int, default=0, help="Test seed")
+    parser.add_argument("--run_iss", action="store_true", help="Also measure retired instructions per checkpoint on Whisper")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp_dir = Path(tmp)
+        print(f"test: {args.testfile.name}, seed={args.seed}")
+        print(f"{'mode':<10} {'instructions':>13} {'table bytes':>12} {'iss instructions / checkpoint':>30}")
+        for mode in ("unrolled", "compact"):
+            compact = mode == "compact"
+            run_dir = tmp_dir / mode
+            run_dir.mkdir()
+            elaborate(args.testfile, run_dir, seed=args.seed, selfcheck=True, selfcheck_compact=compact)
+            instructions, data_bytes = routine_size(run_dir / f"{args.testfile.stem}_selfcheck.inc")
+            per_checkpoint = "-"
+            if args.run_iss:
+                iss_dir = tmp_dir / f"{mode}_iss"
+                iss_dir.mkdir()
+                per_checkpoint = f"{iss_instructions_per_checkpoint(args.testfile, iss_dir, args.seed, compact):.1f}"
+            print(f"{mode:<10} {instructions:>13} {data_bytes:>12} {per_checkpoint:>30}")
+
+
+if __name__ == "__main__":
+    main()
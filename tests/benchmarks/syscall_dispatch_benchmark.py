@@ -0,0 +1,104 @@
+# SPDX-FileCopyrightText: © 2025 Tenstorrent AI ULC
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+ISS instruction-count benchmark for syscall dispatch in :class:`SysCalls`.
+
+Builds a test that issues many syscalls and runs it on the ISS once per mode, reporting the retired instruction count from the ISS trace:
+
+- ``table``: the jump-table dispatch as shipped
+- ``chain``: a linear ``li``/``beq`` compare per syscall, like the dispatch used to be
+
+Requires the RISC-V toolchain and ISS used by ``--run_iss``.
+
+Usage::
+
+    python -m tests.benchmarks.syscall_dispatch_benchmark --tests 20 --syscalls 50 --iss whisper
+"""
+
+import argparse
+import re
+import tempfile
+from pathlib import Path
+
+from riescue.riescued import RiescueD
+from riescue.dtest_framework.runtime.syscalls import SysCalls
+
+# Instruction lines in whisper (``#<step> <hart> ...``) and spike (``core   0: <priv> 0x...``) traces
+_TRACE_LINE_RE = re.compile(r"^(#\d+ \d+ |core\s+\d+: \d )")
+
+# Syscalls that return to the test, and the order the chain dispatch checked groups in
+_SYSCALLS = [0xF0001001, 0xF0001004, 0xF0001005, 0xF0002001]
+_CHAIN_GROUP_ORDER = [0xF0000, 0xF0001, 0xF0002, 0x70003]
+_TABLE_SYSCALL_TABLE = SysCalls.syscall_table
+
+
+def _chain_syscall_table(self: SysCalls) -> str:
+    "Dispatch with one compare per syscall, checking groups in their original order"
+    code = _TABLE_SYSCALL_TABLE(self)
+    dispatch, _, rest = code.partition(f"{self.label_prefix}syscall_dispatch:")
+    groups = self.syscall_groups()
+    chain = f"{self.label_prefix}syscall_dispatch:\n"
+    for group in _CHAIN_GROUP_ORDER:
+        for i, handler in enumerate(groups.get(group, [])):
+            chain += f"    li t0, 0x{group:x}{i + 1:03x}\n    beq x31, t0, {self.label_prefix}{handler}\n"
+    chain += f"    j {self.label_prefix}syscall_not_found\n"
+    return dispatch + chain + rest.split(f"j {self.label_prefix}syscall_not_found", 1)[1]
+
+
+def write_syscall_test(path: Path, num_tests: int, syscalls_per_test: int) -> Path:
+    "Write a machine mode test where each discrete test makes ``syscalls_per_test`` calls to each syscall that returns to the test"
+    with open(path, "w") as f:
+        f.write(";#test.name       syscall_dispatch\n;#test.author     benchmark\n;#test.arch       rv64\n")
+        f.write(";#test.priv       machine\n;#test.env        bare_metal\n;#test.cpus       1\n;#test.paging     disable\n")
+        f.write(";#test.category   arch\n;#test.class      benchmark\n;#test.features   ext_v.disable ext_fp.disable\n;#test.tags       benchmark\n\n")
+        f.write('.section .code, "ax"\n\ntest_setup:\n    ;#test_passed()\n\n')
+        for t in range(num_tests):
+            f.write(f";#discrete_test(test=test{t:04})\ntest{t:04}:\n")
+            for _ in range(syscalls_per_test):
+                for syscall in _SYSCALLS:
+                    if syscall == 0xF0001005:
+                        f.write("    ;#csr_rw(mscratch, read, true)\n")
+                    else:
+                        f.write(f"    li x31, 0x{syscall:x}\n    ecall\n")
+            f.write("    ;#test_passed()\n\n")
+        f.write("test_cleanup:\n    ;#test_passed()\n\n.section .data\nmy_data:\n    .dword 0xc001c0de\n")
+    return path
+
+
+def count_instructions(testfile: Path, run_dir: Path, iss: str, seed: int) -> int:
+    "Build and run the test on the ISS, return the number of retired instructions in the trace"
+    rd = RiescueD.run_cli(["--testfile", str(testfile), "--run_dir", str(run_dir), "--seed", str(seed), "--run_iss", "--iss", iss, "--repeat_times", "1"])
+    trace = run_dir / f"{rd.testname}_{iss}.log"
+    with open(trace, "r") as f:
+        return sum(1 for line in f if _TRACE_LINE_RE.match(line))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tests", type=int, default=20, help="Number of discrete tests")
+    parser.add_argument("--syscalls", type=int, default=50, help="Calls to each syscall per discrete test")
+    parser.add_argument("--iss", default="whisper", choices=["whisper", "spike"], help="ISS to run")
+    parser.add_argument("--seed", type=int, default=0, help="Test seed")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp_dir = Path(tmp)
+        testfile = write_syscall_test(tmp_dir / "syscall_dispatch.s", args.tests, args.syscalls)
+        num_syscalls = args.tests * args.syscalls * len(_SYSCALLS)
+        counts = {}
+        for mode in ("chain", "table"):
+            SysCalls.syscall_table = _chain_syscall_table if mode == "chain" else _TABLE_SYSCALL_TABLE  # type: ignore[method-assign]
+            run_dir = tmp_dir / mode
+            run_dir.mkdir()
+            counts[mode] = count_instructions(testfile, run_dir, args.iss, args.seed)
+        SysCalls.syscall_table = _TABLE_SYSCALL_TABLE  # type: ignore[method-assign]
+
+    print(f"test: {args.tests} discrete tests x {args.syscalls} calls to each of {', '.join(hex(s) for s in _SYSCALLS)} ({num_syscalls} syscalls), iss={args.iss}")
+    print(f"{'mode':<8} {'instructions':>14} {'per syscall vs chain':>22}")
+    for mode, count in counts.items():
+        print(f"{mode:<8} {count:>14} {(count - counts['chain']) / num_syscalls:>+22.2f}")
+
+
+if __name__ == "__main__":
+    main()
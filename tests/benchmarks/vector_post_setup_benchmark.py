@@ -0,0 +1,137 @@
+# SPDX-FileCopyrightText: © 2025 Tenstorrent AI ULC
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Throughput benchmark for segmented vector load post-setup.
+
+Sets up the rv64 segmented and whole register load groups, then times ``post_setup`` on a synthetic first-pass ISS state that updates every destination register, once per mode:
+
+- ``register_file``: register contents are decoded through :class:`VectorRegisterFile` as shipped
+- ``sliced``: each element is sliced from the hex string and sign extended on its own, like post-setup used to
+
+Usage::
+
+    python -m tests.benchmarks.vector_post_setup_benchmark --rpt_cnt 1 --repeat 3
+"""
+
+import argparse
+import json
+import sys
+import tempfile
+import time
+import types
+from pathlib import Path
+
+import riescue
+
+if "riescue.compliance" not in sys.modules:
+    # riescue.compliance imports coretp for test plan mode, which bringup setup doesn't use
+    try:
+        import riescue.compliance  # noqa: F401
+    except ImportError:
+        compliance = types.ModuleType("riescue.compliance")
+        compliance.__path__ = [str(Path(riescue.__file__).parent / "compliance")]
+        sys.modules["riescue.compliance"] = compliance
+
+from riescue.compliance.config import ResourceBuilder
+from riescue.compliance.lib.instr_setup.vector.base import VectorInstrSetup
+from riescue.compliance.lib.instr_setup.vector.register_file import VectorRegisterFile
+from riescue.compliance.src.instr_builder import InstrBuilder
+from riescue.compliance.src.instr_generator import InstrGenerator
+from riescue.lib.rand import RandNum
+
+GROUPS = ["vector_load_unit_stride_segmented", "vector_load_strided_segmented", "vector_load_indexed_segmented", "vector_load_whole_reg"]
+
+
+class SlicedRegisterFile(VectorRegisterFile):
+    "Keeps the hex strings and slices one element at a time"
+
+    def __init__(self, vlen: int, num_regs: int = 32):
+        super().__init__(vlen, num_regs)
+        self.values: dict[int, str] = {}
+
+    def load_hex(self, reg: int, value: str) -> None:
+        self.values[reg] = value
+
+    def sign_extended_hex(self, reg: int, eew: int) -> list[str]:
+        value = self.values[reg]
+        elements = []
+        for offset in range(0, self.vlen, eew):
+            first_slice_index = (len(value) * 4 - offset - eew) // 4
+            last_slice_index = (len(value) * 4 - offset) // 4
+            elements.append(VectorInstrSetup.sign_extend(None, int(value[first_slice_index:last_slice_index], 16), eew, 64))
+        return elements
+
+
+def setup_instructions(run_dir: Path, seed: int, rpt_cnt: int) -> list:
+    "Load instructions of :data:`GROUPS` after pre-setup"
+    bringup_test = run_dir / "bringup.json"
+    bringup_test.write_text(json.dumps({"arch": "rv64", "include_extensions": [], "include_groups": GROUPS, "include_instrs": [], "exclude_groups": [], "exclude_instrs": []}))
+    builder = ResourceBuilder()
+    builder.with_bringup_test_json(bringup_test)
+    resource = builder.build(seed=seed, run_dir=run_dir)
+    resource.rpt_cnt = rpt_cnt
+    resource.max_instr_per_file = 1 << 30
+    resource.with_rng(RandNum(resource.seed))
+    instrs = InstrGenerator(resource).generate_instructions(InstrBuilder.build_dynamic_classes(resource.get_sim_set()))
+    return [instr for instr in instrs.values() if "_mask_" not in instr.label]
+
+
+def first_pass_state(instr, rng: RandNum) -> list[str]:
+    "Trace row updating every register from the destination register to the end of its segment"
+    setup = instr.setup
+    first = int(instr._fields["vd"].name[1:])
+    last = min(31, first + setup.nf_number * max(1, int(setup.emul if hasattr(setup, "emul") else setup.vlmul)) - 1)
+    vrs = ";".join(f"v{reg}:{rng.random_nbit(setup.vlen):0{setup.vlen // 4}x}" for reg in range(first, last + 1))
+    return ["", "", vrs, ""]
+
+
+def run_post_setup(instrs: list, states: list[list[str]]) -> list[list[str]]:
+    """
+    Post-setup code of each instruction. Post-setup checks are written after the setup code.
+
+    Setup code, register choices and the random stream are restored for each instruction, so every run produces the same code.
+    """
+    output = []
+    for instr, state in zip(instrs, states):
+        pre_setup = instr.get_pre_setup()
+        setup_lines = len(pre_setup)
+        avail_regs = {name: list(value) for name, value in vars(instr.reg_manager).items() if isinstance(value, list)}
+        with instr.resource_db.rng.substream(instr.label):
+            post_setup = list(instr.get_post_setup(state))
+        output.append(pre_setup[setup_lines:] + post_setup)
+        del pre_setup[setup_lines:]
+        vars(instr.reg_manager).update(avail_regs)
+    return output
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--seed", type=int, default=1, help="Bringup seed")
+    parser.add_argument("--rpt_cnt", type=int, default=1, help="Instances of each instruction")
+    parser.add_argument("--repeat", type=int, default=1, help="Number of timed runs")
+    args = parser.parse_args()
+
+    import riescue.compliance.lib.instr_setup.vector.segmented as segmented
+
+    with tempfile.TemporaryDirectory() as tmp:
+        instrs = setup_instructions(Path(tmp), args.seed, args.rpt_cnt)
+        rng = RandNum(args.seed)
+        states = [first_pass_state(instr, rng) for instr in instrs]
+
+        results = {}
+        for mode, register_file in (("register_file", VectorRegisterFile), ("sliced", SlicedRegisterFile)):
+            segmented.VectorRegisterFile = register_file  # type: ignore[misc]
+            best = float("inf")
+            for _ in range(args.repeat):
+                start = time.perf_counter()
+                results[mode] = run_post_setup(instrs, states)
+                best = min(best, time.perf_counter() - start)
+            print(f"{mode}: {best:.3f} s, {len(instrs) / best:,.0f} instructions/s")
+        segmented.VectorRegisterFile = VectorRegisterFile  # type: ignore[misc]
+
+    print(f"instructions: {len(instrs)}, output identical: {results['register_file'] == results['sliced']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -95,6 +95,18 @@ class MiscellaneousTests(BaseRiescuedTest):
         testname = "riescue/dtest_framework/tests/union_find.s"
         self.run_riescued(testname=testname, cli_args=args, iterations=self.iterations)
 
+    def test_scheduler_order_shuffle(self):
+        "Tests stored once and reshuffled at runtime for each repetition"
+        args = ["--run_iss", "--repeat_times", "20", "--scheduler_order", "shuffle", "--test_paging_mode", "sv39"]
+        testname = "riescue/dtest_framework/tests/test_template.s"
+        self.run_riescued(testname=testname, cli_args=args, iterations=self.iterations)
+
+    def test_scheduler_order_iterate(self):
+        "Tests stored once and repeated in order at runtime"
+        args = ["--run_iss", "--repeat_times", "20", "--scheduler_order", "iterate", "--test_priv_mode", "machine"]
+        testname = "riescue/dtest_framework/tests/test_template.s"
+        self.run_riescued(testname=testname, cli_args=args, iterations=self.iterations)
+
     def test_mp_2p_petersons(self):
         "2-processor Peterson's algorithm test"
         args = ["--run_iss", "--deleg_excp_to", "machine", "--repeat_times", "2", "--test_priv_mode", "machine", "--mp", "on", "--num_cpus", "2"]
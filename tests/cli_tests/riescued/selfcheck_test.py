@@ -188,3 +188,17 @@ class SelfcheckTests(BaseRiescuedTest):
         "Run test_selfcheck in M mode and ensure state changes affect the checksum and that corrupting a checksum causes the test to fail"
         # Test pass/fail handling is a little special in M mode, so worth testing that selfcheck still works as expected
         self._run_selfcheck_test_selfcheck(["--test_priv=machine"])
+
+    def test_selfcheck_compact(self):
+        "Run test_selfcheck with the compact checksum loop and ensure state changes affect the checksum and that corrupting a checksum causes the test to fail"
+        self._run_selfcheck_test_selfcheck(["--selfcheck_compact"])
+
+    def test_selfcheck_compact_matches_unrolled(self):
+        "The compact checksum loop folds values in the same order as the unrolled code, so the dumped checksums match"
+        dumps = []
+        for args in ([], ["--selfcheck_compact"]):
+            result = self.run_riescued(testname=self.testname, cli_args=["--run_iss", "--selfcheck"] + args, iterations=1, starting_seed=0)[0]
+            dump_path = result.generated_files.selfcheck_dump
+            assert dump_path is not None  # Type narrowing for pyright
+            dumps.append(self._parse_selfcheck_dump(dump_path))
+        self.assertEqual(dumps[0], dumps[1])
@@ -0,0 +1,58 @@
+# SPDX-FileCopyrightText: © 2025 Tenstorrent AI ULC
+# SPDX-License-Identifier: Apache-2.0
+
+import unittest
+from pathlib import Path
+
+from coretp.rv_enums import PageFlags, PageSize
+
+from riescue.compliance.test_plan.types import AssemblyFile, DataPage, DataSegment, Header, Page, TextSegment
+from riescue.dtest_framework.parser import Parser
+from riescue.dtest_framework.pool import Pool
+
+
+class AssemblyFileBuildPoolTest(unittest.TestCase):
+    """Test that AssemblyFile.build_pool fills the pool the same way parsing the emitted test does"""
+
+    def setUp(self):
+        header = Header(plan_name="plan", arch="rv64", priv="super", cpus=1, paging_mode="sv39", g_paging_mode="disable", category="arch", virtualized="bare_metal")
+        pages = [
+            Page(name="code0"),
+            Page(name="multi", size=0x3000, num_pages=3, flags=PageFlags.VALID | PageFlags.READ | PageFlags.USER, exclude_flags=PageFlags.DIRTY, modify=True, or_mask="0x100"),
+            Page(
+                name="gstage",
+                page_size=(PageSize.SIZE_4K, PageSize.SIZE_2M),
+                nonleaf_flags=PageFlags.VALID | PageFlags.ACCESSED,
+                nonleaf_exclude_flags=PageFlags.DIRTY,
+                vleaf_page_size=PageSize.SIZE_2M,
+                leaf_gleaf_flags=PageFlags.VALID | PageFlags.READ,
+                leaf_gleaf_exclude_flags=PageFlags.USER,
+                nonleaf_gnonleaf_flags=PageFlags.GLOBAL,
+            ),
+            DataPage(name="data0", size=0x200000, page_size=PageSize.SIZE_2M, flags=None, data=[".dword 1"], buffer_page=False),
+        ]
+        self.assembly_file = AssemblyFile(header=header, data=DataSegment(blocks=pages), code=TextSegment())
+
+    @staticmethod
+    def entries(pool: Pool) -> list:
+        page_mappings = [{k: v for k, v in vars(ppm).items() if k not in ("source_line", "pagemap_str")} for ppm in pool.get_raw_parsed_page_mappings()]
+        return [list(pool.get_parsed_addrs().items()), list(pool.get_parsed_res_mems().items()), page_mappings]
+
+    def test_matches_parsed_text(self):
+        parsed = Pool()
+        Parser(Path("test.s"), pool=parsed, lines=self.assembly_file.emit().splitlines(keepends=True)).parse()
+        built = self.assembly_file.build_pool(Path("test.s"))
+        self.assertEqual(len(built.get_raw_parsed_page_mappings()), 6)
+        self.assertEqual(self.entries(built), self.entries(parsed))
+
+    def test_remaining_directives_parsed(self):
+        "Parsing the emitted test into the built pool only adds the directives that weren't built"
+        pool = self.assembly_file.build_pool(Path("test.s"))
+        Parser(Path("test.s"), pool=pool, lines=self.assembly_file.emit().splitlines(keepends=True), skip_directives=Parser.MEMORY_DIRECTIVES).parse()
+        self.assertEqual(len(pool.get_raw_parsed_page_mappings()), 6)
+        self.assertEqual(pool.get_parsed_init_mem_addrs(), ["code0", "multi", "gstage", "data0"])
+        self.assertEqual(pool.get_test_header().priv.strip(), "super")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,70 @@
+# SPDX-FileCopyrightText: © 2025 Tenstorrent AI ULC
+# SPDX-License-Identifier: Apache-2.0
+
+import tempfile
+import threading
+import time
+import unittest
+from pathlib import Path
+from types import SimpleNamespace
+from unittest import mock
+
+from riescue.compliance.bringup import BringupMode
+
+
+class RdRunIssTest(unittest.TestCase):
+    "ISS runs of ``BringupMode._rd_run_iss``, with RiescueD and the ISS replaced by mocks"
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.mode = BringupMode(run_dir=Path(self.tmp.name))
+        self.toolchain = mock.MagicMock()
+        self.toolchain.whisper.name = "whisper"
+        self.toolchain.spike.name = "spike"
+        self.lock = threading.Lock()
+        self.running = 0
+        self.max_running = 0
+        self.finished: list[str] = []
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def simulate(self, featmgr, iss, whisper_config_json_override=None, trace=None):
+        "Stands in for a slow ISS run"
+        with self.lock:
+            self.running += 1
+            self.max_running = max(self.max_running, self.running)
+        time.sleep(0.2)
+        with self.lock:
+            self.running -= 1
+        if iss.name == "spike" and self.spike_fails:
+            raise RuntimeError("spike failed")
+
+    def run_iss(self, iss_jobs: int, spike_fails: bool = False):
+        self.spike_fails = spike_fails
+        resource = SimpleNamespace(seed=1, featmgr=None, iss_jobs=iss_jobs)
+        with mock.patch("riescue.compliance.bringup.RiescueD") as riescued:
+            riescued.return_value.simulate.side_effect = self.simulate
+            rd = self.mode._rd_run_iss(Path("test.s"), ["whisper", "spike"], resource, self.toolchain, on_log=self.finished.append)
+            riescued.return_value.build.assert_called_once()
+        return rd
+
+    def test_concurrent(self):
+        self.run_iss(iss_jobs=2)
+        self.assertEqual(self.max_running, 2)
+        self.assertCountEqual(self.finished, ["whisper", "spike"])
+
+    def test_serial(self):
+        self.run_iss(iss_jobs=1)
+        self.assertEqual(self.max_running, 1)
+        self.assertEqual(self.finished, ["whisper", "spike"])
+
+    def test_failure(self):
+        "A failing ISS is raised after the other run finishes and its log is handed off"
+        with self.assertRaises(RuntimeError):
+            self.run_iss(iss_jobs=2, spike_fails=True)
+        self.assertEqual(self.finished, ["whisper"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,88 @@
+# SPDX-FileCopyrightText: © 2025 Tenstorrent AI ULC
+# SPDX-License-Identifier: Apache-2.0
+
+import tempfile
+import unittest
+from pathlib import Path
+from types import SimpleNamespace
+
+from riescue.compliance.src.comparator import Comparator, TraceMismatch
+
+DISASSEMBLY = """\
+0000000080000000 <_start>:
+    80000000:	0040006f          	j	80000004 <add_0>
+
+0000000080000004 <add_0>:
+    80000004:	00b50533          	add	a0,a0,a1
+
+0000000080000008 <sub_1>:
+    80000008:	40b50533          	sub	a0,a0,a1
+    8000000c:	ff9ff06f          	j	80000004 <add_0>
+"""
+
+HEADER = "pc,instr,gpr,csr,pa,stdata,binary,mode,instr_str,operand,pad\n"
+
+
+def trace(*rows: tuple[str, str]) -> str:
+    return HEADER + "".join(f"{pc},,{gpr},,,,,3,,,\n" for pc, gpr in rows)
+
+
+class ComparatorTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.tmp_dir = Path(self.tmp.name)
+        self.disassembly = self.tmp_dir / "test.dis"
+        self.disassembly.write_text(DISASSEMBLY)
+        self.testcase = SimpleNamespace(
+            disassembly=self.disassembly,
+            instrs=[SimpleNamespace(label="add_0"), SimpleNamespace(label="sub_1"), SimpleNamespace(label="missing_2")],
+        )
+        self.comparator = Comparator(resource_db=None)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def write(self, name: str, text: str) -> Path:
+        path = self.tmp_dir / name
+        path.write_text(text)
+        return path
+
+    def test_label_index(self):
+        "Labels resolve to their definition, not to a jump referencing them first"
+        index = self.comparator.label_index(self.disassembly)
+        self.assertEqual(index["_start"], "80000000")
+        self.assertEqual(index["add_0"], "80000004")
+        self.assertEqual(index["sub_1"], "80000008")
+        self.assertEqual(self.comparator.search_label("sub_1", self.disassembly), "80000008")
+
+    def test_process_testcase_first_row_per_pc(self):
+        csv_log = self.write("spike.csv", trace(("80000000", ""), ("80000004", "a0:5"), ("80000008", "a0:1"), ("80000008", "a0:2")))
+        self.comparator.process_testcase(self.testcase, csv_log, iss="spike")
+        self.assertEqual(self.comparator.spike_state_tracker["sub_1"][2], "a0:1")
+        self.assertEqual(self.comparator.spike_state_tracker["add_0"][2], "a0:5")
+        self.assertIsNone(self.comparator.spike_state_tracker["missing_2"])
+        self.assertEqual(self.comparator.extract_state("0000000080000008", csv_log)[2], "a0:1")
+        self.assertIsNone(self.comparator.extract_state(None, csv_log))
+
+    def test_compare_traces_fields(self):
+        spike = self.write("spike.csv", trace(("80000000", "a0:1"), ("80000004", "a0:5"), ("80000008", "a0:3")))
+        whisper = self.write("whisper.csv", trace(("0080000000", "a0:9"), ("80000004", "a0:5"), ("80000008", "a0:4")))
+        mismatches = self.comparator.compare_traces(self.testcase, spike, whisper)
+        # _start isn't a testcase instruction: pcs match and its gpr isn't compared
+        self.assertEqual(mismatches, [TraceMismatch(2, "80000008", "sub_1", "gpr", "a0:3", "a0:4")])
+
+    def test_compare_traces_diverged(self):
+        spike = self.write("spike.csv", trace(("80000000", ""), ("80000004", "a0:1"), ("80000008", "a0:2"), ("80000004", "a0:3")))
+        whisper = self.write("whisper.csv", trace(("80000000", ""), ("80000008", "a0:2"), ("80000004", "a0:3")))
+        mismatches = self.comparator.compare_traces(self.testcase, spike, whisper)
+        self.assertEqual(mismatches, [TraceMismatch(1, "80000004", "add_0", "pc", "80000004", "80000008")])
+
+    def test_compare_traces_length(self):
+        spike = self.write("spike.csv", trace(("80000004", "a0:1"), ("80000008", "a0:2")))
+        whisper = self.write("whisper.csv", trace(("80000004", "a0:1")))
+        mismatches = self.comparator.compare_traces(self.testcase, spike, whisper)
+        self.assertEqual(mismatches, [TraceMismatch(1, "80000008", "sub_1", "pc", "80000008", "")])
+
+
+if __name__ == "__main__":
+    unittest.main()
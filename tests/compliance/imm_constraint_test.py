@@ -0,0 +1,72 @@
+# SPDX-FileCopyrightText: © 2025 Tenstorrent AI ULC
+# SPDX-License-Identifier: Apache-2.0
+
+import unittest
+from types import SimpleNamespace
+from typing import Optional
+
+from riescue.compliance.lib.riscv_imm_constraint_database import IMM_CONSTRAINTS, ImmConstraint, imm_constraints, twos_complement
+from riescue.lib.rand import RandNum
+
+
+def legal_values(width: int, mask: int, signed: bool = False, nonzero: bool = False, limit: Optional[int] = None) -> set[int]:
+    "Values the rejection loops used to accept: ``getrandbits(width) & mask``, optionally sign-extended, nonzero or below ``limit``"
+    values = set()
+    for raw in range(1 << width):
+        value = raw & mask
+        if limit is not None and value >= limit:
+            continue
+        if signed:
+            value = twos_complement(value, width)
+        if nonzero and value == 0:
+            continue
+        values.add(value)
+    return values
+
+
+class ImmConstraintTest(unittest.TestCase):
+    def setUp(self):
+        self.rng = RandNum(seed=7)
+
+    def sample_all(self, constraint: ImmConstraint) -> set[int]:
+        "Sample until every legal value has been seen, bounded so a wrong count fails instead of hanging"
+        seen: set[int] = set()
+        for _ in range(constraint.count * 40):
+            seen.add(constraint.sample(self.rng))
+            if len(seen) == constraint.count:
+                break
+        return seen
+
+    def test_matches_rejection_sampling(self):
+        expected = {
+            "c.lwsp": legal_values(8, 0b11111100),
+            "c.ldsp": legal_values(9, 0b111111000),
+            "c.lw": legal_values(7, 0b1111100),
+            "c.j": legal_values(12, 0b111111111110, signed=True, nonzero=True),
+            "c.beqz": legal_values(9, 0b111111110, signed=True, nonzero=True),
+            "c.li": legal_values(6, 0b111111, signed=True),
+            "c.addi": legal_values(6, 0b111111, signed=True, nonzero=True),
+            "c.addi16sp": legal_values(10, 0b1111110000, signed=True, nonzero=True),
+            "c.addi4spn": legal_values(10, 0b1111111100, nonzero=True),
+            "c.slli": legal_values(6, 0b111111, nonzero=True),
+            "fld": legal_values(11, 0x7FF, limit=0x800 - 8),
+        }
+        for instr, values in expected.items():
+            (constraint,) = IMM_CONSTRAINTS[instr].values()
+            self.assertEqual(constraint.count, len(values), instr)
+            self.assertEqual(self.sample_all(constraint), values, instr)
+
+    def test_ranges(self):
+        constraint = IMM_CONSTRAINTS["c.lui"]["nzimm"]
+        self.assertEqual(self.sample_all(constraint), set(range(0xFFFE0, 0x100000)) | set(range(0x1, 0x20)))
+
+    def test_generators(self):
+        constraints = imm_constraints(SimpleNamespace(rng=self.rng))
+        self.assertEqual(constraints.get_sole_value_generator("c.sdsp")() % 8, 0)
+        self.assertIsNone(constraints.get_constraint("c.sdsp", "imm"))
+        self.assertIsNone(constraints.get_sole_value_generator("add"))
+        self.assertEqual(constraints.get_format("c.addi4spn"), "CIW")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,52 @@
+# SPDX-FileCopyrightText: © 2025 Tenstorrent AI ULC
+# SPDX-License-Identifier: Apache-2.0
+
+import tempfile
+import unittest
+from pathlib import Path
+from typing import Optional
+
+from riescue.compliance.config import ResourceBuilder
+from riescue.compliance.src.instr_builder import InstrBuilder
+from riescue.compliance.src.instr_generator import InstrGenerator
+from riescue.lib.rand import RandNum
+
+BRINGUP_TEST = Path(__file__).parents[2] / "riescue/compliance/tests/rv_i/rv64i.json"
+
+
+class InstrGeneratorTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.run_dir = Path(self.tmp.name)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def generate(self, setup_jobs: Optional[int], max_instr_per_file: int = 100000) -> list[tuple[str, list[str]]]:
+        "Label and setup code of each generated instruction, in order"
+        builder = ResourceBuilder()
+        builder.with_bringup_test_json(BRINGUP_TEST)
+        resource = builder.build(seed=11, run_dir=self.run_dir)
+        resource.rpt_cnt = 2
+        resource.setup_jobs = setup_jobs
+        resource.max_instr_per_file = max_instr_per_file
+        resource.with_rng(RandNum(resource.seed))
+        instr_classes = InstrBuilder.build_dynamic_classes(resource.get_sim_set())
+        instrs = InstrGenerator(resource).generate_instructions(instr_classes)
+        return [(label, list(instr.get_pre_setup())) for label, instr in instrs.items()]
+
+    def test_setup_jobs_deterministic(self):
+        "Output only depends on the seed, not the number of setup processes"
+        serial = self.generate(setup_jobs=1)
+        self.assertGreater(len(serial), 0)
+        self.assertEqual(self.generate(setup_jobs=3), serial)
+
+    def test_setup_jobs_line_limit(self):
+        "Parallel setup stops at the same instruction as serial setup"
+        serial = self.generate(setup_jobs=1, max_instr_per_file=500)
+        self.assertLess(len(serial), len(self.generate(setup_jobs=1)))
+        self.assertEqual(self.generate(setup_jobs=2, max_instr_per_file=500), serial)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,42 @@
+# SPDX-FileCopyrightText: © 2025 Tenstorrent AI ULC
+# SPDX-License-Identifier: Apache-2.0
+
+import unittest
+from unittest.mock import patch
+
+from riescue.compliance.test_plan.context import FILTERED_CSRS, LoweringContext
+from riescue.lib.csr_manager.csr_manager_interface import CsrManagerInterface
+from riescue.lib.rand import RandNum
+
+
+class CsrCandidatesTest(unittest.TestCase):
+    def setUp(self):
+        self.ctx = LoweringContext(rng=RandNum(seed=3), mem_reg=None, env=None, instruction_catalog=None, featmgr=None)  # type: ignore[arg-type]
+
+    def test_filtering(self):
+        "Candidates match the CSR lookup for the accessibility, without the filtered CSRs"
+        csr_manager = self.ctx.get_csr_manager()
+        writable = set(csr_manager.lookup_csrs(match={"Accessibility": "Supervisor", "software-write": "W", "ISS_Support": "Yes"}))
+        candidates = self.ctx.csr_candidates("Supervisor", read_only=False)
+        self.assertTrue(candidates)
+        self.assertEqual(set(candidates), writable - FILTERED_CSRS)
+        self.assertFalse(FILTERED_CSRS & set(self.ctx.csr_candidates("Machine", read_only=True)))
+        user = self.ctx.csr_candidates("User", read_only=True)
+        self.assertFalse(set(user) & set(csr_manager.lookup_csrs(match={"Accessibility": "Machine"})))
+        self.assertFalse(set(user) & set(csr_manager.lookup_csrs(match={"Accessibility": "Supervisor"})))
+        self.assertGreater(len(self.ctx.csr_candidates("Supervisor", read_only=True)), len(candidates), "read-only accesses add readable CSRs")
+
+    def test_cached(self):
+        "The lookup runs once per key and the shared result can't be modified"
+        with patch.object(CsrManagerInterface, "lookup_csrs", wraps=self.ctx.get_csr_manager().lookup_csrs) as lookup_csrs:
+            first = self.ctx.csr_candidates("Machine", read_only=False)
+            calls = lookup_csrs.call_count
+            self.assertIs(self.ctx.csr_candidates("Machine", read_only=False), first)
+            self.assertEqual(lookup_csrs.call_count, calls)
+            self.ctx.csr_candidates("Machine", read_only=True)
+            self.assertGreater(lookup_csrs.call_count, calls)
+        self.assertIsInstance(first, tuple)
+
+
+if __name__ == "__main__":
+    unittest.main()
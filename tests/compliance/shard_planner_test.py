@@ -0,0 +1,104 @@
+# SPDX-FileCopyrightText: © 2025 Tenstorrent AI ULC
+# SPDX-License-Identifier: Apache-2.0
+
+import json
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from riescue.compliance.bringup import BringupMode
+from riescue.compliance.config import ResourceBuilder
+from riescue.compliance.lib.testcase import TestCase
+from riescue.compliance.src.instr_builder import InstrBuilder
+from riescue.compliance.src.instr_generator import InstrGenerator
+from riescue.compliance.src.shard_planner import estimate_cost, plan_shards, shard_count, shard_report_elfs
+from riescue.lib.rand import RandNum
+
+BRINGUP_TEST = Path(__file__).parents[2] / "riescue/compliance/tests/rv_i/rv64i.json"
+
+
+class ShardPlannerTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.run_dir = Path(self.tmp.name)
+        builder = ResourceBuilder()
+        builder.with_bringup_test_json(BRINGUP_TEST)
+        self.resource = builder.build(seed=5, run_dir=self.run_dir)
+        self.resource.rpt_cnt = 2
+        self.resource.with_rng(RandNum(self.resource.seed))
+        self.instr_generator = InstrGenerator(self.resource)
+        self.classes = InstrBuilder.build_dynamic_classes(self.resource.get_sim_set())
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_partition(self):
+        "Every repeat of every instruction is in exactly one shard, and shard costs are balanced"
+        shards = plan_shards(self.classes, self.resource, 3, RandNum(1))
+        self.assertEqual(len(shards), 3)
+        units = sorted((name, rpt) for shard in shards for name, rpts in shard.repeats.items() for rpt in rpts)
+        self.assertEqual(units, sorted((instr.name, rpt) for instr in self.classes for rpt in range(2)))
+        max_unit = max(estimate_cost(instr, self.resource) for instr in self.classes)
+        costs = [shard.cost for shard in shards]
+        self.assertLessEqual(max(costs) - min(costs), max_unit)
+        self.assertEqual([shard.seed for shard in shards], [shard.seed for shard in plan_shards(self.classes, self.resource, 3, RandNum(1))])
+
+    def test_auto_shard_count(self):
+        total = sum(estimate_cost(instr, self.resource) for instr in self.classes) * 2
+        self.resource.max_instr_per_file = 1000
+        self.assertEqual(len(plan_shards(self.classes, self.resource, 0, RandNum(1))), shard_count(total, 1000))
+        self.assertEqual(len(plan_shards(self.classes, self.resource, 1000, RandNum(1))), len(self.classes) * 2, "At most one shard per repeat")
+
+    def test_generate_repeats(self):
+        "Only the repeats of a shard are generated"
+        self.resource.max_instr_per_file = 1 << 30
+        shard = plan_shards(self.classes, self.resource, 4, RandNum(1))[0]
+        instrs = self.instr_generator.generate_instructions(self.classes, shard.repeats)
+        generated = {(instr.name, int(label[len(instr.name) + 1 :].split("_")[0])) for label, instr in instrs.items()}
+        self.assertEqual(generated, {(name, rpt) for name, rpts in shard.repeats.items() for rpt in rpts})
+
+    def test_generate_shards_report(self):
+        "Each shard runs in its own directory with its own seed, and failures and signatures are merged into the report"
+        self.resource.shards = 3
+
+        def generate_test(mode, resource, toolchain, instr_generator, sim_classes, repeats=None):
+            if mode.run_dir.name == "shard_1":
+                raise ValueError("ISS failed")
+            signature = mode.run_dir / f"bringup_1_{resource.seed}_2"
+            return TestCase(signature, [], resource), signature.with_suffix(".o")
+
+        mode = BringupMode(run_dir=self.run_dir)
+        with mock.patch.object(BringupMode, "_generate_test", autospec=True, side_effect=generate_test):
+            with self.assertRaisesRegex(RuntimeError, "1 of 3 bringup shards failed"):
+                mode._generate_shards(self.resource, mock.MagicMock(), self.classes)
+
+        report = json.loads((self.run_dir / "bringup_shards.json").read_text())
+        self.assertEqual(report["seed"], 5)
+        self.assertEqual([shard["passed"] for shard in report["shards"]], [True, False, True])
+        self.assertEqual(report["shards"][1]["error"], "ValueError: ISS failed")
+        self.assertEqual(report["shards"][0]["signature"], str(self.run_dir / "shard_0" / f"bringup_1_{report['shards'][0]['seed']}_2"))
+        self.assertEqual(report["shards"][0]["elf"], report["shards"][0]["signature"] + ".o")
+        self.assertFalse(report["passed"])
+        signatures = {shard["signature"] for shard in report["shards"]}
+        self.assertEqual(len(signatures), 3, "Failed shards have an empty signature")
+        self.assertEqual(sorted(report["signatures"]), sorted(instr.name for instr in self.classes))
+        self.assertTrue(all(len(shard_signatures) == 2 and set(shard_signatures) <= signatures for shard_signatures in report["signatures"].values()))
+
+    def test_generate_shards_returns_report(self):
+        "The shard report is returned and lists every shard's ELF"
+        self.resource.shards = 2
+        mode = BringupMode(run_dir=self.run_dir)
+
+        def generate_test(mode, resource, *args, **kwargs):
+            return TestCase(mode.run_dir / "bringup_1_2", [], resource), mode.run_dir / "bringup_1_2.o"
+
+        with mock.patch.object(BringupMode, "_generate_test", autospec=True, side_effect=generate_test):
+            report = mode._generate_shards(self.resource, mock.MagicMock(), self.classes)
+        self.assertEqual(report, self.run_dir / "bringup_shards.json")
+        self.assertTrue(json.loads(report.read_text())["passed"])
+        self.assertEqual(shard_report_elfs(report), [self.run_dir / f"shard_{i}" / "bringup_1_2.o" for i in range(2)])
+
+
+if __name__ == "__main__":
+    unittest.main()
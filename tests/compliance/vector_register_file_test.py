@@ -0,0 +1,43 @@
+# SPDX-FileCopyrightText: © 2025 Tenstorrent AI ULC
+# SPDX-License-Identifier: Apache-2.0
+
+import random
+import unittest
+
+from riescue.compliance.lib.instr_setup.vector.base import VectorInstrSetup
+from riescue.compliance.lib.instr_setup.vector.register_file import VectorRegisterFile
+
+
+def sliced_elements(value: str, vlen: int, eew: int) -> list[str]:
+    "Elements the way segmented post-setup sliced them from the hex string, element 0 first"
+    elements = []
+    for offset in range(0, vlen, eew):
+        first_slice_index = (len(value) * 4 - offset - eew) // 4
+        last_slice_index = (len(value) * 4 - offset) // 4
+        elements.append(VectorInstrSetup.sign_extend(None, int(value[first_slice_index:last_slice_index], 16), eew, 64))
+    return elements
+
+
+class VectorRegisterFileTest(unittest.TestCase):
+    def test_matches_sliced_elements(self):
+        rng = random.Random(3)
+        vlen = 256
+        vreg_file = VectorRegisterFile(vlen)
+        for reg in range(32):
+            # Register groups report more digits than one register holds; only the lowest vlen bits belong to the register
+            value = f"{rng.getrandbits(vlen * 2):0{vlen // 2}x}"
+            vreg_file.load_hex(reg, value)
+            for eew in (8, 16, 32, 64):
+                self.assertEqual(vreg_file.sign_extended_hex(reg, eew), sliced_elements(value, vlen, eew), f"v{reg} eew {eew}")
+
+    def test_elements(self):
+        vreg_file = VectorRegisterFile(128)
+        vreg_file.load_hex(3, "ff")
+        self.assertEqual(vreg_file.elements(3, 8).tolist(), [-1] + [0] * 15)
+        self.assertEqual(vreg_file.elements(3, 16).tolist(), [0xFF] + [0] * 7)
+        self.assertEqual(vreg_file.sign_extended_hex(3, 8)[:2], ["0xffffffffffffffff", "0x0"])
+        self.assertEqual(vreg_file.elements(4, 64).tolist(), [0, 0])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -155,13 +155,14 @@ class CliAdapterTest(unittest.TestCase):
 
     def test_store_true_flags_set_correctly(self):
         """Test store_true flags are properly transferred"""
-        args = self.parser.parse_args(args=["--tohost_nonzero_terminate", "--single_assembly_file", "--force_alignment", "--c_used", "--big_endian"])
+        args = self.parser.parse_args(args=["--tohost_nonzero_terminate", "--single_assembly_file", "--force_alignment", "--c_used", "--big_endian", "--bulk_random_data"])
         result = self.adapter.apply(self.builder, args).featmgr
         self.assertTrue(result.tohost_nonzero_terminate)
         self.assertTrue(result.single_assembly_file)
         self.assertTrue(result.force_alignment)
         self.assertTrue(result.c_used)
         self.assertTrue(result.big_endian)
+        self.assertTrue(result.bulk_random_data)
 
     def test_mutually_exclusive_bss_flags(self):
         """Test small_bss and big_bss can be set simultaneously (no mutual exclusion)"""
@@ -0,0 +1,69 @@
+# SPDX-FileCopyrightText: © 2025 Tenstorrent AI ULC
+# SPDX-License-Identifier: Apache-2.0
+
+import json
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from riescue.dtest_framework.config import CpuConfig
+from riescue.dtest_framework.config.cpu_config_cache import CpuConfigCache
+
+CPU_CONFIG = Path(__file__).parents[3] / "riescue/dtest_framework/lib/config.json"
+
+
+class CpuConfigCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.config = Path(self.tmp.name) / "config.json"
+        self.config.write_text(CPU_CONFIG.read_text())
+        self.cache = CpuConfigCache()
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_parsed_once(self):
+        with mock.patch.object(CpuConfig, "from_dict", wraps=CpuConfig.from_dict) as from_dict:
+            _, first = self.cache.load(self.config)
+            _, second = self.cache.load(self.config, "ext_v.disable")
+        from_dict.assert_called_once()
+        self.assertEqual(first.memory, second.memory)
+        self.assertIsNot(first.features, second.features)
+
+    def test_memory_not_shared(self):
+        "Changes to a loaded config's memory ranges don't leak into later loads"
+        _, first = self.cache.load(self.config)
+        dram_ranges = len(first.memory.dram_ranges)
+        first.memory.dram_ranges.append(first.memory.dram_ranges[0])
+        first.memory.io_ranges[0].size = 0
+        _, second = self.cache.load(self.config)
+        self.assertEqual(len(second.memory.dram_ranges), dram_ranges)
+        self.assertNotEqual(second.memory.io_ranges[0].size, 0)
+
+    def test_same_as_parsing(self):
+        "Feature overrides give the same config as parsing with them, and don't leak into later loads"
+        overrides = "ext_v.disable ext_zba.enable ext_debug.enable"
+        cfg, cached = self.cache.load(self.config, overrides)
+        parsed = CpuConfig.from_dict(json.loads(self.config.read_text()), overrides)
+        self.assertEqual(cached.features.features, parsed.features.features)
+        self.assertEqual(cached.debug_mode, parsed.debug_mode)
+        self.assertEqual(cached.memory, parsed.memory)
+
+        _, plain = self.cache.load(self.config)
+        self.assertEqual(plain.features.features, CpuConfig.from_dict(json.loads(self.config.read_text())).features.features)
+        self.assertEqual(cfg, json.loads(self.config.read_text()))
+
+    def test_edited_file(self):
+        _, before = self.cache.load(self.config)
+        cfg = json.loads(self.config.read_text())
+        cfg["reset_pc"] = "0x9000_0000"
+        self.config.write_text(json.dumps(cfg))
+        _, after = self.cache.load(self.config)
+        self.assertNotEqual(before.reset_pc, after.reset_pc)
+        self.assertEqual(after.reset_pc, 0x9000_0000)
+        self.assertEqual(len(self.cache.entries), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
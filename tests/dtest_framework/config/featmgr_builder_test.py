@@ -280,6 +280,15 @@ class TestFeatMgrBuilder(FeatMgrBuilderBase):
 
         self.assertEqual(featmgr.repeat_times, 1)
 
+    def test_scheduler_order_arg(self):
+        "Check that --scheduler_order is respected and defaults to static"
+        featmgr = self.builder.build(rng=self.rng)
+        self.assertEqual(featmgr.scheduler_order, RV.SchedulerOrder.STATIC)
+
+        args = self.parse_args(["--scheduler_order=shuffle"])
+        featmgr = self.builder.with_args(args).build(rng=self.rng)
+        self.assertEqual(featmgr.scheduler_order, RV.SchedulerOrder.SHUFFLE)
+
     def test_linux_mode(self):
         "Check that --linux_mode is respected"
         args = self.parse_args(["--linux_mode"])
@@ -0,0 +1,133 @@
+# SPDX-FileCopyrightText: © 2025 Tenstorrent AI ULC
+# SPDX-License-Identifier: Apache-2.0
+
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+from riescue.dtest_framework.generator.budget import _AssemblyWalker, li_instructions
+from tests.dtest_framework.synthetic import elaborate
+
+TEST_FILE = """\
+;#test.name       budget
+;#test.author     unittest
+;#test.arch       rv64
+;#test.priv       machine
+;#test.env        bare_metal
+;#test.cpus       1
+;#test.paging     disable
+;#test.category   arch
+;#test.class      budget
+;#test.features   ext_v.disable ext_fp.disable
+;#test.tags       budget
+
+.section .code, "ax"
+
+test_setup:
+    ;#test_passed()
+
+;#discrete_test(test=test01)
+test01:
+    .rept 100
+    addi t0, t0, 1
+    .endr
+    ;#test_passed()
+
+;#discrete_test(test=test02)
+test02:
+    li t0, 0x123456789
+    ;#test_passed()
+
+test_cleanup:
+    ;#test_passed()
+"""
+
+ASSEMBLY = """\
+.equ BASE, 0x80000000
+.macro TWICE
+    nop
+    nop
+.endm
+.section .code, "ax"
+test01:
+    li t0, BASE  # 0x80000000 is li 1 and slli
+    TWICE
+    .rept 4
+    la t1, test01
+    .endr
+local:
+    ret
+.section .data
+    .dword 1, 2
+    .balign 16
+    .fill 3, 4, 0
+#define MACRO(x) \\
+    addi x, x, 1; \\
+    addi x, x, 1
+"""
+
+
+class BudgetTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.run_dir = Path(self.tmp.name)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def elaborate(self, **featmgr_overrides) -> dict:
+        test_file = self.run_dir / "budget.s"
+        test_file.write_text(TEST_FILE)
+        generated_files = elaborate(test_file, self.run_dir, seed=1, **featmgr_overrides)
+        assert generated_files.budget is not None
+        return json.loads(generated_files.budget.read_text())
+
+    def test_li_instructions(self):
+        self.assertEqual(li_instructions(0), 1)
+        self.assertEqual(li_instructions(-1), 1)
+        self.assertEqual(li_instructions(0x1000), 1)
+        self.assertEqual(li_instructions(0x12345678), 2)
+        self.assertEqual(li_instructions(0x80000000), 2)
+        self.assertEqual(li_instructions(0x100000000), 2)
+        self.assertEqual(li_instructions(0x123456789), 4)
+
+    def test_walk(self):
+        "Sizes follow .rept, macros and pseudo-instruction expansion, and skip C preprocessor macros"
+        (self.run_dir / "test.S").write_text(ASSEMBLY)
+        walker = _AssemblyWalker(self.run_dir, "test", ["test01"])
+        walker.walk_file(self.run_dir / "test.S")
+        instructions = 2 + 2 + 4 * 2 + 1
+        self.assertEqual(walker.sections, {".code": instructions * 4, ".data": 16 + 12})
+        self.assertEqual(walker.tests["test01"].body, instructions)
+        self.assertEqual(walker.span("test01", "local"), instructions - 1)
+
+    def test_estimate(self):
+        "Each run adds the test body and the runtime dispatch, and the estimate is written next to the test"
+        once, twice = self.elaborate(repeat_times=1, instruction_budget=1 << 30), self.elaborate(repeat_times=2, instruction_budget=1 << 30)
+        test01, test02 = once["discrete_tests"]["test01"], once["discrete_tests"]["test02"]
+        self.assertGreaterEqual(test01["body"], 100)
+        self.assertEqual(test01["body"] - test02["body"], 100 - 4)
+        self.assertEqual(test01["per_run"] - test01["body"], once["paths"]["test_passed"] + once["paths"]["scheduler"])
+        self.assertEqual(twice["instructions"] - once["instructions"], test01["per_run"] + test02["per_run"])
+        self.assertGreater(once["sections"][".code"], 100 * 4)
+        self.assertEqual(once["image_size"], sum(once["sections"].values()))
+        self.assertEqual(once["over_budget"], [])
+
+    def test_skipped_without_budget(self):
+        test_file = self.run_dir / "budget.s"
+        test_file.write_text(TEST_FILE)
+        self.assertIsNone(elaborate(test_file, self.run_dir, seed=1).budget)
+        self.assertFalse((self.run_dir / "budget_budget.json").exists())
+
+    def test_over_budget(self):
+        with self.assertLogs("riescue.dtest_framework.generator.budget", level="WARNING"):
+            estimate = self.elaborate(instruction_budget=100, image_size_budget=1 << 30)
+        self.assertEqual(len(estimate["over_budget"]), 1)
+        with self.assertRaisesRegex(ValueError, "exceeds --image_size_budget"):
+            self.elaborate(image_size_budget=100, fail_over_budget=True)
+        self.assertEqual(len(json.loads((self.run_dir / "budget_budget.json").read_text())["over_budget"]), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,140 @@
+# SPDX-FileCopyrightText: © 2025 Tenstorrent AI ULC
+# SPDX-License-Identifier: Apache-2.0
+
+import tempfile
+import unittest
+from pathlib import Path
+
+import riescue.lib.enums as RV
+from riescue.lib.csr_manager.csr_manager_interface import CsrManagerInterface
+from riescue.lib.rand import RandNum
+from tests.dtest_framework.synthetic import elaborate
+
+TEST_HEADER = """;#test.name       csr
+;#test.author     test
+;#test.arch       rv64
+;#test.priv       {priv}
+;#test.env        bare_metal
+;#test.cpus       1
+;#test.paging     disable
+;#test.category   arch
+;#test.class      csr
+;#test.features   ext_v.enable ext_fp.disable
+;#test.tags       csr
+
+.section .code, "ax"
+
+test_setup:
+    ;#test_passed()
+
+;#discrete_test(test=test01)
+test01:
+    ;#csr_rw(vstart, read)
+    ;#csr_rw(hpmcounter3, read)
+    ;#csr_rw(sscratch, read)
+    ;#csr_rw(mscratch, read)
+    ;#test_passed()
+
+test_cleanup:
+    ;#test_passed()
+
+.section .data
+my_data:
+    .dword 0xc001c0de
+"""
+
+
+class CsrPrivilegeTest(unittest.TestCase):
+    """Test the CSR privilege lookup used to pick direct CSR access over the syscall"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.csr_mgr = CsrManagerInterface(RandNum(0))
+
+    def csr(self, name: str) -> dict:
+        csr_config = self.csr_mgr.lookup_csr_by_name(name)
+        assert csr_config is not None
+        return csr_config
+
+    def test_privilege_level(self):
+        for name, level in [
+            ("vstart", CsrManagerInterface.USER_LEVEL),
+            ("sstatus", CsrManagerInterface.SUPERVISOR_LEVEL),
+            ("hstatus", CsrManagerInterface.HYPERVISOR_LEVEL),
+            ("mstatus", CsrManagerInterface.MACHINE_LEVEL),
+        ]:
+            with self.subTest(csr=name):
+                self.assertEqual(self.csr_mgr.privilege_level(self.csr(name)), level)
+
+    def test_accessible_from(self):
+        user, supervisor, machine = RV.RiscvPrivileges.USER, RV.RiscvPrivileges.SUPER, RV.RiscvPrivileges.MACHINE
+        self.assertFalse(self.csr_mgr.accessible_from(self.csr("hpmcounter3"), user), "counter enables aren't programmed")
+        self.assertFalse(self.csr_mgr.accessible_from(self.csr("cycle"), supervisor))
+        self.assertTrue(self.csr_mgr.accessible_from(self.csr("mhpmcounter3"), machine))
+        for name in ("fcsr", "vstart", "vl", "vtype"):
+            self.assertFalse(self.csr_mgr.accessible_from(self.csr(name), user), f"{name} depends on mstatus.FS/VS")
+        self.assertTrue(self.csr_mgr.accessible_from(self.csr("fcsr"), user, fs_enabled=True))
+        self.assertFalse(self.csr_mgr.accessible_from(self.csr("fcsr"), user, vs_enabled=True))
+        self.assertTrue(self.csr_mgr.accessible_from(self.csr("vstart"), user, vs_enabled=True))
+        self.assertTrue(self.csr_mgr.accessible_from(self.csr("vl"), user, virtualized=True, vs_enabled=True))
+        self.assertFalse(self.csr_mgr.accessible_from(self.csr("sscratch"), user))
+        self.assertTrue(self.csr_mgr.accessible_from(self.csr("sscratch"), supervisor))
+        self.assertTrue(self.csr_mgr.accessible_from(self.csr("hstatus"), supervisor))
+        self.assertFalse(self.csr_mgr.accessible_from(self.csr("hstatus"), supervisor, virtualized=True))
+        self.assertFalse(self.csr_mgr.accessible_from(self.csr("tselect"), supervisor))
+        self.assertTrue(self.csr_mgr.accessible_from(self.csr("tselect"), machine))
+        self.assertFalse(self.csr_mgr.accessible_from(self.csr("dcsr"), machine), "debug mode CSRs need debug mode")
+
+
+class CsrRwDirectAccessTest(unittest.TestCase):
+    """Test that ;#csr_rw only uses the syscall when the test privilege can't access the CSR"""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.tmp_dir = Path(self.tmp.name)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def discrete_test_body(self, priv: str, name: str = "", **featmgr_overrides) -> str:
+        testfile = self.tmp_dir / f"csr_{priv}.s"
+        testfile.write_text(TEST_HEADER.format(priv=priv))
+        run_dir = self.tmp_dir / (name or priv)
+        run_dir.mkdir()
+        generated_files = elaborate(testfile, run_dir, seed=1, **featmgr_overrides)
+        assembly = generated_files.assembly.read_text()
+        return assembly.split("test01:")[1].split("test_cleanup:")[0]
+
+    def accesses(self, body: str) -> dict[str, str]:
+        "Map each CSR to the code emitted for its ;#csr_rw"
+        code = {}
+        for chunk in body.split(";#csr_rw(")[1:]:
+            csr = chunk.split(",")[0]
+            code[csr] = chunk.split("\n", 1)[1].split(";#")[0]
+        return code
+
+    def test_user_mode(self):
+        "vstart is named like a supervisor CSR but is user level, so it's accessed directly while mstatus.VS is on. Counters keep the syscall"
+        code = self.accesses(self.discrete_test_body("user"))
+        self.assertIn("vstart", code["vstart"])
+        self.assertNotIn("ecall", code["vstart"])
+        for csr in ("hpmcounter3", "sscratch", "mscratch"):
+            with self.subTest(csr=csr):
+                self.assertIn("ecall", code[csr])
+        self.assertIn("li x31, 0xf0001006", code["sscratch"])
+        self.assertIn("li x31, 0xf0001005", code["mscratch"])
+
+    def test_user_mode_vs_randomized_off(self):
+        "vstart keeps the syscall when --vs_randomization can turn mstatus.VS off"
+        code = self.accesses(self.discrete_test_body("user", "vs_off", vs_randomization=50, vs_randomization_values=[0, 2]))
+        self.assertIn("li x31, 0xf0001006", code["vstart"])
+
+    def test_super_mode(self):
+        code = self.accesses(self.discrete_test_body("super"))
+        self.assertIn("sscratch", code["sscratch"])
+        self.assertNotIn("ecall", code["sscratch"])
+        self.assertIn("li x31, 0xf0001005", code["mscratch"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,115 @@
+# SPDX-FileCopyrightText: © 2025 Tenstorrent AI ULC
+# SPDX-License-Identifier: Apache-2.0
+
+import tempfile
+import unittest
+from pathlib import Path
+
+import riescue.lib.enums as RV
+from riescue.dtest_framework.config import FeatMgr
+from riescue.dtest_framework.generator.elaboration_cache import CachedElaboration, ElaborationCache
+from riescue.dtest_framework.parser import ParsedRandomData
+from riescue.dtest_framework.pool import Pool
+from tests.dtest_framework.synthetic import elaborate, write_synthetic_test
+
+
+class ElaborationCacheTest(unittest.TestCase):
+    """Test incremental elaboration key and cache storage"""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.run_dir = Path(self.tmp.name)
+        self.pool = Pool()
+        self.pool.testname = "test"
+        self.pool.add_parsed_data(ParsedRandomData(name="data1", type="bits20", and_mask=0xFFFFFFFFFFFFFFFF, or_mask=0))
+        self.featmgr = FeatMgr()
+        self.header = ["#include <foo.h>\n", ";#test.priv machine\n"]
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def key(self, seed: int = 1) -> str:
+        return ElaborationCache.compute_key(self.pool, self.featmgr, seed, self.header)
+
+    def test_key_is_stable(self):
+        self.assertEqual(self.key(), self.key())
+
+    def test_key_changes_with_seed(self):
+        self.assertNotEqual(self.key(seed=1), self.key(seed=2))
+
+    def test_key_changes_with_parsed_directives(self):
+        key = self.key()
+        self.pool.add_parsed_data(ParsedRandomData(name="data2", type="bits8", and_mask=0xFF, or_mask=0))
+        self.assertNotEqual(key, self.key())
+
+    def test_key_changes_with_featmgr(self):
+        key = self.key()
+        self.featmgr.paging_mode = RV.RiscvPagingModes.SV39
+        self.assertNotEqual(key, self.key())
+
+    def test_key_changes_with_header(self):
+        key = self.key()
+        self.header.append(".equ FOO, 1\n")
+        self.assertNotEqual(key, self.key())
+
+    def test_store_and_load(self):
+        cache = ElaborationCache.for_test(self.run_dir, "test")
+        elaboration = CachedElaboration(
+            key=self.key(),
+            prefix_lines=['#include "rvmodel_macros.h"', '.include "test_equates.inc"'],
+            prefix_tail="",
+            section_code_found=False,
+            include_files={"test_equates.inc": ".equ data1, 0x1\n"},
+            linker_script='OUTPUT_ARCH("riscv")\n',
+            pte_pagesizes={"lin1": ["S4KB", None, None]},
+        )
+        cache.store(elaboration)
+        self.assertEqual(cache.load(self.key()), elaboration)
+
+    def test_load_key_mismatch(self):
+        cache = ElaborationCache.for_test(self.run_dir, "test")
+        cache.store(CachedElaboration(key=self.key(seed=1), prefix_lines=[], prefix_tail="", section_code_found=False))
+        self.assertIsNone(cache.load(self.key(seed=2)))
+
+    def test_load_missing_or_corrupt(self):
+        cache = ElaborationCache.for_test(self.run_dir, "test")
+        self.assertIsNone(cache.load(self.key()))
+        cache.cache_file.write_text("{not json")
+        self.assertIsNone(cache.load(self.key()))
+
+
+class IncrementalElaborationTest(unittest.TestCase):
+    """Test that --incremental re-elaboration matches a full elaboration"""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.tmp_dir = Path(self.tmp.name)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_body_edit_matches_full_elaboration(self):
+        "Editing only the test body reuses the cached elaboration, and the output matches elaborating the edited test from scratch"
+        testfile = write_synthetic_test(self.tmp_dir / "incremental.s", num_tests=3, body_lines=8, num_pages=4)
+        incremental_dir = self.tmp_dir / "incremental"
+        full_dir = self.tmp_dir / "full"
+        incremental_dir.mkdir()
+        full_dir.mkdir()
+
+        elaborate(testfile, incremental_dir, seed=2, incremental=True)
+        testfile.write_text(testfile.read_text().replace("test0001:\n", "test0001:\n    nop\n"))
+        with self.assertLogs("riescue.dtest_framework.generator.generator", level="INFO") as logs:
+            elaborate(testfile, incremental_dir, seed=2, incremental=True)
+        self.assertTrue(any("Reusing cached elaboration" in line for line in logs.output))
+        elaborate(testfile, full_dir, seed=2)
+
+        full_files = sorted(path.name for path in full_dir.iterdir())
+        self.assertEqual(sorted(path.name for path in incremental_dir.iterdir() if not path.name.endswith(".elab_cache.json")), full_files)
+        for name in full_files:
+            with self.subTest(file=name):
+                self.assertEqual((incremental_dir / name).read_text(), (full_dir / name).read_text())
+        self.assertIn("test0001:\n    nop\n", (full_dir / "incremental.S").read_text())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,73 @@
+# SPDX-FileCopyrightText: © 2025 Tenstorrent AI ULC
+# SPDX-License-Identifier: Apache-2.0
+
+import re
+import tempfile
+import unittest
+from pathlib import Path
+
+from riescue.dtest_framework.generator.assembly_writer import _plan_load_segments
+from tests.dtest_framework.synthetic import elaborate
+
+TEST_FILE = Path(__file__).parents[3] / "riescue/dtest_framework/tests/test.s"
+DRAM = [(0x8000_0000, 0xFFFF_FFFF)]
+
+
+class PlanLoadSegmentsTest(unittest.TestCase):
+    def test_contiguous(self):
+        "Sections a page apart share a segment"
+        sections = [("a", 0x8000_0000, 0x8000_0000), ("b", 0x8000_1000, 0x8000_1000), ("c", 0x8000_3000, 0x8000_3000)]
+        self.assertEqual(_plan_load_segments(sections), ([0, 0, 1], 0))
+
+    def test_gap(self):
+        sections = [("a", 0x8000_0000, 0x8000_0000), ("b", 0x8000_3000, 0x8000_3000), ("c", 0x8001_0000, 0x8001_0000)]
+        self.assertEqual(_plan_load_segments(sections, max_gap=0x2000, dram_ranges=DRAM), ([0, 0, 1], 0x2000))
+        self.assertEqual(_plan_load_segments(sections, max_gap=0x10000, dram_ranges=DRAM), ([0, 0, 0], 0xE000))
+        self.assertEqual(_plan_load_segments(sections, max_gap=0x10000), ([0, 1, 2], 0), "No padding without DRAM ranges")
+
+    def test_not_mergeable(self):
+        sections = [
+            ("a", 0x1000_0000, 0x8000_0000),
+            ("b", 0x1000_1000, 0x9000_1000),  # different VMA to LMA offset
+            ("c", 0x1000_3000, 0x9000_3000),  # section d is loaded between b and c
+            ("d", 0x2000_0000, 0x9000_2000),
+        ]
+        self.assertEqual(_plan_load_segments(sections, max_gap=0x10000, dram_ranges=DRAM), ([0, 1, 2, 3], 0))
+
+    def test_padding_stays_in_dram(self):
+        sections = [("a", 0x7FFF_0000, 0x7FFF_0000), ("b", 0x8000_0000, 0x8000_0000)]
+        self.assertEqual(_plan_load_segments(sections, max_gap=0x10000, dram_ranges=DRAM), ([0, 1], 0))
+
+    def test_max_segments(self):
+        "Smallest gaps are merged first to meet the cap"
+        sections = [("a", 0x8000_0000, 0x8000_0000), ("b", 0x8000_4000, 0x8000_4000), ("c", 0x8000_6000, 0x8000_6000), ("d", 0x9000_0000, 0x9000_0000)]
+        self.assertEqual(_plan_load_segments(sections, max_segments=3, dram_ranges=DRAM), ([0, 1, 1, 2], 0x1000))
+        self.assertEqual(_plan_load_segments(sections, max_segments=1, dram_ranges=DRAM), ([0, 0, 0, 1], 0x4000), "Gaps over 1MiB aren't padded to meet the cap")
+
+
+class LinkerScriptTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.run_dir = Path(self.tmp.name)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def linker_script(self, **featmgr_overrides) -> tuple[list[int], list[str]]:
+        "Section VMAs in order and segment of each section"
+        generated_files = elaborate(TEST_FILE, self.run_dir, seed=3, **featmgr_overrides)
+        text = generated_files.linker_script.read_text()
+        vmas = [int(vma, 16) for vma in re.findall(r"\. = (0x[0-9a-f]+);", text)]
+        segments = re.findall(r":(seg\d+)\n", text)
+        self.assertEqual(len(re.findall(r"PT_LOAD", text)), len(set(segments)))
+        return vmas, segments
+
+    def test_sorted_sections(self):
+        vmas, segments = self.linker_script()
+        self.assertEqual(vmas, sorted(vmas))
+        self.assertEqual(segments, sorted(segments, key=lambda seg: int(seg[3:])), "Segments are in address order")
+
+    def test_segment_gap(self):
+        _, segments = self.linker_script()
+        _, gap_segments = self.linker_script(linker_segment_gap=0x100000)
+        self.assertLessEqual(len(set(gap_segments)), len(set(segments)))
@@ -0,0 +1,56 @@
+# SPDX-FileCopyrightText: © 2025 Tenstorrent AI ULC
+# SPDX-License-Identifier: Apache-2.0
+
+import re
+import tempfile
+import unittest
+from pathlib import Path
+
+from tests.dtest_framework.synthetic import elaborate, write_synthetic_test
+
+
+class BulkRandomDataTest(unittest.TestCase):
+    """Test ;#random_data generation with --bulk_random_data"""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.tmp_dir = Path(self.tmp.name)
+        testfile = write_synthetic_test(self.tmp_dir / "data.s", num_tests=1, body_lines=4, num_pages=8)
+        extra = ";#random_data(name=masked, type=bits16, and_mask=0xff0, or_mask=0x10001)\n" ";#random_data(name=flt, type=fp32)\n" ";#random_data(name=num, type=int8)\n"
+        testfile.write_text(testfile.read_text().replace(";#random_data(name=data0,", extra + ";#random_data(name=data0,"))
+        self.testfile = testfile
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def random_data(self, name: str, seed: int = 3, **featmgr_overrides) -> dict[str, int]:
+        "Values of the ;#random_data equates"
+        run_dir = self.tmp_dir / name
+        run_dir.mkdir()
+        assembly = elaborate(self.testfile, run_dir, seed=seed, single_assembly_file=True, **featmgr_overrides).assembly.read_text()
+        section = assembly.split("# Test random data:")[1].split("\n\n")[0]
+        return {name: int(value, 16) for name, value in re.findall(r"^\.equ (\w+)\s*, (0x[0-9a-f]+)$", section, re.MULTILINE)}
+
+    def test_masks(self):
+        data = self.random_data("bulk", bulk_random_data=True)
+        self.assertEqual(set(data), {"masked", "flt", "num"} | {f"data{i}" for i in range(8)})
+        self.assertEqual(data["masked"] & ~0xFF0, 0x1, "or_mask is truncated to 16 bits")
+        self.assertLess(data["flt"], 1 << 32)
+        self.assertLess(data["num"], 1 << 8)
+        for i in range(8):
+            self.assertEqual(data[f"data{i}"] & 0xF, 0)
+            self.assertLess(data[f"data{i}"], 1 << 32)
+
+    def test_deterministic(self):
+        "Same seed gives the same values, a different seed gives different values"
+        data = [self.random_data(name, seed, bulk_random_data=True) for name, seed in [("a", 3), ("b", 3), ("c", 4)]]
+        self.assertEqual(data[0], data[1])
+        self.assertNotEqual(data[0], data[2])
+
+    def test_default_unchanged(self):
+        "Without the flag values come from the test's RandNum, so bulk generation doesn't shift existing seeds"
+        self.assertNotEqual(self.random_data("default"), self.random_data("bulk", bulk_random_data=True))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,68 @@
+# SPDX-FileCopyrightText: © 2025 Tenstorrent AI ULC
+# SPDX-License-Identifier: Apache-2.0
+
+import re
+import tempfile
+import unittest
+from pathlib import Path
+
+from tests.dtest_framework.synthetic import elaborate, write_synthetic_test
+
+
+class RandomFillTest(unittest.TestCase):
+    """Test ;#random_fill expansion in the generated assembly"""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.tmp_dir = Path(self.tmp.name)
+        testfile = write_synthetic_test(self.tmp_dir / "fill.s", num_tests=1, body_lines=4, num_pages=1)
+        fills = "    ;#random_fill(type=fp32, count=20)\n" "    ;#random_fill(type=bits16, count=3, and_mask=0xff0, or_mask=0x1)\n" "    ;#random_fill(type=int64, count=4, incbin=1)\n"
+        testfile.write_text(testfile.read_text().replace(";#init_memory @lin0\n", ";#init_memory @lin0\n" + fills))
+        self.testfile = testfile
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def elaborate(self, name: str, seed: int = 3, **featmgr_overrides) -> str:
+        run_dir = self.tmp_dir / name
+        run_dir.mkdir()
+        return elaborate(self.testfile, run_dir, seed=seed, **featmgr_overrides).assembly.read_text()
+
+    def test_expansion(self):
+        assembly = self.elaborate("run")
+        words = re.findall(r"^\.word (.*)$", assembly, re.MULTILINE)
+        self.assertEqual(sum(len(line.split(",")) for line in words), 20)
+        halves = re.search(r"^\.half (.*)$", assembly, re.MULTILINE)
+        assert halves is not None
+        self.assertTrue(all(int(v, 16) & 0xF00F == 0x1 for v in halves.group(1).split(",")))
+        incbin = self.tmp_dir / "run" / "fill_random_fill_2.bin"
+        self.assertIn(f'.incbin "{incbin.name}"', assembly)
+        self.assertEqual(incbin.stat().st_size, 4 * 8)
+
+    def test_incbin_byte_order(self):
+        "The .bin file holds the same values as the data directives, in the target's byte order"
+        values = []
+        for name, big_endian in [("little", False), ("big", True)]:
+            self.elaborate(name, big_endian=big_endian)
+            values.append((self.tmp_dir / name / "fill_random_fill_2.bin").read_bytes())
+        single = self.elaborate("single", single_assembly_file=True)
+        dwords = re.search(r"^\.dword (.*)$", single, re.MULTILINE)
+        assert dwords is not None
+        expected = [int(v, 16) for v in dwords.group(1).split(",")]
+        self.assertEqual([int.from_bytes(values[0][i : i + 8], "little") for i in range(0, 32, 8)], expected)
+        self.assertEqual([int.from_bytes(values[1][i : i + 8], "big") for i in range(0, 32, 8)], expected)
+
+    def test_deterministic(self):
+        "Same seed gives the same data, a different seed gives different data"
+        data = [re.findall(r"^\.(?:word|half) .*$", self.elaborate(name, seed), re.MULTILINE) for name, seed in [("a", 3), ("b", 3), ("c", 4)]]
+        self.assertEqual(data[0], data[1])
+        self.assertNotEqual(data[0], data[2])
+
+    def test_single_assembly_file_inlines_incbin(self):
+        assembly = self.elaborate("single", single_assembly_file=True)
+        self.assertNotIn(".incbin", assembly)
+        self.assertEqual(len(re.findall(r"^\.dword 0x[0-9a-f]{16}(, 0x[0-9a-f]{16}){3}$", assembly, re.MULTILINE)), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
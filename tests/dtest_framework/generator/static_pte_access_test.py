@@ -0,0 +1,176 @@
+# SPDX-FileCopyrightText: © 2025 Tenstorrent AI ULC
+# SPDX-License-Identifier: Apache-2.0
+
+import tempfile
+import unittest
+from pathlib import Path
+from typing import Optional
+from unittest.mock import patch
+
+from riescue.dtest_framework.generator.assembly_writer import AssemblyWriter
+from riescue.dtest_framework.lib.page_map import PageMap
+from tests.dtest_framework.synthetic import elaborate
+
+TEST_FILE = """\
+;#test.name       static_pte
+;#test.author     unittest
+;#test.arch       rv64
+;#test.priv       super
+;#test.env        virtualized
+;#test.cpus       1
+;#test.paging     sv39
+;#test.paging_g   sv48
+;#test.category   arch
+;#test.class      pte
+;#test.features   ext_v.enable ext_fp.disable
+;#test.tags       pte
+
+;#random_addr(name=lin1,  type=linear,   size=0x1000, and_mask=0xfffffffffffff000)
+;#random_addr(name=phys1, type=physical, size=0x1000, and_mask=0xfffffffffffff000)
+;#page_mapping(lin_name=lin1, phys_name=phys1, v=1, r=1, w=1, a=1, d=1, pagesize=['4kb'], gstage_vs_leaf_pagesize=['4kb'])
+
+;#random_addr(name=lin2,  type=linear,   size=0x200000, and_mask=0xffffffffffe00000)
+;#random_addr(name=phys2, type=physical, size=0x200000, and_mask=0xffffffffffe00000)
+;#page_mapping(lin_name=lin2, phys_name=phys2, v=1, r=1, w=1, a=1, d=1, pagesize=['2mb'], gstage_vs_leaf_pagesize=['2mb'])
+
+;#random_addr(name=lin3,  type=linear,   size=0x10000, and_mask=0xffffffffffff0000)
+;#random_addr(name=phys3, type=physical, size=0x10000, and_mask=0xffffffffffff0000)
+;#page_mapping(lin_name=lin3, phys_name=phys3, v=1, r=1, w=1, a=1, d=1, pagesize=['64kb'], gstage_vs_leaf_pagesize=['4kb'])
+
+.section .code, "ax"
+
+test_setup:
+    ;#test_passed()
+
+;#discrete_test(test=test01)
+test01:
+    ;#read_pte(lin1, leaf)
+    ;#read_pte(lin2, 0)
+    ;#read_pte(lin3, leaf, leaf)
+    li t2, 0
+    ;#write_pte(lin1, nonleaf)
+    ;#write_pte(lin1, 3)
+    ;#test_passed()
+
+test_cleanup:
+    ;#test_passed()
+
+.section .data
+my_data:
+    .dword 0xc001c0de
+"""
+
+
+def simulate_walk(memory: dict[int, int], satp_root: int, hgatp_root: int, va: int, level: int, g_level: Optional[int], max_levels: int, g_max_levels: int) -> Optional[int]:
+    "Model of the runtime page table walk in SysCalls._generate_pte_walk, returns the address of the final PTE or None if it reads outside the page tables"
+
+    def walk(address: int, root: int, target: int, levels: int) -> Optional[int]:
+        table = root
+        for current in range(target + 1):
+            entry = table + ((address >> (12 + 9 * (levels - 1 - current))) & 0x1FF) * 8
+            if current == target:
+                return entry
+            if entry not in memory:
+                return None
+            table = (memory[entry] >> 10) << 12
+        return None
+
+    pte = walk(va, satp_root, level, max_levels)
+    if pte is None or g_level is None:
+        return pte
+    return walk(pte, hgatp_root, g_level, g_max_levels)
+
+
+class StaticPteAccessTest(unittest.TestCase):
+    """Test ``static_pte_access`` resolution of ;#read_pte/;#write_pte targets"""
+
+    @classmethod
+    def setUpClass(cls):
+        "Elaborate the test with and without static_pte_access, keeping the writer of the static run"
+        writers: list[AssemblyWriter] = []
+        write = AssemblyWriter.write
+
+        def capture_writer(self, *args, **kwargs):
+            writers.append(self)
+            return write(self, *args, **kwargs)
+
+        with tempfile.TemporaryDirectory() as tmp:
+            tmp_dir = Path(tmp)
+            testfile = tmp_dir / "static_pte.s"
+            testfile.write_text(TEST_FILE)
+            (tmp_dir / "static").mkdir()
+            (tmp_dir / "walk").mkdir()
+            with patch.object(AssemblyWriter, "write", capture_writer):
+                static_files = elaborate(testfile, tmp_dir / "static", seed=5, static_pte_access=True)
+            walk_files = elaborate(testfile, tmp_dir / "walk", seed=5)
+            cls.static_assembly = static_files.assembly.read_text()
+            cls.static_syscalls = (tmp_dir / "static" / "static_pte_syscalls.inc").read_text()
+            cls.walk_assembly = walk_files.assembly.read_text()
+            cls.walk_syscalls = (tmp_dir / "walk" / "static_pte_syscalls.inc").read_text()
+            cls.writer = writers[0]
+            cls.cached = cls.writer.export_elaboration("key", static_files)
+
+    def test_matches_runtime_walk(self):
+        "Every resolved address is the PTE the runtime walk would reach"
+        pool = self.writer.pool
+        os_map: PageMap = pool.get_page_map("map_os")
+        hyp_map: PageMap = pool.get_page_map("map_hyp")
+        memory: dict[int, int] = {}
+        for page_map in (os_map, hyp_map):
+            for walk in page_map.pte_index.values():
+                for pt_entry in walk.entries:
+                    assert pt_entry.address is not None
+                    memory[pt_entry.address] = pt_entry.get_value()
+
+        resolved = 0
+        for lin_name in ("lin1", "lin2", "lin3"):
+            va = os_map.pages[lin_name].lin_addr
+            assert va is not None
+            for level in range(os_map.max_levels + 1):
+                for g_level in [None, *range(hyp_map.max_levels)]:
+                    pte_address = self.writer._get_static_pte_address(lin_name, level, g_level)
+                    if pte_address is None:
+                        continue
+                    resolved += 1
+                    expected = simulate_walk(memory, os_map.sptbr, hyp_map.sptbr, va, level, g_level, os_map.max_levels, hyp_map.max_levels)
+                    self.assertEqual(pte_address, expected, f"{lin_name} level {level} g_level {g_level}")
+        self.assertGreater(resolved, 0)
+
+    def test_leaf_entries_resolved(self):
+        pool = self.writer.pool
+        os_map: PageMap = pool.get_page_map("map_os")
+        for lin_name in ("lin1", "lin2", "lin3"):
+            walk = os_map.get_pte_walk(lin_name)
+            assert walk is not None
+            leaf_level = os_map.max_levels - 1 - walk.entries[-1].level
+            self.assertIsNotNone(self.writer._get_static_pte_address(lin_name, 0, None), lin_name)
+            self.assertIsNotNone(self.writer._get_static_pte_address(lin_name, leaf_level, None), lin_name)
+            self.assertIsNone(self.writer._get_static_pte_address(lin_name, leaf_level + 1, None), lin_name)
+        self.assertIsNone(self.writer._get_static_pte_address("not_a_page", 0, None))
+
+    def test_cached_addresses(self):
+        "Incremental elaboration reuses the resolved addresses"
+        self.assertIn("lin3,1,0", self.cached.pte_addresses)
+        for key, pte_address in self.cached.pte_addresses.items():
+            lin_name, level, g_level = key.split(",")
+            self.assertEqual(self.writer._get_static_pte_address(lin_name, int(level), int(g_level) if g_level != "-1" else None), pte_address, key)
+
+    def test_directives_use_static_syscalls(self):
+        "Known targets use the single access syscalls, unknown targets fall back to the walk"
+        self.assertEqual(self.static_assembly.count("li x31, 0xf0001009"), 3)
+        self.assertEqual(self.static_assembly.count("li x31, 0xf000100a"), 1)
+        self.assertEqual(self.static_assembly.count("li x31, 0xf0001008"), 1)
+        self.assertNotIn("li x31, 0xf0001007", self.static_assembly)
+        self.assertIn("syscalls__os_fn_f0001009:", self.static_syscalls)
+        self.assertIn("syscalls__os_fn_f000100a:", self.static_syscalls)
+        self.assertIn("hfence.gvma", self.static_syscalls)
+
+    def test_default_uses_walk(self):
+        self.assertEqual(self.walk_assembly.count("li x31, 0xf0001007"), 3)
+        self.assertEqual(self.walk_assembly.count("li x31, 0xf0001008"), 2)
+        self.assertNotIn("0xf0001009", self.walk_assembly)
+        self.assertNotIn("os_fn_f0001009", self.walk_syscalls)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,80 @@
+# SPDX-FileCopyrightText: © 2025 Tenstorrent AI ULC
+# SPDX-License-Identifier: Apache-2.0
+
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from riescue.dtest_framework.generator import Generator
+from riescue.dtest_framework.lib.page_map import PageMap
+from riescue.dtest_framework.pool import Pool
+from tests.dtest_framework.synthetic import PACKAGE_PATH, elaborate
+
+
+class PteIndexTest(unittest.TestCase):
+    """Test the page table walk index built by PageMap.create_pagetables"""
+
+    @classmethod
+    def setUpClass(cls):
+        "Elaborate a virtualized test once and keep its pool"
+        pools: list[Pool] = []
+        generate = Generator.generate
+
+        def capture_pool(self, *args, **kwargs):
+            pools.append(self.pool)
+            return generate(self, *args, **kwargs)
+
+        with tempfile.TemporaryDirectory() as tmp, patch.object(Generator, "generate", capture_pool):
+            elaborate(PACKAGE_PATH / "dtest_framework/tests/test_vs_gstage.s", Path(tmp), seed=3)
+        cls.pool = pools[0]
+        cls.vs_map: PageMap = cls.pool.get_page_map("map_os")
+        cls.g_map: PageMap = cls.pool.get_page_map("map_hyp")
+
+    def test_every_page_indexed(self):
+        for page_map in (self.vs_map, self.g_map):
+            self.assertEqual(set(page_map.pte_index), set(page_map.pages))
+
+    def test_entry_addresses_follow_walk(self):
+        "Each entry lives in the table pointed to by the previous entry, starting at the root table"
+        for page_map in (self.vs_map, self.g_map):
+            for name, walk in page_map.pte_index.items():
+                table_base = page_map.sptbr
+                for pt_entry in walk.entries:
+                    self.assertIsNotNone(pt_entry.address, name)
+                    self.assertEqual(pt_entry.address & ~0xFFF, table_base & ~0xFFF, f"{name} level {pt_entry.level}")
+                    table_base = pt_entry.get_base_addr()
+
+    def test_g_stage_linked(self):
+        "Every vs-stage entry points to a guest physical address mapped by the g-stage map"
+        walk = self.vs_map.get_pte_walk("lin1")
+        assert walk is not None
+        self.assertEqual(walk.page.name, "lin1")
+        for name, walk in self.vs_map.pte_index.items():
+            for pt_entry in walk.entries:
+                g_walk = walk.g_stage.get(pt_entry.level)
+                self.assertIsNotNone(g_walk, f"{name} level {pt_entry.level}")
+                assert g_walk is not None
+                self.assertIs(self.g_map.get_pte_walk(g_walk.page.name), g_walk)
+
+    def test_g_stage_debug_comments(self):
+        "The g-stage map lists the g-stage page of each linked vs-stage entry"
+        comments = list(self.g_map.generate_page_debug_comments())
+        walk = self.vs_map.get_pte_walk("lin1")
+        assert walk is not None
+        start = comments.index("\n#g-stage for map: map_os, page: lin1")
+        for offset, (level, g_walk) in enumerate(walk.g_stage.items(), start=1):
+            self.assertTrue(comments[start + offset].startswith(f"#level: {level}: g_page: {g_walk.page.name}, "), comments[start + offset])
+        self.assertFalse(any(c.startswith("\n#g-stage") for c in self.vs_map.generate_page_debug_comments()))
+
+    def test_entry_at_level(self):
+        walk = self.vs_map.get_pte_walk("lin1")
+        assert walk is not None
+        leaf = walk.entries[-1]
+        self.assertIs(walk.entry_at_level(leaf.level), leaf)
+        self.assertIsNone(walk.entry_at_level(self.vs_map.max_levels))
+        self.assertIsNone(self.vs_map.get_pte_walk("not_a_page"))
+
+
+if __name__ == "__main__":
+    unittest.main()
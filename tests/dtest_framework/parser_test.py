@@ -0,0 +1,120 @@
+# SPDX-FileCopyrightText: © 2025 Tenstorrent AI ULC
+# SPDX-License-Identifier: Apache-2.0
+
+import tempfile
+import unittest
+from pathlib import Path
+
+from riescue.dtest_framework.parser import Parser
+from riescue.dtest_framework.pool import Pool
+
+
+class ParserDispatchTest(unittest.TestCase):
+    """Test directive dispatch in Parser.parse"""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.pool = Pool()
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def parse(self, text: str) -> Parser:
+        testfile = Path(self.tmp.name) / "test.s"
+        testfile.write_text(text)
+        parser = Parser(testfile, pool=self.pool)
+        parser.parse()
+        return parser
+
+    def test_directives_dispatched(self):
+        self.parse(
+            ";#test.priv machine\n"
+            ";#random_data(name=data1, type=bits32, and_mask=0xff)\n"
+            ";#random_addr(name=lin1, type=linear48, size=0x1000, and_mask=0xfffffffffffff000)\n"
+            ";#discrete_test(test=test01)\n"
+            '.section .code, "ax"\n'
+        )
+        self.assertEqual(self.pool.get_test_header().priv.strip(), "machine")
+        self.assertIn("data1", self.pool.get_parsed_data())
+        self.assertEqual(self.pool.get_parsed_addrs()["lin1"].addr_bits, 48)
+        self.assertEqual(self.pool.parsed_discrete_tests, {"test01": "test01"})
+        self.assertEqual(self.pool.parsed_sections, ["code"])
+
+    def test_indented_directives(self):
+        "Only code-level directives like ;#csr_rw are recognized when indented"
+        self.parse("    ;#csr_rw(mstatus, read)\n    ;#random_data(name=data1, type=bits32)\n")
+        self.assertIn("mstatus", self.pool.parsed_csr_accesses)
+        self.assertNotIn("data1", self.pool.get_parsed_data())
+
+    def test_similar_directive_names(self):
+        "Directives sharing a prefix dispatch to their own handler"
+        self.parse(";#page_map(name=map1, mode=sv39)\n;#test.name foo\n;#tests_unknown(foo)\n")
+        self.assertIn("map1", self.pool.parsed_page_maps)
+        self.assertEqual(len(self.pool.raw_parsed_page_mappings), 0)
+
+    def test_discrete_debug_test_body(self):
+        self.parse(";#discrete_debug_test()\n    li t0, 1\n    ebreak\n.section .data\n")
+        self.assertEqual(self.pool.get_parsed_discrete_debug_test(), ["    li t0, 1", "    ebreak"])
+        self.assertEqual(self.pool.parsed_sections, ["data"])
+
+    def test_random_fill(self):
+        self.parse(";#init_memory @lin1\n    ;#random_fill(type=fp32, count=0x10)\n    ;#random_fill(type=bits12, count=4, and_mask=0xff0, incbin=1)\n")
+        fills = self.pool.get_parsed_random_fills()
+        self.assertEqual([(f.data_type, f.count, f.incbin) for f in fills], [("fp32", 16, False), ("bits12", 4, True)])
+        self.assertEqual(fills[1].and_mask, 0xFF0)
+        with self.assertRaises(ValueError):
+            self.parse(";#random_fill(type=fp32)\n")
+
+
+class ParserMemoryDirectiveTest(unittest.TestCase):
+    """Test that the add_* helpers build the same pool entries as parsing the directive text"""
+
+    MEMORY = (
+        ";#random_addr(name=lin1, type=linear, size=0x2000, and_mask=0xffffffffffe00000, or_mask=0x100)\n"
+        ";#random_addr(name=phys1, type=physical, size=0x1000, and_mask=0xffffffffffe00000, pma_memory_type=wb)\n"
+        ";#reserve_memory(name=res1, start_addr=0x80000000, type=linear, size=0x2000)\n"
+        ";#page_mapping(lin_name=lin1, phys_name=phys1, pagesize=['4kb', '2mb'], v=1, r=1, w=0, modify_pt=1, v_nonleaf=1, d_nonleaf=0, "
+        "gstage_vs_leaf_pagesize=['4kb'], gstage_vs_nonleaf_pagesize=['4kb'], pbmt_leaf_gleaf=2, u_leaf_gleaf=0, secure=1)\n"
+        ";#page_mapping(lin_name=lin1+0x1000, phys_name=phys1+0x1000, pagesize=['4kb'], page_maps=[map1, map2])\n"
+        ";#init_memory @lin1\n"
+    )
+
+    def parse(self, pool: Pool, **kwargs) -> None:
+        Parser(Path("test.s"), pool=pool, lines=self.MEMORY.splitlines(keepends=True), **kwargs).parse()
+
+    @staticmethod
+    def entries(pool: Pool) -> list:
+        page_mappings = [{k: v for k, v in vars(ppm).items() if k not in ("source_line", "pagemap_str")} for ppm in pool.get_raw_parsed_page_mappings()]
+        return [pool.get_parsed_addrs(), pool.get_parsed_res_mems(), page_mappings]
+
+    def test_add_matches_parse(self):
+        parsed = Pool()
+        self.parse(parsed)
+        built = Pool()
+        parser = Parser(Path("test.s"), pool=built, lines=[])
+        parser.add_random_addr({"name": "lin1", "type": "linear", "size": "0x2000", "and_mask": "0xffffffffffe00000", "or_mask": "0x100"})
+        parser.add_random_addr({"name": "phys1", "type": "physical", "size": "0x1000", "and_mask": "0xffffffffffe00000", "pma_memory_type": "wb"})
+        parser.add_reserve_memory({"name": "res1", "start_addr": "0x80000000", "type": "linear", "size": "0x2000"})
+        first = {"lin_name": "lin1", "phys_name": "phys1", "pagesize": "['4kb','2mb']", "v": "1", "r": "1", "w": "0", "modify_pt": "1", "v_nonleaf": "1", "d_nonleaf": "0"}
+        first.update({"gstage_vs_leaf_pagesize": "['4kb']", "gstage_vs_nonleaf_pagesize": "['4kb']", "pbmt_leaf_gleaf": "2", "u_leaf_gleaf": "0", "secure": "1"})
+        parser.add_page_mapping(first)
+        parser.add_page_mapping({"lin_name": "lin1+0x1000", "phys_name": "phys1+0x1000", "pagesize": "['4kb']", "page_maps": "[map1,map2]"})
+        self.assertEqual(self.entries(built), self.entries(parsed))
+
+        ppm = parsed.get_raw_parsed_page_mappings()[0]
+        self.assertEqual((ppm.pagesizes, ppm.gstage_vs_leaf_pagesizes, ppm.gstage_vs_nonleaf_pagesizes), (["4kb", "2mb"], ["4kb"], ["4kb"]))
+        self.assertEqual((ppm.v_nonleaf, ppm.d_nonleaf, ppm.u_leaf_gleaf, ppm.pbmt_leaf_gleaf, ppm.modify_pt), (True, False, False, 2, 1))
+        self.assertTrue(parsed.get_parsed_addrs()["phys1"].secure)
+        self.assertEqual(parsed.get_raw_parsed_page_mappings()[1].page_maps, ["map1", "map2"])
+
+    def test_skip_memory_directives(self):
+        "A pool that already holds the memory directives isn't given duplicates, the rest of the test is still parsed"
+        pool = Pool()
+        self.parse(pool)
+        self.parse(pool, skip_directives=Parser.MEMORY_DIRECTIVES)
+        self.assertEqual(len(pool.get_raw_parsed_page_mappings()), 2)
+        self.assertEqual(pool.get_parsed_init_mem_addrs().count("lin1"), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,77 @@
+# SPDX-FileCopyrightText: © 2025 Tenstorrent AI ULC
+# SPDX-License-Identifier: Apache-2.0
+
+import shutil
+import subprocess
+import tempfile
+import unittest
+from pathlib import Path
+
+import riescue.lib.enums as RV
+from riescue.dtest_framework.runtime.variable.manager import VariableManager
+
+HART_COUNT = 8
+
+
+def variable_manager(compact: bool, hart_count: int = HART_COUNT) -> VariableManager:
+    manager = VariableManager(data_section_name="hart_context", xlen=RV.Xlen.XLEN64, hart_count=hart_count, amo_enabled=True, compact_hart_context=compact)
+    manager.register_hart_variable("check_excp_expected_pc", -1)
+    manager.register_hart_variable("gpr_save_area", value=0, element_count=32)
+    manager.register_hart_variable("scheduler__order", value=0x1_0000_0001, element_count=5)
+    manager.register_hart_variable("selfcheck_mode", value=3)
+    return manager
+
+
+def hart_context(manager: VariableManager) -> str:
+    return manager.allocate().split('.section .hart_context, "aw"')[1].split(".section .hart_stack_0")[0]
+
+
+class CompactHartContextTest(unittest.TestCase):
+    def test_text_independent_of_hart_count(self):
+        "Template lines don't grow with the number of harts, besides one equate per hart"
+        small, large = hart_context(variable_manager(True, 2)), hart_context(variable_manager(True, 256))
+        self.assertEqual(len(large.splitlines()) - len(small.splitlines()), 254)
+        self.assertLess(len(large.splitlines()), len(hart_context(variable_manager(False, 256)).splitlines()) // 10)
+
+    def test_single_hart_not_compact(self):
+        self.assertEqual(hart_context(variable_manager(True, 1)), hart_context(variable_manager(False, 1)))
+
+    def test_loader_sets_per_hart_fields(self):
+        manager = variable_manager(True)
+        code = manager.initialize(["mscratch"])
+        self.assertIn(f"sd t0, {manager.get_variable('mhartid').offset}(tp)", code)
+        self.assertIn("sd t0, 0(tp)", code)
+        self.assertIn(f".dword hart_stack_{HART_COUNT - 1}_end", code.split("hart_stack_end_table:")[1])
+        self.assertNotIn("hart_stack_end_table", variable_manager(False).initialize(["mscratch"]))
+
+    @unittest.skipIf(shutil.which("as") is None or shutil.which("objcopy") is None, "needs host binutils")
+    def test_same_layout(self):
+        "After the loader sets sp and mhartid, the template assembles to the same bytes as per-hart contexts"
+        per_hart, compact = (self.assemble(hart_context(variable_manager(compact))) for compact in (False, True))
+        self.assertEqual(len(per_hart), len(compact))
+
+        manager = variable_manager(True)
+        size = manager._hart_context.per_hart_size()
+        mhartid = manager.get_variable("mhartid").offset
+        for hart_id in range(HART_COUNT):
+            base = hart_id * size
+            compact[base : base + 8] = self.stack_end(hart_id).to_bytes(8, "little")
+            compact[base + mhartid : base + mhartid + 8] = hart_id.to_bytes(8, "little")
+        self.assertEqual(per_hart, compact)
+
+    def stack_end(self, hart_id: int) -> int:
+        return 0x8000_0000 + 0x1000 * (hart_id + 1)
+
+    def assemble(self, data: str) -> bytearray:
+        "Assemble with the host assembler; ``.dword`` is ``.quad`` there"
+        stack_ends = "".join(f".equ hart_stack_{hart_id}_end, 0x{self.stack_end(hart_id):x}\n" for hart_id in range(HART_COUNT))
+        with tempfile.TemporaryDirectory() as tmp:
+            source, obj, binary = Path(tmp, "context.s"), Path(tmp, "context.o"), Path(tmp, "context.bin")
+            source.write_text(stack_ends + ".data\n" + data.replace(".dword", ".quad") + "\n")
+            subprocess.run(["as", "-o", str(obj), str(source)], check=True)
+            subprocess.run(["objcopy", "-O", "binary", "-j", ".data", str(obj), str(binary)], check=True)
+            return bytearray(binary.read_bytes())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,59 @@
+# SPDX-FileCopyrightText: © 2025 Tenstorrent AI ULC
+# SPDX-License-Identifier: Apache-2.0
+
+import re
+import tempfile
+import unittest
+from pathlib import Path
+
+import riescue.lib.enums as RV
+from tests.dtest_framework.synthetic import elaborate, write_synthetic_test
+
+
+class SchedulerOrderTest(unittest.TestCase):
+    """Test the size of the single hart test sequence for each ``scheduler_order``"""
+
+    NUM_TESTS = 3
+    REPEAT_TIMES = 50
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.tmp_dir = Path(self.tmp.name)
+        self.testfile = write_synthetic_test(self.tmp_dir / "sched.s", num_tests=self.NUM_TESTS, body_lines=2, num_pages=1)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def scheduler_code(self, order: RV.SchedulerOrder, **featmgr_overrides) -> str:
+        run_dir = self.tmp_dir / order.name
+        run_dir.mkdir()
+        elaborate(self.testfile, run_dir, seed=1, scheduler_order=order, repeat_times=self.REPEAT_TIMES, **featmgr_overrides)
+        return (run_dir / "sched_scheduler.inc").read_text()
+
+    def test_sequence_entries(self):
+        "static stores every run, iterate and shuffle store each test once"
+        for order, expected in [
+            (RV.SchedulerOrder.STATIC, self.NUM_TESTS * self.REPEAT_TIMES),
+            (RV.SchedulerOrder.ITERATE, self.NUM_TESTS),
+            (RV.SchedulerOrder.SHUFFLE, self.NUM_TESTS),
+        ]:
+            with self.subTest(order=order):
+                code = self.scheduler_code(order)
+                sequence = code.split("os_test_sequence:")[1]
+                self.assertEqual(len(re.findall(r"\.dword test\d+", sequence)), expected)
+
+    def test_runtime_rounds(self):
+        "iterate and shuffle repeat at runtime, shuffle reorders each repetition"
+        iterate = self.scheduler_code(RV.SchedulerOrder.ITERATE)
+        self.assertIn(f"li t0, {self.REPEAT_TIMES} # setting num_rounds", iterate)
+        self.assertNotIn("scheduler__shuffle", iterate)
+        shuffle = self.scheduler_code(RV.SchedulerOrder.SHUFFLE)
+        self.assertIn("scheduler__shuffle_loop", shuffle)
+
+    def test_runtime_repeat_requires_single_hart(self):
+        with self.assertRaises(ValueError):
+            self.scheduler_code(RV.SchedulerOrder.SHUFFLE, linux_mode=True)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,95 @@
+# SPDX-FileCopyrightText: © 2026 Tenstorrent AI ULC
+# SPDX-License-Identifier: Apache-2.0
+
+import re
+import tempfile
+import unittest
+from pathlib import Path
+
+import riescue
+from riescue.dtest_framework.runtime.selfcheck import CheckResource
+from tests.dtest_framework.synthetic import elaborate, routine_size
+
+SELFCHECK_TEST = Path(riescue.__file__).parent / "dtest_framework/tests/test_selfcheck.s"
+
+
+class SelfcheckCompactTest(unittest.TestCase):
+    """Test the descriptor table and checksum loop generated with ``selfcheck_compact``"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.tmp = tempfile.TemporaryDirectory()
+        tmp_dir = Path(cls.tmp.name)
+        cls.run_dirs: dict[bool, Path] = {}
+        for compact in (False, True):
+            run_dir = tmp_dir / f"compact_{compact}"
+            run_dir.mkdir()
+            elaborate(SELFCHECK_TEST, run_dir, seed=0, selfcheck=True, selfcheck_compact=compact)
+            cls.run_dirs[compact] = run_dir
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.tmp.cleanup()
+
+    def selfcheck_code(self, compact: bool) -> str:
+        return (self.run_dirs[compact] / "test_selfcheck_selfcheck.inc").read_text()
+
+    def hart_variable(self, compact: bool, name: str) -> tuple[int, int]:
+        "Return the offset from the hart context and the element count of a hart variable"
+        equates = (self.run_dirs[compact] / "test_selfcheck_equates.inc").read_text()
+        offset = int(re.search(rf"{name},\s*hart_context \+ (\d+)", equates).group(1))
+        os_code = (self.run_dirs[compact] / "test_selfcheck_os.inc").read_text()
+        count = len(re.findall(rf"\.dword .*# {name}(?:\[\d+\])?$", os_code, flags=re.MULTILINE))
+        return offset, count
+
+    def test_segments_cover_checked_state(self):
+        "descriptors fold the GPR save area, then the snapshot of FP, vector CSR and vector state"
+        code = self.selfcheck_code(compact=True)
+        table = code.split("selfcheck__descriptors:")[1].split("selfcheck__descriptors_end:")[0]
+        segments = [(int(start), int(end)) for start, end in re.findall(r"\.dword (\d+), (\d+)", table)]
+
+        gpr_offset, gpr_count = self.hart_variable(True, "gpr_save_area")
+        snapshot_offset, snapshot_count = self.hart_variable(True, "selfcheck_snapshot")
+        self.assertEqual(snapshot_count, 32 + 3 + 32 * 4, "f0-f31, vtype/vl/vstart and v0-v31 with VLEN=256")
+        expected = [(gpr_offset, gpr_offset + 8 * gpr_count), (snapshot_offset, snapshot_offset + 8 * snapshot_count)]
+        if expected[0][1] == expected[1][0]:
+            expected = [(expected[0][0], expected[1][1])]
+        self.assertEqual(segments, expected)
+
+    def test_snapshot_in_fold_order(self):
+        "registers are copied to the snapshot in the order the unrolled code folds them"
+        unrolled = self.selfcheck_code(compact=False)
+        unrolled_order = re.findall(r"(?:fmv\.x\.d t0, |csrr t0, |vs1r\.v )(f\d+|v\d+|vtype|vl|vstart)\b", unrolled)
+        compact = self.selfcheck_code(compact=True)
+        compact_order = re.findall(r"(?:fmv\.x\.d t0, |csrr t0, |vs1r\.v )(f\d+|v\d+|vtype|vl|vstart)\b", compact)
+        self.assertEqual(compact_order, unrolled_order)
+        self.assertEqual(len(compact_order), 32 + 3 + 32)
+
+    def test_code_size(self):
+        "compact mode has a single fold sequence and no per-value code"
+        compact = self.selfcheck_code(compact=True)
+        self.assertEqual(compact.count("sltu t1, t5, t0"), 1)
+        self.assertNotIn("selfcheck_vec_scratch", compact)
+        compact_instructions, _ = routine_size(self.run_dirs[True] / "test_selfcheck_selfcheck.inc")
+        unrolled_instructions, _ = routine_size(self.run_dirs[False] / "test_selfcheck_selfcheck.inc")
+        self.assertLess(compact_instructions * 4, unrolled_instructions)
+
+
+class CheckResourceTest(unittest.TestCase):
+    def test_snapshot_code_required(self):
+        "A resource without snapshot code can't be created, rather than failing when compact mode elaborates"
+
+        class NoSnapshot(CheckResource):
+            def generate_checksum_update_code(self) -> str:
+                return ""
+
+            @property
+            def num_values(self) -> int:
+                return 1
+
+        with self.assertRaises(TypeError):
+            NoSnapshot()  # type: ignore[abstract]
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,55 @@
+# SPDX-FileCopyrightText: © 2025 Tenstorrent AI ULC
+# SPDX-License-Identifier: Apache-2.0
+
+import re
+import tempfile
+import unittest
+from pathlib import Path
+
+from tests.dtest_framework.synthetic import elaborate, write_synthetic_test
+
+
+class SyscallTableTest(unittest.TestCase):
+    """Test the jump tables used to dispatch syscalls"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.tmp = tempfile.TemporaryDirectory()
+        tmp_dir = Path(cls.tmp.name)
+        testfile = write_synthetic_test(tmp_dir / "sys.s", num_tests=2, body_lines=2, num_pages=1)
+        run_dir = tmp_dir / "run"
+        run_dir.mkdir()
+        elaborate(testfile, run_dir, seed=1)
+        cls.code = (run_dir / "sys_syscalls.inc").read_text()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.tmp.cleanup()
+
+    def jump_table(self, group: int) -> list[tuple[str, int]]:
+        "Return (handler, syscall number) for each entry in a group's jump table"
+        table = self.code.split(f"syscalls__syscall_jump_table_{group:x}:")[1].split(":")[0]
+        return [(handler, int(num, 16)) for handler, num in re.findall(r"\.dword (\S+)\s+# 0x([0-9a-f]+)", table)]
+
+    def test_entries_in_syscall_order(self):
+        "entry n - 1 of a group's table handles syscall (group << 12) | n"
+        for group in (0xF0000, 0xF0001, 0xF0002):
+            with self.subTest(group=hex(group)):
+                entries = self.jump_table(group)
+                self.assertTrue(entries)
+                self.assertEqual([num for _, num in entries], [(group << 12) | (i + 1) for i in range(len(entries))])
+        self.assertIn(("syscalls__os_fn_f0001004", 0xF0001004), self.jump_table(0xF0001))
+        self.assertIn(("syscalls__os_get_hart_context", 0xF0002001), self.jump_table(0xF0002))
+
+    def test_bounds_checked(self):
+        "each group checks the index against its table size and unknown syscalls restore the cause"
+        for group, size in ((0xF0000, 3), (0xF0001, 8), (0xF0002, 1)):
+            with self.subTest(group=hex(group)):
+                block = self.code.split(f"syscalls__syscall_group_{group:x}:")[1].split("jr t0")[0]
+                self.assertIn(f"li t1, {size}\n\tbgeu t0, t1, syscalls__syscall_not_found", block)
+        not_found = self.code.split("syscalls__syscall_not_found:")[1]
+        self.assertRegex(not_found, r"csrr t1, mcause")
+
+
+if __name__ == "__main__":
+    unittest.main()
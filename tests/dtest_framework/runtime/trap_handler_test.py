@@ -1,11 +1,15 @@
 # SPDX-FileCopyrightText: © 2025 Tenstorrent AI ULC
 # SPDX-License-Identifier: Apache-2.0
 
+import re
+import tempfile
 import unittest
 from pathlib import Path
 
 import riescue.lib.enums as RV
 from riescue.dtest_framework.runtime.trap_handler import InterruptHandler
+from riescue.dtest_framework.trap_context import TrapContext
+from tests.dtest_framework.synthetic import elaborate, write_synthetic_test
 
 
 class InterruptHandlerTest(unittest.TestCase):
@@ -170,5 +174,59 @@ class InterruptHandlerTest(unittest.TestCase):
                 self.assertEqual(isr.label, "clear_highest_priority_interrupt")
 
 
+def skip_instruction_handler(ctx: TrapContext) -> str:
+    return f"""
+    csrr t0, {ctx.xepc}
+    addi t0, t0, 4
+    csrw {ctx.xepc}, t0
+    {ctx.xret}
+    """
+
+
+class ExceptionOverrideDispatchTest(unittest.TestCase):
+    """
+    Test the xcause-indexed table used to dispatch FeatMgr exception handler overrides.
+    """
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.tmp_dir = Path(self.tmp.name)
+        self.testfile = write_synthetic_test(self.tmp_dir / "excp.s", num_tests=1, body_lines=2, num_pages=1)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def trap_handler_code(self, overrides: dict, **featmgr_overrides) -> str:
+        run_dir = self.tmp_dir / f"run{len(list(self.tmp_dir.iterdir()))}"
+        run_dir.mkdir()
+        handlers = {cause: (label, skip_instruction_handler) for cause, label in overrides.items()}
+        elaborate(self.testfile, run_dir, seed=1, exception_handler_overrides=handlers, medeleg=0, **featmgr_overrides)
+        return (run_dir / "excp_trap_handler_m.inc").read_text()
+
+    def test_table_indexed_by_cause(self):
+        """
+        Each cause up to the highest override has an entry; causes without an override fall through to save_context.
+        """
+        code = self.trap_handler_code({2: "my_illegal", 13: "my_load_page_fault"})
+        table = code.split("trap_handler_m__exception_override_table:")[1].split("\n\n")[0]
+        entries = re.findall(r"\.dword (\S+)\s+# cause (\d+)", table)
+        self.assertEqual([int(cause) for _, cause in entries], list(range(14)))
+        for label, cause in entries:
+            expected = {"2": "my_illegal", "13": "my_load_page_fault"}.get(cause, "trap_handler_m__exception_path_save_context")
+            self.assertEqual(label, expected)
+
+        dispatch = code.split("trap_handler_m__exception_path:")[1].split("trap_handler_m__exception_path_save_context:")[0]
+        self.assertIn("li t1, 14\n\tbgeu t0, t1, trap_handler_m__exception_path_save_context", dispatch)
+        self.assertNotIn("beq t0, t1", dispatch)
+
+    def test_no_overrides(self):
+        """
+        Without overrides no table is emitted and exceptions go straight to save_context.
+        """
+        code = self.trap_handler_code({})
+        self.assertNotIn("exception_override_table", code)
+        self.assertNotIn("exception_path_save_context", code)
+
+
 if __name__ == "__main__":
     unittest.main(verbosity=2)
@@ -0,0 +1,99 @@
+# SPDX-FileCopyrightText: © 2025 Tenstorrent AI ULC
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Test helpers shared by the unit tests and benchmarks: write synthetic RiescueD tests and elaborate them without a toolchain.
+"""
+
+from pathlib import Path
+
+import riescue
+from riescue.dtest_framework.artifacts import GeneratedFiles
+from riescue.dtest_framework.config import FeatMgr, FeatMgrBuilder
+from riescue.dtest_framework.generator import Generator
+from riescue.dtest_framework.lib.discrete_test import DiscreteTest
+from riescue.dtest_framework.parser import Parser
+from riescue.dtest_framework.pool import Pool
+from riescue.lib.rand import RandNum
+
+PACKAGE_PATH = Path(riescue.__file__).parent
+DEFAULT_CPU_CONFIG = PACKAGE_PATH / "dtest_framework/lib/config.json"
+
+
+def write_synthetic_test(path: Path, num_tests: int, body_lines: int, num_pages: int, paging: str = "sv39") -> Path:
+    """
+    Write a synthetic .rasm test.
+
+    :param path: Output path
+    :param num_tests: Number of ``;#discrete_test`` entries
+    :param body_lines: Instruction lines per discrete test
+    :param num_pages: Number of ``;#page_mapping`` entries, each with a ``;#random_addr`` pair and ``;#init_memory`` section
+    :param paging: Test paging mode
+    """
+    with open(path, "w") as f:
+        f.write(";#test.name       synthetic\n;#test.author     benchmark\n;#test.arch       rv64\n")
+        f.write(f";#test.priv       super\n;#test.env        bare_metal\n;#test.cpus       1\n;#test.paging     {paging}\n")
+        f.write(";#test.category   arch\n;#test.class      benchmark\n;#test.features   ext_v.enable ext_fp.disable\n;#test.tags       benchmark\n\n")
+        for i in range(num_pages):
+            f.write(f";#random_data(name=data{i}, type=bits32, and_mask=0xfffffff0)\n")
+            f.write(f";#random_addr(name=lin{i},  type=linear,   size=0x1000, and_mask=0xfffffffffffff000)\n")
+            f.write(f";#random_addr(name=phys{i}, type=physical, size=0x1000, and_mask=0xfffffffffffff000)\n")
+            f.write(f";#page_mapping(lin_name=lin{i}, phys_name=phys{i}, v=1, r=1, w=1, a=1, d=1, pagesize=['4kb'])\n")
+        f.write('\n.section .code, "ax"\n\ntest_setup:\n    ;#test_passed()\n\n')
+        for t in range(num_tests):
+            f.write(f";#discrete_test(test=test{t:04})\ntest{t:04}:\n")
+            for i in range(body_lines):
+                page = (t * body_lines + i) % max(num_pages, 1)
+                if num_pages and i % 4 == 0:
+                    f.write(f"    li t1, lin{page}\n    ld t2, 0(t1)\n")
+                else:
+                    f.write(f"    addi t{i % 3}, t{(i + 1) % 3}, {i % 2048}\n")
+            f.write("    ;#test_passed()\n\n")
+        f.write("test_cleanup:\n    ;#test_passed()\n\n.section .data\nmy_data:\n    .dword 0xc001c0de\n\n")
+        for i in range(num_pages):
+            f.write(f";#init_memory @lin{i}\n    .dword 0x{i:016x}\n\n")
+    return path
+
+
+def elaborate(testfile: Path, run_dir: Path, seed: int = 0, **featmgr_overrides) -> GeneratedFiles:
+    """
+    Elaborate a test the way ``RiescueD.generate`` does, without needing a toolchain.
+
+    :param featmgr_overrides: ``FeatMgr`` fields set after randomization, e.g. ``single_assembly_file=True``
+    """
+    rng = RandNum(seed)
+    pool = Pool()
+    pool.testname = testfile.stem
+    parser = Parser(testfile, pool=pool)
+    parser.parse()
+
+    builder = FeatMgrBuilder()
+    builder.with_test_header(parser.test_header)
+    builder.with_cpu_json(DEFAULT_CPU_CONFIG)
+    builder.with_vector_delegations(pool.parsed_vector_delegations)
+    featmgr: FeatMgr = builder.build(rng=rng)
+    for name, value in featmgr_overrides.items():
+        setattr(featmgr, name, value)
+    featmgr.rvmodel_macros = PACKAGE_PATH / "dtest_framework/lib/rvmodel_macros_htif.h"
+
+    for test in pool.parsed_discrete_tests:
+        pool.add_discrete_test(DiscreteTest(name=test, priv=featmgr.priv_mode))
+
+    generated_files = GeneratedFiles.from_testname(pool.testname, run_dir)
+    Generator(rng=rng, pool=pool, featmgr=featmgr, run_dir=run_dir).generate(file_in=testfile, generated_files=generated_files)
+    return generated_files
+
+
+def routine_size(selfcheck_inc: Path) -> tuple[int, int]:
+    "Return the number of instructions and the bytes of .dword data in the selfcheck routines"
+    instructions = 0
+    data_bytes = 0
+    for line in selfcheck_inc.read_text().splitlines():
+        line = line.split("#")[0].strip()
+        if not line or line.endswith(":"):
+            continue
+        if line.startswith(".dword"):
+            data_bytes += 8 * len(line.split(","))
+        elif not line.startswith("."):
+            instructions += 1
+    return instructions, data_bytes
@@ -0,0 +1,44 @@
+# SPDX-FileCopyrightText: © 2025 Tenstorrent AI ULC
+# SPDX-License-Identifier: Apache-2.0
+
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import MagicMock
+
+from riescue.riescued import RiescueD
+from riescue.lib.toolchain import Toolchain
+
+TEST_FILE = Path(__file__).parents[2] / "riescue/dtest_framework/tests/test.s"
+
+
+class TestSourceTest(unittest.TestCase):
+    "Tests held in memory generate the same code as tests read from a file"
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.tmp_dir = Path(self.tmp.name)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def generate(self, run_dir: Path, **kwargs) -> tuple[RiescueD, str]:
+        "Generated assembly, with the run directory replaced so runs can be compared"
+        rd = RiescueD(run_dir=run_dir, seed=5, toolchain=MagicMock(spec=Toolchain), **kwargs)
+        generated_files = rd.generate(rd.configure())
+        return rd, generated_files.assembly.read_text().replace(str(run_dir), "<run_dir>")
+
+    def test_same_as_file(self):
+        file_rd, expected = self.generate(self.tmp_dir / "file", testfile=TEST_FILE)
+        source_rd, generated = self.generate(self.tmp_dir / "source", testfile=Path("test.s"), test_source=TEST_FILE.read_text())
+        self.assertEqual(generated, expected)
+        self.assertEqual(source_rd.pool.parsed_discrete_tests.keys(), file_rd.pool.parsed_discrete_tests.keys())
+        self.assertFalse((self.tmp_dir / "source/test.s").exists(), "Test source shouldn't be written unless requested")
+
+    def test_write_testfile(self):
+        self.generate(self.tmp_dir, testfile=Path("test.s"), test_source=TEST_FILE.read_text(), write_testfile=True)
+        self.assertEqual((self.tmp_dir / "test.s").read_text(), TEST_FILE.read_text())
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
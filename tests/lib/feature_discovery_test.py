@@ -214,6 +214,23 @@ class TestFeatureDiscovery(unittest.TestCase):
             self.assertIn("enabled", config)
             self.assertIn("randomize", config)
 
+    def test_overlay(self):
+        """Overrides and randomization apply to a copy, leaving the original unchanged"""
+        fd = FeatureDiscovery.from_config(self.config_path)
+        overlay = fd.overlay("ext_zba.enable ext_v.disable")
+        self.assertTrue(overlay.is_feature_enabled("zba"))
+        self.assertFalse(overlay.is_feature_enabled("v"))
+
+        class AlwaysEnable:
+            def random(self):
+                return 0.0
+
+        randomized = fd.overlay()
+        randomized.enable_features_by_randomization(AlwaysEnable())
+        self.assertTrue(randomized.is_feature_enabled("d"))
+        self.assertEqual(fd.features, self.test_features)
+        self.assertFalse(fd.is_feature_enabled("d"))
+
     def test_error_handling(self):
         """Test error handling for invalid config files"""
         # Test with non-existent file
@@ -8,7 +8,7 @@ from unittest.mock import patch
 
 import riescue.lib.enums as RV
 from riescue.lib.rand import RandNum
-from riescue.lib.numgen import NumGen
+from riescue.lib.numgen import BulkNumGen, NumGen
 
 
 class TestNumGen(unittest.TestCase):
@@ -167,5 +167,62 @@ class TestNumGen(unittest.TestCase):
                     self.numgen.rand_num(CustomDataType.CUSTOM)
 
 
+class TestBulkNumGen(unittest.TestCase):
+    """
+    Test Suite for BulkNumGen Class
+    Used by the ;#random_fill directive to generate arrays of fp / int numbers
+    """
+
+    def test_deterministic(self):
+        """Same seed and stream give the same values, a different stream gives different values"""
+        a = BulkNumGen(seed=42, stream=0).rand_type("int64", 64)
+        b = BulkNumGen(seed=42, stream=0).rand_type("int64", 64)
+        c = BulkNumGen(seed=42, stream=1).rand_type("int64", 64)
+        self.assertEqual(a.tolist(), b.tolist())
+        self.assertNotEqual(a.tolist(), c.tolist())
+
+    def test_element_dtypes(self):
+        """Values use the smallest unsigned dtype that holds the type"""
+        bulk = BulkNumGen(seed=1)
+        for data_type, itemsize in [("bits1", 1), ("bits12", 2), ("bits32", 4), ("bits33", 8), ("int8", 1), ("int16", 2), ("fp32", 4), ("fp64", 8)]:
+            values = bulk.rand_type(data_type, 16)
+            self.assertEqual(len(values), 16)
+            self.assertEqual(values.dtype.itemsize, itemsize, data_type)
+
+    def test_bits_masks(self):
+        """bitsN values respect and_mask, or_mask and the bit range of random_in_bitrange"""
+        values = BulkNumGen(seed=7).rand_bits(1000, 20, and_mask=0xFFFF0, or_mask=0x3)
+        for v in values.tolist():
+            self.assertEqual(v & 0x3, 0x3)
+            self.assertEqual(v & ~0xFFFF3, 0)
+        values = BulkNumGen(seed=7).rand_bits(1000, 32)
+        self.assertLess(max(values.tolist()), 1 << 30)
+
+    def test_bits_invalid_width(self):
+        with self.assertRaises(ValueError):
+            BulkNumGen(seed=1).rand_bits(1, 65)
+        with self.assertRaises(ValueError):
+            BulkNumGen(seed=1).rand_type("word32", 1)
+
+    def test_fp_special_and_low_fidelity(self):
+        """Selected options force values from the NumGen special / low fidelity tables"""
+        opts = NumGen.weighted_opts()
+        opts[RV.NumGenOps.select_special_num] = {True: 100}
+        values = BulkNumGen(seed=3, opts=opts).rand_nums(200, RV.DataType.FP16)
+        self.assertTrue(set(values.tolist()) <= set(NumGen.special_nums_fp16.values()))
+
+        opts[RV.NumGenOps.low_fidelity] = {True: 100}
+        values = BulkNumGen(seed=3, opts=opts).rand_nums(200, RV.DataType.FP64)
+        self.assertTrue(set(values.tolist()) <= set(NumGen.low_fidelity_fp64))
+
+    def test_fp_fields(self):
+        """Default weights zero the mantissa (fractional) and subnormal values have a zero exponent"""
+        values = BulkNumGen(seed=5).rand_nums(500, RV.DataType.FP32)
+        specials = set(NumGen.special_nums_fp32.values())
+        for v in values.tolist():
+            if v not in specials:
+                self.assertEqual(v & 0x7FFFFF, 0)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -116,6 +116,21 @@ class RandNumTest(unittest.TestCase):
         rand.shuffle(test_list)
         self.assertCountEqual(test_list, original_list, f"Shuffled list {test_list} does not contain the same elements as original {original_list}")
 
+    def test_substream(self):
+        seed = 9
+        rand = RandNum(seed=seed)
+        with rand.substream("add_0", 1):
+            expected = [rand.random_nbit(32) for _ in range(4)]
+        after = rand.random_nbit(32)
+
+        other = RandNum(seed=seed)
+        other.random_nbit(32)  # earlier draws don't change the sub-stream
+        with other.substream("add_0", 1):
+            self.assertEqual([other.random_nbit(32) for _ in range(4)], expected)
+        with other.substream("add_0", 2):
+            self.assertNotEqual([other.random_nbit(32) for _ in range(4)], expected)
+        self.assertEqual(RandNum(seed=seed).random_nbit(32), after, "Sub-stream should not consume from the parent stream")
+
 
 if __name__ == "__main__":
     unittest.main(verbosity=2)
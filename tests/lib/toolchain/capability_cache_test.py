@@ -0,0 +1,90 @@
+# SPDX-FileCopyrightText: © 2025 Tenstorrent AI ULC
+# SPDX-License-Identifier: Apache-2.0
+
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+import riescue.lib.toolchain.capability_cache as capability_cache
+from riescue.lib.toolchain import Spike
+from riescue.lib.toolchain.capability_cache import CapabilityCache
+
+FAKE_SPIKE = """
+import sys
+from pathlib import Path
+
+with Path(__file__).with_suffix(".count").open("a") as f:
+    f.write("x")
+print("usage: spike [host options] <target program>\\n  -p<n>  Simulate <n> processors\\n  --misaligned  Support misaligned accesses")
+"""
+
+
+class CapabilityCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.tmp_dir = Path(self.tmp.name)
+        self.cache_file = self.tmp_dir / "cache/toolchain_capabilities.json"
+        self.executable = self.tmp_dir / "tool"
+        self.executable.write_text("v1")
+        self.probes = 0
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def probe(self) -> list[str]:
+        self.probes += 1
+        return ["--flag"]
+
+    def test_cached(self):
+        cache = CapabilityCache(self.cache_file)
+        self.assertEqual(cache.get(self.executable, "flags", self.probe), ["--flag"])
+        self.assertEqual(cache.get(self.executable, "flags", self.probe), ["--flag"])
+        self.assertEqual(CapabilityCache(self.cache_file).get(self.executable, "flags", self.probe), ["--flag"], "New processes should use the cache file")
+        self.assertEqual(self.probes, 1)
+
+    def test_executable_changed(self):
+        CapabilityCache(self.cache_file).get(self.executable, "flags", self.probe)
+        self.executable.write_text("v2, rebuilt")
+        CapabilityCache(self.cache_file).get(self.executable, "flags", self.probe)
+        self.assertEqual(self.probes, 2)
+
+    def test_unreadable_cache(self):
+        self.cache_file.parent.mkdir()
+        self.cache_file.write_text("{not json")
+        self.assertEqual(CapabilityCache(self.cache_file).get(self.executable, "flags", self.probe), ["--flag"])
+        self.assertEqual(CapabilityCache(self.cache_file).get(self.executable, "flags", self.probe), ["--flag"])
+        self.assertEqual(self.probes, 1, "Unreadable cache file should be replaced")
+
+    def test_failed_probe_not_cached(self):
+        def fail():
+            raise OSError("can't run")
+
+        cache = CapabilityCache(self.cache_file)
+        with self.assertRaises(OSError):
+            cache.get(self.executable, "flags", fail)
+        self.assertEqual(cache.get(self.executable, "flags", self.probe), ["--flag"])
+
+    def test_default_cache_file(self):
+        with patch.dict(os.environ, {"RIESCUE_CACHE_DIR": str(self.tmp_dir)}):
+            self.assertEqual(capability_cache.default_cache_file(), self.tmp_dir / "toolchain_capabilities.json")
+
+    def test_spike_supports_misaligned(self):
+        "spike --help is only run once per spike executable"
+        spike = self.tmp_dir / "spike"
+        spike.with_suffix(".py").write_text(FAKE_SPIKE)
+        spike.write_text(f"#!/bin/sh\nexec {sys.executable} {spike.with_suffix('.py')} \"$@\"\n")
+        spike.chmod(0o755)
+        with patch.object(capability_cache, "_capability_cache", CapabilityCache(self.cache_file)):
+            self.assertTrue(Spike._spike_supports_misaligned(spike))
+            self.assertTrue(Spike._spike_supports_misaligned(spike))
+            self.assertEqual(spike.with_suffix(".count").read_text(), "x")
+            flags = capability_cache.capability_cache().get(spike, "help_flags", list)
+        self.assertIn("-p", flags)
+        self.assertNotIn("-n", flags)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
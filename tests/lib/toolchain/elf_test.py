@@ -0,0 +1,34 @@
+# SPDX-FileCopyrightText: © 2025 Tenstorrent AI ULC
+# SPDX-License-Identifier: Apache-2.0
+
+import sys
+import unittest
+from pathlib import Path
+
+from riescue.lib.toolchain import Whisper
+from riescue.lib.toolchain.elf import read_symbols
+
+TEST_ELF = Path(__file__).parent / "max_instruction_test.elf"
+
+
+class ElfTest(unittest.TestCase):
+    def test_read_symbols(self):
+        "Same symbols as nm lists; the undefined _start reference is skipped"
+        symbols = read_symbols(TEST_ELF)
+        self.assertEqual(symbols["_start"], 0x8000_0000)
+        self.assertEqual(symbols["fail"], 0x8000_0020)
+        self.assertEqual(symbols["tohost"], 0x1000, "Absolute symbols should be included")
+        self.assertEqual(set(symbols), {"_start", "$xrv64i2p1", "end_test", "pass", "fail", "infinite_loop", "tohost"})
+
+    def test_not_elf(self):
+        with self.assertRaises(ValueError):
+            read_symbols(Path(__file__))
+
+    def test_process_dumpmem_arg(self):
+        whisper = Whisper(whisper_path=Path(sys.executable))
+        self.assertEqual(whisper.process_dumpmem_arg(TEST_ELF, "dump.hex:@pass:@fail+@tohost*2"), "dump.hex:0x80000018:0x80002020")
+        self.assertEqual(whisper.process_dumpmem_arg(TEST_ELF, "dump.hex:0x10:0x20"), "dump.hex:0x10:0x20")
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,96 @@
+# SPDX-FileCopyrightText: © 2025 Tenstorrent AI ULC
+# SPDX-License-Identifier: Apache-2.0
+
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+from riescue.lib.toolchain import Spike, Whisper, ToolchainError, ToolFailureType
+
+# Stands in for an ISS. The ELF file holds the tohost value the test ends with; the trace is written to --logfile, or stderr for spike's -l
+FAKE_ISS = """
+import sys
+from pathlib import Path
+
+args = sys.argv[1:]
+Path(__file__).with_suffix(".args").open("a").write(" ".join(args) + "\\n")
+elf = next(arg for arg in args if arg.endswith(".elf"))
+tohost = int(Path(elf).read_text())
+trace = "".join(f"#{i} 0 {0x80000000 + 4 * i:016x} 00000013 r 00000000 addi x0, x0, 0\\n" for i in range(20000))
+trace += f"#20000 0 0000000080050000 00f2a023 m 80001000 00000000 {tohost:08x} sw t5, 0(t0)\\n"
+trace += "Target program exited\\n"
+if "--logfile" in args:
+    Path(args[args.index("--logfile") + 1]).write_text(trace)
+elif "-l" in args:
+    sys.stderr.write(trace)
+sys.exit(0 if tohost == 1 else 1)
+"""
+
+
+class IssTraceTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.run_dir = Path(self.tmp.name)
+        self.iss = self.run_dir / "iss"
+        self.iss.with_suffix(".py").write_text(FAKE_ISS)
+        self.iss.write_text(f"#!/bin/sh\nexec {sys.executable} {self.iss.with_suffix('.py')} \"$@\"\n")
+        self.iss.chmod(0o755)
+        self.log = self.run_dir / "test_iss.log"
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def elf(self, tohost: int) -> Path:
+        elf = self.run_dir / "test.elf"
+        elf.write_text(str(tohost))
+        return elf
+
+    def runs(self) -> list[list[str]]:
+        "Arguments of each ISS run"
+        return [line.split() for line in self.iss.with_suffix(".args").read_text().splitlines()]
+
+    def whisper(self, trace: bool) -> Whisper:
+        return Whisper(whisper_path=self.iss, whisper_config_json=Path("dtest_framework/lib/whisper_config.json"), whisper_trace=trace)
+
+    def test_whisper_pass_without_trace(self):
+        self.whisper(trace=False).run_iss(elf_file=self.elf(1), output_file=self.log)
+        self.assertEqual(len(self.runs()), 1)
+        self.assertNotIn("--logfile", self.runs()[0])
+        self.assertFalse(self.log.exists(), "Passing run shouldn't write a trace")
+
+    def test_whisper_fail_reruns_with_trace(self):
+        with self.assertRaises(ToolchainError) as excp:
+            self.whisper(trace=False).run_iss(elf_file=self.elf(3), output_file=self.log, args=["--quitany"])
+        self.assertEqual(excp.exception.kind, ToolFailureType.TOHOST_FAIL)
+        self.assertEqual(excp.exception.fail_code, 3)
+        self.assertEqual(excp.exception.log_path, self.log)
+        first, rerun = self.runs()
+        self.assertNotIn("--logfile", first)
+        self.assertIn("--logfile", rerun)
+        self.assertEqual([arg for arg in rerun if arg not in ("--logfile", str(self.log))], first, "Rerun should use the same arguments")
+
+    def test_whisper_trace_override(self):
+        self.whisper(trace=False).run_iss(elf_file=self.elf(1), output_file=self.log, trace=True)
+        self.assertTrue(self.log.exists())
+
+    def test_find_tohost_write(self):
+        "tohost write is found reading back from the end of the trace, including across block boundaries"
+        self.whisper(trace=True).run_iss(elf_file=self.elf(1), output_file=self.log)
+        whisper = self.whisper(trace=True)
+        expected = "#20000 0 0000000080050000 00f2a023 m 80001000 00000000 00000001 sw t5, 0(t0)"
+        for block_size in (7, 64, 1 << 16, 1 << 30):
+            self.assertEqual(whisper._find_tohost_write(self.log, block_size=block_size), expected)
+
+    def test_spike_without_commit_log(self):
+        spike = Spike(spike_path=self.iss, third_party_spike=True, spike_trace=False)
+        spike.run_iss(elf_file=self.elf(1), output_file=self.log)
+        self.assertNotIn("-l", self.runs()[0])
+        with self.assertRaises(ToolchainError):
+            spike.run_iss(elf_file=self.elf(3), output_file=self.log)
+        self.assertIn("-l", self.runs()[-1])
+        self.assertIn("sw t5, 0(t0)", self.log.read_text(), "Failing run should leave the commit log")
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)